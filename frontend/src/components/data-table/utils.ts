@@ -1,7 +1,10 @@
 /* Copyright 2026 Marimo. All rights reserved. */
 
 import type { Table } from "@tanstack/react-table";
-import type { TableData } from "@/plugins/impl/DataTablePlugin";
+import type {
+  TableData,
+  TableDataFormat,
+} from "@/plugins/impl/DataTablePlugin";
 import { vegaLoadData } from "@/plugins/impl/vega/loader";
 import { jsonParseWithSpecialChar } from "@/utils/json/json-parser";
 import { isRecord } from "@/utils/records";
@@ -68,12 +71,24 @@ export function splitLeadingTrailingWhitespace(value: string): {
  */
 export async function loadTableData<T = object>(
   tableData: TableData<T>,
+  format: TableDataFormat = "json",
 ): Promise<T[]> {
   // If we already have the data, return it
   if (Array.isArray(tableData)) {
     return tableData;
   }
 
+  // Arrow pages only hold floats, booleans and the row id, so plain numbers
+  // are safe; copy the rows out of the Arrow proxies.
+  if (format === "arrow") {
+    const rows = await vegaLoadData<T>(
+      tableData,
+      { type: "arrow" },
+      { handleBigIntAndNumberLike: false },
+    );
+    return rows.map((row) => ({ ...row }));
+  }
+
   // If it looks like json, parse it
   if (tableData.startsWith("{") || tableData.startsWith("[")) {
     return jsonParseWithSpecialChar(tableData);
@@ -95,12 +110,16 @@ export async function loadTableData<T = object>(
 export async function loadTableAndRawData<T>(
   tableData: TableData<T>,
   rawTableData?: TableData<T> | null,
+  format?: TableDataFormat,
 ): Promise<[T[], T[] | undefined]> {
   if (rawTableData) {
-    return Promise.all([loadTableData(tableData), loadTableData(rawTableData)]);
+    return Promise.all([
+      loadTableData(tableData, format),
+      loadTableData(rawTableData),
+    ]);
   }
 
-  return [await loadTableData(tableData), undefined];
+  return [await loadTableData(tableData, format), undefined];
 }
 
 /**
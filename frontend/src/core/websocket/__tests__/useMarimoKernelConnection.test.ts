@@ -24,6 +24,14 @@ describe("classifyCloseEvent", () => {
       expect(logger).toHaveBeenCalled();
       logger.mockRestore();
     });
+
+    it("retries without a warning on MARIMO_SLOW_CONSUMER", () => {
+      const logger = vi.spyOn(Logger, "warn").mockImplementation(() => {});
+      const decision = classify("MARIMO_SLOW_CONSUMER");
+      expect(decision.kind).toBe("retry");
+      expect(logger).not.toHaveBeenCalled();
+      logger.mockRestore();
+    });
   });
 
   afterEach(() => {
@@ -98,6 +98,7 @@ export type CloseReason =
   | "MARIMO_KERNEL_STARTUP_ERROR"
   | "MARIMO_UNAUTHORIZED"
   | "MARIMO_KIOSK_NOT_ALLOWED"
+  | "MARIMO_SLOW_CONSUMER"
   | typeof TRANSPORT_EXHAUSTED_REASON;
 
 export type CloseDecision =
@@ -159,6 +160,9 @@ export function classifyCloseEvent(event: { reason?: string }): CloseDecision {
         },
         closeTransport: true,
       };
+    case "MARIMO_SLOW_CONSUMER":
+      // The server dropped this client's backlog; reconnecting resyncs it.
+      break;
     default:
       // Empty/undefined reasons are normal transient closes. Anything else is
       // an unknown server reason; warn so a new MARIMO_* reason doesn't fall
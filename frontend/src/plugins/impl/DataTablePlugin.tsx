@@ -94,6 +94,8 @@ import {
 
 type CsvURL = string;
 export type TableData<T> = T[] | CsvURL;
+/** How `search` encodes a page: inline JSON or a URL to an Arrow IPC file. */
+export type TableDataFormat = "json" | "arrow";
 
 interface ColumnSummaries<T = unknown> {
   data: TableData<T> | null | undefined;
@@ -102,6 +104,7 @@ interface ColumnSummaries<T = unknown> {
   value_counts: Record<ColumnName, ValueCounts>;
   show_charts: boolean;
   is_disabled?: boolean;
+  is_approximate?: boolean;
 }
 
 export type GetRowIds = (opts: {}) => Promise<{
@@ -221,8 +224,10 @@ type DataTableFunctions = {
     page_number: number;
     page_size: number;
     max_columns?: number | null;
+    data_format?: TableDataFormat;
   }) => Promise<{
     data: TableData<T>;
+    data_format?: TableDataFormat;
     total_rows: number | TooManyRows;
     cell_styles?: CellStyleState | null;
     cell_hover_texts?: Record<string, Record<string, string | null>> | null;
@@ -310,6 +315,7 @@ export const DataTablePlugin = createPlugin<S>("marimo-table")
         value_counts: z.record(z.string(), valueCounts),
         show_charts: z.boolean(),
         is_disabled: z.boolean().optional(),
+        is_approximate: z.boolean().optional(),
       }),
     ),
     search: rpc
@@ -328,11 +334,13 @@ export const DataTablePlugin = createPlugin<S>("marimo-table")
           page_number: z.number(),
           page_size: z.number(),
           max_columns: z.number().nullable().optional(),
+          data_format: z.enum(["json", "arrow"]).optional(),
         }),
       )
       .output(
         z.object({
           data: z.union([z.string(), z.array(z.object({}).passthrough())]),
+          data_format: z.enum(["json", "arrow"]).optional(),
           total_rows: z.union([z.number(), z.literal(TOO_MANY_ROWS)]),
           cell_styles: z
             .record(
@@ -562,6 +570,7 @@ export const LoadingDataTableComponent = memo(
       // Table data is a url string or an array of objects
       let tableData = props.data;
       let rawTableData: TableData<T> | undefined | null = props.rawData;
+      let tableDataFormat: TableDataFormat | undefined;
       let totalRows = props.totalRows;
       let cellStyles = props.cellStyles;
       let cellHoverTexts = props.cellHoverTexts;
@@ -591,6 +600,8 @@ export const LoadingDataTableComponent = memo(
         page_number: paginationState.pageIndex,
         page_size: paginationState.pageSize,
         filters: filtersToFilterGroup(filters),
+        // Numeric pages can come back as Arrow IPC instead of JSON
+        data_format: "arrow",
       });
 
       if (canShowInitialPage) {
@@ -604,6 +615,7 @@ export const LoadingDataTableComponent = memo(
       } else {
         const searchResults = await searchResultsPromise;
         tableData = searchResults.data;
+        tableDataFormat = searchResults.data_format;
         rawTableData = searchResults.raw_data;
         totalRows = searchResults.total_rows;
         cellStyles = searchResults.cell_styles || {};
@@ -612,6 +624,7 @@ export const LoadingDataTableComponent = memo(
       const [data, rawData] = await loadTableAndRawData(
         tableData,
         rawTableData,
+        tableDataFormat,
       );
       tableData = data;
       return {
@@ -1141,6 +1154,11 @@ const DataTableComponent = ({
           1,000,000 rows.
         </Banner>
       )}
+      {columnSummaries?.is_approximate && (
+        <Banner className="mb-1 rounded">
+          Column summaries are approximate, estimated from a sample of rows.
+        </Banner>
+      )}
 
       <ColumnChartContext value={chartSpecModel}>
         <Labeled label={label} align="top" fullWidth={true}>
@@ -626,10 +626,11 @@ class App:
         return get_context().app_kernel_runner_registry.get_runner(self)
 
     def _flatten_outputs(self, outputs: dict[CellId_t, Any]) -> Sequence[Any]:
+        disabled = self._graph.flagged_mask("disabled")
         return tuple(
             outputs[cid]
             for cid in self._cell_manager.valid_cell_ids()
-            if not self._graph.is_disabled(cid) and cid in outputs
+            if not self._graph.is_disabled(cid, disabled) and cid in outputs
         )
 
     def _globals_to_defs(self, glbls: dict[str, Any]) -> _Namespace:
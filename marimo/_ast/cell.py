@@ -210,6 +210,24 @@ class CellImpl:
         self.config.configure(update)
         return self
 
+    def fork(self) -> CellImpl:
+        """Return a copy of this cell with fresh runtime state.
+
+        The compiled fields (code, AST, defs, refs, code objects, ...) are
+        shared with this cell, not copied, so they must not be mutated.
+        """
+        return dataclasses.replace(
+            self,
+            config=CellConfig.from_dict(self.config.asdict()),
+            import_workspace=ImportWorkspace(
+                is_import_block=self.import_workspace.is_import_block
+            ),
+            _status=RuntimeState(),
+            _run_result_status=RunResultStatus(),
+            _stale=CellStaleState(),
+            _output=CellOutput(),
+        )
+
     @property
     def runtime_state(self) -> RuntimeStateType | None:
         """Gets the current runtime state of the cell.
@@ -47,6 +47,7 @@ if TYPE_CHECKING:
     from types import FrameType
 
     from marimo._ast.app import InternalApp
+    from marimo._ast.compile_cache import CompiledCellCache
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -245,7 +246,10 @@ class CellManager:
         self._compiled_cells[cell_id] = cell
 
     def register_ir_cell(
-        self, cell_def: CellDef, app: InternalApp | None = None
+        self,
+        cell_def: CellDef,
+        app: InternalApp | None = None,
+        compile_cache: CompiledCellCache | None = None,
     ) -> None:
         if isinstance(cell_def, SetupCell):
             cell_id = self.setup_cell_id
@@ -258,7 +262,10 @@ class CellManager:
 
         try:
             cell = ir_cell_factory(
-                cell_def, cell_id=cell_id, filename=filename
+                cell_def,
+                cell_id=cell_id,
+                filename=filename,
+                compile_cache=compile_cache,
             )
         except SyntaxError:
             self.unparsable = True
@@ -0,0 +1,231 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""On-disk cache of compiled cells, the marimo analogue of `__pycache__`.
+
+Compiling a cell parses it, walks the AST to find its definitions and
+references, and compiles it to bytecode. For large notebooks this adds up
+every time the notebook is loaded and every time a kernel starts (which,
+for `marimo run`, is every session).
+
+`CompiledCellCache` stores the result for each cell of a notebook in a
+single file, `__marimo__/compiled/<notebook>.<cache tag>.msgpack`, keyed
+by a hash of the cell's code, id and source position. The file is tied to
+the Python and marimo versions that wrote it. On a hit, `compile_cell`
+still parses the cell (the AST is part of the cell) but skips the visitor
+and the bytecode compiler.
+
+The cache writes files next to notebooks, so it is opt-in: set
+`MARIMO_COMPILE_CACHE=1` to enable it. Like Python, it isn't written
+when `sys.dont_write_bytecode` is set.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import msgspec
+
+from marimo import _loggers
+from marimo._ast.sql_visitor import SQLRef
+from marimo._ast.visitor import VariableData
+from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._utils.paths import notebook_output_dir
+from marimo._utils.platform import is_pyodide
+from marimo._version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from types import CodeType
+
+    from marimo._ast.cell import SourcePosition
+
+LOGGER = _loggers.marimo_logger()
+
+# Bump when the layout of `CompiledCell` or what compile_cell computes
+# changes, to invalidate existing caches.
+_FORMAT_VERSION = 1
+
+
+class CompiledCell(msgspec.Struct, array_like=True):
+    """Everything `compile_cell` derives from a cell's code, other than
+    its AST."""
+
+    body: bytes
+    last_expr: bytes
+    defs: set[str]
+    refs: set[str]
+    sql_refs: dict[str, SQLRef]
+    temporaries: set[str]
+    closed_over_temporaries: set[str]
+    variable_data: dict[str, list[VariableData]]
+    deleted_refs: set[str]
+    language: str
+    markdown: str | None
+    is_import_block: bool
+
+    @property
+    def code_objects(self) -> tuple[CodeType, CodeType]:
+        return marshal.loads(self.body), marshal.loads(self.last_expr)
+
+
+class _CacheFile(msgspec.Struct, array_like=True):
+    format_version: int
+    marimo_version: str
+    python_version: str
+    entries: dict[str, CompiledCell]
+
+
+def _python_version() -> str:
+    return f"{sys.implementation.name}-{sys.hexversion:x}"
+
+
+def cache_key(
+    code: str,
+    cell_id: str,
+    filename: str,
+    source_position: SourcePosition | None,
+) -> str:
+    """Identifies a compilation: the bytecode embeds the filename and line
+    numbers, and local names are mangled with the cell id."""
+    position = (
+        f"{source_position.lineno}:{source_position.col_offset}"
+        if source_position is not None
+        else ""
+    )
+    digest = hashlib.sha256()
+    for part in (code, cell_id, filename, position):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class CompiledCellCache:
+    """The compiled cells of one notebook, backed by one file.
+
+    Entries are read on first use and written back by `flush`, which keeps
+    only the latest entry looked up or added for each cell, so versions of
+    cells that have since been edited or deleted are pruned.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, CompiledCell] | None = None
+        # The latest key of each cell, and its entry.
+        self._used: dict[str, tuple[str, CompiledCell]] = {}
+        # Keys of the entries in the file on disk.
+        self._written: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, cell_id: str) -> CompiledCell | None:
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._use(key, cell_id, entry)
+            return entry
+
+    def put(self, key: str, cell_id: str, entry: CompiledCell) -> None:
+        with self._lock:
+            self._load()[key] = entry
+            self._use(key, cell_id, entry)
+
+    def _use(self, key: str, cell_id: str, entry: CompiledCell) -> None:
+        assert self._entries is not None
+        previous = self._used.get(cell_id)
+        if previous is not None and previous[0] != key:
+            # Keys include the cell id, so no other cell uses this entry.
+            self._entries.pop(previous[0], None)
+        self._used[cell_id] = (key, entry)
+
+    def flush(self, cell_ids: Collection[str] | None = None) -> None:
+        """Write the latest entry of each cell, if they differ from the
+        file; if `cell_ids` is given, cells not among them are dropped."""
+        with self._lock:
+            if cell_ids is not None:
+                for cell_id in self._used.keys() - set(cell_ids):
+                    key, _ = self._used.pop(cell_id)
+                    if self._entries is not None:
+                        self._entries.pop(key, None)
+            used = {key: entry for key, entry in self._used.values()}
+            if sys.dont_write_bytecode or self._written == used.keys():
+                return
+            data = msgspec.msgpack.encode(
+                _CacheFile(
+                    format_version=_FORMAT_VERSION,
+                    marimo_version=__version__,
+                    python_version=_python_version(),
+                    entries=used,
+                )
+            )
+            self._written = set(used)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            LOGGER.debug("Failed to write compile cache %s: %s", self.path, e)
+            tmp.unlink(missing_ok=True)
+
+    def _load(self) -> dict[str, CompiledCell]:
+        if self._entries is None:
+            self._entries = self._read()
+            self._written = set(self._entries)
+        return self._entries
+
+    def _read(self) -> dict[str, CompiledCell]:
+        try:
+            data = self.path.read_bytes()
+        except OSError:
+            return {}
+        try:
+            cache_file = msgspec.msgpack.decode(data, type=_CacheFile)
+        except msgspec.DecodeError:
+            LOGGER.debug("Ignoring unreadable compile cache %s", self.path)
+            return {}
+        if (
+            cache_file.format_version != _FORMAT_VERSION
+            or cache_file.marimo_version != __version__
+            or cache_file.python_version != _python_version()
+        ):
+            return {}
+        return cache_file.entries
+
+
+_caches: dict[Path, CompiledCellCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_compiled_cell_cache(
+    notebook_path: str | Path | None,
+) -> CompiledCellCache | None:
+    """The compile cache for a notebook, shared within this process, or
+    `None` if caching is off or the notebook has no file."""
+    if (
+        notebook_path is None
+        or not GLOBAL_SETTINGS.COMPILE_CACHE
+        or is_pyodide()
+    ):
+        return None
+    stem = Path(notebook_path).name
+    tag = sys.implementation.cache_tag or sys.implementation.name
+    path = (
+        notebook_output_dir(notebook_path)
+        / "compiled"
+        / f"{stem}.{tag}.msgpack"
+    )
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = CompiledCellCache(path)
+        return cache
@@ -6,6 +6,7 @@ import functools
 import inspect
 import io
 import linecache
+import marshal
 import os
 import re
 import sys
@@ -24,6 +25,7 @@ from marimo._ast.cell import (
     ImportWorkspace,
     SourcePosition,
 )
+from marimo._ast.compile_cache import CompiledCell, cache_key
 from marimo._ast.dedent import smart_dedent
 from marimo._ast.names import SETUP_CELL_NAME, TOPLEVEL_CELL_PREFIX
 from marimo._ast.pytest import has_fixture_decorator
@@ -33,6 +35,7 @@ from marimo._ast.visitor import (
     ImportData,
     Name,
     ScopedVisitor,
+    VariableData,
     get_closure_refs,
 )
 from marimo._schemas.serialization import CellDef, ClassCell, FunctionCell
@@ -42,6 +45,8 @@ from marimo._utils.tmpdir import get_tmpdir
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from marimo._ast.compile_cache import CompiledCellCache
+
 LOGGER = _loggers.marimo_logger()
 Cls: TypeAlias = type
 
@@ -261,7 +266,13 @@ def compile_cell(
     carried_imports: list[ImportData] | None = None,
     test_rewrite: bool = False,
     filename: str | None = None,
+    compile_cache: CompiledCellCache | None = None,
 ) -> CellImpl:
+    """Compile a cell's code, extracting its definitions and references.
+
+    If a `compile_cache` is given, the bytecode and definitions are looked
+    up in it by code, cell id and source position, and stored on a miss.
+    """
     if filename is not None and source_position is None:
         source_position = solve_source_position(
             code,
@@ -301,6 +312,27 @@ def compile_cell(
         isinstance(stmt, (ast.Import, ast.ImportFrom)) for stmt in module.body
     )
 
+    key: str | None = None
+    if compile_cache is not None and not (is_test or test_rewrite):
+        key = cache_key(
+            code,
+            cell_id,
+            source_position.filename
+            if source_position
+            else get_filename(cell_id),
+            source_position,
+        )
+        compiled = compile_cache.get(key, cell_id)
+        if compiled is not None:
+            return _cell_from_cache(
+                compiled,
+                code,
+                cell_id,
+                module,
+                source_position,
+                carried_imports,
+            )
+
     v = ScopedVisitor("cell_" + cell_id)
     v.visit(module)
 
@@ -375,22 +407,28 @@ def compile_cell(
     # through private (temporary) closures are still found.
     closed_over_temporaries = get_closure_refs(v.variable_data) & temporaries
 
-    # If this cell is an import cell, we carry over any imports in
-    # `carried_imports` that are also in this cell to the import workspace's
-    # definitions.
-    imported_defs: set[Name] = set()
-    if is_import_block and carried_imports is not None:
-        for data in variable_data.values():
-            for datum in data:
-                import_data = datum.import_data
-                if import_data is None:
-                    continue
-                for previous_import_data in carried_imports:
-                    if previous_import_data == import_data:
-                        imported_defs.add(import_data.definition)
-
     maybe_md = _extract_markdown(original_module)
 
+    if key is not None and compile_cache is not None:
+        compile_cache.put(
+            key,
+            cell_id,
+            CompiledCell(
+                body=marshal.dumps(body),
+                last_expr=marshal.dumps(last_expr),
+                defs=nonlocals,
+                refs=v.refs,
+                sql_refs=v.sql_refs,
+                temporaries=temporaries,
+                closed_over_temporaries=closed_over_temporaries,
+                variable_data=variable_data,
+                deleted_refs=v.deleted_refs,
+                language=v.language,
+                markdown=maybe_md,
+                is_import_block=is_import_block,
+            ),
+        )
+
     return CellImpl(
         # keyed by original (user) code, for cache lookups
         key=code_key(code),
@@ -404,7 +442,9 @@ def compile_cell(
         variable_data=variable_data,
         import_workspace=ImportWorkspace(
             is_import_block=is_import_block,
-            imported_defs=imported_defs,
+            imported_defs=_carried_imported_defs(
+                is_import_block, variable_data, carried_imports
+            ),
         ),
         deleted_refs=v.deleted_refs,
         language=v.language,
@@ -416,6 +456,66 @@ def compile_cell(
     )
 
 
+def _carried_imported_defs(
+    is_import_block: bool,
+    variable_data: dict[Name, list[VariableData]],
+    carried_imports: list[ImportData] | None,
+) -> set[Name]:
+    # If this cell is an import cell, we carry over any imports in
+    # `carried_imports` that are also in this cell to the import workspace's
+    # definitions.
+    imported_defs: set[Name] = set()
+    if is_import_block and carried_imports is not None:
+        for data in variable_data.values():
+            for datum in data:
+                import_data = datum.import_data
+                if import_data is None:
+                    continue
+                for previous_import_data in carried_imports:
+                    if previous_import_data == import_data:
+                        imported_defs.add(import_data.definition)
+    return imported_defs
+
+
+def _cell_from_cache(
+    compiled: CompiledCell,
+    code: str,
+    cell_id: CellId_t,
+    module: ast.Module,
+    source_position: SourcePosition | None,
+    carried_imports: list[ImportData] | None,
+) -> CellImpl:
+    if source_position is None:
+        # As on a miss, debuggers read the cell's code from the linecache.
+        cache(get_filename(cell_id), code)
+    body, last_expr = compiled.code_objects
+    return CellImpl(
+        key=code_key(code),
+        code=code,
+        mod=module,
+        defs=compiled.defs,
+        refs=compiled.refs,
+        sql_refs=compiled.sql_refs,
+        temporaries=compiled.temporaries,
+        closed_over_temporaries=compiled.closed_over_temporaries,
+        variable_data=compiled.variable_data,
+        import_workspace=ImportWorkspace(
+            is_import_block=compiled.is_import_block,
+            imported_defs=_carried_imported_defs(
+                compiled.is_import_block,
+                compiled.variable_data,
+                carried_imports,
+            ),
+        ),
+        deleted_refs=compiled.deleted_refs,
+        language=compiled.language,  # type: ignore[arg-type]
+        body=body,
+        last_expr=last_expr,
+        cell_id=cell_id,
+        markdown=compiled.markdown,
+    )
+
+
 @functools.lru_cache(maxsize=1)
 def _build_source_position_map(
     filename: str,
@@ -605,7 +705,10 @@ def toplevel_cell_factory(
 
 
 def ir_cell_factory(
-    cell_def: CellDef, cell_id: CellId_t, filename: str | None = None
+    cell_def: CellDef,
+    cell_id: CellId_t,
+    filename: str | None = None,
+    compile_cache: CompiledCellCache | None = None,
 ) -> Cell:
     # NB. no need for test rewrite, anonymous file, etc.
     # Because this is never invoked in script mode.
@@ -627,6 +730,7 @@ def ir_cell_factory(
             cell_def.code,
             cell_id=cell_id,
             source_position=source_position,
+            compile_cache=compile_cache,
         ),
     )
 
@@ -8,6 +8,7 @@ from typing import Literal
 from marimo import _loggers
 from marimo._ast.app import App, InternalApp
 from marimo._ast.app_config import _AppConfig
+from marimo._ast.compile_cache import get_compiled_cell_cache
 from marimo._ast.parse import (
     MarimoFileError,
     NonMarimoPythonScriptError,
@@ -95,11 +96,16 @@ def load_notebook_ir(
         options = _AppConfig.sanitize(options)
 
     app = App(**options, _filename=filepath)
+    compile_cache = get_compiled_cell_cache(filepath)
     for cell in notebook.cells:
         if isinstance(cell, UnparsableCell):
             app._unparsable_cell(cell.code, **cell.options)
             continue
-        app._cell_manager.register_ir_cell(cell, InternalApp(app))
+        app._cell_manager.register_ir_cell(
+            cell, InternalApp(app), compile_cache=compile_cache
+        )
+    if compile_cache is not None:
+        compile_cache.flush()
     if notebook.header and notebook.header.value:
         app._header = notebook.header.value
     return app
@@ -157,6 +157,10 @@ class RuntimeConfig(TypedDict):
         The default is `False`.
     - `std_stream_max_bytes`: the maximum size in bytes of console outputs;
       larger values may affect frontend performance
+    - `virtual_files_max_bytes`: the maximum total size in bytes of the
+        files (images, downloads, ...) a session keeps for its outputs; the
+        least recently used are removed past it. A negative value removes
+        the limit. The default is `500_000_000`.
     - `pythonpath`: a list of directories to add to the Python search path.
         Directories will be added to the head of sys.path. Similar to the
         `PYTHONPATH` environment variable, the directories will be included in
@@ -185,6 +189,7 @@ class RuntimeConfig(TypedDict):
     output_max_bytes: int
     serve_cached_sessions_in_apps: NotRequired[bool]
     std_stream_max_bytes: int
+    virtual_files_max_bytes: NotRequired[int]
     pythonpath: NotRequired[list[str]]
     dotenv: NotRequired[list[str]]
     default_sql_output: SqlOutputType
@@ -259,12 +264,26 @@ class ServerConfig(TypedDict):
         services that do not support WebSockets. Terminal, LSP, and
         real-time collaboration still require WebSockets; RTC is disabled
         when using `"sse"`.
+    - `kernel_pool_size`: number of edit-mode kernel processes to keep
+        spawned and idle, so new sessions don't wait for interpreter
+        startup. The default is `0` (no pool).
+    - `warm_imports`: modules to import ahead of time, e.g.
+        `["numpy", "pandas"]`: in pooled kernels in edit mode, and in the
+        server process in run mode.
+    - `run_snapshots`: experimental, Linux only. When `marimo run` hosts
+        each app in its own process, execute each notebook once and fork
+        new sessions from the executed kernel instead of running the
+        notebook for every session. Only cells that depend on UI elements
+        with different initial values are re-run. The default is `false`.
     """
 
     browser: Literal["default"] | str
     follow_symlink: bool
     disable_file_downloads: NotRequired[bool]
     transport: NotRequired[Literal["websocket", "sse"]]
+    kernel_pool_size: NotRequired[int]
+    warm_imports: NotRequired[list[str]]
+    run_snapshots: NotRequired[bool]
 
 
 @dataclass
@@ -641,6 +660,7 @@ class ExperimentalConfig(TypedDict, total=False):
     isolate_apps: bool
     debugger: bool  # Live frame-watching debugger (gutter breakpoints + pdb)
     line_timing: bool  # Active-line highlight + per-line timer (sys.settrace)
+    concurrent_async_cells: bool  # Await independent async cells concurrently
 
     # Internal features
     execution_type: ExecutionType
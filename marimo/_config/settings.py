@@ -39,6 +39,10 @@ class GlobalSettings:
     # boundary -- exported HTML still embeds source and endpoints still serve
     # code. Pair with network egress filtering for defence-in-depth.
     RESTRICT_SHARING: bool = is_env_true("MARIMO_RESTRICT_SHARING")
+    # Cache compiled cells under each notebook's `__marimo__/compiled`
+    # directory, like `__pycache__`, to speed up loading notebooks. Opt-in,
+    # since it writes files next to the user's notebooks.
+    COMPILE_CACHE: bool = is_env_true("MARIMO_COMPILE_CACHE")
 
 
 GLOBAL_SETTINGS = GlobalSettings()
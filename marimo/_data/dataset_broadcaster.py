@@ -0,0 +1,335 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Background profiling of dataframe variables for the data explorer.
+
+Profiling a frame (column types and sample values) is proportional to
+its column count, so doing it inline after a cell runs delays every cell
+downstream of it. `DatasetBroadcaster` takes that work off the run: the
+kernel hands it the variables a cell defined, and a worker thread
+profiles them once the run has been quiet for a moment and broadcasts
+the result.
+
+Dataframes aren't thread-safe, so the worker never touches the user's
+objects: on the kernel thread, `submit` detaches each eager in-memory
+frame (a shallow copy or clone that later writes to the original don't
+reach) for the worker to profile. Other tables, such as lazy frames and
+database relations, are profiled on the kernel thread as they are
+submitted.
+
+Results are cached per variable by object identity and a cheap change
+witness (type, shape, columns, dtypes), so re-running a cell that
+returns the same, unmodified frame doesn't profile it again.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._data.get_datasets import get_datasets_from_variables
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._messaging.notification import DatasetsNotification
+from marimo._messaging.notification_utils import broadcast_notification
+from marimo._utils.platform import is_pyodide
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from marimo._data.models import DataTable
+    from marimo._messaging.types import Stream
+    from marimo._types.ids import VariableName
+
+LOGGER = _loggers.marimo_logger()
+
+# How long the kernel must stop defining variables before they are profiled.
+DEBOUNCE_SECONDS = 0.1
+
+
+def change_witness(value: Any) -> Hashable | None:
+    """A cheap fingerprint of a table's schema and size, or `None` if
+    `value` doesn't expose one without computing it (e.g. lazy frames).
+
+    Two calls return equal witnesses if the table wasn't resized, and
+    had no columns added, removed, renamed or re-typed in between.
+    """
+    shape = getattr(value, "shape", None)
+    if not isinstance(shape, tuple):
+        return None
+    witness: list[Hashable] = [type(value), shape]
+    for attr in ("columns", "dtypes", "dtype"):
+        try:
+            part = getattr(value, attr, None)
+            if part is None:
+                continue
+            witness.append(
+                part
+                if isinstance(part, (str, int, tuple))
+                else str(part)
+                if attr == "dtype"
+                else tuple(map(str, part))
+            )
+        except Exception:
+            return None
+    return tuple(witness)
+
+
+# Live broadcasters, to reset in forked children.
+_BROADCASTERS: weakref.WeakSet[DatasetBroadcaster] = weakref.WeakSet()
+
+
+def _reset_broadcasters_after_fork() -> None:
+    for broadcaster in list(_BROADCASTERS):
+        broadcaster._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_broadcasters_after_fork)
+
+
+def detach(value: Any) -> Any | None:
+    """A copy of eager in-memory frame `value` that is safe to profile on
+    another thread while the kernel keeps using `value`, or `None` if
+    `value` isn't one.
+
+    The copies are cheap: they share the frame's data, not its mutable
+    state.
+    """
+    if DependencyManager.pandas.imported():
+        import pandas as pd
+
+        if isinstance(value, pd.DataFrame):
+            return value.copy(deep=False)
+    if DependencyManager.polars.imported():
+        import polars as pl
+
+        if isinstance(value, pl.DataFrame):
+            return value.clone()
+    if DependencyManager.pyarrow.imported():
+        import pyarrow as pa
+
+        # Immutable
+        if isinstance(value, (pa.Table, pa.RecordBatch)):
+            return value
+    return None
+
+
+@dataclass
+class _Pending:
+    value: Any
+    # `value`'s witness and detached copy, taken on the kernel thread.
+    witness: Hashable | None
+    detached: Any
+    stream: Stream
+
+
+@dataclass
+class _CacheEntry:
+    ref: weakref.ref[Any]
+    witness: Hashable
+    table: DataTable | None
+
+
+class DatasetBroadcaster:
+    """Profiles variables on a background thread and broadcasts the
+    dataframes among them as a `DatasetsNotification`.
+
+    Submissions are debounced: the worker waits until no variables have
+    been submitted for `debounce_seconds`, and a variable submitted again
+    before then is only profiled once, with its latest value. Pending
+    variables can be cancelled, e.g. when the cell that defines them is
+    about to run again.
+
+    Only eager in-memory frames are profiled by the worker (see `detach`);
+    other variables, and all of them in Pyodide, where there are no
+    threads, are profiled as they are submitted.
+    """
+
+    def __init__(self, debounce_seconds: float = DEBOUNCE_SECONDS) -> None:
+        self.debounce_seconds = debounce_seconds
+        self._pending: dict[VariableName, _Pending] = {}
+        # Variables taken by the worker and not yet profiled.
+        self._in_flight: set[VariableName] = set()
+        self._last_submit = 0.0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._cache: dict[tuple[VariableName, int], _CacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        _BROADCASTERS.add(self)
+
+    def submit(
+        self, variables: Iterable[tuple[VariableName, Any]], stream: Stream
+    ) -> None:
+        """Queue `variables` to be profiled and broadcast on `stream`.
+
+        Must be called on the thread that owns the variables' values.
+        """
+        background: dict[VariableName, _Pending] = {}
+        inline: list[tuple[VariableName, Any]] = []
+        for name, value in variables:
+            detached = detach(value)
+            if detached is None:
+                inline.append((name, value))
+            else:
+                background[name] = _Pending(
+                    value, change_witness(value), detached, stream
+                )
+        if inline:
+            # Superseded by the values profiled now
+            self.cancel(name for name, _ in inline)
+            self._broadcast_tables(get_datasets_from_variables(inline), stream)
+        if not background:
+            return
+        if is_pyodide():
+            profiled = [
+                self._profile(name, pending)
+                for name, pending in background.items()
+            ]
+            self._broadcast_tables(
+                [table for table in profiled if table is not None], stream
+            )
+            return
+
+        with self._lock:
+            if self._closed:
+                return
+            for name, pending in background.items():
+                self._pending[name] = pending
+                self._in_flight.discard(name)
+            self._last_submit = time.monotonic()
+            self._idle.clear()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="marimo-dataset-broadcaster",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def cancel(self, names: Iterable[VariableName] | None = None) -> None:
+        """Drop pending variables: those in `names`, or all of them."""
+        with self._lock:
+            if names is None:
+                self._pending.clear()
+                self._in_flight.clear()
+            else:
+                for name in names:
+                    self._pending.pop(name, None)
+                    self._in_flight.discard(name)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted variable has been broadcast; returns
+        False on timeout."""
+        self._wakeup.set()
+        return self._idle.wait(timeout)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._cache.clear()
+
+    def _reset_after_fork(self) -> None:
+        # The worker thread doesn't exist in a forked child, and the locks
+        # may have been held by it; pending variables belong to the
+        # parent's streams.
+        self._pending.clear()
+        self._in_flight.clear()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            while True:
+                with self._lock:
+                    if self._closed:
+                        self._idle.set()
+                        return
+                    quiet_for = time.monotonic() - self._last_submit
+                    if quiet_for >= self.debounce_seconds:
+                        batch = list(self._pending.items())
+                        self._pending.clear()
+                        self._in_flight = {name for name, _ in batch}
+                        if not batch:
+                            self._idle.set()
+                            break
+                if quiet_for < self.debounce_seconds:
+                    time.sleep(self.debounce_seconds - quiet_for)
+                    continue
+                try:
+                    self._broadcast(batch)
+                except Exception:
+                    LOGGER.warning(
+                        "Failed to broadcast datasets", exc_info=True
+                    )
+
+    def _broadcast(self, batch: list[tuple[VariableName, _Pending]]) -> None:
+        by_stream: dict[int, tuple[Stream, list[DataTable]]] = {}
+        for name, pending in batch:
+            if self._is_cancelled(name):
+                continue
+            table = self._profile(name, pending)
+            if table is not None:
+                stream = pending.stream
+                by_stream.setdefault(id(stream), (stream, []))[1].append(table)
+        for stream, tables in by_stream.values():
+            self._broadcast_tables(tables, stream)
+
+    @staticmethod
+    def _broadcast_tables(tables: list[DataTable], stream: Stream) -> None:
+        if not tables:
+            return
+        LOGGER.debug("Broadcasting data tables")
+        broadcast_notification(
+            DatasetsNotification(tables=tables), stream=stream
+        )
+
+    def _is_cancelled(self, name: VariableName) -> bool:
+        # The variable was cancelled, or resubmitted with a newer value,
+        # while earlier ones in the batch were being profiled.
+        with self._lock:
+            return self._closed or name not in self._in_flight
+
+    def _profile(
+        self, name: VariableName, pending: _Pending
+    ) -> DataTable | None:
+        value, witness = pending.value, pending.witness
+        key = (name, id(value))
+        entry = self._cache.get(key)
+        if (
+            entry is not None
+            and entry.ref() is value
+            and witness is not None
+            and entry.witness == witness
+        ):
+            self.hits += 1
+            return entry.table
+
+        self.misses += 1
+        tables = get_datasets_from_variables([(name, pending.detached)])
+        table = tables[0] if tables else None
+        if witness is not None:
+            try:
+                ref = weakref.ref(value, lambda _: self._cache.pop(key, None))
+            except TypeError:
+                # Not weak-referenceable; an id alone could be reused.
+                return table
+            self._cache[key] = _CacheEntry(ref, witness, table)
+        return table
@@ -287,6 +287,8 @@ class DependencyManager:
     huggingface_hub = Dependency("huggingface_hub")
     cloudpathlib = Dependency("cloudpathlib")
     cryptography = Dependency("cryptography")
+    zstandard = Dependency("zstandard")
+    lz4 = Dependency("lz4")
 
     @staticmethod
     def has(pkg: str) -> bool:
@@ -766,9 +766,10 @@ def _disabled_cell_ids(cell_data: list[CellData]) -> set[CellId_t]:
         if cell is not None:
             graph.register_cell(data.cell_id, cell._cell)
 
+    disabled = graph.flagged_mask("disabled")
     for data in cell_data:
         cell = data.cell
-        if cell is not None and graph.is_disabled(data.cell_id):
+        if cell is not None and graph.is_disabled(data.cell_id, disabled):
             disabled_cell_ids.add(data.cell_id)
 
     return disabled_cell_ids
@@ -62,6 +62,17 @@ def broadcast_notification(
         return
 
 
+def _track_virtual_files(cell_id: CellId_t, output: str) -> None:
+    """Let the virtual file registry know what the cell's output is now,
+    so it can remove files that are no longer shown."""
+    try:
+        ctx = get_context()
+    except ContextNotInitializedError:
+        return
+    if ctx.virtual_files_supported:
+        ctx.virtual_file_registry.track_output(cell_id, output)
+
+
 class CellNotificationUtils:
     """Utilities for broadcasting cell notifications."""
 
@@ -138,6 +149,7 @@ class CellNotificationUtils:
             ),
             stream=stream,
         )
+        _track_virtual_files(cell_id, data)
 
     @staticmethod
     def broadcast_empty_output(
@@ -160,6 +172,7 @@ class CellNotificationUtils:
             ),
             stream=stream,
         )
+        _track_virtual_files(cell_id, "")
 
     @staticmethod
     def broadcast_console_output(
@@ -270,6 +283,7 @@ class CellNotificationUtils:
                 status=None,
             )
         )
+        _track_virtual_files(cell_id, "")
 
     @staticmethod
     def broadcast_stale(
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 import msgspec
@@ -56,3 +57,47 @@ def try_deserialize_kernel_notification_name(
         ).op
     except msgspec.DecodeError:
         return None
+
+
+def format_wire_message(op: str, data: bytes) -> str:
+    """Format a serialized message for transport to the frontend.
+
+    Wraps serialized notification data with operation metadata.
+
+    Args:
+        op: The operation name (e.g., "cell-op", "kernel-ready")
+        data: The serialized notification data as bytes
+
+    Returns:
+        JSON string in wire format: {"op": "...", "data": ...}
+    """
+    return f'{{"op": "{op}", "data": {data.decode("utf-8")}}}'
+
+
+class FramedMessage(bytes):
+    """A KernelMessage that caches what every consumer derives from it.
+
+    A broadcast notification is read by each consumer in a room and by the
+    session view. Wrapping it once lets them share its op name, its wire
+    format and its decoded notification, each computed on first use,
+    instead of decoding the message once per reader. It is still a
+    `KernelMessage`, so it can be passed anywhere one is expected.
+    """
+
+    @classmethod
+    def of(cls, message: KernelMessage) -> FramedMessage:
+        if isinstance(message, FramedMessage):
+            return message
+        return cls(message)
+
+    @cached_property
+    def op(self) -> str:
+        return deserialize_kernel_notification_name(KernelMessage(self))
+
+    @cached_property
+    def wire(self) -> str:
+        return format_wire_message(self.op, self)
+
+    @cached_property
+    def notification(self) -> NotificationMessage:
+        return deserialize_kernel_message(KernelMessage(self))
@@ -242,6 +242,9 @@ class Watcher:
         self.standard_stream = standard_stream
         self.fd = self.standard_stream._original_fd
         self.read_fd, self.write_fd = os.pipe()
+        # Number of open `start()`s. Cells running concurrently overlap
+        # their redirections; only the outermost start/pause touch the fd.
+        self._depth = 0
         self._should_exit = threading.Event()
         self.thread = threading.Thread(
             target=_forward_os_stream,
@@ -251,6 +254,9 @@ class Watcher:
         self.thread.start()
 
     def start(self) -> None:
+        self._depth += 1
+        if self._depth > 1:
+            return
         # Save the file for the standard stream by opening a new file
         # descriptor for it
         self.fd_dup = os.dup(self.fd)
@@ -260,6 +266,9 @@ class Watcher:
         os.dup2(self.write_fd, self.fd)
 
     def pause(self) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
         # Restore the original file descriptor to point to the standard
         # stream file
         os.dup2(self.fd_dup, self.fd)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import base64
 import io
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from marimo._messaging.msgspec_encoder import enc_hook
@@ -147,10 +148,14 @@ def html(data: str) -> VirtualFile:
     return any_data(data, ext="html")
 
 
-def any_data(data: str | bytes | io.BytesIO, ext: str) -> VirtualFile:
+def any_data(
+    data: str | bytes | bytearray | memoryview | io.BytesIO | Iterable[bytes],
+    ext: str,
+) -> VirtualFile:
     """Create a virtual file from any data.
 
-    It can be a string, bytes, or a file-like object.
+    It can be a string, a bytes-like object, a file-like object, or an
+    iterator of bytes, which is streamed into storage as it is consumed.
     For external URLs, these are passed through as-is.
 
     Args:
@@ -178,8 +183,8 @@ def any_data(data: str | bytes | io.BytesIO, ext: str) -> VirtualFile:
     if isinstance(data, str) and data.startswith("http"):
         return VirtualFile.from_external_url(data)
 
-    # Bytes
-    if isinstance(data, bytes):
+    # Bytes-like
+    if isinstance(data, (bytes, bytearray, memoryview)):
         item = VirtualFileLifecycleItem(ext=ext, buffer=data)
         item.add_to_cell_lifecycle_registry()
         return item.virtual_file
@@ -192,9 +197,14 @@ def any_data(data: str | bytes | io.BytesIO, ext: str) -> VirtualFile:
 
     # BytesIO
     if isinstance(data, io.BytesIO):
-        # clone before reading, so we don't consume the stream
-        buffer = io.BytesIO(data.getvalue()).read()
-        item = VirtualFileLifecycleItem(ext=ext, buffer=buffer)
+        # a view of the contents, so we neither copy nor consume the stream
+        item = VirtualFileLifecycleItem(ext=ext, buffer=data.getbuffer())
+        item.add_to_cell_lifecycle_registry()
+        return item.virtual_file
+
+    # Iterator of bytes, e.g. a generator
+    if isinstance(data, Iterator):
+        item = VirtualFileLifecycleItem(ext=ext, buffer=data)
         item.add_to_cell_lifecycle_registry()
         return item.virtual_file
 
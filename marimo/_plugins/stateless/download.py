@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import io
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, cast
@@ -16,6 +17,7 @@ from marimo._plugins.core.media import (
 )
 from marimo._plugins.ui._core.ui_element import UIElement
 from marimo._runtime.functions import EmptyArgs, Function
+from marimo._runtime.virtual_file.storage import DEFAULT_CHUNK_SIZE
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
@@ -107,11 +109,16 @@ class download(UIElement[None, None]):
         )
         ext = mime_type_to_ext(resolved_mimetype) or "txt"
 
-        # Convert to bytes right away since can only be read once
+        contents: Any = data
         if isinstance(data, io.BufferedReader):
             filename = filename or data.name
             data.seek(0)
-            data = data.read()
+            disabled = disabled or data.peek(1) == b""
+            # Stream the file into the virtual file's storage in chunks,
+            # instead of reading it into memory first
+            contents = iter(
+                functools.partial(data.read, DEFAULT_CHUNK_SIZE), b""
+            )
 
         # When non-lazy
         if not callable(data):
@@ -124,7 +131,7 @@ class download(UIElement[None, None]):
 
             # create a virtual file to avoid loading the data in the browser
             # only if the data is not lazy
-            data_url = mo_data.any_data(data, ext=ext).url
+            data_url = mo_data.any_data(contents, ext=ext).url
 
         super().__init__(
             component_name=self._name,
@@ -34,6 +34,8 @@ from marimo._types.ids import UIElementId
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
+    from typing_extensions import Self
+
     from marimo._plugins.ui._impl.input import form as form_plugin
 
 # S: Type of frontend value
@@ -108,10 +110,13 @@ class UIElement(Html, Generic[S, T]):
     **Methods.**
 
     - form: create a submittable form this `UIElement`.
+    - latest_value_wins: stop in-flight runs when a newer value arrives.
     """
 
     _value_frontend: S
     _value: T
+    # Set by `latest_value_wins()`
+    _latest_value_wins: bool = False
 
     # We want this to be fully random in production,
     # otherwise cached session state could use incorrect object-ids.
@@ -353,6 +358,29 @@ class UIElement(Html, Generic[S, T]):
             )
         super().__setattr__(name, value)
 
+    def latest_value_wins(self) -> Self:
+        """Stop running cells for a stale value when a newer one arrives.
+
+        By default, every value sent by the frontend runs the cells that
+        reference this element to completion. With this policy, a run
+        started for one value is cut short, between cells, as soon as a
+        newer value for the element arrives; the cells it didn't get to
+        are marked stale and run again for the newer value.
+
+        Use it for elements like sliders whose downstream cells are slow,
+        and whose intermediate values don't matter.
+
+        Examples:
+            ```python
+            slider = mo.ui.slider(0, 100).latest_value_wins()
+            ```
+
+        Returns:
+            This element.
+        """
+        self._latest_value_wins = True
+        return self
+
     @mddoc
     def form(
         self,
@@ -1,6 +1,9 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, TypeVar
 
 from marimo._plugins.ui._impl.dataframes.transforms.handlers import (
@@ -102,16 +105,58 @@ def get_handler_for_dataframe(
     return NarwhalsTransformHandler()
 
 
+# Per-dataframe budget for the intermediate frames of transform pipelines.
+# Lazy frames (e.g. Polars) only hold a query plan; eager backends hold a
+# copy of the data per step.
+DEFAULT_SNAPSHOT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def _estimated_nbytes(df: nw.LazyFrame[IntoLazyFrame]) -> int:
+    native = df.to_native()
+    if df.implementation.is_pandas_like():
+        return int(native.memory_usage(index=True).sum())
+    if df.implementation.is_pyarrow():
+        return int(native.nbytes)
+    return sys.getsizeof(native)
+
+
+@dataclass(eq=False)
+class _Snapshot:
+    """A node of the snapshot tree: the dataframe and field types after the
+    transforms on the path from the root to this node."""
+
+    transform: Transform | None
+    df: nw.LazyFrame[IntoLazyFrame]
+    field_types: FieldTypes
+    nbytes: int = 0
+    parent: _Snapshot | None = None
+    children: list[_Snapshot] = field(default_factory=list)
+
+    def child(self, transform: Transform) -> _Snapshot | None:
+        for child in self.children:
+            if child.transform == transform:
+                return child
+        return None
+
+
 class TransformsContainer:
     """
-    Keeps internal state of the last transformation applied to the dataframe.
-    So that we can incrementally apply transformations.
+    Keeps the intermediate dataframes of the transformations applied to the
+    dataframe, so that we can incrementally apply transformations.
+
+    Snapshots form a prefix tree rooted at the original dataframe: each node
+    holds the dataframe and field types after one more transform than its
+    parent. Applying a list of transforms follows the longest cached prefix
+    and only computes the rest, so toggling, reordering or undoing a step
+    only recomputes the steps after it. Snapshots are evicted least recently
+    used first, within a byte budget.
     """
 
     def __init__(
         self,
         df: nw.LazyFrame[IntoLazyFrame],
         handler: NarwhalsTransformHandler,
+        max_bytes: int = DEFAULT_SNAPSHOT_CACHE_BYTES,
     ) -> None:
         self._original_df = df
         # The dataframe for the given transform.
@@ -119,6 +164,11 @@ class TransformsContainer:
         self._handler = handler
         self._transforms: list[Transform] = []
         self._field_types_cache: list[FieldTypes] = []
+        self.max_bytes = max_bytes
+        self._root: _Snapshot | None = None
+        # Snapshots other than the root, least recently used first
+        self._snapshots: OrderedDict[int, _Snapshot] = OrderedDict()
+        self._nbytes = 0
 
     def apply(
         self, transform: Transformations
@@ -130,61 +180,66 @@ class TransformsContainer:
             Tuple of (final_dataframe, field_types_per_step).
             field_types_per_step[0] = original, field_types_per_step[N] = after N transforms.
         """
-        # If the new transformations are a superset of the existing ones,
-        # then we can just apply the new ones to the snapshot dataframe.
-        if self._is_superset(transform):
-            transforms_to_apply = self._get_next_transformations(transform)
-            df = self._snapshot_df
-            field_types = list(self._field_types_cache)
-
-            for t in transforms_to_apply.transforms:
-                df = _handle(df, self._handler, t)
-                field_types.append(get_table_manager(df).get_field_types())
-
-            self._snapshot_df = df
-        else:
-            field_types = [
-                get_table_manager(self._original_df).get_field_types()
-            ]
-            df = self._original_df
-
-            for t in transform.transforms:
-                df = _handle(df, self._handler, t)
-                field_types.append(get_table_manager(df).get_field_types())
-
-            self._snapshot_df = df
+        if self._root is None:
+            self._root = _Snapshot(
+                transform=None,
+                df=self._original_df,
+                field_types=get_table_manager(
+                    self._original_df
+                ).get_field_types(),
+            )
 
+        node = self._root
+        path: list[_Snapshot] = []
+        for t in transform.transforms:
+            child = node.child(t)
+            if child is None:
+                df = _handle(node.df, self._handler, t)
+                child = _Snapshot(
+                    transform=t,
+                    df=df,
+                    field_types=get_table_manager(df).get_field_types(),
+                    nbytes=_estimated_nbytes(df),
+                    parent=node,
+                )
+                node.children.append(child)
+                self._nbytes += child.nbytes
+            node = child
+            path.append(node)
+
+        # Mark the deepest snapshots least recent, so that they are evicted
+        # before their ancestors.
+        for snapshot in reversed(path):
+            self._snapshots[id(snapshot)] = snapshot
+            self._snapshots.move_to_end(id(snapshot))
+        # Snapshots that can't fit on their own aren't kept
+        for snapshot in path:
+            if snapshot.nbytes > self.max_bytes and (
+                id(snapshot) in self._snapshots
+            ):
+                self._evict(snapshot)
+        while self._nbytes > self.max_bytes and self._snapshots:
+            _, evicted = self._snapshots.popitem(last=False)
+            self._evict(evicted)
+
+        df = node.df
+        field_types = [self._root.field_types] + [
+            snapshot.field_types for snapshot in path
+        ]
+        self._snapshot_df = df
         self._transforms = transform.transforms
         self._field_types_cache = field_types
         return df, field_types
 
-    def _is_superset(self, transforms: Transformations) -> bool:
-        """
-        Checks if the new transformations are a superset of the existing ones.
-        """
-        if not self._transforms:
-            return False
-
-        # If the new transformations are smaller than the existing ones,
-        # then it's not a superset.
-        if len(self._transforms) > len(transforms.transforms):
-            return False
-
-        for i, transform in enumerate(self._transforms):
-            if transform != transforms.transforms[i]:
-                return False
-
-        return True
-
-    def _get_next_transformations(
-        self, transforms: Transformations
-    ) -> Transformations:
-        """
-        Gets the next transformations to apply.
-        """
-        if self._is_superset(transforms):
-            return Transformations(
-                transforms.transforms[len(self._transforms) :]
-            )
-        else:
-            return transforms
+    def _evict(self, snapshot: _Snapshot) -> None:
+        """Drop `snapshot` and its descendants from the tree."""
+        if snapshot.parent is not None:
+            snapshot.parent.children.remove(snapshot)
+            snapshot.parent = None
+        stack = [snapshot]
+        while stack:
+            node = stack.pop()
+            self._nbytes -= node.nbytes
+            self._snapshots.pop(id(node), None)
+            stack.extend(node.children)
+            node.children = []
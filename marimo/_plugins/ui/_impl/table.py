@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import functools
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
@@ -14,7 +15,7 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Callable, Hashable, Mapping
 
 from narwhals.typing import IntoDataFrame
 
@@ -41,6 +42,15 @@ from marimo._plugins.ui._impl.dataframes.transforms.types import (
     TransformType,
     validate_operator_for_dtype,
 )
+from marimo._plugins.ui._impl.tables.approximate import (
+    approximate_bin_values,
+    approximate_stats,
+    approximate_value_counts,
+)
+from marimo._plugins.ui._impl.tables.narwhals_table import (
+    NarwhalsTableManager,
+)
+from marimo._plugins.ui._impl.tables.search_index import TrigramSearchIndex
 from marimo._plugins.ui._impl.tables.selection import (
     INDEX_COLUMN_NAME,
     add_selection_column,
@@ -54,6 +64,7 @@ from marimo._plugins.ui._impl.tables.table_manager import (
     TableManager,
 )
 from marimo._plugins.ui._impl.tables.utils import get_table_manager
+from marimo._plugins.ui._impl.tables.view_cache import TableViewCache
 from marimo._plugins.ui._impl.utils.dataframe import (
     ListOrTuple,
     TableData,
@@ -122,6 +133,9 @@ class ColumnSummaries:
     # Disabled because of too many columns/rows
     # This will show a banner in the frontend
     is_disabled: bool | None = None
+    # Estimated from a sample because of too many rows
+    # This will show a banner in the frontend
+    is_approximate: bool | None = None
 
 
 ShowColumnSummaries = bool | Literal["stats", "chart"]
@@ -165,6 +179,33 @@ MAX_COLUMNS_NOT_PROVIDED: MaxColumnsNotProvided = "inherit"
 
 MaxColumnsType = int | None | MaxColumnsNotProvided
 
+PageDataFormat = Literal["json", "arrow"]
+
+# Column summaries kept per table, one per filter/search query
+MAX_CACHED_COLUMN_SUMMARIES = 8
+
+# Field types whose Arrow values render exactly as their JSON encoding
+# does; pages with any other column type are always sent as JSON.
+ARROW_PAGE_FIELD_TYPES = frozenset({"number", "boolean"})
+
+
+def _page_to_arrow_ipc(page: TableManager[Any]) -> bytes:
+    """Encode a table page as an Arrow IPC file.
+
+    Narwhals-backed pages without an Arrow encoding of their own (e.g.
+    pyarrow tables) are converted through narwhals. This is only used for
+    pages; charts and summaries keep using the manager's own formats.
+    """
+    if type(page) is not NarwhalsTableManager:
+        return page.to_arrow_ipc()
+    import pyarrow as pa
+
+    table = page.as_frame().to_arrow()
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return cast(bytes, sink.getvalue().to_pybytes())
+
 
 @dataclass(frozen=True)
 class SortArgs:
@@ -181,6 +222,8 @@ class SearchTableArgs:
     filters: FilterGroup | None = None
     limit: int | None = None
     max_columns: int | MaxColumnsNotProvided | None = MAX_COLUMNS_NOT_PROVIDED
+    # Page encodings the client can decode; it opts in to "arrow".
+    data_format: PageDataFormat = "json"
 
 
 CellStyles = dict[RowId, dict[ColumnName, dict[str, Any]]]
@@ -196,6 +239,8 @@ class SearchTableResponse:
     # Unformatted data mirroring the same shape/page as `data`,
     # provided when format_mapping is applied.
     raw_data: str | None = None
+    # Encoding of `data`: inline JSON, or a URL to an Arrow IPC file.
+    data_format: PageDataFormat = "json"
 
 
 @dataclass(frozen=True)
@@ -504,6 +549,15 @@ class table(
             Defaults to True for dataframes, False otherwise.
         show_search (bool, optional): Whether to show the search bar.
             Defaults to True.
+        approximate_column_summaries (bool, optional): Whether to estimate
+            column summaries from a sample of rows when the table has too
+            many rows to summarize exactly, instead of hiding them.
+            Approximate summaries are labeled as such. Defaults to False.
+        search_index (bool, optional): Whether to search tables of 100,000
+            rows or more through an in-memory index of their values, built
+            on the first search. Makes repeated searches of large tables
+            faster, at the cost of the memory the index holds. Defaults to
+            False.
         format_mapping (Dict[str, Union[str, Callable[..., Any]]], optional): A mapping from
             column names to formatting strings or functions.
         freeze_columns_left (Sequence[str], optional): List of column names to freeze on the left.
@@ -625,6 +679,8 @@ class table(
         max_columns: MaxColumnsType = MAX_COLUMNS_NOT_PROVIDED,
         *,
         show_search: bool = True,
+        approximate_column_summaries: bool = False,
+        search_index: bool = False,
         label: str = "",
         on_change: Callable[
             [
@@ -707,6 +763,8 @@ class table(
         self._show_column_summaries: ShowColumnSummaries = (
             show_column_summaries
         )
+        self._approximate_column_summaries = approximate_column_summaries
+        self._use_search_index = search_index
 
         if _internal_column_charts_row_limit is not None:
             self._column_charts_row_limit = _internal_column_charts_row_limit
@@ -734,6 +792,16 @@ class table(
         # Holds the data after user searching from original data
         # (searching operations include query, sort, filter, etc.)
         self._searched_manager = self._manager
+        # Filtered views and sort permutations served by `_search`
+        self._view_cache = TableViewCache()
+        # Trigram index over the data, built on the first search if enabled,
+        # and the data it was built for
+        self._search_index: TrigramSearchIndex | None = None
+        self._search_index_source: TableManager[Any] | None = None
+        # Column summaries, by the filters and query they summarize
+        self._column_summaries: OrderedDict[Hashable, ColumnSummaries] = (
+            OrderedDict()
+        )
         # Holds the data after user selecting from the component
         self._selected_manager: TableManager[Any] | list[TableCell] | None = (
             None
@@ -1113,7 +1181,11 @@ class table(
 
         Calculates summaries like null counts, min/max values, unique counts, etc.
         for each column. Summaries are only calculated if the total number of rows
-        is below the column summary row limit.
+        is below the column summary row limit, or approximately from a sample
+        of rows if `approximate_column_summaries` is set. The stats, bins and
+        value counts of all columns are each computed together, and
+        summaries are cached per filter and search query, since they don't
+        depend on the sort.
 
         Args:
             args (ColumnSummariesArgs): Arguments specifying whether to precompute
@@ -1126,6 +1198,23 @@ class table(
         """
         del args
 
+        key = (self._current_filters, self._current_query)
+        if not is_hashable(*key):
+            return self._compute_column_summaries()
+        summaries = self._column_summaries.get(key)
+        if summaries is not None:
+            self._column_summaries.move_to_end(key)
+            return summaries
+        summaries = self._compute_column_summaries()
+        # Fallback chart data is served from a virtual file, which may be
+        # released; don't hold on to its URL.
+        if summaries.data is None:
+            self._column_summaries[key] = summaries
+            if len(self._column_summaries) > MAX_CACHED_COLUMN_SUMMARIES:
+                self._column_summaries.popitem(last=False)
+        return summaries
+
+    def _compute_column_summaries(self) -> ColumnSummaries:
         show_column_summaries = self._show_column_summaries
 
         if not show_column_summaries:
@@ -1141,25 +1230,37 @@ class table(
             )
 
         total_rows = self._searched_manager.get_num_rows(force=True) or 0
+        data = self._searched_manager
 
         # Avoid expensive column summaries calculation by setting a upper limit
-        # if we are above the limit, we hide the column summaries
-        if total_rows > self._column_summary_row_limit:
-            return ColumnSummaries(
-                data=None,
-                stats={},
-                bin_values={},
-                value_counts={},
-                is_disabled=True,
-                show_charts=False,
+        # if we are above the limit, we hide the column summaries or
+        # summarize a sample of the rows instead
+        is_approximate = total_rows > self._column_summary_row_limit
+        if is_approximate:
+            sample = (
+                self._sample_rows()
+                if self._approximate_column_summaries
+                else None
             )
+            if sample is None:
+                return ColumnSummaries(
+                    data=None,
+                    stats={},
+                    bin_values={},
+                    value_counts={},
+                    is_disabled=True,
+                    show_charts=False,
+                )
+            data, sample_rows = sample, sample.get_num_rows(force=True) or 0
+        else:
+            sample_rows = total_rows
 
         # If we are above the limit to show charts,
         # or if we are in stats-only mode,
         # we don't show charts
         show_charts = (
             self._show_column_summaries != "stats"
-            and total_rows <= self._column_charts_row_limit
+            and sample_rows <= self._column_charts_row_limit
         )
 
         # Get column stats if not chart-only mode
@@ -1169,25 +1270,21 @@ class table(
         chart_data = None
         bin_values: dict[ColumnName, list[BinValue]] = {}
         value_counts: dict[ColumnName, list[ValueCount]] = {}
-        data = self._searched_manager
 
         DEFAULT_BIN_SIZE = 9
         DEFAULT_VALUE_COUNTS_SIZE = 15
 
         bin_aggregation_failed = False
         cols_to_drop = []
+        value_count_columns: list[ColumnName] = []
+        bin_columns: list[ColumnName] = []
 
-        for column in self._manager.get_column_names():
-            statistic = None
-            if should_get_stats:
-                try:
-                    statistic = self._searched_manager.get_stats(column)
-                    stats[column] = statistic
-                except BaseException:
-                    # Catch-all: some libraries like Polars have bugs and raise
-                    # BaseExceptions, which shouldn't crash the kernel
-                    LOGGER.warning("Failed to get stats for column %s", column)
+        column_names = self._manager.get_column_names()
+        if should_get_stats:
+            stats = data.get_stats_batch(column_names)
 
+        for column in column_names:
+            statistic = stats.get(column)
             if show_charts:
                 if not should_get_stats:
                     LOGGER.warning(
@@ -1204,7 +1301,7 @@ class table(
 
                 # Handle columns with all nulls first
                 # These get empty bins regardless of type
-                if statistic and statistic.nulls == total_rows:
+                if statistic and statistic.nulls == sample_rows:
                     try:
                         bin_values[column] = []
                         cols_to_drop.append(column)
@@ -1221,51 +1318,87 @@ class table(
                     "cat" in external_type or "enum" in external_type
                 )
                 if column_type == "string" and categorical_type:
-                    try:
-                        val_counts = self._get_value_counts(
-                            column, DEFAULT_VALUE_COUNTS_SIZE, total_rows
-                        )
-                        if len(val_counts) > 0:
-                            value_counts[column] = val_counts
-                            cols_to_drop.append(column)
-                        continue
-                    except BaseException as e:
-                        LOGGER.warning(
-                            "Failed to get value counts for column %s: %s",
-                            column,
-                            e,
-                        )
+                    value_count_columns.append(column)
+                    continue
 
                 # Bin values are only supported for numeric and temporal columns
-                if column_type not in [
+                if column_type in [
                     "integer",
                     "number",
                     "date",
                     "datetime",
                     "time",
                 ]:
-                    continue
+                    bin_columns.append(column)
 
-                try:
-                    # get_bin_values is marked unstable
-                    # https://narwhals-dev.github.io/narwhals/api-reference/series/#narwhals.series.Series.hist
-                    bins = data.get_bin_values(column, DEFAULT_BIN_SIZE)
-                    bin_values[column] = bins
-                    if len(bins) > 0:
-                        cols_to_drop.append(column)
+        # Value counts and bins of all columns are computed together
+        if value_count_columns:
+            top_k_rows = data.calculate_top_k_rows_batch(
+                value_count_columns, DEFAULT_VALUE_COUNTS_SIZE
+            )
+            for column in value_count_columns:
+                if column not in top_k_rows:
                     continue
-                except BaseException as e:
+                val_counts = self._to_value_counts(
+                    top_k_rows[column], DEFAULT_VALUE_COUNTS_SIZE, sample_rows
+                )
+                if len(val_counts) > 0:
+                    value_counts[column] = val_counts
+                    cols_to_drop.append(column)
+
+        if bin_columns:
+            try:
+                # get_bin_values is marked unstable
+                # https://narwhals-dev.github.io/narwhals/api-reference/series/#narwhals.series.Series.hist
+                column_bins = data.get_bin_values_batch(
+                    bin_columns, DEFAULT_BIN_SIZE
+                )
+            except BaseException as e:
+                LOGGER.warning("Failed to get bin values: %s", e)
+                column_bins = {}
+            for column in bin_columns:
+                bins = column_bins.get(column)
+                if bins is None:
                     bin_aggregation_failed = True
-                    LOGGER.warning(
-                        "Failed to get bin values for column %s: %s", column, e
-                    )
+                    continue
+                bin_values[column] = bins
+                if len(bins) > 0:
+                    cols_to_drop.append(column)
 
-        should_fallback = show_charts and bin_aggregation_failed
+        # Chart data for a sample would show the sample's counts
+        should_fallback = (
+            show_charts and bin_aggregation_failed and not is_approximate
+        )
         if should_fallback:
             LOGGER.debug("Bin aggregation failed, falling back to chart data")
             data = data.drop_columns(cols_to_drop)
             chart_data, _ = self._to_chart_data_url(data)
 
+        if is_approximate:
+            singletons = data.get_singleton_counts(
+                [
+                    column
+                    for column, statistic in stats.items()
+                    if statistic.unique is not None
+                ]
+            )
+            stats = {
+                column: approximate_stats(
+                    statistic, singletons.get(column), sample_rows, total_rows
+                )
+                for column, statistic in stats.items()
+            }
+            bin_values = {
+                column: approximate_bin_values(bins, sample_rows, total_rows)
+                for column, bins in bin_values.items()
+            }
+            value_counts = {
+                column: approximate_value_counts(
+                    counts, sample_rows, total_rows
+                )
+                for column, counts in value_counts.items()
+            }
+
         return ColumnSummaries(
             data=chart_data,
             stats=stats,
@@ -1273,10 +1406,26 @@ class table(
             value_counts=value_counts,
             show_charts=show_charts,
             is_disabled=False,
+            is_approximate=is_approximate,
         )
 
+    def _sample_rows(self) -> TableManager[Any] | None:
+        """A sample of the searched rows to estimate column summaries
+        from, or None if the data can't be sampled."""
+        try:
+            return self._searched_manager.sample_rows(
+                TableManager.DEFAULT_SUMMARY_SAMPLE_SIZE
+            )
+        except BaseException as e:
+            LOGGER.warning("Failed to sample rows for column summaries: %s", e)
+            return None
+
     def _get_value_counts(
-        self, column: ColumnName, size: int, total_rows: int
+        self,
+        column: ColumnName,
+        size: int,
+        total_rows: int,
+        manager: TableManager[Any] | None = None,
     ) -> list[ValueCount]:
         """Get value counts for a column. The last item will be 'others' with the count of remaining
         unique values. If there are only unique values, we return 'unique values' instead.
@@ -1285,6 +1434,8 @@ class table(
             column (ColumnName): The column to get value counts for.
             size (int): The number of value counts to return.
             total_rows (int): The total number of rows in the table.
+            manager (TableManager[Any], optional): The rows to count values
+                in. Defaults to the searched rows.
 
         Returns:
             list[ValueCount]: The value counts.
@@ -1293,7 +1444,18 @@ class table(
             LOGGER.warning("Total rows and size is not valid")
             return []
 
-        top_k_rows = self._searched_manager.calculate_top_k_rows(column, size)
+        if manager is None:
+            manager = self._searched_manager
+        return self._to_value_counts(
+            manager.calculate_top_k_rows(column, size), size, total_rows
+        )
+
+    @staticmethod
+    def _to_value_counts(
+        top_k_rows: list[tuple[Any, int]], size: int, total_rows: int
+    ) -> list[ValueCount]:
+        """Value counts from a column's `size` most common values, as
+        described in `_get_value_counts`."""
         if len(top_k_rows) == 0:
             return []
 
@@ -1390,19 +1552,56 @@ class table(
             format=data_format,
         )
 
-    @functools.lru_cache(maxsize=1)  # noqa: B019
     def _apply_filters_query_sort_cached(
         self,
         filters: FilterGroup | None,
         query: str | None,
         sort: tuple[SortArgs, ...] | None,
     ) -> TableManager[Any]:
-        """Cached version that expects hashable arguments."""
-        return self._apply_filters_query_sort(
-            filters,
-            query,
-            list(sort) if sort else None,
-        )
+        """Cached version that expects hashable arguments.
+
+        Filtered views and sort permutations are reused from the table's
+        view cache; a sort whose leading keys were cached only re-sorts
+        their ties.
+        """
+        cache = self._view_cache
+        current = cache.get_current((filters, query, sort))
+        if current is not None:
+            return current
+
+        view = self._manager
+        if (filters and filters.children) or query:
+            cached_view = cache.get_view(filters, query)
+            if cached_view is None:
+                cached_view = self._apply_filters_query_sort(
+                    filters, query, None
+                )
+                cache.put_view(filters, query, cached_view)
+            view = cached_view
+
+        result = view
+        valid_sort = self._valid_sort(view, list(sort) if sort else None)
+        if valid_sort:
+            positions = cache.get_permutation(filters, query, valid_sort)
+            if positions is None:
+                presorted, prefix = cache.longest_prefix(
+                    filters, query, valid_sort
+                )
+                positions = view.sort_permutation(
+                    valid_sort, presorted, prefix
+                )
+                if positions is not None:
+                    cache.put_permutation(
+                        filters, query, valid_sort, positions
+                    )
+            result = (
+                view.sort_values(valid_sort)
+                if positions is None
+                else view.gather_rows(positions)
+            )
+
+        cache.set_current((filters, query, sort), result)
+        return result
 
     def _apply_filters_query_sort(
         self,
@@ -1430,27 +1629,61 @@ class table(
                 result = get_table_manager(data)
 
         if query:
-            result = result.search(query)
-
-        if sort:
-            existing_columns = set(result.get_column_names())
-            field_types = dict(result.get_field_types())
-            valid_sort: list[SortArgs] = []
-            for sort_arg in sort:
-                if sort_arg.by not in existing_columns:
-                    continue
-                field_type = field_types.get(sort_arg.by)
-                if field_type is not None and field_type[0] == "geometry":
-                    LOGGER.warning(
-                        "Ignoring sort on geometry column '%s'", sort_arg.by
-                    )
-                    continue
-                valid_sort.append(sort_arg)
-            if valid_sort:
-                result = result.sort_values(valid_sort)
+            result = self._search_rows(result, query)
+
+        valid_sort = self._valid_sort(result, sort)
+        if valid_sort:
+            result = result.sort_values(valid_sort)
 
         return result
 
+    def _search_rows(
+        self, manager: TableManager[Any], query: str
+    ) -> TableManager[Any]:
+        """Search `manager`, the table's data or rows of it, through the
+        table's search index when it has one."""
+        if not self._use_search_index:
+            return manager.search(query)
+        # (Re)build the index on the first search since the data changed
+        if self._search_index_source is not self._manager:
+            self._search_index = TrigramSearchIndex.create(self._manager)
+            self._search_index_source = self._manager
+
+        index = self._search_index
+        if index is not None:
+            try:
+                result = index.search(manager, query)
+            except BaseException as e:
+                # Catch-all: some libraries like Polars have bugs and raise
+                # BaseExceptions, which shouldn't crash the kernel
+                LOGGER.warning("Failed to search with search index: %s", e)
+                result = None
+            if result is not None:
+                return result
+        return manager.search(query)
+
+    @staticmethod
+    def _valid_sort(
+        manager: TableManager[Any], sort: list[SortArgs] | None
+    ) -> list[SortArgs]:
+        """Drop sort keys on missing or geometry columns."""
+        if not sort:
+            return []
+        existing_columns = set(manager.get_column_names())
+        field_types = dict(manager.get_field_types())
+        valid_sort: list[SortArgs] = []
+        for sort_arg in sort:
+            if sort_arg.by not in existing_columns:
+                continue
+            field_type = field_types.get(sort_arg.by)
+            if field_type is not None and field_type[0] == "geometry":
+                LOGGER.warning(
+                    "Ignoring sort on geometry column '%s'", sort_arg.by
+                )
+                continue
+            valid_sort.append(sort_arg)
+        return valid_sort
+
     def _calculate_top_k_rows(
         self, args: CalculateTopKRowsArgs
     ) -> CalculateTopKRowsResponse:
@@ -1695,7 +1928,7 @@ class table(
 
         def clamp_rows_and_columns(
             manager: TableManager[Any],
-        ) -> tuple[str, str | None]:
+        ) -> tuple[str, str | None, PageDataFormat]:
             # Limit to page and column clamping for the frontend
             data = manager.take(args.page_size, offset)
             column_names = data.get_column_names()
@@ -1710,10 +1943,15 @@ class table(
                     columns_to_select = [INDEX_COLUMN_NAME] + columns_to_select
                 data = data.select_columns(columns_to_select)
 
+            if args.data_format == "arrow":
+                url = self._page_to_arrow_url(data)
+                if url is not None:
+                    return url, None, "arrow"
+
             try:
                 formatted = data.to_json_str(self._format_mapping)
                 raw = data.to_json_str() if self._format_mapping else None
-                return formatted, raw
+                return formatted, raw, "json"
             except BaseException as e:
                 # Catch and re-raise the error as a non-BaseException
                 # to avoid crashing the kernel
@@ -1729,7 +1967,9 @@ class table(
             else:
                 total_rows = self._manager.get_num_rows(force=True) or 0
 
-            formatted_data, raw_data = clamp_rows_and_columns(self._manager)
+            formatted_data, raw_data, data_format = clamp_rows_and_columns(
+                self._manager
+            )
             return SearchTableResponse(
                 data=formatted_data,
                 total_rows=total_rows,
@@ -1740,18 +1980,18 @@ class table(
                     offset, args.page_size, total_rows
                 ),
                 raw_data=raw_data,
+                data_format=data_format,
             )
 
-        filter_function = (
-            self._apply_filters_query_sort_cached
-            if is_hashable(args.filters, args.query, args.sort)
-            else self._apply_filters_query_sort
-        )
-        result = filter_function(
-            args.filters,
-            args.query,
-            tuple(args.sort) if args.sort else None,  # type: ignore
-        )
+        sort = tuple(args.sort) if args.sort else None
+        if is_hashable(args.filters, args.query, sort):
+            result = self._apply_filters_query_sort_cached(
+                args.filters, args.query, sort
+            )
+        else:
+            result = self._apply_filters_query_sort(
+                args.filters, args.query, args.sort
+            )
 
         # Save the manager to be used for selection
         self._searched_manager = result
@@ -1761,7 +2001,7 @@ class table(
         else:
             total_rows = result.get_num_rows(force=True) or 0
 
-        formatted_data, raw_data = clamp_rows_and_columns(result)
+        formatted_data, raw_data, data_format = clamp_rows_and_columns(result)
         return SearchTableResponse(
             data=formatted_data,
             total_rows=total_rows,
@@ -1770,8 +2010,48 @@ class table(
                 offset, args.page_size, total_rows
             ),
             raw_data=raw_data,
+            data_format=data_format,
         )
 
+    def _page_to_arrow_url(self, page: TableManager[Any]) -> str | None:
+        """Encode a page as an Arrow IPC virtual file, if that is lossless.
+
+        Only pages of unformatted float and boolean columns qualify: their
+        Arrow values decode to what their JSON would, without a JSON
+        encoding pass over every cell. Returns `None` to fall back to JSON.
+        """
+        if self._format_mapping or not DependencyManager.pyarrow.has():
+            return None
+        if any(
+            name != INDEX_COLUMN_NAME
+            and field_type not in ARROW_PAGE_FIELD_TYPES
+            for name, (field_type, _) in page.get_field_types()
+        ):
+            return None
+        try:
+            ipc = _page_to_arrow_ipc(page)
+        except NotImplementedError:
+            return None
+        except Exception as e:
+            LOGGER.debug("Failed to encode table page as Arrow: %s", e)
+            return None
+        # Backends may add columns of their own (e.g. a pandas index), so
+        # check what was actually encoded.
+        import pyarrow as pa
+
+        schema = pa.ipc.open_file(pa.py_buffer(ipc)).schema
+        if not all(
+            pa.types.is_floating(field.type)
+            or pa.types.is_boolean(field.type)
+            or (
+                field.name == INDEX_COLUMN_NAME
+                and pa.types.is_integer(field.type)
+            )
+            for field in schema
+        ):
+            return None
+        return mo_data.arrow(ipc).url
+
     def _get_row_ids(self, args: EmptyArgs) -> GetRowIdsResponse:
         """Get row IDs of a table. If searched, return searched rows else all_rows flag is True.
 
@@ -0,0 +1,106 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Approximate column summaries, estimated from a sample of rows.
+
+Tables above the column summary row limit are summarized from an evenly
+spaced sample (see `TableManager.sample_rows`), so the work is bounded by
+the sample size rather than the table size. Stats that describe the
+distribution (min, max, mean, quantiles, ...) are read off the sample
+directly; counts are scaled up to the full table.
+"""
+
+from __future__ import annotations
+
+import math
+
+from marimo._data.models import BinValue, ColumnStats, ValueCount
+
+
+def estimate_distinct(
+    sample_distinct: int, singletons: int, sample_rows: int, total_rows: int
+) -> int:
+    """Estimate the number of distinct values among `total_rows`, from a
+    sample of `sample_rows` with `sample_distinct` distinct values, of
+    which `singletons` occur exactly once.
+
+    Uses the Guaranteed-Error Estimator (Charikar et al., 2000): values
+    seen more than once are likely frequent, and so all already seen;
+    each singleton stands for sqrt(total_rows / sample_rows) values. A
+    sample without repeats is taken to come from a column of unique values.
+    """
+    if sample_rows <= 0 or total_rows <= sample_rows:
+        return sample_distinct
+    if singletons >= sample_rows:
+        return total_rows
+    scale = math.sqrt(total_rows / sample_rows)
+    estimate = round(scale * singletons + sample_distinct - singletons)
+    return max(sample_distinct, min(estimate, total_rows))
+
+
+def scale_count(count: int, sample_rows: int, total_rows: int) -> int:
+    """Scale a count over `sample_rows` rows up to `total_rows` rows."""
+    if sample_rows <= 0:
+        return count
+    return round(count * total_rows / sample_rows)
+
+
+def approximate_stats(
+    stats: ColumnStats,
+    singletons: int | None,
+    sample_rows: int,
+    total_rows: int,
+) -> ColumnStats:
+    """Full-table estimates of the `stats` of a sample."""
+
+    def scale(count: int | None) -> int | None:
+        if count is None:
+            return None
+        return scale_count(count, sample_rows, total_rows)
+
+    unique = None
+    if stats.unique is not None and singletons is not None:
+        unique = estimate_distinct(
+            stats.unique, singletons, sample_rows, total_rows
+        )
+    return ColumnStats(
+        total=total_rows,
+        nulls=scale(stats.nulls),
+        unique=unique,
+        min=stats.min,
+        max=stats.max,
+        mean=stats.mean,
+        median=stats.median,
+        std=stats.std,
+        true=scale(stats.true),
+        false=scale(stats.false),
+        p5=stats.p5,
+        p25=stats.p25,
+        p75=stats.p75,
+        p95=stats.p95,
+    )
+
+
+def approximate_bin_values(
+    bin_values: list[BinValue], sample_rows: int, total_rows: int
+) -> list[BinValue]:
+    """Full-table estimates of the bin counts of a sample."""
+    return [
+        BinValue(
+            bin_start=bin_value.bin_start,
+            bin_end=bin_value.bin_end,
+            count=scale_count(bin_value.count, sample_rows, total_rows),
+        )
+        for bin_value in bin_values
+    ]
+
+
+def approximate_value_counts(
+    value_counts: list[ValueCount], sample_rows: int, total_rows: int
+) -> list[ValueCount]:
+    """Full-table estimates of the value counts of a sample."""
+    return [
+        ValueCount(
+            value=value_count.value,
+            count=scale_count(value_count.count, sample_rows, total_rows),
+        )
+        for value_count in value_counts
+    ]
@@ -130,6 +130,14 @@ class IbisTableManagerFactory(TableManagerFactory):
                     for row in bin_values.itertuples(index=False)
                 ]
 
+            def get_bin_values_batch(
+                self, columns: list[ColumnName], num_bins: int
+            ) -> dict[ColumnName, list[BinValue]]:
+                # Ibis bins in its own query, column by column
+                return TableManager.get_bin_values_batch(
+                    self, columns, num_bins
+                )
+
             def _get_bin_values_temporal(
                 self, column: ColumnName, dtype: DataType, num_bins: int
             ) -> list[BinValue]:
@@ -60,6 +60,29 @@ POSITIVE_INF = str(float("inf"))
 NEGATIVE_INF = str(float("-inf"))
 
 
+# Scratch columns used while computing sort permutations.
+_SORT_POSITION_COLUMN = "__marimo_sort_position__"
+_SORT_RUN_COLUMN = "__marimo_sort_run__"
+
+
+def _value_changed(column: str, is_float: bool) -> nw.Expr:
+    """True where `column` differs from the previous row.
+
+    Nulls (and NaNs, for floats) compare equal to each other, matching how
+    `sort` groups them.
+    """
+    col = nw.col(column)
+    prev = col.shift(1)
+    changed = (col != prev).fill_null(value=False) | (
+        col.is_null() != prev.is_null()
+    )
+    if is_float:
+        changed = changed & ~(col.is_nan() & prev.is_nan()).fill_null(
+            value=False
+        )
+    return changed
+
+
 class NarwhalsTableManager(
     TableManager[nw.DataFrame[IntoDataFrameT] | nw.LazyFrame[IntoLazyFrameT]]
 ):
@@ -157,6 +180,9 @@ class NarwhalsTableManager(
     def supports_filters(self) -> bool:
         return True
 
+    def supports_search_index(self) -> bool:
+        return not is_narwhals_lazyframe(self.data)
+
     def select_rows(
         self, indices: list[int]
     ) -> TableManager[IntoDataFrameT | IntoLazyFrameT]:
@@ -283,6 +309,82 @@ class NarwhalsTableManager(
 
         return value_counts
 
+    def calculate_top_k_rows_batch(
+        self, columns: list[ColumnName], k: int
+    ) -> dict[ColumnName, list[tuple[Any, int]]]:
+        """The top `k` rows of each of `columns`, in one query.
+
+        Only string-like columns are counted together, and the values of
+        categorical columns come back as strings; other columns are
+        counted one by one.
+        """
+        schema = self.nw_schema
+        batched = [
+            column
+            for column in columns
+            if column in schema
+            and column not in self._geometry_columns
+            and is_narwhals_string_type(schema[column])
+        ]
+        top_k_rows = super().calculate_top_k_rows_batch(
+            [column for column in columns if column not in batched], k
+        )
+        if not batched:
+            return top_k_rows
+
+        frame = self.as_lazy_frame()
+        _column_name = "__column__"
+        _value_name = "__value__"
+        _unique_name = "__len_count__"
+
+        # Each column's top k, stacked so they're collected together
+        def _stack_top_k_rows() -> nw.LazyFrame[Any]:
+            return nw.concat(
+                [
+                    frame.group_by(column)
+                    .agg(nw.len().alias(_unique_name))
+                    .sort(
+                        [_unique_name, column],
+                        descending=[True, False],
+                        nulls_last=False,
+                    )
+                    .head(k)
+                    .select(
+                        nw.lit(index).alias(_column_name),
+                        nw.col(column).cast(nw.String).alias(_value_name),
+                        nw.col(_unique_name).cast(nw.Int64),
+                    )
+                    for index, column in enumerate(batched)
+                ],
+                how="vertical",
+            )
+
+        try:
+            rows = _stack_top_k_rows().collect().rows()
+        except BaseException as e:
+            # Catch-all: some libraries like Polars have bugs and raise
+            # BaseExceptions, which shouldn't crash the kernel. A single
+            # failing column fails the whole query, so retry one by one.
+            LOGGER.debug("Failed to get value counts in one query: %s", e)
+            top_k_rows.update(super().calculate_top_k_rows_batch(batched, k))
+            return top_k_rows
+
+        for column in batched:
+            top_k_rows[column] = []
+        for index, value, count in rows:
+            value = unwrap_py_scalar(value)
+            # NaN is pandas' missing value sentinel for strings
+            if isinstance(value, float) and math.isnan(value):
+                value = None
+            top_k_rows[batched[int(unwrap_py_scalar(index))]].append(
+                (value, int(unwrap_py_scalar(count)))
+            )
+        return {
+            column: top_k_rows[column]
+            for column in columns
+            if column in top_k_rows
+        }
+
     @staticmethod
     def is_type(value: Any) -> bool:
         return can_narwhalify(value)
@@ -382,7 +484,82 @@ class NarwhalsTableManager(
         return NarwhalsTableManager(filtered)
 
     def get_stats(self, column: str) -> ColumnStats:
-        stats = self._get_stats_internal(column)
+        return self._normalize_stats(self._get_stats_internal(column))
+
+    def get_stats_batch(
+        self, columns: list[ColumnName]
+    ) -> dict[ColumnName, ColumnStats]:
+        """Stats for each of `columns`, in a single `select`."""
+        exprs: dict[str, nw.Expr] = {}
+        units: dict[ColumnName, dict[str, str]] = {}
+        for index, column in enumerate(columns):
+            if column not in self.nw_schema:
+                continue
+            column_exprs, units[column] = self._stats_exprs(column)
+            # Each column's expressions get a unique prefix
+            for key, expr in column_exprs.items():
+                exprs[f"{index}_{key}"] = expr
+        if not exprs:
+            return {column: ColumnStats() for column in columns}
+
+        try:
+            stats_dict = self._collect_stats(exprs)
+        except BaseException as e:
+            # Catch-all: some libraries like Polars have bugs and raise
+            # BaseExceptions, which shouldn't crash the kernel. A single
+            # failing column fails the whole select, so retry one by one.
+            LOGGER.debug("Failed to get stats in one pass: %s", e)
+            return super().get_stats_batch(columns)
+
+        stats: dict[ColumnName, ColumnStats] = {}
+        for index, column in enumerate(columns):
+            if column not in units:
+                stats[column] = ColumnStats()
+                continue
+            prefix = f"{index}_"
+            stats[column] = self._normalize_stats(
+                self._to_column_stats(
+                    {
+                        key[len(prefix) :]: value
+                        for key, value in stats_dict.items()
+                        if key.startswith(prefix)
+                    },
+                    units[column],
+                )
+            )
+        return stats
+
+    def get_singleton_counts(
+        self, columns: list[ColumnName]
+    ) -> dict[ColumnName, int]:
+        frame = self.as_frame()
+        columns = [column for column in columns if column in self.nw_schema]
+
+        def count(columns: list[ColumnName]) -> dict[ColumnName, int]:
+            row = frame.select(
+                *(nw.col(column).is_unique().sum() for column in columns)
+            ).row(0)
+            return {
+                column: int(unwrap_py_scalar(value))
+                for column, value in zip(columns, row, strict=True)
+            }
+
+        try:
+            return count(columns)
+        except BaseException:
+            # Catch-all: retry one by one, leaving out failing columns
+            counts: dict[ColumnName, int] = {}
+            for column in columns:
+                try:
+                    counts.update(count([column]))
+                except BaseException as e:
+                    LOGGER.debug(
+                        "Failed to count singletons in %s: %s", column, e
+                    )
+            return counts
+
+    @staticmethod
+    def _normalize_stats(stats: ColumnStats) -> ColumnStats:
         import warnings
 
         with warnings.catch_warnings():
@@ -405,6 +582,14 @@ class NarwhalsTableManager(
         if column not in self.nw_schema:
             return ColumnStats()
 
+        exprs, units = self._stats_exprs(column)
+        return self._to_column_stats(self._collect_stats(exprs), units)
+
+    def _stats_exprs(
+        self, column: str
+    ) -> tuple[dict[str, nw.Expr], dict[str, str]]:
+        """The expressions computing `column`'s stats, by stat name, and
+        the units to label stats with."""
         frame = self.data.lazy()
         col = nw.col(column)
         dtype = self.nw_schema[column]
@@ -537,17 +722,24 @@ class NarwhalsTableManager(
                     }
                 )
 
+        return exprs, units
+
+    def _collect_stats(self, exprs: dict[str, nw.Expr]) -> dict[str, Any]:
         import warnings
 
-        stats = frame.select(**exprs)
+        stats = self.data.lazy().select(**exprs)
         with warnings.catch_warnings():
             warnings.filterwarnings(
                 "ignore",
                 message="Mean of empty slice|Degrees of freedom",
                 category=RuntimeWarning,
             )
-            stats_dict = stats.collect().rows(named=True)[0]
+            return stats.collect().rows(named=True)[0]
 
+    @staticmethod
+    def _to_column_stats(
+        stats_dict: dict[str, Any], units: dict[str, str]
+    ) -> ColumnStats:
         # Maybe add units to the stats
         for key, value in stats_dict.items():
             if key in units:
@@ -560,17 +752,10 @@ class NarwhalsTableManager(
         return ColumnStats(**stats_dict)
 
     def get_bin_values(self, column: str, num_bins: int) -> list[BinValue]:
-        if column not in self.nw_schema:
-            LOGGER.error(f"Column {column} not found in schema")
+        dtype = self._get_bin_dtype(column)
+        if dtype is None:
             return []
 
-        dtype = self.nw_schema[column]
-
-        # Some backends (e.g. DuckDB) report Unknown for types like Time
-        # until the data is collected. Resolve by checking the collected schema.
-        if dtype == nw.Unknown:
-            dtype = self.as_frame().schema[column]
-
         if dtype.is_temporal():
             return self._get_bin_values_temporal(column, dtype, num_bins)
 
@@ -605,6 +790,163 @@ class NarwhalsTableManager(
             bin_start = bin_end
         return bin_values
 
+    def get_bin_values_batch(
+        self, columns: list[ColumnName], num_bins: int
+    ) -> dict[ColumnName, list[BinValue]]:
+        """Bin values for each of `columns`, in two `select`s: one for the
+        range of each column, and one counting the values up to each bin
+        edge. The bins match those of `get_bin_values`."""
+        values: dict[ColumnName, nw.Expr] = {}
+        dtypes: dict[ColumnName, Any] = {}
+        bin_values: dict[ColumnName, list[BinValue]] = {}
+        for column in columns:
+            dtype = self._get_bin_dtype(column)
+            if dtype is None or not (
+                dtype.is_numeric() or dtype.is_temporal()
+            ):
+                bin_values[column] = []
+            elif dtype != nw.Duration and num_bins > 0:
+                values[column] = self._bin_values_expr(column, dtype)
+                dtypes[column] = dtype
+        try:
+            if values:
+                bin_values.update(
+                    self._collect_bin_values(values, dtypes, num_bins)
+                )
+        except BaseException as e:
+            # Catch-all: some libraries like Polars have bugs and raise
+            # BaseExceptions, which shouldn't crash the kernel. A single
+            # failing column fails the whole select, so retry one by one.
+            LOGGER.debug("Failed to get bin values in one pass: %s", e)
+
+        # Durations, empty columns, and failed selects are binned one by one
+        bin_values.update(
+            super().get_bin_values_batch(
+                [column for column in columns if column not in bin_values],
+                num_bins,
+            )
+        )
+        return {
+            column: bin_values[column]
+            for column in columns
+            if column in bin_values
+        }
+
+    def _get_bin_dtype(self, column: str) -> Any:
+        """The dtype to bin `column` by, or None if it doesn't exist."""
+        if column not in self.nw_schema:
+            LOGGER.error(f"Column {column} not found in schema")
+            return None
+
+        dtype = self.nw_schema[column]
+
+        # Some backends (e.g. DuckDB) report Unknown for types like Time
+        # until the data is collected. Resolve by checking the collected schema.
+        if dtype == nw.Unknown:
+            dtype = self.as_frame().schema[column]
+        return dtype
+
+    @staticmethod
+    def _bin_values_expr(column: str, dtype: Any) -> nw.Expr:
+        """`column` as the numbers that `get_bin_values` bins it by."""
+        col = nw.col(column)
+        if dtype == nw.Time:
+            # Convert to timestamp in ms
+            return (
+                col.dt.hour().cast(nw.Int64) * 3600000
+                + col.dt.minute().cast(nw.Int64) * 60000
+                + col.dt.second().cast(nw.Int64) * 1000
+                + col.dt.microsecond().cast(nw.Int64) // 1000
+            )
+        if dtype.is_temporal():
+            return col.dt.timestamp(time_unit="ms")
+        if dtype.is_decimal():
+            return col.cast(nw.Float64)
+        return col
+
+    def _collect_bin_values(
+        self,
+        values: dict[ColumnName, nw.Expr],
+        dtypes: dict[ColumnName, Any],
+        num_bins: int,
+    ) -> dict[ColumnName, list[BinValue]]:
+        """Bin values of the columns in `values`, leaving out those without
+        any values."""
+        ranges = self._collect_stats(
+            {
+                f"{index}_{key}": expr
+                for index, column in enumerate(values)
+                for key, expr in (
+                    ("min", values[column].min()),
+                    ("max", values[column].max()),
+                    ("start", nw.col(column).min()),
+                )
+            }
+        )
+
+        # Like `Series.hist`, split each range into evenly spaced bins,
+        # widening it when it's a single value
+        edges: dict[ColumnName, list[float]] = {}
+        for index, column in enumerate(values):
+            lower = unwrap_py_scalar(ranges[f"{index}_min"])
+            upper = unwrap_py_scalar(ranges[f"{index}_max"])
+            if lower is None or upper is None:
+                continue
+            lower, upper = float(lower), float(upper)
+            if lower == upper:
+                lower -= 0.5
+                upper += 0.5
+            width = (upper - lower) / num_bins
+            edges[column] = [lower + i * width for i in range(1, num_bins)]
+            edges[column].append(upper)
+        if not edges:
+            return {}
+
+        # Bins are closed on the right, so each bin's count is the number
+        # of values up to its end less those up to its start
+        cumulative_counts = self._collect_stats(
+            {
+                f"{index}_{bin_index}": (values[column] <= edge).sum()
+                for index, column in enumerate(values)
+                if column in edges
+                for bin_index, edge in enumerate(edges[column])
+            }
+        )
+
+        bin_values: dict[ColumnName, list[BinValue]] = {}
+        for index, column in enumerate(values):
+            if column not in edges:
+                continue
+            dtype = dtypes[column]
+            bin_start = unwrap_py_scalar(ranges[f"{index}_start"])
+            if dtype.is_decimal():
+                bin_start = float(bin_start)
+            bin_values[column] = []
+            previous = 0
+            for bin_index, edge in enumerate(edges[column]):
+                cumulative = int(
+                    unwrap_py_scalar(cumulative_counts[f"{index}_{bin_index}"])
+                )
+                count, previous = cumulative - previous, cumulative
+                if not dtype.is_temporal():
+                    bin_values[column].append(
+                        BinValue(
+                            bin_start=bin_start, bin_end=edge, count=count
+                        )
+                    )
+                    bin_start = edge
+                    continue
+                bin_end = self._to_temporal_bin_end(edge, dtype)
+                # Only append if the count is greater than 0
+                if count > 0:
+                    bin_values[column].append(
+                        BinValue(
+                            bin_start=bin_start, bin_end=bin_end, count=count
+                        )
+                    )
+                bin_start = bin_end
+        return bin_values
+
     def _get_bin_values_temporal(
         self, column: str, dtype: Any, num_bins: int
     ) -> list[BinValue]:
@@ -638,50 +980,11 @@ class NarwhalsTableManager(
             hist = col_in_ms.hist(bin_count=num_bins)
 
         bin_values = []
-        ms_time = 1000
 
         bin_start = col.min()
 
         for bin_end, count in hist.iter_rows(named=False):
-            if dtype == nw.Time:
-                hours = bin_end // 3600000
-                minutes = (bin_end % 3600000) // 60000
-                seconds = (bin_end % 60000) // 1000
-                microseconds = (bin_end % 1000) * 1000
-                bin_end = datetime.time(
-                    int(hours), int(minutes), int(seconds), int(microseconds)
-                )
-            elif dtype == nw.Date:
-                # Use timedelta to handle dates before Unix epoch (1970)
-                # which cause OSError on Windows with fromtimestamp
-                try:
-                    bin_end = datetime.date.fromtimestamp(bin_end / ms_time)
-                except (OSError, OverflowError, ValueError):
-                    # Fall back to timedelta calculation for old dates
-                    epoch = datetime.datetime(
-                        1970, 1, 1, tzinfo=datetime.timezone.utc
-                    )
-                    bin_end_dt = epoch + datetime.timedelta(
-                        seconds=bin_end / ms_time
-                    )
-                    bin_end = bin_end_dt.date()
-            else:
-                # Use timedelta to handle datetimes before Unix epoch (1970)
-                # which cause OSError on Windows with fromtimestamp
-                try:
-                    bin_end = datetime.datetime.fromtimestamp(
-                        bin_end / ms_time
-                    )
-                except (OSError, OverflowError, ValueError):
-                    # Fall back to timedelta calculation for old dates
-                    epoch = datetime.datetime(
-                        1970, 1, 1, tzinfo=datetime.timezone.utc
-                    )
-                    bin_end = epoch + datetime.timedelta(
-                        seconds=bin_end / ms_time
-                    )
-                    # Remove timezone to match fromtimestamp behavior
-                    bin_end = bin_end.replace(tzinfo=None)
+            bin_end = self._to_temporal_bin_end(bin_end, dtype)
 
             # Only append if the count is greater than 0
             if count > 0:
@@ -691,12 +994,76 @@ class NarwhalsTableManager(
             bin_start = bin_end
         return bin_values
 
+    @staticmethod
+    def _to_temporal_bin_end(bin_end: Any, dtype: Any) -> Any:
+        """Convert a bin edge in ms back to a value of the temporal `dtype`."""
+        ms_time = 1000
+        if dtype == nw.Time:
+            hours = bin_end // 3600000
+            minutes = (bin_end % 3600000) // 60000
+            seconds = (bin_end % 60000) // 1000
+            microseconds = (bin_end % 1000) * 1000
+            return datetime.time(
+                int(hours), int(minutes), int(seconds), int(microseconds)
+            )
+        elif dtype == nw.Date:
+            # Use timedelta to handle dates before Unix epoch (1970)
+            # which cause OSError on Windows with fromtimestamp
+            try:
+                return datetime.date.fromtimestamp(bin_end / ms_time)
+            except (OSError, OverflowError, ValueError):
+                # Fall back to timedelta calculation for old dates
+                epoch = datetime.datetime(
+                    1970, 1, 1, tzinfo=datetime.timezone.utc
+                )
+                bin_end_dt = epoch + datetime.timedelta(
+                    seconds=bin_end / ms_time
+                )
+                return bin_end_dt.date()
+        else:
+            # Use timedelta to handle datetimes before Unix epoch (1970)
+            # which cause OSError on Windows with fromtimestamp
+            try:
+                return datetime.datetime.fromtimestamp(bin_end / ms_time)
+            except (OSError, OverflowError, ValueError):
+                # Fall back to timedelta calculation for old dates
+                epoch = datetime.datetime(
+                    1970, 1, 1, tzinfo=datetime.timezone.utc
+                )
+                bin_end = epoch + datetime.timedelta(seconds=bin_end / ms_time)
+                # Remove timezone to match fromtimestamp behavior
+                return bin_end.replace(tzinfo=None)
+
     def _sample_indexes(self, size: int, total: int) -> list[int]:
         """Sample evenly from a list of length `total`"""
         if total <= size:
             return list(range(total))
         return [round(i * (total - 1) / (size - 1)) for i in range(size)]
 
+    def sample_rows(
+        self, size: int
+    ) -> TableManager[IntoDataFrameT | IntoLazyFrameT] | None:
+        # An evenly spaced sample is stratified: one row from each of
+        # `size` equal runs of rows, so it covers sorted data evenly.
+        if (
+            is_narwhals_lazyframe(self.data)
+            and "_collected_frame" not in self.__dict__
+        ):
+            # Only collect the sample, not the whole table
+            total = self.data.select(nw.len()).collect().item()
+            if total <= size:
+                return self
+            try:
+                sample = self.data.gather_every(math.ceil(total / size))
+                return self.with_new_data(sample.collect())
+            except NotImplementedError:
+                # Not every lazy backend can take every nth row
+                return None
+        frame = self.as_frame()
+        return self.with_new_data(
+            frame[self._sample_indexes(size, frame.shape[0])]
+        )
+
     def get_num_rows(self, force: bool = True) -> int | None:
         # If force is true, collect the data and get the number of rows
         if force:
@@ -803,6 +1170,61 @@ class NarwhalsTableManager(
             self.data.sort(columns, descending=descending, nulls_last=True)
         )
 
+    def sort_permutation(
+        self,
+        by: list[SortArgs],
+        presorted: Any | None = None,
+        prefix: int = 0,
+    ) -> Any | None:
+        if not by or is_narwhals_lazyframe(self.data):
+            return None
+
+        columns = [sort_arg.by for sort_arg in by]
+        descending = [sort_arg.descending for sort_arg in by]
+        # Only the sort keys are materialized, never the full rows.
+        frame = self.data.select(columns)
+        if presorted is not None and 0 < prefix < len(by):
+            # Rows are already ordered by the prefix keys, so replace those
+            # keys with the id of each run of equal values and sort by
+            # (run, remaining keys); comparing one integer is much cheaper
+            # than comparing the (possibly string) prefix columns again.
+            frame = frame[presorted].with_columns(
+                nw.any_horizontal(
+                    *(
+                        _value_changed(col, frame.schema[col].is_float())
+                        for col in columns[:prefix]
+                    ),
+                    ignore_nulls=True,
+                )
+                .cast(nw.Int64)
+                .cum_sum()
+                .alias(_SORT_RUN_COLUMN)
+            )
+            columns = [_SORT_RUN_COLUMN, *columns[prefix:]]
+            descending = [False, *descending[prefix:]]
+        positions = (
+            frame.with_row_index(_SORT_POSITION_COLUMN)
+            .sort(columns, descending=descending, nulls_last=True)
+            .get_column(_SORT_POSITION_COLUMN)
+        )
+        if presorted is not None and 0 < prefix < len(by):
+            positions = presorted[positions]
+        # Positions are stored, so keep them compact.
+        if len(positions) < 2**32:
+            return positions.cast(nw.UInt32)
+        return positions
+
+    def gather_rows(self, positions: Any) -> TableManager[Any]:
+        return self.with_new_data(self.as_frame()[positions])
+
+    def estimated_nbytes(self) -> int | None:
+        if is_narwhals_lazyframe(self.data):
+            return None
+        try:
+            return int(self.data.estimated_size())
+        except Exception:
+            return None
+
     def __repr__(self) -> str:
         rows = self.get_num_rows(force=False)
         columns = self.get_num_columns()
@@ -506,6 +506,13 @@ class PandasTableManagerFactory(TableManagerFactory):
                 index = self._original_data.index
                 return not _trivial_range_index(index)
 
+            def supports_search_index(self) -> bool:
+                # Search also looks at a non-trivial index
+                return (
+                    super().supports_search_index()
+                    and not self._has_non_trivial_index()
+                )
+
             def search(self, query: str) -> PandasTableManager:
                 # If there's a non-trivial index, include it in the search
                 # by resetting the index first
@@ -0,0 +1,215 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Trigram index for searching large tables.
+
+`TableManager.search` stringifies every searchable column and scans every
+row for the query. For large tables, `mo.ui.table(..., search_index=True)`
+instead builds a `TrigramSearchIndex` on its first search: for each
+column, the distinct values as strings, and for each trigram, the values
+that contain it.
+
+A query resolves the values that contain it from the index (verified
+with a substring check), and so the candidate rows: those holding one of
+them. The backend's own `search` then runs over the candidates only, so
+results are exactly what a full scan would return.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import narwhals.stable.v2 as nw
+
+from marimo import _loggers
+from marimo._plugins.ui._impl.tables.narwhals_table import (
+    NarwhalsTableManager,
+)
+from marimo._plugins.ui._impl.tables.selection import INDEX_COLUMN_NAME
+from marimo._utils.narwhals_utils import (
+    is_narwhals_string_type,
+    is_narwhals_temporal_type,
+)
+
+if TYPE_CHECKING:
+    from marimo._plugins.ui._impl.tables.table_manager import (
+        ColumnName,
+        TableManager,
+    )
+
+LOGGER = _loggers.marimo_logger()
+
+# Smaller tables are scanned quickly enough
+SEARCH_INDEX_MIN_ROWS = 100_000
+# Distinct values indexed per table; columns beyond it are scanned
+MAX_INDEXED_VALUES = 500_000
+# Matches kept for recent queries, to narrow queries they are a prefix of
+MAX_CACHED_QUERIES = 32
+
+# Backends search with a regex; only literal queries can use the index
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+
+
+def _trigrams(value: str) -> set[str]:
+    return {value[i : i + 3] for i in range(len(value) - 2)}
+
+
+class _ColumnIndex:
+    """The distinct values of a column, as strings, by trigram."""
+
+    def __init__(self, values: list[str]) -> None:
+        self.values = values
+        self.lowered = [value.lower() for value in values]
+        postings: dict[str, list[int]] = {}
+        for i, value in enumerate(self.lowered):
+            for trigram in _trigrams(value):
+                postings.setdefault(trigram, []).append(i)
+        self.postings = {
+            trigram: array("I", ids) for trigram, ids in postings.items()
+        }
+
+    def candidates(self, query: str) -> set[int] | range:
+        """Ids of the values that may contain the lowercase `query`."""
+        trigrams = _trigrams(query)
+        if not trigrams:
+            return range(len(self.values))
+        ids = sorted(
+            (self.postings.get(trigram, array("I")) for trigram in trigrams),
+            key=len,
+        )
+        return set(ids[0]).intersection(*ids[1:])
+
+
+class TrigramSearchIndex:
+    """Trigram index over the values of a table's searchable columns.
+
+    Build one with `create`, which returns `None` for tables that are small
+    or can't be indexed; then use `search` in place of the table's own.
+    """
+
+    def __init__(self, manager: NarwhalsTableManager[Any, Any]) -> None:
+        self._columns: dict[ColumnName, _ColumnIndex] = {}
+        # Columns with too many distinct values to index
+        self._scanned: list[ColumnName] = []
+        self._matches: OrderedDict[str, dict[ColumnName, list[int]]] = (
+            OrderedDict()
+        )
+
+        frame = manager.as_frame()
+        budget = MAX_INDEXED_VALUES
+        for column, dtype in manager.nw_schema.items():
+            if column == INDEX_COLUMN_NAME or not self._is_indexable(
+                manager, column, dtype
+            ):
+                continue
+            values = (
+                frame.get_column(column)
+                .cast(nw.String)
+                .drop_nulls()
+                .unique()
+                .to_list()
+            )
+            if len(values) > budget:
+                self._scanned.append(column)
+                continue
+            budget -= len(values)
+            self._columns[column] = _ColumnIndex(values)
+
+    @staticmethod
+    def create(manager: TableManager[Any]) -> TrigramSearchIndex | None:
+        """Index `manager`'s data, or `None` if it isn't worth indexing or
+        can't be indexed."""
+        if not isinstance(manager, NarwhalsTableManager):
+            return None
+        if not manager.supports_search_index():
+            return None
+        if (manager.get_num_rows(force=False) or 0) < SEARCH_INDEX_MIN_ROWS:
+            return None
+        # The index must cover every column that search looks at
+        if any(
+            isinstance(dtype, nw.List) for dtype in manager.nw_schema.values()
+        ):
+            return None
+        try:
+            index = TrigramSearchIndex(manager)
+        except BaseException as e:
+            # Catch-all: some libraries like Polars have bugs and raise
+            # BaseExceptions, which shouldn't crash the kernel
+            LOGGER.warning("Failed to build search index: %s", e)
+            return None
+        if not index._columns:
+            return None
+        return index
+
+    @staticmethod
+    def _is_indexable(
+        manager: NarwhalsTableManager[Any, Any], column: str, dtype: Any
+    ) -> bool:
+        """Whether search looks at `column`, matching it as a string."""
+        if column in manager._geometry_columns:
+            return False
+        return (
+            is_narwhals_string_type(dtype)
+            or dtype.is_numeric()
+            or is_narwhals_temporal_type(dtype)
+            or dtype == nw.Boolean
+        )
+
+    def search(
+        self, manager: TableManager[Any], query: str
+    ) -> TableManager[Any] | None:
+        """Rows of `manager` (this index's data, or rows of it) that match
+        `query`, or `None` if the index can't answer the query."""
+        if not isinstance(manager, NarwhalsTableManager) or any(
+            char in _REGEX_SPECIAL for char in query
+        ):
+            return None
+        query = query.lower()
+
+        expressions = [
+            nw.col(column)
+            .cast(nw.String)
+            .is_in([self._columns[column].values[i] for i in ids])
+            for column, ids in self._find(query).items()
+            if ids
+        ]
+        expressions.extend(
+            nw.col(column).cast(nw.String).str.contains(f"(?i){query}")
+            for column in self._scanned
+        )
+        if not expressions:
+            return manager.with_new_data(manager.data.head(0))
+        candidates = manager.data.filter(
+            nw.any_horizontal(expressions, ignore_nulls=False)
+        )
+        # Verify the candidates with the backend's own search
+        return manager.with_new_data(candidates).search(query)
+
+    def _find(self, query: str) -> dict[ColumnName, list[int]]:
+        """Ids of the values that contain `query`, by column."""
+        matches = self._matches.get(query)
+        if matches is not None:
+            self._matches.move_to_end(query)
+            return matches
+
+        # Values matching a query also match its prefixes
+        prefix = max(
+            (cached for cached in self._matches if query.startswith(cached)),
+            key=len,
+            default=None,
+        )
+        matches = {}
+        for column, index in self._columns.items():
+            candidates = (
+                index.candidates(query)
+                if prefix is None
+                else self._matches[prefix][column]
+            )
+            matches[column] = [
+                i for i in sorted(candidates) if query in index.lowered[i]
+            ]
+
+        self._matches[query] = matches
+        while len(self._matches) > MAX_CACHED_QUERIES:
+            self._matches.popitem(last=False)
+        return matches
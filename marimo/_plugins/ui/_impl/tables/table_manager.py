@@ -12,6 +12,7 @@ from typing import (
     TypeVar,
 )
 
+from marimo import _loggers
 from marimo._data.models import (
     BinValue,
     ColumnStats,
@@ -25,6 +26,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+LOGGER = _loggers.marimo_logger()
+
 # Rows used when estimating the JSON-serialized size of the rendered data.
 # Bigger samples are more precise but cost more on the kernel control loop.
 SIZE_ESTIMATE_SAMPLE_ROWS = 100
@@ -67,6 +70,8 @@ class TableManager(abc.ABC, Generic[T]):
     # Upper limit for column summaries to avoid hanging up the kernel
     # Note: Keep this value in sync with DataTablePlugin's banner text
     DEFAULT_SUMMARY_STATS_ROW_LIMIT = 1_000_000
+    # Rows sampled for approximate column summaries of larger tables
+    DEFAULT_SUMMARY_SAMPLE_SIZE = 20_000
 
     type: str = ""
 
@@ -92,10 +97,46 @@ class TableManager(abc.ABC, Generic[T]):
     def supports_filters(self) -> bool:
         pass
 
+    def supports_search_index(self) -> bool:
+        """Whether `search` can be answered from a `TrigramSearchIndex`
+        over this data's columns."""
+        return False
+
     @abc.abstractmethod
     def sort_values(self, by: list[SortArgs]) -> TableManager[Any]:
         pass
 
+    def sort_permutation(
+        self,
+        by: list[SortArgs],
+        presorted: Any | None = None,
+        prefix: int = 0,
+    ) -> Any | None:
+        """Row positions that order the table like `sort_values(by)`.
+
+        `presorted` is an earlier permutation that already orders the table
+        by the first `prefix` keys of `by`; only its ties are re-sorted.
+        Returns `None` when the backend can't produce positions (e.g. lazy
+        frames), in which case callers fall back to `sort_values`.
+        """
+        del by, presorted, prefix
+        return None
+
+    def gather_rows(self, positions: Any) -> TableManager[Any]:
+        """Rows at `positions` (from `sort_permutation`), in that order."""
+        del positions
+        raise NotImplementedError("Gathering rows is not supported")
+
+    def sample_rows(self, size: int) -> TableManager[Any] | None:
+        """An evenly spaced sample of at most `size` rows, in order, or
+        None if the data can't be sampled."""
+        del size
+        return None
+
+    def estimated_nbytes(self) -> int | None:
+        """Estimated in-memory size of the data, if known."""
+        return None
+
     @abc.abstractmethod
     def to_csv_str(
         self,
@@ -233,12 +274,58 @@ class TableManager(abc.ABC, Generic[T]):
     def get_stats(self, column: str) -> ColumnStats:
         pass
 
+    def get_stats_batch(
+        self, columns: list[ColumnName]
+    ) -> dict[ColumnName, ColumnStats]:
+        """Stats for each of `columns`, leaving out those that fail.
+
+        Backends that can should override this to compute the stats of
+        all columns together, in one pass over the data.
+        """
+        stats: dict[ColumnName, ColumnStats] = {}
+        for column in columns:
+            try:
+                stats[column] = self.get_stats(column)
+            except BaseException:
+                # Catch-all: some libraries like Polars have bugs and raise
+                # BaseExceptions, which shouldn't crash the kernel
+                LOGGER.warning("Failed to get stats for column %s", column)
+        return stats
+
+    def get_singleton_counts(
+        self, columns: list[ColumnName]
+    ) -> dict[ColumnName, int]:
+        """The number of values that occur exactly once in each of
+        `columns`, leaving out those that can't be computed."""
+        del columns
+        return {}
+
     @abc.abstractmethod
     def get_bin_values(
         self, column: ColumnName, num_bins: int
     ) -> list[BinValue]:
         pass
 
+    def get_bin_values_batch(
+        self, columns: list[ColumnName], num_bins: int
+    ) -> dict[ColumnName, list[BinValue]]:
+        """Bin values for each of `columns`, leaving out those that fail.
+
+        Backends that can should override this to bin all columns
+        together, in a few passes over the data.
+        """
+        bin_values: dict[ColumnName, list[BinValue]] = {}
+        for column in columns:
+            try:
+                bin_values[column] = self.get_bin_values(column, num_bins)
+            except BaseException as e:
+                # Catch-all: some libraries like Polars have bugs and raise
+                # BaseExceptions, which shouldn't crash the kernel
+                LOGGER.warning(
+                    "Failed to get bin values for column %s: %s", column, e
+                )
+        return bin_values
+
     @abc.abstractmethod
     def get_num_rows(self, force: bool = True) -> int | None:
         # This can be expensive to compute,
@@ -267,6 +354,27 @@ class TableManager(abc.ABC, Generic[T]):
     ) -> list[tuple[Any, int]]:
         pass
 
+    def calculate_top_k_rows_batch(
+        self, columns: list[ColumnName], k: int
+    ) -> dict[ColumnName, list[tuple[Any, int]]]:
+        """The top `k` rows of each of `columns`, as `calculate_top_k_rows`
+        gives them, leaving out columns that fail.
+
+        Backends that can should override this to count the values of all
+        columns together, in one query.
+        """
+        top_k_rows: dict[ColumnName, list[tuple[Any, int]]] = {}
+        for column in columns:
+            try:
+                top_k_rows[column] = self.calculate_top_k_rows(column, k)
+            except BaseException as e:
+                # Catch-all: some libraries like Polars have bugs and raise
+                # BaseExceptions, which shouldn't crash the kernel
+                LOGGER.warning(
+                    "Failed to get value counts for column %s: %s", column, e
+                )
+        return top_k_rows
+
     def __repr__(self) -> str:
         rows = self.get_num_rows(force=False)
         columns = self.get_num_columns()
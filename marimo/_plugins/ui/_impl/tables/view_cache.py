@@ -0,0 +1,143 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from marimo._plugins.ui._impl.table import SortArgs
+    from marimo._plugins.ui._impl.tables.table_manager import TableManager
+
+LOGGER = _loggers.marimo_logger()
+
+# Per-table budget for cached views and sort permutations.
+DEFAULT_VIEW_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class TableViewCache:
+    """Byte-bounded LRU of the views a table has served.
+
+    Holds two kinds of entries, keyed by the request that produced them:
+
+    - the filtered/searched view for a `(filters, query)` pair, and
+    - a sort permutation (row positions into that view) for a
+      `(filters, query, sort)` triple.
+
+    Permutations are a few bytes per row, so flipping between sort orders
+    or toggling a filter costs a gather rather than a filter and a sort,
+    and a request that only appends a sort key starts from the permutation
+    of its prefix. The view most recently served is also held outside the
+    budget, so paging through it costs nothing.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_VIEW_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._current: tuple[Hashable, TableManager[Any]] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_view(
+        self, filters: Any, query: str | None
+    ) -> TableManager[Any] | None:
+        return self._get(("view", filters, query))  # type: ignore[no-any-return]
+
+    def put_view(
+        self, filters: Any, query: str | None, view: TableManager[Any]
+    ) -> None:
+        nbytes = view.estimated_nbytes()
+        if nbytes is None:
+            nbytes = sys.getsizeof(view.data)
+        self._put(("view", filters, query), view, nbytes)
+
+    def get_permutation(
+        self, filters: Any, query: str | None, sort: list[SortArgs]
+    ) -> Any | None:
+        return self._get(("sort", filters, query, tuple(sort)))
+
+    def put_permutation(
+        self,
+        filters: Any,
+        query: str | None,
+        sort: list[SortArgs],
+        positions: Any,
+    ) -> None:
+        dtype = getattr(positions, "dtype", None)
+        itemsize = 4 if str(dtype) == "UInt32" else 8
+        self._put(
+            ("sort", filters, query, tuple(sort)),
+            positions,
+            len(positions) * itemsize,
+        )
+
+    def longest_prefix(
+        self, filters: Any, query: str | None, sort: list[SortArgs]
+    ) -> tuple[Any | None, int]:
+        """The cached permutation for the longest proper prefix of `sort`,
+        and that prefix's length; `(None, 0)` when there is none."""
+        for length in range(len(sort) - 1, 0, -1):
+            key = ("sort", filters, query, tuple(sort[:length]))
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0], length
+        return None, 0
+
+    def get_current(self, key: Hashable) -> TableManager[Any] | None:
+        if self._current is not None and self._current[0] == key:
+            return self._current[1]
+        return None
+
+    def set_current(self, key: Hashable, view: TableManager[Any]) -> None:
+        self._current = (key, view)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+        self._current = None
+
+    def _get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        LOGGER.debug(
+            "Table view cache %s for %s: %d hits, %d misses (%.0f%% hit "
+            "rate), %d entries, %d bytes",
+            "hit" if entry is not None else "miss",
+            key[0],  # type: ignore[index]
+            self.hits,
+            self.misses,
+            100 * self.hits / (self.hits + self.misses),
+            len(self._entries),
+            self._nbytes,
+        )
+        return entry[0] if entry is not None else None
+
+    def _put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        if nbytes > self.max_bytes:
+            # Would evict everything else and still not fit.
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._nbytes -= previous[1]
+        self._entries[key] = (value, nbytes)
+        self._nbytes += nbytes
+        while self._nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._nbytes -= evicted
@@ -62,11 +62,12 @@ class AppScriptRunner:
             excluded=CellId_t(SETUP_CELL_NAME),
         )
 
+        disabled = self.app.graph.flagged_mask("disabled")
         cells_to_run = [
             cid
             for cid in pruned_execution_order
             if app.cell_manager.cell_data_at(cid).cell is not None
-            and not self.app.graph.is_disabled(cid)
+            and not self.app.graph.is_disabled(cid, disabled)
         ]
 
         self._scheduler = SequentialScheduler(cells_to_run, self.app.graph)
@@ -80,10 +80,10 @@ class CacheCallbacks:
 
         for obj in self._scope.globals.values():
             if isinstance(obj, CacheContext):
-                hits, misses, _, _, time = obj.cache_info()
-                total_hits += hits
-                total_misses += misses
-                total_time += time
+                info = obj.cache_info()
+                total_hits += info.hits
+                total_misses += info.misses
+                total_time += info.time_saved
                 # d2f, dt = obj.loader.disk_usage()
         broadcast_notification(
             CacheInfoNotification(
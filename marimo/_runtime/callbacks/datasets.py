@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from marimo import _loggers
 from marimo._data.data_source_discovery import discover_data_sources
+from marimo._data.dataset_broadcaster import DatasetBroadcaster
 from marimo._data.preview_column import (
     get_column_preview_for_dataframe,
     get_column_preview_for_duckdb,
@@ -36,7 +37,13 @@ from marimo._types.ids import VariableName
 from marimo._utils.assert_never import assert_never
 
 if TYPE_CHECKING:
+    from marimo._ast.cell import CellImpl
     from marimo._runtime.request_router import RequestRouter
+    from marimo._runtime.runner import cell_runner
+    from marimo._runtime.runner.hook_context import (
+        PostExecutionHookContext,
+        PreExecutionHookContext,
+    )
     from marimo._runtime.runtime import Kernel
 
 LOGGER = _loggers.marimo_logger()
@@ -45,6 +52,8 @@ LOGGER = _loggers.marimo_logger()
 class DatasetCallbacks:
     def __init__(self, kernel: Kernel):
         self._kernel = kernel
+        # Profiles the dataframes cells define off the run's critical path.
+        self.broadcaster = DatasetBroadcaster()
 
     def register(self, router: RequestRouter) -> None:
         router.register(
@@ -59,6 +68,37 @@ class DatasetCallbacks:
         )
         router.register(DiscoverDataSourcesCommand, self.discover_data_sources)
 
+    def teardown(self) -> None:
+        self.broadcaster.shutdown()
+
+    def cancel_datasets(
+        self, cell: CellImpl, ctx: PreExecutionHookContext
+    ) -> None:
+        """Pre-execution hook: the cell is about to redefine its variables,
+        so don't profile their old values."""
+        del ctx
+        self.broadcaster.cancel(cell.defs)
+
+    def broadcast_datasets(
+        self,
+        cell: CellImpl,
+        ctx: PostExecutionHookContext,
+        run_result: cell_runner.RunResult,
+    ) -> None:
+        """Post-execution hook: profile and broadcast the dataframes the
+        cell defined, in the background."""
+        del run_result
+        if not ctx.should_broadcast_data:
+            return
+        self.broadcaster.submit(
+            [
+                (VariableName(variable), ctx.glbls[variable])
+                for variable in cell.defs
+                if variable in ctx.glbls
+            ],
+            stream=self._kernel.stream,
+        )
+
     async def discover_data_sources(
         self, request: DiscoverDataSourcesCommand
     ) -> None:
@@ -39,6 +39,9 @@ def transitive_closure(
     If predicate, only cells satisfying predicate(cell) are included; applied
         after the relatives are computed
     """
+    if relatives is None and predicate is None:
+        # Plain reachability is answered by the graph's closure index.
+        return graph.closure(cell_ids, children=children, inclusive=inclusive)
 
     result: set[CellId_t] = cell_ids.copy() if inclusive else set()
     seen: set[CellId_t] = cell_ids.copy()
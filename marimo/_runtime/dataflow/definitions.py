@@ -41,6 +41,21 @@ class DefinitionRegistry:
     )
     conflict_names: dict[tuple[str, str], Name] = field(default_factory=dict)
 
+    def copy_from(self, other: DefinitionRegistry) -> None:
+        """Replace this registry's contents with a copy of `other`'s."""
+        self.definitions = {
+            name: set(cell_ids) for name, cell_ids in other.definitions.items()
+        }
+        self.typed_definitions = {
+            key: set(cell_ids)
+            for key, cell_ids in other.typed_definitions.items()
+        }
+        self.definition_conflicts = {
+            key: set(cell_ids)
+            for key, cell_ids in other.definition_conflicts.items()
+        }
+        self.conflict_names = dict(other.conflict_names)
+
     def _conflict_key(
         self, name: Name, variable: VariableData
     ) -> tuple[str, str]:
@@ -19,7 +19,7 @@ from marimo._runtime.dataflow.topology import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Callable, Iterable, Mapping
 
     from marimo._ast.cell import CellImpl
     from marimo._ast.visitor import ImportData, Name, VariableData
@@ -27,6 +27,17 @@ if TYPE_CHECKING:
 
 LOGGER = _loggers.marimo_logger()
 
+# Cell flags that carry over to descendants
+CellFlag = Literal["stale", "disabled", "errored"]
+
+_FLAG_PREDICATES: dict[CellFlag, Callable[[CellImpl], bool]] = {
+    "stale": lambda cell: cell.stale,
+    "disabled": lambda cell: cell.config.disabled,
+    "errored": lambda cell: (
+        cell.run_result_status in ("exception", "marimo-error")
+    ),
+}
+
 
 @dataclass(frozen=True)
 class DirectedGraph(GraphTopology):
@@ -138,25 +149,50 @@ class DirectedGraph(GraphTopology):
         if self.is_any_ancestor_disabled(cell_id):
             cell.set_runtime_state(status="disabled-transitively")
 
-    def is_any_ancestor_stale(self, cell_id: CellId_t) -> bool:
-        """Check if any ancestor of a cell is stale."""
-        return any(
-            self.topology.cells[cid].stale for cid in self.ancestors(cell_id)
+    def flagged_mask(self, flag: CellFlag) -> int:
+        """Bitset of the cells with `flag` set.
+
+        The `is_any_ancestor_*` and `is_disabled` checks otherwise look at
+        every cell's flag; callers checking many cells compute this once
+        and pass it in. It is only valid until cells' flags, or the
+        graph's cells, next change.
+        """
+        predicate = _FLAG_PREDICATES[flag]
+        return self.topology.mask(
+            cid for cid, cell in self.topology.cells.items() if predicate(cell)
         )
 
-    def is_any_ancestor_disabled(self, cell_id: CellId_t) -> bool:
+    def is_any_ancestor_stale(
+        self, cell_id: CellId_t, flagged: int | None = None
+    ) -> bool:
+        """Check if any ancestor of a cell is stale."""
+        return self._is_any_ancestor(cell_id, "stale", flagged)
+
+    def is_any_ancestor_disabled(
+        self, cell_id: CellId_t, flagged: int | None = None
+    ) -> bool:
         """Check if any ancestor of a cell is disabled."""
-        return any(
-            self.topology.cells[cid].config.disabled
-            for cid in self.ancestors(cell_id)
-        )
+        return self._is_any_ancestor(cell_id, "disabled", flagged)
 
-    def is_any_ancestor_errored(self, cell_id: CellId_t) -> bool:
+    def is_any_ancestor_errored(
+        self, cell_id: CellId_t, flagged: int | None = None
+    ) -> bool:
         """Check if any ancestor of a cell has an error."""
+        return self._is_any_ancestor(cell_id, "errored", flagged)
+
+    def _is_any_ancestor(
+        self, cell_id: CellId_t, flag: CellFlag, flagged: int | None
+    ) -> bool:
+        if flagged is not None:
+            return self.topology.is_mask_reachable(
+                cell_id, flagged, children=False
+            )
+        # A single check only needs to look at the cell's ancestors, which
+        # the closure index enumerates without walking the graph.
+        predicate = _FLAG_PREDICATES[flag]
+        cells = self.topology.cells
         return any(
-            self.topology.cells[cid].run_result_status
-            in ("exception", "marimo-error")
-            for cid in self.ancestors(cell_id)
+            predicate(cells[cid]) for cid in self.topology.ancestors(cell_id)
         )
 
     def disable_cell(self, cell_id: CellId_t) -> None:
@@ -189,8 +225,9 @@ class DirectedGraph(GraphTopology):
         from marimo._runtime.dataflow import transitive_closure
 
         cells_to_run: set[CellId_t] = set()
+        disabled = self.flagged_mask("disabled")
         for cid in transitive_closure(self, {cell_id}):
-            if not self.is_disabled(cid):
+            if not self.is_disabled(cid, disabled):
                 child = self.topology.cells[cid]
                 if child.stale:
                     # cell was previously disabled, is no longer
@@ -238,26 +275,20 @@ class DirectedGraph(GraphTopology):
         LOGGER.debug("Deleted cell %s and Released graph lock.", cell_id)
         return children
 
-    def is_disabled(self, cell_id: CellId_t) -> bool:
-        """Check if a cell is disabled (directly or transitively)."""
+    def is_disabled(
+        self, cell_id: CellId_t, disabled: int | None = None
+    ) -> bool:
+        """Check if a cell is disabled (directly or transitively).
+
+        `disabled`, from `flagged_mask("disabled")`, saves looking at every
+        cell's config when checking many cells.
+        """
         if cell_id not in self.topology.cells:
             raise ValueError(f"Cell {cell_id} not in graph.")
         cell = self.topology.cells[cell_id]
         if cell.config.disabled:
             return True
-        seen: set[CellId_t] = set()
-        queue = [cell_id]
-        while queue:
-            cid = queue.pop()
-            seen.add(cid)
-            for parent_id in self.topology.parents[cid]:
-                if parent_id in seen:
-                    continue
-                elif self.topology.cells[parent_id].config.disabled:
-                    return True
-                else:
-                    queue.append(parent_id)
-        return False
+        return self.is_any_ancestor_disabled(cell_id, disabled)
 
     def get_imports(
         self, cell_id: CellId_t | None = None
@@ -400,6 +431,28 @@ class DirectedGraph(GraphTopology):
                 graph.register_cell(cid, cell)
         return graph
 
+    def fork(self, into: DirectedGraph | None = None) -> DirectedGraph:
+        """Return a copy of the graph that shares its cells' compiled code.
+
+        Unlike `copy`, nothing is recompiled or recomputed: each cell is
+        forked (see `CellImpl.fork`), so the copy starts with fresh runtime
+        state, and the edges, definitions and cycles are copied as is.
+
+        If `into` is given, that graph, which must be empty, is populated
+        in place and returned.
+        """
+        graph = DirectedGraph() if into is None else into
+        with self.lock:
+            cells = {cid: cell.fork() for cid, cell in self.cells.items()}
+            with graph.lock:
+                assert not graph.topology.cells, (
+                    "Can only fork into an empty graph"
+                )
+                graph.topology.copy_from(self.topology, cells)
+                graph.definition_registry.copy_from(self.definition_registry)
+                graph.cycle_tracker.cycles = set(self.cycle_tracker.cycles)
+        return graph
+
     @property
     def cells(self) -> Mapping[CellId_t, CellImpl]:
         """Get the cells dictionary."""
@@ -429,6 +482,18 @@ class DirectedGraph(GraphTopology):
         """Get all ancestors of a cell."""
         return self.topology.ancestors(cell_id)
 
+    def closure(
+        self,
+        cell_ids: Iterable[CellId_t],
+        *,
+        children: bool,
+        inclusive: bool,
+    ) -> set[CellId_t]:
+        """Get the cells reachable from `cell_ids`."""
+        return self.topology.closure(
+            cell_ids, children=children, inclusive=inclusive
+        )
+
     @property
     def definitions(self) -> Mapping[Name, set[CellId_t]]:
         """Get the definitions dictionary."""
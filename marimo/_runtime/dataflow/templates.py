@@ -0,0 +1,90 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Graphs shared between kernels that run the same notebook.
+
+Registering a notebook's cells compiles each one and computes its edges
+against every cell registered before it. In `marimo run`, every session
+has its own kernel and so repeats this for the same file. Instead, the
+first kernel to register a notebook's cells stores the resulting graph
+as a template, and later kernels fork it (see `DirectedGraph.fork`):
+compiled code is shared, and only the edges and runtime state are
+copied.
+
+Templates are keyed by the notebook file's path, size and modification
+time, and by the exact ids and code of its cells: compiled code embeds
+line numbers from the file, so any edit to it gets a new template.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from marimo._runtime.dataflow.graph import DirectedGraph
+    from marimo._types.ids import CellId_t
+
+# Enough for the notebooks served by one `marimo run`, plus a few
+# versions of each under `--watch`.
+MAX_TEMPLATES = 32
+
+
+def template_key(
+    filename: str, cells: Iterable[tuple[CellId_t, str]]
+) -> Hashable | None:
+    """Key for the graph of `cells` (ids and code, in registration order)
+    compiled against the current version of `filename`, or `None` if the
+    file can't be read."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return (filename, stat.st_size, stat.st_mtime_ns, tuple(cells))
+
+
+class GraphTemplates:
+    """A bounded, thread-safe LRU cache of template graphs.
+
+    Templates are never run or mutated; they are only forked.
+    """
+
+    def __init__(self, maxsize: int = MAX_TEMPLATES) -> None:
+        self.maxsize = maxsize
+        self._templates: OrderedDict[Hashable, DirectedGraph] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def fork(self, key: Hashable, into: DirectedGraph) -> bool:
+        """Populate the empty graph `into` from the template for `key`;
+        returns False if there is no such template."""
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                self.misses += 1
+                return False
+            self._templates.move_to_end(key)
+            self.hits += 1
+        template.fork(into=into)
+        return True
+
+    def put(self, key: Hashable, graph: DirectedGraph) -> None:
+        """Store a fork of `graph` as the template for `key`."""
+        template = graph.fork()
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+GRAPH_TEMPLATES = GraphTemplates()
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Protocol
 from marimo._runtime.dataflow.types import Edge
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
 
     from marimo._ast.cell import CellImpl
     from marimo._types.ids import CellId_t
@@ -41,6 +41,131 @@ class GraphTopology(Protocol):
 
     def descendants(self, cell_id: CellId_t) -> set[CellId_t]: ...
 
+    def closure(
+        self,
+        cell_ids: Iterable[CellId_t],
+        *,
+        children: bool,
+        inclusive: bool,
+    ) -> set[CellId_t]: ...
+
+
+class ReachabilityIndex:
+    """Transitive closure of the graph, kept as one bitset per cell.
+
+    Each cell is assigned a bit position; `_ancestors[cid]` and
+    `_descendants[cid]` are ints whose set bits are the cells reachable
+    from `cid` along parent and child edges respectively. Membership and
+    "any of these cells reachable" tests are a mask `&` — O(n/64) — and
+    enumerating a closure costs O(size of the closure) rather than a graph
+    traversal.
+
+    Adding an edge updates the closure incrementally. Removing an edge or
+    node can split reachability in ways that are expensive to patch, so it
+    only marks the index stale; the next query rebuilds it from the edge
+    lists. Mutations are rare compared to queries (a rebuild happens once
+    per batch of edits, not per query).
+    """
+
+    def __init__(self) -> None:
+        self._bit: dict[CellId_t, int] = {}
+        self._ids: list[CellId_t | None] = []
+        self._free: list[int] = []
+        self._ancestors: dict[CellId_t, int] = {}
+        self._descendants: dict[CellId_t, int] = {}
+        self._stale = False
+
+    def add_node(self, cell_id: CellId_t) -> None:
+        if self._free:
+            position = self._free.pop()
+            self._ids[position] = cell_id
+        else:
+            position = len(self._ids)
+            self._ids.append(cell_id)
+        self._bit[cell_id] = 1 << position
+        self._ancestors[cell_id] = 0
+        self._descendants[cell_id] = 0
+
+    def remove_node(self, cell_id: CellId_t) -> None:
+        position = self._bit.pop(cell_id).bit_length() - 1
+        self._ids[position] = None
+        self._free.append(position)
+        del self._ancestors[cell_id]
+        del self._descendants[cell_id]
+        self._stale = True
+
+    def add_edge(self, parent: CellId_t, child: CellId_t) -> None:
+        if self._stale:
+            # Will be rebuilt (edge included) on the next query.
+            return
+        self._link(parent, child)
+
+    def remove_edge(self, parent: CellId_t, child: CellId_t) -> None:
+        del parent, child
+        self._stale = True
+
+    def _link(self, parent: CellId_t, child: CellId_t) -> None:
+        # Everything at or above `parent` now reaches everything at or
+        # below `child`. Snapshot both sides before mutating either.
+        upstream = self._ancestors[parent] | self._bit[parent]
+        downstream = self._descendants[child] | self._bit[child]
+        for cid in self._decode(downstream):
+            self._ancestors[cid] |= upstream
+        for cid in self._decode(upstream):
+            self._descendants[cid] |= downstream
+
+    def _decode(self, mask: int) -> Iterable[CellId_t]:
+        ids = self._ids
+        while mask:
+            low = mask & -mask
+            cid = ids[low.bit_length() - 1]
+            if cid is not None:
+                yield cid
+            mask ^= low
+
+    def copy(self) -> ReachabilityIndex:
+        index = ReachabilityIndex()
+        index._bit = dict(self._bit)
+        index._ids = list(self._ids)
+        index._free = list(self._free)
+        index._ancestors = dict(self._ancestors)
+        index._descendants = dict(self._descendants)
+        index._stale = self._stale
+        return index
+
+    def rebuild(self, children: Mapping[CellId_t, set[CellId_t]]) -> None:
+        for cid in self._bit:
+            self._ancestors[cid] = 0
+            self._descendants[cid] = 0
+        self._stale = False
+        for parent, kids in children.items():
+            for child in kids:
+                self._link(parent, child)
+
+    def ensure_fresh(self, children: Mapping[CellId_t, set[CellId_t]]) -> None:
+        if self._stale:
+            self.rebuild(children)
+
+    def mask(self, cell_ids: Iterable[CellId_t]) -> int:
+        """Bitset of `cell_ids` (ids not in the graph are ignored)."""
+        result = 0
+        bit = self._bit
+        for cid in cell_ids:
+            result |= bit.get(cid, 0)
+        return result
+
+    def closure_mask(
+        self, cell_ids: Iterable[CellId_t], children: bool
+    ) -> int:
+        table = self._descendants if children else self._ancestors
+        result = 0
+        for cid in cell_ids:
+            result |= table[cid]
+        return result
+
+    def cells(self, mask: int) -> set[CellId_t]:
+        return set(self._decode(mask))
+
 
 @dataclass
 class MutableGraphTopology(GraphTopology):
@@ -62,6 +187,9 @@ class MutableGraphTopology(GraphTopology):
     # Reversed edges (parent pointers) for convenience
     _parents: dict[CellId_t, set[CellId_t]] = field(default_factory=dict)
 
+    # Maintained transitive closure, for ancestor/descendant queries
+    _reachability: ReachabilityIndex = field(default_factory=ReachabilityIndex)
+
     @property
     def cells(self) -> Mapping[CellId_t, CellImpl]:
         return self._cells
@@ -76,17 +204,65 @@ class MutableGraphTopology(GraphTopology):
 
     def ancestors(self, cell_id: CellId_t) -> set[CellId_t]:
         """Get all ancestors of a cell."""
-        from marimo._runtime.dataflow import transitive_closure
-
-        return transitive_closure(
-            self, {cell_id}, children=False, inclusive=False
-        )
+        return self.closure({cell_id}, children=False, inclusive=False)
 
     def descendants(self, cell_id: CellId_t) -> set[CellId_t]:
         """Get all descendants of a cell."""
-        from marimo._runtime.dataflow import transitive_closure
+        return self.closure({cell_id}, children=True, inclusive=False)
+
+    def closure(
+        self,
+        cell_ids: Iterable[CellId_t],
+        *,
+        children: bool,
+        inclusive: bool,
+    ) -> set[CellId_t]:
+        """Cells reachable from any of `cell_ids`, from the closure index.
+
+        Equivalent to `dataflow.transitive_closure` without `relatives` or
+        `predicate`: a cell on a cycle is not its own ancestor unless
+        `inclusive`.
+        """
+        index = self._reachability
+        index.ensure_fresh(self._children)
+        cell_ids = set(cell_ids)
+        roots = index.mask(cell_ids)
+        reachable = index.closure_mask(cell_ids, children)
+        if inclusive:
+            return index.cells(reachable | roots)
+        # Roots reached only through a cycle are still excluded, matching
+        # the traversal, which never revisits its starting cells.
+        return index.cells(reachable & ~roots)
+
+    def is_reachable(
+        self,
+        cell_id: CellId_t,
+        targets: Iterable[CellId_t],
+        *,
+        children: bool,
+    ) -> bool:
+        """Whether any of `targets` is a descendant (or ancestor) of `cell_id`."""
+        return self.is_mask_reachable(
+            cell_id, self._reachability.mask(targets), children=children
+        )
 
-        return transitive_closure(self, {cell_id}, inclusive=False)
+    def mask(self, cell_ids: Iterable[CellId_t]) -> int:
+        """Bitset of `cell_ids`, for `is_mask_reachable`.
+
+        Bits are reused once cells are removed, so a mask is only valid
+        until the graph's cells next change.
+        """
+        return self._reachability.mask(cell_ids)
+
+    def is_mask_reachable(
+        self, cell_id: CellId_t, mask: int, *, children: bool
+    ) -> bool:
+        """Whether any cell in bitset `mask`, other than `cell_id`, is a
+        descendant (or ancestor) of `cell_id`."""
+        index = self._reachability
+        index.ensure_fresh(self._children)
+        mask &= ~index.mask((cell_id,))
+        return bool(index.closure_mask((cell_id,), children) & mask)
 
     def add_node(self, cell_id: CellId_t, cell: CellImpl) -> None:
         """Add a cell to the graph topology."""
@@ -94,6 +270,7 @@ class MutableGraphTopology(GraphTopology):
         self._cells[cell_id] = cell
         self._children[cell_id] = set()
         self._parents[cell_id] = set()
+        self._reachability.add_node(cell_id)
 
     def remove_node(self, cell_id: CellId_t) -> None:
         """Remove a cell from the graph topology.
@@ -113,6 +290,24 @@ class MutableGraphTopology(GraphTopology):
         del self._cells[cell_id]
         del self._children[cell_id]
         del self._parents[cell_id]
+        self._reachability.remove_node(cell_id)
+
+    def copy_from(
+        self,
+        other: MutableGraphTopology,
+        cells: Mapping[CellId_t, CellImpl],
+    ) -> None:
+        """Replace this topology's contents with a copy of `other`'s,
+        substituting `cells` for its nodes (in `other`'s order)."""
+        assert cells.keys() == other._cells.keys()
+        self._cells = {cid: cells[cid] for cid in other._cells}
+        self._children = {
+            cid: set(kids) for cid, kids in other._children.items()
+        }
+        self._parents = {
+            cid: set(parents) for cid, parents in other._parents.items()
+        }
+        self._reachability = other._reachability.copy()
 
     def reorder_nodes(self, ordered_ids: list[CellId_t]) -> None:
         """Reorder the internal cells dict to match the given id order.
@@ -125,13 +320,19 @@ class MutableGraphTopology(GraphTopology):
 
     def add_edge(self, parent: CellId_t, child: CellId_t) -> None:
         """Add an edge from parent to child."""
-        self.children[parent].add(child)
-        self.parents[child].add(parent)
+        if child in self._children[parent]:
+            return
+        self._children[parent].add(child)
+        self._parents[child].add(parent)
+        self._reachability.add_edge(parent, child)
 
     def remove_edge(self, parent: CellId_t, child: CellId_t) -> None:
         """Remove an edge from parent to child."""
-        self.children[parent].discard(child)
-        self.parents[child].discard(parent)
+        if child not in self._children[parent]:
+            return
+        self._children[parent].discard(child)
+        self._parents[child].discard(parent)
+        self._reachability.remove_edge(parent, child)
 
     def get_path(self, source: CellId_t, dst: CellId_t) -> list[Edge]:
         """Get a path from `source` to `dst`, if any.
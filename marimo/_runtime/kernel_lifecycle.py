@@ -235,6 +235,7 @@ async def listen_messages(
     either a threading/multiprocessing queue or an `asyncio.Queue`.
     """
     ui_request_mgr = SetUIElementRequestManager(set_ui_element_queue)
+    kernel.ui_request_manager = ui_request_mgr
 
     while True:
         try:
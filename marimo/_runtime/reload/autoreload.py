@@ -275,11 +275,8 @@ class ModuleReloader:
 
         When `skip_non_user_modules` is True, modules whose `__file__` is
         under stdlib/site-packages are skipped — intended for the per-cell
-        hot path. The background `ModuleWatcher` leaves it False so it still
-        stats every module on its 1s loop, which is what keeps edits inside
-        installed packages detectable. Both paths populate the same skip
-        cache, so the hot path benefits from classifications the watcher
-        has already done.
+        hot path. Every call populates the same skip cache, so later calls
+        benefit from classifications done by earlier ones.
 
         Returns a set of modules that were found to have been modified.
         """
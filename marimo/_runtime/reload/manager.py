@@ -8,7 +8,7 @@ import sys
 from typing import TYPE_CHECKING, Literal
 
 from marimo._runtime.reload.autoreload import ModuleReloader
-from marimo._runtime.reload.module_watcher import ModuleWatcher
+from marimo._runtime.reload.module_watcher import ModuleIndex, ModuleWatcher
 from marimo._utils.platform import is_pyodide
 
 if TYPE_CHECKING:
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from marimo._ast.cell import CellImpl
     from marimo._runtime.runner.hook_context import OnFinishHookContext
     from marimo._runtime.runtime import Kernel
+    from marimo._types.ids import CellId_t
 
 AutoReloadMode = Literal["off", "lazy", "autorun"]
 
@@ -28,6 +29,9 @@ class AutoreloadManager:
         self._kernel = kernel
         self._reloader: ModuleReloader | None = None
         self._watcher: ModuleWatcher | None = None
+        # Kept up to date even while the watcher is off, so that it
+        # never has to scan the graph.
+        self._index = ModuleIndex()
 
         # Re-arm the watcher after every kernel run, regardless of trigger.
         kernel._hooks.add_on_finish(self._on_finish_hook)
@@ -55,6 +59,7 @@ class AutoreloadManager:
                 self._watcher = ModuleWatcher(
                     self._kernel.graph,
                     reloader=self._reloader,
+                    index=self._index,
                     enqueue_run_stale_cells=self._kernel._execute_stale_cells_callback,
                     mode=mode,
                     stream=self._kernel.stream,
@@ -71,6 +76,14 @@ class AutoreloadManager:
             self._watcher = None
         self._reloader = None
 
+    def register_cell(self, cell_id: CellId_t, cell: CellImpl) -> None:
+        """Index the cell's imports, and flag it if any are stale."""
+        self._index.add(cell_id, cell)
+        self.flag_if_imports_stale(cell)
+
+    def unregister_cell(self, cell_id: CellId_t) -> None:
+        self._index.remove(cell_id)
+
     def flag_if_imports_stale(self, cell: CellImpl) -> None:
         reloader = self._reloader
         if reloader is None:
@@ -97,11 +110,12 @@ class AutoreloadManager:
             # skip here — `new_modules` is small (typically 0-3) and we need
             # an mtime baseline for newly-imported installed packages so the
             # next edit isn't silently treated as the initial state.
-            new_modules = set(sys.modules) - snapshot
-            self._reloader.check(
-                modules={m: sys.modules[m] for m in new_modules},
-                reload=False,
-            )
+            new_modules = {
+                m: sys.modules[m] for m in set(sys.modules) - snapshot
+            }
+            self._reloader.check(modules=new_modules, reload=False)
+            if self._watcher is not None:
+                self._watcher.watch(new_modules)
 
     def _on_finish_hook(self, ctx: OnFinishHookContext) -> None:
         del ctx
@@ -2,25 +2,29 @@
 from __future__ import annotations
 
 import itertools
+import os
 import pathlib
+import queue
 import sys
 import threading
-import time
+from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Literal
 
 from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.types import Stream
 from marimo._runtime import dataflow
 from marimo._runtime.reload.autoreload import (
     ModuleReloader,
-    modules_imported_by_cell,
+    _normalized_path,
     safe_getattr,
 )
 
 if TYPE_CHECKING:
     import types
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
+    from marimo._ast.cell import CellImpl
     from marimo._types.ids import CellId_t
 
 LOGGER = _loggers.marimo_logger()
@@ -123,10 +127,17 @@ def _check_modules(
     modules: dict[str, types.ModuleType],
     reloader: ModuleReloader,
     sys_modules: dict[str, types.ModuleType],
+    changed: dict[str, types.ModuleType] | None = None,
 ) -> dict[str, types.ModuleType]:
-    """Returns the set of modules used by the graph that have been modified"""
+    """Returns the set of modules used by the graph that have been modified
+
+    Only the modules in `changed` are checked for modifications, if given;
+    otherwise, every module in `sys_modules` is.
+    """
     stale_modules: dict[str, types.ModuleType] = {}
-    modified_modules = reloader.check(modules=sys_modules, reload=False)
+    modified_modules = reloader.check(
+        modules=sys_modules if changed is None else changed, reload=False
+    )
     # TODO(akshayka): could also exclude modules part of the standard library;
     # haven't found a reliable way to do this, however.
     excludes = _get_excluded_modules(sys_modules)
@@ -154,97 +165,193 @@ MODULE_WATCHER_SLEEP_INTERVAL = 1.0
 _TEST_SLEEP_INTERVAL: float | None = None
 
 
-def watch_modules(
-    graph: dataflow.DirectedGraph,
-    reloader: ModuleReloader,
-    mode: Literal["lazy", "autorun"],
-    enqueue_run_stale_cells: Callable[[], None],
-    should_exit: threading.Event,
-    run_is_processed: threading.Event,
-    stream: Stream,
-) -> None:
-    """Watches for changes to modules used by graph
-
-    The modules used by the graph are determined statically, by analyzing the
-    modules imported by the notebook as well as the modules imported by those
-    modules, recursively.
-    """
-    # work with a copy to avoid race conditions
-    # in CPython, dict.copy() is atomic
-    sys_modules = sys.modules.copy()
-    sleep_interval = _TEST_SLEEP_INTERVAL or MODULE_WATCHER_SLEEP_INTERVAL
-    while not should_exit.is_set():
-        # Collect the modules used by each cell
-        modules: dict[str, types.ModuleType] = {}
-        modname_to_cell_id: dict[str, CellId_t] = {}
-        with graph.lock:
-            for cell_id, cell in graph.cells.items():
-                for modname in modules_imported_by_cell(cell, sys_modules):
-                    if modname in sys_modules:
-                        modules[modname] = sys_modules[modname]
-                        modname_to_cell_id[modname] = cell_id
+class ModuleIndex:
+    """The cells that import each module, by module name.
 
-        stale_modules = _check_modules(
-            modules=modules,
-            reloader=reloader,
-            sys_modules=sys_modules,
-        )
+    Updated as cells are registered and deleted, so that the watcher can
+    find the cells affected by a change without walking the graph.
+    """
 
-        if stale_modules:
-            LOGGER.debug(
-                "Found stale modules; acquiring lock to update graph."
-            )
-            with graph.lock:
-                LOGGER.debug("Acquired graph lock.")
-                for modname in stale_modules:
-                    # prune definitions that are derived from stale modules
-                    cell_id = modname_to_cell_id[modname]
-                    cell = graph.cells[cell_id]
-                    defs_to_prune = [
-                        import_data.definition
-                        for import_data in cell.imports
-                        if import_data.module == modname
-                    ]
-                    cell.import_workspace.imported_defs -= set(defs_to_prune)
+    def __init__(self) -> None:
+        self._cells: dict[str, set[CellId_t]] = {}
+        self._modules: dict[CellId_t, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, cell_id: CellId_t, cell: CellImpl) -> None:
+        # Like `modules_imported_by_cell`, but by name alone: a cell is
+        # registered before it runs, so its imports aren't loaded yet.
+        modnames = {
+            name
+            for import_data in cell.imports
+            for name in (import_data.module, import_data.imported_symbol)
+            if name is not None
+        }
+        with self._lock:
+            self._remove(cell_id)
+            self._modules[cell_id] = modnames
+            for modname in modnames:
+                self._cells.setdefault(modname, set()).add(cell_id)
+
+    def remove(self, cell_id: CellId_t) -> None:
+        with self._lock:
+            self._remove(cell_id)
+
+    def _remove(self, cell_id: CellId_t) -> None:
+        for modname in self._modules.pop(cell_id, ()):
+            cells = self._cells[modname]
+            cells.discard(cell_id)
+            if not cells:
+                del self._cells[modname]
+
+    def modules(self) -> list[str]:
+        """Names of the modules imported by at least one cell."""
+        with self._lock:
+            return list(self._cells)
+
+    def cells_importing(self, modname: str) -> set[CellId_t]:
+        with self._lock:
+            return set(self._cells.get(modname, ()))
+
+
+class ModuleFileWatcher(ABC):
+    """Reports changes to a set of source files.
+
+    Files are identified by their normalized path; `on_change` is called
+    with the path of each changed file, from any thread.
+    """
 
-                # If any modules are stale, communicate that to the FE
-                # and update the backend's view of the importing cells'
-                # staleness
-                stale_cell_ids = dataflow.transitive_closure(
-                    graph,
-                    {modname_to_cell_id[modname] for modname in stale_modules},
-                    relatives=dataflow.get_import_block_relatives(graph),
+    @staticmethod
+    def create(on_change: Callable[[str], None]) -> ModuleFileWatcher:
+        if DependencyManager.watchdog.has():
+            LOGGER.debug("Using watchdog module file watcher")
+            return _create_watchdog(on_change)
+        LOGGER.debug("watchdog is not installed, polling module files")
+        return PollingModuleFileWatcher(on_change)
+
+    def __init__(self, on_change: Callable[[str], None]) -> None:
+        self.on_change = on_change
+
+    @abstractmethod
+    def watch(self, filename: str) -> None:
+        pass
+
+    def poll(self) -> None:  # noqa: B027
+        """Look for changes; only needed by watchers without events."""
+
+    def stop(self) -> None:  # noqa: B027
+        pass
+
+
+class PollingModuleFileWatcher(ModuleFileWatcher):
+    """Stats each watched file on every `poll`."""
+
+    def __init__(self, on_change: Callable[[str], None]) -> None:
+        super().__init__(on_change)
+        self._mtimes: dict[str, float | None] = {}
+        self._lock = threading.Lock()
+
+    def watch(self, filename: str) -> None:
+        mtime = self._get_modified(filename)
+        with self._lock:
+            self._mtimes.setdefault(filename, mtime)
+
+    def poll(self) -> None:
+        with self._lock:
+            files = list(self._mtimes.items())
+        for filename, last_modified in files:
+            modified = self._get_modified(filename)
+            if modified is None or modified == last_modified:
+                continue
+            with self._lock:
+                self._mtimes[filename] = modified
+            self.on_change(filename)
+
+    @staticmethod
+    def _get_modified(filename: str) -> float | None:
+        try:
+            return os.stat(filename).st_mtime
+        except OSError:
+            return None
+
+
+def _create_watchdog(on_change: Callable[[str], None]) -> ModuleFileWatcher:
+    import watchdog.events  # type: ignore[import-not-found,import-untyped,unused-ignore]
+    import watchdog.observers  # type: ignore[import-not-found,import-untyped,unused-ignore]
+
+    class WatchdogModuleFileWatcher(ModuleFileWatcher):
+        """Watches the directories of the watched files, not recursively."""
+
+        def __init__(self, on_change: Callable[[str], None]) -> None:
+            super().__init__(on_change)
+            self._files: set[str] = set()
+            self._directories: set[str] = set()
+            self._lock = threading.Lock()
+            self._handler = watchdog.events.FileSystemEventHandler()
+            self._handler.on_modified = self._on_event  # type: ignore
+            self._handler.on_created = self._on_event  # type: ignore
+            # Editors that save by moving a temporary file into place
+            self._handler.on_moved = self._on_event  # type: ignore
+            self._observer = watchdog.observers.Observer()
+            self._observer.start()  # type: ignore
+
+        def _on_event(self, event: watchdog.events.FileSystemEvent) -> None:
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if not path:
+                    continue
+                filename = _normalized_path(os.fsdecode(path))
+                if filename in self._files:
+                    self.on_change(filename)
+
+        def watch(self, filename: str) -> None:
+            directory = os.path.dirname(filename)
+            with self._lock:
+                self._files.add(filename)
+                if directory in self._directories:
+                    return
+                self._directories.add(directory)
+            try:
+                self._observer.schedule(  # type: ignore
+                    self._handler, directory, recursive=False
                 )
-                for cid in stale_cell_ids:
-                    graph.cells[cid].set_stale(stale=True, stream=stream)
-            LOGGER.debug("Released graph lock and updated stale statuses.")
-
-            if mode == "autorun":
-                run_is_processed.clear()
-                enqueue_run_stale_cells()
-
-        # Don't proceed until enqueue_run_stale_cells() has been processed,
-        # ie until stale cells have been rerun
-        run_is_processed.wait()
-        time.sleep(sleep_interval)
-        # Update our snapshot of sys.modules
-        sys_modules = sys.modules.copy()
+            except OSError as e:
+                LOGGER.debug("Failed to watch %s: %s", directory, e)
+
+        def stop(self) -> None:
+            self._observer.stop()  # type: ignore
+            self._observer.join()
+
+    return WatchdogModuleFileWatcher(on_change)
 
 
 class ModuleWatcher:
+    """Marks the cells that use modified modules as stale.
+
+    Only the source files of user modules (see
+    `ModuleReloader._is_user_module`) are watched, with filesystem events
+    if watchdog is installed, or else by polling just those files. When
+    one changes, the cells importing a module that depends on it are
+    found through the `ModuleIndex`.
+
+    The modules used by a cell are determined statically, by analyzing the
+    modules it imports, as well as the modules imported by those modules,
+    recursively.
+    """
+
     def __init__(
         self,
         graph: dataflow.DirectedGraph,
         reloader: ModuleReloader,
+        index: ModuleIndex,
         mode: Literal["lazy", "autorun"],
         enqueue_run_stale_cells: Callable[[], None],
         stream: Stream,
     ) -> None:
-        # ModuleWatcher uses the graph to determine the modules used by the
-        # notebook
+        # ModuleWatcher uses the graph to mark cells as stale
         self.graph = graph
         # Reloader is used to keep track of stale modules
         self.reloader = reloader
+        # The cells that import each module
+        self.index = index
         # When set, signals the watcher thread to exit
         self.should_exit = threading.Event()
         # When False, an ExecuteStaleRequest is inflight to the kernel
@@ -256,19 +363,105 @@ class ModuleWatcher:
         self.mode = mode
         # A callable that signals the kernel to run stale cells
         self.enqueue_run_stale_cells = enqueue_run_stale_cells
-        threading.Thread(
-            target=watch_modules,
-            args=(
+        # normalized source file -> names of the modules loaded from it
+        self._modules_by_file: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        # Paths of changed files, reported by `files`
+        self._changes: queue.Queue[str] = queue.Queue()
+        self.files = ModuleFileWatcher.create(self._changes.put)
+        self.watch(sys.modules.copy())
+        threading.Thread(target=self._watch_files, daemon=True).start()
+
+    def watch(self, modules: Mapping[str, types.ModuleType]) -> None:
+        """Watch the source files of the user modules among `modules`."""
+        for modname, module in modules.items():
+            if not self.reloader._is_user_module(module):
+                continue
+            module_mtime = self.reloader.filename_and_mtime(module)
+            if module_mtime is None:
+                continue
+            filename = _normalized_path(module_mtime.name)
+            with self._lock:
+                modnames = self._modules_by_file.setdefault(filename, set())
+                is_new = not modnames
+                modnames.add(modname)
+            if is_new:
+                self.files.watch(filename)
+
+    def _watch_files(self) -> None:
+        sleep_interval = _TEST_SLEEP_INTERVAL or MODULE_WATCHER_SLEEP_INTERVAL
+        while not self.should_exit.is_set():
+            try:
+                changed = {self._changes.get(timeout=sleep_interval)}
+            except queue.Empty:
+                self.files.poll()
+                continue
+            while not self._changes.empty():
+                changed.add(self._changes.get_nowait())
+            self._on_files_changed(changed)
+            # Don't proceed until enqueue_run_stale_cells() has been
+            # processed, ie until stale cells have been rerun
+            self.run_is_processed.wait()
+
+    def _on_files_changed(self, filenames: set[str]) -> None:
+        # work with a copy to avoid race conditions
+        # in CPython, dict.copy() is atomic
+        sys_modules = sys.modules.copy()
+        with self._lock:
+            changed = {
+                modname: sys_modules[modname]
+                for filename in filenames
+                for modname in self._modules_by_file.get(filename, ())
+                if modname in sys_modules
+            }
+        modules = {
+            modname: sys_modules[modname]
+            for modname in self.index.modules()
+            if modname in sys_modules
+        }
+        stale_modules = _check_modules(
+            modules=modules,
+            reloader=self.reloader,
+            sys_modules=sys_modules,
+            changed=changed,
+        )
+        if not stale_modules:
+            return
+
+        LOGGER.debug("Found stale modules; acquiring lock to update graph.")
+        with self.graph.lock:
+            LOGGER.debug("Acquired graph lock.")
+            importing_cells: set[CellId_t] = set()
+            for modname in stale_modules:
+                for cell_id in self.index.cells_importing(modname):
+                    cell = self.graph.cells.get(cell_id)
+                    if cell is None:
+                        continue
+                    importing_cells.add(cell_id)
+                    # prune definitions that are derived from stale modules
+                    defs_to_prune = [
+                        import_data.definition
+                        for import_data in cell.imports
+                        if import_data.module == modname
+                    ]
+                    cell.import_workspace.imported_defs -= set(defs_to_prune)
+
+            # If any modules are stale, communicate that to the FE
+            # and update the backend's view of the importing cells'
+            # staleness
+            stale_cell_ids = dataflow.transitive_closure(
                 self.graph,
-                self.reloader,
-                self.mode,
-                self.enqueue_run_stale_cells,
-                self.should_exit,
-                self.run_is_processed,
-                self.stream,
-            ),
-            daemon=True,
-        ).start()
+                importing_cells,
+                relatives=dataflow.get_import_block_relatives(self.graph),
+            )
+            for cid in stale_cell_ids:
+                self.graph.cells[cid].set_stale(stale=True, stream=self.stream)
+        LOGGER.debug("Released graph lock and updated stale statuses.")
+
+        if self.mode == "autorun":
+            self.run_is_processed.clear()
+            self.enqueue_run_stale_cells()
 
     def stop(self) -> None:
         self.should_exit.set()
+        self.files.stop()
@@ -42,13 +42,20 @@ from marimo._runtime.executor import (
 )
 from marimo._runtime.executor.executor import _strip_frame
 from marimo._runtime.marimo_pdb import MarimoPdb
+from marimo._runtime.runner.cell_scope import (
+    current_cell_scope,
+    make_cell_scope,
+)
 from marimo._runtime.runner.hook_context import (
     CancelledCells,
     ExceptionOrError,
     ExecutionContextManager,
 )
 from marimo._runtime.runner.result import RunResult
-from marimo._runtime.runner.scheduler import SequentialScheduler
+from marimo._runtime.runner.scheduler import (
+    AsyncWaveScheduler,
+    SequentialScheduler,
+)
 from marimo._sql.error_utils import (
     create_sql_error_from_exception,
     is_sql_parse_error,
@@ -60,6 +67,7 @@ LOGGER = marimo_logger()
 
 if TYPE_CHECKING:
     from collections import deque
+    from collections.abc import Callable
 
     from marimo._ast.cell import CellImpl
     from marimo._runtime.runner.hooks import NotebookCellHooks
@@ -150,6 +158,7 @@ class Runner:
         excluded_cells: set[CellId_t] | None = None,
         execution_context: ExecutionContextManager | None = None,
         user_config: MarimoConfig | None = None,
+        preempt: Callable[[], bool] | None = None,
     ):
         self.graph = graph
         self.debugger = debugger
@@ -157,6 +166,12 @@ class Runner:
         self.execution_context = execution_context
         self._hooks = hooks
         self.user_config = user_config
+        # Polled between cells; when it returns True, the cells still
+        # queued are dropped (see `_preempt_if_superseded`).
+        self._preempt = preempt
+        self.preempted = False
+        # Cells dropped from the run when it was preempted
+        self.preempted_cells: set[CellId_t] = set()
 
         # runtime globals
         self.glbls = glbls
@@ -176,7 +191,20 @@ class Runner:
             self.execution_mode,
         )
 
-        self._scheduler = SequentialScheduler(cells_to_run_list, self.graph)
+        experimental = (
+            self.user_config.get("experimental", {})
+            if self.user_config is not None
+            else {}
+        )
+
+        # Concurrent async cells: independent cells are grouped into waves,
+        # and the coroutine cells of a wave are awaited concurrently.
+        # Synchronous cells still run one at a time.
+        self._scheduler = (
+            AsyncWaveScheduler(cells_to_run_list, self.graph)
+            if experimental.get("concurrent_async_cells", False)
+            else SequentialScheduler(cells_to_run_list, self.graph)
+        )
 
         # mapping from cell_id to exception it raised
         self.exceptions: dict[CellId_t, ExceptionOrError] = {}
@@ -209,11 +237,6 @@ class Runner:
         # Live debugger and line-timing highlight share one frame-watching
         # lifecycle (a single `sys.settrace` hook). Gated here so there is
         # zero tracing overhead when disabled.
-        experimental = (
-            self.user_config.get("experimental", {})
-            if self.user_config is not None
-            else {}
-        )
         debugger_on = self.debugger is not None and bool(
             experimental.get("debugger", False)
         )
@@ -527,6 +550,10 @@ class Runner:
         coro = self._evaluator.evaluate(cell, self.glbls)
         if not cell.is_coroutine():
             return await coro
+        # A cell running concurrently with its wave carries its own
+        # ambient state; the evaluation task must step inside it too.
+        if (scope := current_cell_scope()) is not None:
+            coro = scope.wrap(coro)
         try:
             async with self._scheduler.start_task(cell.cell_id, coro) as task:
                 return await task
@@ -868,6 +895,7 @@ class Runner:
         snapshot = list(self._scheduler.cells_to_run)
         runnable: list[CellId_t] = []
         interrupted_at: int | None = None
+        disabled = self.graph.flagged_mask("disabled")
         for index, cell_id in enumerate(snapshot):
             if self._scheduler.interrupted:
                 interrupted_at = index
@@ -914,7 +942,7 @@ class Runner:
                 cell.set_run_result_status("disabled")
                 cell.set_runtime_state("idle")
                 continue
-            if self.graph.is_disabled(cell_id):
+            if self.graph.is_disabled(cell_id, disabled):
                 LOGGER.debug("%s disabled transitively", cell_id)
                 cell.set_run_result_status("disabled")
                 cell.set_runtime_state("disabled-transitively")
@@ -929,6 +957,7 @@ class Runner:
         self._scheduler.requeue(runnable)
 
         for batch in self._scheduler.batch():
+            concurrent: list[CellId_t] = []
             for cell_id in batch:
                 # Re-check: an earlier cell in this run may have
                 # cancelled its descendants while we were dispatching.
@@ -937,17 +966,113 @@ class Runner:
                     cell.set_run_result_status("cancelled")
                     cell.set_runtime_state("idle")
                     continue
-                try:
-                    await self._run_one(cell_id, pre_exec_ctx, post_exec_ctx)
-                except MarimoRescheduleError as e:
-                    LOGGER.debug(
-                        "Reschedule for %s; requeuing %s",
-                        cell_id,
-                        e.cells_to_rerun,
-                    )
-                    # Reschedule control signal from a lifecycle.
-                    # Move the cell back to queued state, and reschedule for
-                    # rerun after the relevant cells have been run.
-                    for rerun_id in e.cells_to_rerun:
-                        self.graph.cells[rerun_id].set_runtime_state("queued")
-                    self._scheduler.requeue_for_rerun(e.cells_to_rerun)
+                if self.graph.cells[cell_id].is_coroutine():
+                    # Coroutine cells in a multi-cell batch are awaited
+                    # together once the synchronous cells have run.
+                    concurrent.append(cell_id)
+                    continue
+                await self._run_one_or_reschedule(
+                    cell_id, pre_exec_ctx, post_exec_ctx
+                )
+            if len(concurrent) == 1:
+                await self._run_one_or_reschedule(
+                    concurrent[0], pre_exec_ctx, post_exec_ctx
+                )
+            elif concurrent:
+                await self._run_concurrently(
+                    concurrent, pre_exec_ctx, post_exec_ctx
+                )
+            self._preempt_if_superseded()
+
+    def _preempt_if_superseded(self) -> None:
+        """Drop the rest of the run if `preempt` says it is superseded.
+
+        The dropped cells are marked stale instead of interrupted: a
+        newer run, for the value that superseded this one, is already
+        queued and will run them.
+        """
+        if (
+            self._preempt is None
+            or not self._scheduler.pending()
+            or not self._preempt()
+        ):
+            return
+        LOGGER.debug("Run preempted by a newer request")
+        self.preempted = True
+        dropped = list(self._scheduler.cells_to_run)
+        self.preempted_cells.update(dropped)
+        self._scheduler.requeue(())
+        for cell_id in dropped:
+            cell = self.graph.cells[cell_id]
+            cell.set_runtime_state("idle")
+            cell.set_stale(stale=True)
+
+    async def _run_one_or_reschedule(
+        self,
+        cell_id: CellId_t,
+        pre_exec_ctx: Any,
+        post_exec_ctx: Any,
+    ) -> None:
+        try:
+            await self._run_one(cell_id, pre_exec_ctx, post_exec_ctx)
+        except MarimoRescheduleError as e:
+            LOGGER.debug(
+                "Reschedule for %s; requeuing %s",
+                cell_id,
+                e.cells_to_rerun,
+            )
+            # Reschedule control signal from a lifecycle.
+            # Move the cell back to queued state, and reschedule for
+            # rerun after the relevant cells have been run.
+            for rerun_id in e.cells_to_rerun:
+                self.graph.cells[rerun_id].set_runtime_state("queued")
+            self._scheduler.requeue_for_rerun(e.cells_to_rerun)
+
+    async def _run_concurrently(
+        self,
+        cell_ids: list[CellId_t],
+        pre_exec_ctx: Any,
+        post_exec_ctx: Any,
+    ) -> None:
+        """Run mutually independent coroutine cells as concurrent tasks.
+
+        Each task steps inside its own `CellScope` so that the cells'
+        execution contexts and stream redirections don't clobber each
+        other while they interleave. Without an installed kernel context
+        there is no ambient state to isolate, and cells run in order.
+        """
+        scopes = [make_cell_scope() for _ in cell_ids]
+        if any(scope is None for scope in scopes):
+            for cell_id in cell_ids:
+                if self.cancelled(cell_id):
+                    continue
+                await self._run_one_or_reschedule(
+                    cell_id, pre_exec_ctx, post_exec_ctx
+                )
+            return
+
+        async def run_in_wave(cell_id: CellId_t) -> None:
+            try:
+                await self._run_one_or_reschedule(
+                    cell_id, pre_exec_ctx, post_exec_ctx
+                )
+            except KeyboardInterrupt:
+                # Must not escape the task: asyncio re-raises
+                # KeyboardInterrupt out of the event loop itself.
+                # `cancel_all` already halted the queue.
+                LOGGER.info("Runner interrupted via SIGINT")
+
+        LOGGER.debug("Running cells concurrently: %s", cell_ids)
+        tasks = [
+            asyncio.ensure_future(scope.wrap(run_in_wave(cell_id)))
+            for scope, cell_id in zip(scopes, cell_ids, strict=True)
+            if scope is not None
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for cell_id, result in zip(cell_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                LOGGER.error(
+                    "Unexpected error running cell %s concurrently: %s",
+                    cell_id,
+                    result,
+                )
@@ -0,0 +1,165 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Per-task ambient state for cells that run concurrently on one loop.
+
+Running a cell installs process-wide, cell-scoped state: the context's
+`execution_context` and UI-id provider, the stream's `cell_id`, and the
+redirected `sys.stdout`/`sys.stderr`/`sys.stdin`. That is fine when cells
+run one at a time, but when the `AsyncWaveScheduler` hands the runner a
+wave of coroutine cells, their tasks interleave at every `await` and
+would otherwise clobber each other's state (and restore it out of order
+when their `with` blocks exit).
+
+`CellScope` gives each concurrently running cell a private copy of that
+state. Every coroutine step taken under a scope swaps the cell's state
+in, runs, records whatever the step left behind, and swaps the previous
+state back — so `with`-statements inside the cell see a consistent,
+cell-local view, and nothing leaks between tasks.
+
+File-descriptor level redirection (output written by C extensions
+directly to fds 1/2) is process-wide and is not swapped.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import sys
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from marimo._messaging.thread_local_streams import ThreadLocalStreamProxy
+from marimo._runtime.context.types import safe_get_context
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from marimo._runtime.context.kernel_context import KernelRuntimeContext
+
+T = TypeVar("T")
+
+# The scope of the cell whose task is currently running, if any. Tasks
+# copy the current `contextvars` context on creation, so tasks spawned
+# from inside a scoped cell (e.g. the scheduler-tracked evaluation task)
+# can find and join their parent's scope.
+_CURRENT_SCOPE: contextvars.ContextVar[CellScope | None] = (
+    contextvars.ContextVar("marimo_cell_scope", default=None)
+)
+
+
+def current_cell_scope() -> CellScope | None:
+    """The scope of the currently running concurrent cell, if any."""
+    return _CURRENT_SCOPE.get()
+
+
+def _proxy_stream(stream: Any) -> Any:
+    if isinstance(stream, ThreadLocalStreamProxy):
+        return getattr(stream._local, "stream", None)
+    return None
+
+
+@dataclass
+class _AmbientState:
+    execution_context: Any
+    id_provider: Any
+    stream_cell_id: Any
+    stdout: Any
+    stderr: Any
+    stdin: Any
+    # Per-thread streams registered on the run-mode stdout/stderr proxies
+    proxied_stdout: Any
+    proxied_stderr: Any
+
+    @staticmethod
+    def capture(ctx: KernelRuntimeContext) -> _AmbientState:
+        return _AmbientState(
+            execution_context=ctx._execution_context,
+            id_provider=ctx._id_provider,
+            stream_cell_id=ctx.stream.cell_id,
+            stdout=sys.stdout,
+            stderr=sys.stderr,
+            stdin=sys.stdin,
+            proxied_stdout=_proxy_stream(sys.stdout),
+            proxied_stderr=_proxy_stream(sys.stderr),
+        )
+
+    def install(self, ctx: KernelRuntimeContext) -> None:
+        ctx._execution_context = self.execution_context
+        ctx._id_provider = self.id_provider
+        ctx.stream.cell_id = self.stream_cell_id
+        sys.stdout = self.stdout
+        sys.stderr = self.stderr
+        sys.stdin = self.stdin
+        if isinstance(sys.stdout, ThreadLocalStreamProxy):
+            sys.stdout._set_stream(self.proxied_stdout)
+        if isinstance(sys.stderr, ThreadLocalStreamProxy):
+            sys.stderr._set_stream(self.proxied_stderr)
+
+
+class CellScope:
+    """Private ambient state for one concurrently running cell.
+
+    The scope starts from the state current at construction (the idle,
+    between-cells state) and is shared by every task that joins it via
+    `wrap`; those tasks never step simultaneously, since the cell's
+    outer task awaits its evaluation task.
+    """
+
+    def __init__(self, ctx: KernelRuntimeContext) -> None:
+        self._ctx = ctx
+        self._state = _AmbientState.capture(ctx)
+
+    def wrap(self, coro: Coroutine[Any, Any, T]) -> _ScopedCoroutine[T]:
+        """Return an awaitable that steps `coro` inside this scope."""
+        return _ScopedCoroutine(self, coro)
+
+    def _step(self, method: Any, *args: Any) -> Any:
+        outer = _AmbientState.capture(self._ctx)
+        self._state.install(self._ctx)
+        token = _CURRENT_SCOPE.set(self)
+        try:
+            return method(*args)
+        finally:
+            _CURRENT_SCOPE.reset(token)
+            self._state = _AmbientState.capture(self._ctx)
+            outer.install(self._ctx)
+
+
+class _ScopedCoroutine(Coroutine[Any, Any, T]):
+    """Coroutine adapter whose every `send`/`throw` runs in a `CellScope`.
+
+    A `collections.abc.Coroutine`, so asyncio accepts it directly as a
+    task body and drives it through `send`/`throw`.
+    """
+
+    def __init__(self, scope: CellScope, coro: Coroutine[Any, Any, T]):
+        self._scope = scope
+        self._coro = coro
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self  # type: ignore[return-value]
+
+    def __iter__(self) -> _ScopedCoroutine[T]:
+        return self
+
+    def __next__(self) -> Any:
+        return self.send(None)
+
+    def send(self, value: Any) -> Any:
+        return self._scope._step(self._coro.send, value)
+
+    def throw(self, *args: Any) -> Any:
+        return self._scope._step(self._coro.throw, *args)
+
+    def close(self) -> None:
+        self._scope._step(self._coro.close)
+
+
+def make_cell_scope() -> CellScope | None:
+    """A fresh scope for the installed kernel context, if there is one."""
+    # Late import to avoid a cycle through the runtime context tree.
+    from marimo._runtime.context.kernel_context import KernelRuntimeContext
+
+    ctx = safe_get_context()
+    if not isinstance(ctx, KernelRuntimeContext):
+        return None
+    return CellScope(ctx)
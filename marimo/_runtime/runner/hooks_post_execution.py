@@ -11,10 +11,7 @@ from marimo._data._external_storage.get_storage import (
     get_storage_backends_from_variables,
     storage_backend_to_storage_namespace,
 )
-from marimo._data.get_datasets import (
-    get_datasets_from_variables,
-    has_updates_to_datasource,
-)
+from marimo._data.get_datasets import has_updates_to_datasource
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.cell_output import CellChannel
 from marimo._messaging.errors import (
@@ -24,7 +21,6 @@ from marimo._messaging.errors import (
     MarimoStrictExecutionError,
 )
 from marimo._messaging.notification import (
-    DatasetsNotification,
     DataSourceConnectionsNotification,
     StorageNamespacesNotification,
     VariableValuesNotification,
@@ -141,28 +137,6 @@ def _broadcast_variables(
         broadcast_notification(VariableValuesNotification(variables=values))
 
 
-@kernel_tracer.start_as_current_span("broadcast_datasets")
-def _broadcast_datasets(
-    cell: CellImpl,
-    ctx: PostExecutionHookContext,
-    run_result: cell_runner.RunResult,
-) -> None:
-    if not ctx.should_broadcast_data:
-        return
-
-    del run_result
-    tables = get_datasets_from_variables(
-        [
-            (VariableName(variable), ctx.glbls[variable])
-            for variable in cell.defs
-            if variable in ctx.glbls
-        ]
-    )
-    if tables:
-        LOGGER.debug("Broadcasting data tables")
-        broadcast_notification(DatasetsNotification(tables=tables))
-
-
 @kernel_tracer.start_as_current_span("broadcast_data_source_connection")
 def _broadcast_data_source_connection(
     cell: CellImpl,
@@ -554,7 +528,7 @@ POST_EXECUTION_HOOKS: list[PostExecutionHook] = [
     _store_state_reference,
     _issue_exception_side_effect,
     _broadcast_variables,
-    _broadcast_datasets,
+    # Datasets are profiled in the background; see `DatasetCallbacks`.
     _broadcast_data_source_connection,
     _broadcast_duckdb_datasource,
     _broadcast_outputs,
@@ -20,8 +20,9 @@ def _update_stale_statuses(ctx: PreparationHookContext) -> None:
         ):
             graph.cells[cid].set_stale(stale=True)
 
+    disabled = graph.flagged_mask("disabled")
     for cid in ctx.cells_to_run:
-        if graph.is_disabled(cid):
+        if graph.is_disabled(cid, disabled):
             graph.cells[cid].set_stale(stale=True)
         else:
             graph.cells[cid].set_runtime_state(status="queued")
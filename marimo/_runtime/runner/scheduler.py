@@ -249,3 +249,46 @@ class SequentialScheduler:
             and ctx._active_scheduler is self
         ):
             ctx._active_scheduler = self._prev_scheduler
+
+
+class AsyncWaveScheduler(SequentialScheduler):
+    """Yields topological waves of mutually independent cells.
+
+    A wave is every queued cell none of whose ancestors is still queued;
+    cells within a wave share no dataflow path, so the runner awaits the
+    coroutine cells of a wave concurrently. Synchronous cells in a wave
+    still run one after another, since stream redirection and the
+    execution context are process-wide.
+
+    Waves are recomputed from the live queue on every step, so
+    `requeue_for_rerun` and cancellations issued while a wave is in
+    flight are honored by the next one. Queue order (which is
+    topological) is preserved within a wave.
+    """
+
+    def batch(
+        self, cell_ids: Iterable[CellId_t] | None = None
+    ) -> Iterator[Iterable[CellId_t]]:
+        if cell_ids is not None:
+            self.requeue(cell_ids)
+        while self._cells_to_run and not self._interrupted:
+            wave = self._next_wave()
+            # Rebuild in place (not rebind): hook contexts hold a
+            # reference to the live deque.
+            taken = set(wave)
+            remaining = [c for c in self._cells_to_run if c not in taken]
+            self._cells_to_run.clear()
+            self._cells_to_run.extend(remaining)
+            yield wave
+
+    def _next_wave(self) -> tuple[CellId_t, ...]:
+        queued = set(self._cells_to_run)
+        wave = tuple(
+            cid
+            for cid in self._cells_to_run
+            if self._graph.ancestors(cid).isdisjoint(queued)
+        )
+        # A cycle among queued cells leaves no cell ready; fall back to
+        # queue order so the run still makes progress (cycles are
+        # reported as errors and excluded upstream, so this is a guard).
+        return wave or (self._cells_to_run[0],)
@@ -25,6 +25,7 @@ from uuid import uuid4
 
 from marimo import _loggers
 from marimo._ast.cell import CellConfig, CellImpl, RuntimeStateType
+from marimo._ast.compile_cache import get_compiled_cell_cache
 from marimo._ast.compiler import _build_source_position_map, compile_cell
 from marimo._ast.errors import ImportStarError
 from marimo._ast.names import SETUP_CELL_NAME
@@ -125,6 +126,7 @@ from marimo._runtime.context.kernel_context import (
 )
 from marimo._runtime.context.utils import get_mode
 from marimo._runtime.control_flow import MarimoInterrupt
+from marimo._runtime.dataflow.templates import GRAPH_TEMPLATES, template_key
 from marimo._runtime.input_override import getpass_override
 from marimo._runtime.kernel_request_handlers import KernelRequestHandlers
 from marimo._runtime.packages.module_registry import ModuleRegistry
@@ -173,10 +175,13 @@ from marimo._utils.signals import restore_signals
 from marimo._utils.typed_connection import TypedConnection
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
+    from collections.abc import Callable, Hashable, Iterator, Sequence
     from types import ModuleType
 
     from marimo._plugins.ui._core.ui_element import UIElement
+    from marimo._runtime.utils.set_ui_element_request_manager import (
+        SetUIElementRequestManager,
+    )
     from marimo._runtime.virtual_file import VirtualFileStorageType
 
 LOGGER = _loggers.marimo_logger()
@@ -641,6 +646,13 @@ class Kernel:
         # Mapping from state to the cell when its setter
         # was invoked. New state updates evict older ones.
         self.state_updates: dict[State[Any], CellId_t] = {}
+        # Set by the control loop; lets runs for elements with the
+        # latest-value-wins policy see newer values while they run.
+        self.ui_request_manager: SetUIElementRequestManager | None = None
+        # Number of runs cut short by a newer value for the same element
+        self.preempted_runs = 0
+        # Cells those runs left stale, for the newer value's run
+        self._preempted_cells: set[CellId_t] = set()
 
         # Override getpass.getpass to route through marimo's stdin with
         # password masking, instead of trying /dev/tty or falling back
@@ -873,13 +885,54 @@ class Kernel:
         self.graph.register_cell(cell_id, cell)
         if stale:
             self.graph.cells[cell_id].set_stale(stale=True, broadcast=False)
-        # leaky abstraction: the graph doesn't know about stale modules, so
-        # we have to check for them here.
-        self.autoreload_manager.flag_if_imports_stale(cell)
+        # leaky abstraction: the graph doesn't know about modules, so the
+        # autoreloader indexes the cell's imports and checks for stale
+        # ones here.
+        self.autoreload_manager.register_cell(cell_id, cell)
         LOGGER.debug("registered cell %s", cell_id)
         LOGGER.debug("parents: %s", self.graph.parents[cell_id])
         LOGGER.debug("children: %s", self.graph.children[cell_id])
 
+    def _graph_template_key(
+        self,
+        execution_requests: Sequence[ExecuteCellCommand],
+        deletion_requests: Sequence[DeleteCellCommand],
+        cells_starting_stale: set[CellId_t],
+    ) -> Hashable | None:
+        """Key of the shared template for the graph these requests build,
+        if it can be forked from one.
+
+        Only run-mode kernels share templates, since they serve many
+        sessions of the same file, and only when populating an empty graph.
+        """
+        filename = self.app_metadata.filename
+        if (
+            get_mode() != "run"
+            or filename is None
+            or self.graph.cells
+            or deletion_requests
+            or cells_starting_stale
+        ):
+            return None
+        return template_key(
+            filename, ((er.cell_id, er.code) for er in execution_requests)
+        )
+
+    def _register_forked_cells(self) -> set[CellId_t]:
+        """Finish registering the cells of a graph forked from a template,
+        as `_register_cell` would have."""
+        for cell_id, cell in self.graph.cells.items():
+            if cell_id in self.cell_metadata:
+                cell.configure(self.cell_metadata[cell_id].config)
+            else:
+                self.cell_metadata[cell_id] = CellMetadata()
+            self.autoreload_manager.register_cell(cell_id, cell)
+        disabled = self.graph.flagged_mask("disabled")
+        for cell_id, cell in self.graph.cells.items():
+            if self.graph.is_any_ancestor_disabled(cell_id, disabled):
+                cell.set_runtime_state(status="disabled-transitively")
+        return set(self.graph.cells)
+
     def _try_compiling_cell(
         self, cell_id: CellId_t, code: str, carried_imports: list[ImportData]
     ) -> tuple[CellImpl | None, Error | None]:
@@ -891,11 +944,18 @@ class Kernel:
             filename = None
             if get_mode() == "run" or os.environ.get("DEBUGPY_RUNNING"):
                 filename = self.app_metadata.filename
+            # Scratchpad code is throwaway; don't cache it.
+            compile_cache = (
+                get_compiled_cell_cache(self.app_metadata.filename)
+                if cell_id != SCRATCH_CELL_ID
+                else None
+            )
             cell = compile_cell(
                 code,
                 cell_id=cell_id,
                 carried_imports=carried_imports,
                 filename=filename,
+                compile_cache=compile_cache,
             )
         except Exception as e:
             cell = None
@@ -1173,6 +1233,7 @@ class Kernel:
         In contrast to deleting a cell, which fully scrubs the cell
         from the kernel and graph.
         """
+        self.autoreload_manager.unregister_cell(cell_id)
         if cell_id not in self.errors:
             self._invalidate_cell_state(cell_id, deletion=True)
             return self.graph.delete_cell(cell_id)
@@ -1199,6 +1260,8 @@ class Kernel:
 
         # Note: we don't remove packages from the inline script-metadata.
 
+        # The cell's output is gone, so it no longer keeps files alive
+        get_context().virtual_file_registry.track_output(cell_id, "")
         return self._deactivate_cell(cell_id)
 
     def mutate_graph(
@@ -1249,15 +1312,27 @@ class Kernel:
         syntax_errors: dict[CellId_t, Error] = {}
 
         # Register and delete cells
-        for er in execution_requests:
-            old_children, error = self._maybe_register_cell(
-                er.cell_id, er.code, stale=er.cell_id in cells_starting_stale
-            )
-            cells_that_were_children_of_mutated_cells |= old_children
-            if error is None:
-                registered_cell_ids.add(er.cell_id)
-            else:
-                syntax_errors[er.cell_id] = error
+        template = self._graph_template_key(
+            execution_requests, deletion_requests, cells_starting_stale
+        )
+        if template is not None and GRAPH_TEMPLATES.fork(
+            template, into=self.graph
+        ):
+            registered_cell_ids = self._register_forked_cells()
+        else:
+            for er in execution_requests:
+                old_children, error = self._maybe_register_cell(
+                    er.cell_id,
+                    er.code,
+                    stale=er.cell_id in cells_starting_stale,
+                )
+                cells_that_were_children_of_mutated_cells |= old_children
+                if error is None:
+                    registered_cell_ids.add(er.cell_id)
+                else:
+                    syntax_errors[er.cell_id] = error
+            if template is not None and not syntax_errors:
+                GRAPH_TEMPLATES.put(template, self.graph)
 
         for dr in deletion_requests:
             if dr.cell_id not in cells_before_mutation:
@@ -1266,6 +1341,11 @@ class Kernel:
                 dr.cell_id
             )
         cells_in_graph = set(self.graph.cells.keys())
+        compiled_cell_cache = get_compiled_cell_cache(
+            self.app_metadata.filename
+        )
+        if compiled_cell_cache is not None:
+            compiled_cell_cache.flush(cells_in_graph)
 
         # Check for semantic errors, like multiple definition errors, cycle
         # errors, and delete nonlocal errors.
@@ -1366,12 +1446,13 @@ class Kernel:
             self._invalidate_cell_state(cid, exclude_defs=keep_alive_defs)
 
         self.errors = all_errors
+        disabled = self.graph.flagged_mask("disabled")
         for cid in self.errors:
             cell = self.graph.cells.get(cid, None)
             if (
                 cell is not None
                 and not cell.config.disabled
-                and self.graph.is_disabled(cid)
+                and self.graph.is_disabled(cid, disabled)
             ):
                 # this may be the first time we're seeing the cell: set its
                 # status
@@ -1440,8 +1521,17 @@ class Kernel:
         else:
             return cells_registered_without_error.union(stale_cells)
 
-    async def _run_cells(self, cell_ids: set[CellId_t]) -> None:
-        """Run cells and any state updates they trigger"""
+    async def _run_cells(
+        self,
+        cell_ids: set[CellId_t],
+        *,
+        preempt: Callable[[], bool] | None = None,
+    ) -> None:
+        """Run cells and any state updates they trigger
+
+        If given, `preempt` is polled between cells; the run stops early
+        once it returns True.
+        """
 
         with run_id_context():
             # This patch is an attempt to mitigate problems caused by the fact
@@ -1453,26 +1543,32 @@ class Kernel:
                 # Snapshot disabled cells that are in an error/cancelled state
                 # BEFORE running, so we can clear them after the run if their
                 # ancestor recovered.
+                disabled = self.graph.flagged_mask("disabled")
                 pre_run_errored_disabled = {
                     cid
                     for cid, cell in self.graph.cells.items()
-                    if self.graph.is_disabled(cid)
+                    if self.graph.is_disabled(cid, disabled)
                     and cell.run_result_status
                     in ("exception", "marimo-error", "cancelled")
                 }
-                while cell_ids := await self._run_cells_internal(cell_ids):
+                while cell_ids := await self._run_cells_internal(
+                    cell_ids, preempt=preempt
+                ):
                     LOGGER.debug("Running state updates ...")
                     if self.lazy() and cell_ids:
                         self.graph.set_stale(cell_ids, prune_imports=True)
                         break
                 LOGGER.debug("Finished run.")
+                self._log_run_stats()
                 # Clear stale error state from disabled cells whose ancestor
                 # recovered. Uses pre-run snapshot since run_result_status is
                 # updated during the run.
+                errored = self.graph.flagged_mask("errored")
                 for cid in pre_run_errored_disabled:
                     cell_impl = self.graph.cells[cid]
-                    if not self.graph.is_any_ancestor_errored(cid):
+                    if not self.graph.is_any_ancestor_errored(cid, errored):
                         cell_impl.set_run_result_status("disabled")
+                        errored &= ~self.graph.topology.mask((cid,))
                         status = cast(
                             RuntimeStateType,
                             "idle"
@@ -1484,6 +1580,22 @@ class Kernel:
                             cell_id=cid, status=status
                         )
 
+    def _log_run_stats(self) -> None:
+        """Log the session's virtual file usage and preempted runs, for
+        debugging memory use and responsiveness."""
+        LOGGER.debug(
+            "Runs preempted by newer UI values: %d", self.preempted_runs
+        )
+        ctx = get_context()
+        if ctx.virtual_files_supported:
+            stats = ctx.virtual_file_registry.stats()
+            LOGGER.debug(
+                "Virtual files: %d live, %d bytes, %d evicted",
+                stats.files,
+                stats.nbytes,
+                stats.evictions,
+            )
+
     async def maybe_autorun_cells(self, cell_ids: set[CellId_t]) -> None:
         if self.reactive_execution_mode == "autorun":
             await self._run_cells(cell_ids)
@@ -1500,7 +1612,12 @@ class Kernel:
             if isinstance(error, MarimoStrictExecutionError):
                 self.errors[cell_id] = (error,)
 
-    async def _run_cells_internal(self, roots: set[CellId_t]) -> set[CellId_t]:
+    async def _run_cells_internal(
+        self,
+        roots: set[CellId_t],
+        *,
+        preempt: Callable[[], bool] | None = None,
+    ) -> set[CellId_t]:
         """Run cells, send outputs to frontends
 
         Returns set of cells that need to be re-run due to state updates.
@@ -1531,6 +1648,10 @@ class Kernel:
         run_hooks = self._hooks.copy()
         run_hooks.add_preparation(invalidate_state)
         run_hooks.add_post_execution(note_time_of_interruption, Priority.LATE)
+        run_hooks.add_pre_execution(self.datasets_callbacks.cancel_datasets)
+        run_hooks.add_post_execution(
+            self.datasets_callbacks.broadcast_datasets
+        )
         run_hooks.add_on_finish(self.packages_callbacks.missing_packages_hook)
         run_hooks.add_on_finish(self._propagate_kernel_errors)
 
@@ -1551,6 +1672,7 @@ class Kernel:
             execution_context=self._install_execution_context,
             hooks=run_hooks,
             user_config=self.user_config,
+            preempt=preempt,
         )
 
         # I/O
@@ -1559,6 +1681,9 @@ class Kernel:
         #                 redirected to frontend (it's printed to console),
         #                 which is incorrect
         await runner.run_all()
+        if runner.preempted:
+            self.preempted_runs += 1
+            self._preempted_cells |= runner.preempted_cells
         with self._state_lock:
             cells_with_stale_state = runner.resolve_state_updates(
                 self.state_updates
@@ -1889,8 +2014,9 @@ class Kernel:
             )
             self._uninstantiated_execution_requests = {}
 
+        disabled = self.graph.flagged_mask("disabled")
         for cid, cell_impl in self.graph.cells.items():
-            if cell_impl.stale and not self.graph.is_disabled(cid):
+            if cell_impl.stale and not self.graph.is_disabled(cid, disabled):
                 cells_to_run.add(cid)
 
         await self._run_cells(
@@ -1967,12 +2093,18 @@ class Kernel:
         resolved_requests: dict[UIElementId, Any] = {}
         referring_cells: set[CellId_t] = set()
         ui_element_registry = ctx.ui_element_registry
+        requested_ids = frozenset(request.object_ids)
+        # Runs are only preempted by a newer value if every updated element
+        # opted in with `UIElement.latest_value_wins()`: cells downstream
+        # of the others must still see their value.
+        preemptible = True
         for object_id, value in request.ids_and_values:
             try:
                 resolved_id, resolved_value = ui_element_registry.resolve_lens(
                     object_id, value
                 )
             except (KeyError, RuntimeError):
+                preemptible = False
                 # Attempt to set the UI element in a child context (app).
                 for child_context in ctx.children:
                     if (
@@ -2021,6 +2153,7 @@ class Kernel:
                 # assigned to a global variable
                 LOGGER.debug("Could not find UIElement with id %s", object_id)
                 continue
+            preemptible = preemptible and component._latest_value_wins
 
             with self._install_execution_context(
                 ui_element_registry.get_cell(object_id),
@@ -2109,7 +2242,15 @@ class Kernel:
                 )
 
         if self.reactive_execution_mode == "autorun":
-            await self._run_cells(referring_cells)
+            # Cells that a preempted run left stale are run here too, in
+            # case this update skipped them (e.g. its value didn't convert)
+            referring_cells |= self._take_preempted_cells()
+            await self._run_cells(
+                referring_cells,
+                preempt=self._preempt_for(requested_ids)
+                if preemptible and resolved_requests
+                else None,
+            )
         else:
             # Any cells referring to a UI element cannot be import cells,
             # so not necessary to specify `prune_imports`.
@@ -2136,6 +2277,26 @@ class Kernel:
 
         return bool(updated_components) or bool(referring_cells)
 
+    def _take_preempted_cells(self) -> set[CellId_t]:
+        """The cells dropped by preempted runs that are still stale."""
+        cells = {
+            cell_id
+            for cell_id in self._preempted_cells
+            if cell_id in self.graph.cells and self.graph.cells[cell_id].stale
+        }
+        self._preempted_cells.clear()
+        return cells
+
+    def _preempt_for(
+        self, object_ids: frozenset[UIElementId]
+    ) -> Callable[[], bool] | None:
+        """A check for whether a newer value for any of `object_ids` has
+        arrived, or None without a control loop to receive one."""
+        manager = self.ui_request_manager
+        if manager is None:
+            return None
+        return lambda: manager.superseded(object_ids)
+
     def get_ui_initial_value(self, object_id: str) -> Any:
         """Get an initial value for a UIElement, if any.
 
@@ -15,7 +15,7 @@ from marimo._types.ids import UIElementId, WidgetModelId
 
 if TYPE_CHECKING:
     import asyncio
-    from collections.abc import Callable
+    from collections.abc import Callable, Collection
 
 A = TypeVar("A")
 B = TypeVar("B")
@@ -182,6 +182,9 @@ class SetUIElementRequestManager:
         # been processed via the drain so the control_queue copy
         # can be skipped.
         self._processed_tokens: set[str] = set()
+        # Commands drained by `superseded` while a run was in flight;
+        # they are processed with the next request.
+        self._buffered: list[BatchableCommand] = []
 
     def _dedup(
         self,
@@ -208,13 +211,29 @@ class SetUIElementRequestManager:
         Contiguous runs of same-type commands are merged together while
         preserving the relative interleaving order of different types.
         """
-        pending: list[BatchableCommand] = []
+        pending, self._buffered = self._buffered, []
 
         # Add the triggering request (with token dedup)
         self._dedup(request, pending)
 
         # Drain everything currently in the queue
-        while not self._set_ui_element_queue.empty():
-            self._dedup(self._set_ui_element_queue.get_nowait(), pending)
+        self._drain(pending)
 
         return merge_batchable_commands(pending)
+
+    def superseded(self, object_ids: Collection[UIElementId]) -> bool:
+        """Whether a newer value for any of `object_ids` has arrived.
+
+        Called while a run is in flight; commands drained to answer are
+        buffered, and processed with the next request.
+        """
+        self._drain(self._buffered)
+        return any(
+            isinstance(cmd, UpdateUIElementCommand)
+            and any(object_id in object_ids for object_id in cmd.object_ids)
+            for cmd in self._buffered
+        )
+
+    def _drain(self, pending: list[BatchableCommand]) -> None:
+        while not self._set_ui_element_queue.empty():
+            self._dedup(self._set_ui_element_queue.get_nowait(), pending)
@@ -10,6 +10,7 @@ from __future__ import annotations
 from marimo._runtime.virtual_file.storage import (
     InMemoryStorage,
     SharedMemoryStorage,
+    VirtualFileContents,
     VirtualFileStorage,
     VirtualFileStorageManager,
     VirtualFileStorageType,
@@ -20,6 +21,7 @@ from marimo._runtime.virtual_file.virtual_file import (
     VirtualFileLifecycleItem,
     VirtualFileRegistry,
     VirtualFileRegistryItem,
+    VirtualFileStats,
     random_filename,
     read_virtual_file,
     read_virtual_file_chunked,
@@ -29,6 +31,7 @@ __all__ = [  # noqa: RUF022
     # Storage
     "VirtualFileStorage",
     "VirtualFileStorageType",
+    "VirtualFileContents",
     "SharedMemoryStorage",
     "InMemoryStorage",
     "VirtualFileStorageManager",
@@ -38,6 +41,7 @@ __all__ = [  # noqa: RUF022
     "VirtualFileLifecycleItem",
     "VirtualFileRegistryItem",
     "VirtualFileRegistry",
+    "VirtualFileStats",
     "random_filename",
     "read_virtual_file",
     "read_virtual_file_chunked",
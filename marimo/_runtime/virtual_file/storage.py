@@ -1,16 +1,40 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import contextlib
+import itertools
+import mmap
+import os
+import re
+import stat
 import sys
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal, Protocol
 
+from marimo import _loggers
 from marimo._utils.platform import is_pyodide
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Generator, Iterator
+
+LOGGER = _loggers.marimo_logger()
 
 DEFAULT_CHUNK_SIZE = 256 * 1024  # 256KB
 
+# Contents larger than this are written to a memory-mapped temporary file
+# instead of shared memory, which is often small (64MB in Docker
+# containers by default) and is backed by RAM.
+SPILL_THRESHOLD = 32 * 1024 * 1024  # 32MB
+
+# Anything exposing the buffer protocol: bytes, bytearray, memoryview,
+# numpy arrays, ...
+BufferLike = bytes | bytearray | memoryview
+# Either a buffer, or a producer (e.g. a generator) of buffers that are
+# written to storage as they are produced.
+VirtualFileContents = BufferLike | Iterable[BufferLike]
+
 VirtualFileStorageType = Literal["in_memory", "shared_memory"]
 
 if not is_pyodide():
@@ -21,8 +45,11 @@ if not is_pyodide():
 class VirtualFileStorage(Protocol):
     """Protocol for virtual file storage backends."""
 
-    def store(self, key: str, buffer: bytes) -> None:
-        """Store buffer data by key."""
+    def store(self, key: str, buffer: VirtualFileContents) -> int:
+        """Store a buffer, or the buffers yielded by a producer, by key.
+
+        Returns the number of bytes stored. Empty contents are not stored.
+        """
         ...
 
     def read(self, key: str, byte_length: int) -> bytes:
@@ -79,14 +106,120 @@ class VirtualFileStorage(Protocol):
         ...
 
 
+def as_buffer(contents: VirtualFileContents) -> memoryview | None:
+    """A flat view of the bytes of `contents`, without copying them.
+
+    Returns None if `contents` does not support the buffer protocol, in
+    which case it is a producer of buffers.
+    """
+    try:
+        view = memoryview(contents)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    return view
+
+
+def _iter_buffers(contents: Iterable[BufferLike]) -> Iterator[memoryview]:
+    for chunk in contents:
+        view = as_buffer(chunk)
+        if view is None:
+            raise TypeError(
+                f"Expected a bytes-like object, got {type(chunk).__name__}"
+            )
+        if view.nbytes:
+            yield view
+        # Producers may reuse (and resize) their buffers once resumed
+        view.release()
+
+
+# Spilled files are named by their key; keys come from URLs, so they
+# must not be able to name anything outside the spill directory.
+_SPILLABLE_KEY = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9._-]*$")
+
+
+def _spill_dir() -> Path | None:
+    """This user's directory for spilled virtual files, or None if it
+    can't be used safely."""
+    uid = os.getuid() if hasattr(os, "getuid") else None
+    name = (
+        "marimo-virtual-files"
+        if uid is None
+        else f"marimo-{uid}-virtual-files"
+    )
+    path = Path(tempfile.gettempdir()) / name
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    # Don't trust a directory that someone else created or can write to
+    if uid is not None and (st.st_uid != uid or st.st_mode & 0o077):
+        return None
+    return path
+
+
+def _spill_path(key: str) -> Path | None:
+    if _SPILLABLE_KEY.match(key) is None:
+        return None
+    directory = _spill_dir()
+    return directory / key if directory is not None else None
+
+
+@contextlib.contextmanager
+def _open_by_name(key: str) -> Generator[memoryview, None, None]:
+    """Map the contents stored under `key` by a `SharedMemoryStorage` in
+    any process.
+
+    Raises:
+        KeyError: If key not found
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=key)
+    except FileNotFoundError:
+        pass
+    else:
+        try:
+            yield shm.buf
+        finally:
+            shm.close()
+        return
+
+    path = _spill_path(key)
+    if path is None:
+        raise KeyError(f"Virtual file not found: {key}")
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError as err:
+        raise KeyError(f"Virtual file not found: {key}") from err
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        # Release the memoryview before closing the map, otherwise
+        # close() fails with "cannot close exported pointers".
+        view.release()
+        mapped.close()
+
+
 class SharedMemoryStorage(VirtualFileStorage):
     """Storage backend using multiprocessing shared memory.
 
-    Used in `edit` mode when kernel runs in a separate process.
+    Used in `edit` mode when kernel runs in a separate process. Contents
+    larger than `SPILL_THRESHOLD` are instead written to a file in a
+    private temporary directory, which readers memory-map.
     """
 
     def __init__(self) -> None:
         self._storage: dict[str, shared_memory.SharedMemory] = {}
+        self._spilled: dict[str, Path] = {}
+        self._sizes: dict[str, int] = {}
         self._shutting_down = False
         self._stale = False
 
@@ -94,28 +227,62 @@ class SharedMemoryStorage(VirtualFileStorage):
     def stale(self) -> bool:
         return self._stale
 
-    def store(self, key: str, buffer: bytes) -> None:
-        if key in self._storage:
-            return  # Already stored
+    def store(self, key: str, buffer: VirtualFileContents) -> int:
+        if key in self._sizes:
+            return self._sizes[key]  # Already stored
 
         # Immediately writes the contents of the file to an in-memory
-        # buffer; not lazy.
-        #
-        # To retrieve the buffer from another process, use:
+        # buffer (or a file); not lazy.
         #
-        # ```
-        # try:
-        #   shm = shared_memory.SharedMemory(name=key)
-        #   buffer_contents = bytes(shm.buf)
-        # except FileNotFoundError:
-        #   # virtual file was removed
-        # ```
+        # To retrieve the buffer from another process, use `read()` or
+        # `read_chunked()` on any `SharedMemoryStorage`; these look up
+        # the contents by name.
+        view = as_buffer(buffer)
+        if view is None:
+            size = self._store_stream(key, _iter_buffers(buffer))  # type: ignore[arg-type]
+        elif view.nbytes == 0:
+            size = 0
+        elif view.nbytes <= SPILL_THRESHOLD or not self._spill(key, [view]):
+            size = self._store_shared(key, [view], view.nbytes)
+        else:
+            size = view.nbytes
+        if size > 0:
+            self._sizes[key] = size
+        return size
+
+    def _store_stream(self, key: str, chunks: Iterator[memoryview]) -> int:
+        # The size of a stream isn't known up front, so buffer it until
+        # it's either exhausted or too large for shared memory. Chunks are
+        # copied, since producers may reuse the buffers they yield.
+        pending: list[bytes] = []
+        size = 0
+        for chunk in chunks:
+            pending.append(chunk.tobytes())
+            size += chunk.nbytes
+            if size > SPILL_THRESHOLD:
+                spilled = self._spill(key, itertools.chain(pending, chunks))
+                if spilled is not None:
+                    return spilled
+                # Can't spill, so keep the rest in shared memory too
+                pending.extend(chunk.tobytes() for chunk in chunks)
+                size = sum(len(chunk) for chunk in pending)
+                break
+        if size > 0:
+            self._store_shared(key, pending, size)
+        return size
+
+    def _store_shared(
+        self, key: str, chunks: Iterable[BufferLike], size: int
+    ) -> int:
         shm = shared_memory.SharedMemory(
             name=key,
             create=True,
-            size=len(buffer),
+            size=size,
         )
-        shm.buf[: len(buffer)] = buffer
+        offset = 0
+        for chunk in chunks:
+            shm.buf[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
         # we can safely close this shm, since we don't need to access its
         # buffer; we do need to keep it around so we can unlink it later
         if sys.platform != "win32":
@@ -127,26 +294,49 @@ class SharedMemoryStorage(VirtualFileStorage):
         # We have to keep a reference to the shared memory to prevent it from
         # being destroyed on Windows
         self._storage[key] = shm
+        return size
+
+    def _spill(self, key: str, chunks: Iterable[BufferLike]) -> int | None:
+        """Write `chunks` to a file; returns the number of bytes written,
+        or None if spilling isn't possible and nothing was consumed."""
+        path = _spill_path(key)
+        if path is None:
+            return None
+        try:
+            fd = os.open(
+                path,
+                os.O_WRONLY
+                | os.O_CREAT
+                | os.O_EXCL
+                | getattr(os, "O_BINARY", 0),
+                0o600,
+            )
+        except OSError as err:
+            LOGGER.debug("Failed to spill virtual file %s: %s", key, err)
+            return None
+        size = 0
+        try:
+            with open(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        self._spilled[key] = path
+        return size
 
     def read(self, key: str, byte_length: int) -> bytes:
         if is_pyodide():
             raise RuntimeError(
                 "Shared memory is not supported on this platform"
             )
-        # Read from shared memory by name (works cross-process)
-        shm = None
-        try:
-            shm = shared_memory.SharedMemory(name=key)
+        # Read by name (works cross-process)
+        with _open_by_name(key) as buf:
             # Slice the memoryview first, then copy — avoids allocating
             # a bytes object for the entire buffer when only a prefix
             # is needed.
-            buffer_contents = bytes(shm.buf[:byte_length])
-        except FileNotFoundError as err:
-            raise KeyError(f"Virtual file not found: {key}") from err
-        finally:
-            if shm is not None:
-                shm.close()
-        return buffer_contents
+            return bytes(buf[:byte_length])
 
     def read_chunked(
         self,
@@ -159,29 +349,34 @@ class SharedMemoryStorage(VirtualFileStorage):
             raise RuntimeError(
                 "Shared memory is not supported on this platform"
             )
-        shm = None
-        view = None
-        try:
-            shm = shared_memory.SharedMemory(name=key)
-            view = shm.buf[start : start + byte_length]
-            for i in range(0, byte_length, chunk_size):
-                yield bytes(view[i : i + chunk_size])
-        except FileNotFoundError as err:
-            raise KeyError(f"Virtual file not found: {key}") from err
-        finally:
-            # Release the memoryview before closing the shared memory,
-            # otherwise close() fails with "cannot close exported pointers".
-            if view is not None:
+        with _open_by_name(key) as buf:
+            view = buf[start : start + byte_length]
+            try:
+                for i in range(0, byte_length, chunk_size):
+                    yield bytes(view[i : i + chunk_size])
+            finally:
+                # Release the memoryview before the buffer is closed,
+                # otherwise close() fails with "cannot close exported
+                # pointers".
                 view.release()
-            if shm is not None:
-                shm.close()
 
-    def remove(self, key: str) -> None:
+    def _unlink(self, key: str) -> None:
+        self._sizes.pop(key, None)
         if key in self._storage:
+            shm = self._storage.pop(key)
             if sys.platform == "win32":
-                self._storage[key].close()
-            self._storage[key].unlink()
-            del self._storage[key]
+                shm.close()
+            shm.unlink()
+        path = self._spilled.pop(key, None)
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as err:
+                # On Windows, files can't be removed while mapped by a reader
+                LOGGER.debug("Failed to remove spilled file %s: %s", path, err)
+
+    def remove(self, key: str) -> None:
+        self._unlink(key)
 
     def shutdown(self, keys: Iterable[str] | None = None) -> None:
         if self._shutting_down:
@@ -193,18 +388,15 @@ class SharedMemoryStorage(VirtualFileStorage):
                     self.remove(key)
                 return
 
-            for shm in self._storage.values():
-                if sys.platform == "win32":
-                    shm.close()
-                shm.unlink()
-            self._storage.clear()
+            for key in list(self._sizes):
+                self._unlink(key)
         finally:
             self._shutting_down = False
             if keys is None:
                 self._stale = True
 
     def has(self, key: str) -> bool:
-        return key in self._storage
+        return key in self._sizes
 
 
 class InMemoryStorage(VirtualFileStorage):
@@ -220,8 +412,22 @@ class InMemoryStorage(VirtualFileStorage):
     def stale(self) -> bool:
         return False  # Never stale - can be shared
 
-    def store(self, key: str, buffer: bytes) -> None:
-        self._storage[key] = buffer
+    def store(self, key: str, buffer: VirtualFileContents) -> int:
+        contents: bytes
+        if isinstance(buffer, bytes):
+            # Immutable, so no need to copy
+            contents = buffer
+        elif (view := as_buffer(buffer)) is not None:
+            # Copy, since the owner may still mutate it
+            contents = view.tobytes()
+        else:
+            contents = b"".join(
+                chunk.tobytes()
+                for chunk in _iter_buffers(buffer)  # type: ignore[arg-type]
+            )
+        if len(contents) > 0:
+            self._storage[key] = contents
+        return len(contents)
 
     def read(self, key: str, byte_length: int) -> bytes:
         if key not in self._storage:
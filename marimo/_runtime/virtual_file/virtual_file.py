@@ -5,6 +5,7 @@ import base64
 import dataclasses
 import mimetypes
 import random
+import re
 import string
 import threading
 from typing import TYPE_CHECKING, cast
@@ -17,8 +18,11 @@ from marimo._messaging.mimetypes import KnownMimeType
 from marimo._runtime.cell_lifecycle_item import CellLifecycleItem
 from marimo._runtime.context import ContextNotInitializedError
 from marimo._runtime.virtual_file.storage import (
+    BufferLike,
+    VirtualFileContents,
     VirtualFileStorage,
     VirtualFileStorageManager,
+    as_buffer,
 )
 from marimo._utils.data_uri import build_data_url
 from marimo._utils.http import HTTPException, HTTPStatus
@@ -27,6 +31,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from marimo._runtime.context.types import RuntimeContext
+    from marimo._types.ids import CellId_t
 
 LOGGER = _loggers.marimo_logger()
 
@@ -45,28 +50,43 @@ def random_filename(ext: str) -> str:
     return f"{basename}.{ext}"
 
 
+def _file_url(filename: str, size: int) -> str:
+    # Create a file URL with the buffer size
+    # This is a hack so when we pull from shared memory we know how
+    # many bytes to read.
+    # Also, URL is intentionally relative, so it can be resolved with
+    # different base URLs.
+    return f"./@file/{size}-{filename}"
+
+
+def _collect(contents: VirtualFileContents) -> bytes:
+    """Contents as bytes, for when they can't be moved into storage."""
+    if isinstance(contents, bytes):
+        return contents
+    if (view := as_buffer(contents)) is not None:
+        # Copy, so we don't hold on to (and pin) the caller's buffer
+        return view.tobytes()
+    return b"".join(bytes(chunk) for chunk in contents)  # type: ignore[union-attr]
+
+
 @dataclasses.dataclass
 class VirtualFile:
     url: str
     filename: str
-    buffer: bytes
+    # Empty once the contents have been moved into the registry's storage
+    buffer: BufferLike
 
     def __init__(
         self,
         filename: str,
-        buffer: bytes,
+        buffer: BufferLike,
         url: str | None = None,
         as_data_url: bool = False,
     ) -> None:
         self.filename = filename
         self.buffer = buffer
-        # Create a file URL with the buffer size
-        # This is a hack so when we pull from shared memory we know how
-        # many bytes to read.
-        # Also, URL is intentionally relative, so it can be resolved with
-        # different base URLs.
         if not as_data_url:
-            self.url = url or f"./@file/{len(buffer)}-{filename}"
+            self.url = url or _file_url(filename, _nbytes(buffer))
         else:
             mimetype = mimetypes.guess_type(self.filename)[0] or "text/plain"
             self.url = url or build_data_url(
@@ -83,9 +103,14 @@ class VirtualFile:
         )
 
     @staticmethod
-    def create_and_register(buffer: bytes, ext: str) -> VirtualFile:
+    def create_and_register(
+        buffer: VirtualFileContents, ext: str
+    ) -> VirtualFile:
         """Create a virtual file and register it in the current context.
 
+        `buffer` is any bytes-like object, or a producer of bytes-like
+        chunks (such as a generator), which is streamed into storage.
+
         Falls back to a data URL if no runtime context is available,
         virtual files aren't supported, or the buffer is empty.
         """
@@ -95,14 +120,11 @@ class VirtualFile:
 
         def return_data_url() -> VirtualFile:
             return VirtualFile(
-                filename=vfile_name, buffer=buffer, as_data_url=True
+                filename=vfile_name,
+                buffer=_collect(buffer),
+                as_data_url=True,
             )
 
-        # Empty buffers can't be served via the file registry, so use a
-        # data URL instead to ensure the URL is always resolvable.
-        if len(buffer) == 0:
-            return return_data_url()
-
         try:
             ctx = get_context()
         except ContextNotInitializedError:
@@ -111,8 +133,13 @@ class VirtualFile:
         if not ctx.virtual_files_supported:
             return return_data_url()
 
-        vfile = VirtualFile(filename=vfile_name, buffer=buffer)
-        ctx.virtual_file_registry.add(vfile, ctx)
+        vfile = ctx.virtual_file_registry.store(vfile_name, buffer)
+        # Empty buffers can't be served via the file registry, so use a
+        # data URL instead to ensure the URL is always resolvable.
+        if vfile is None:
+            return VirtualFile(
+                filename=vfile_name, buffer=b"", as_data_url=True
+            )
         return vfile
 
 
@@ -126,7 +153,7 @@ EMPTY_VIRTUAL_FILE = VirtualFile(
 
 
 class VirtualFileLifecycleItem(CellLifecycleItem):
-    def __init__(self, ext: str, buffer: bytes) -> None:
+    def __init__(self, ext: str, buffer: VirtualFileContents) -> None:
         self.ext = _without_leading_dot(ext)
         self.buffer = buffer
         # Not resolved until added to registry
@@ -159,7 +186,9 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
         filename = random_filename(self.ext)
         if context is None or not context.virtual_files_supported:
             self._virtual_file = VirtualFile(
-                filename=filename, buffer=self.buffer, as_data_url=True
+                filename=filename,
+                buffer=_collect(self.buffer),
+                as_data_url=True,
             )
             return
 
@@ -175,27 +204,72 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
                 "Failed to add virtual file to registry. "
                 "This is a bug in marimo. Please file an issue."
             )
-        self._virtual_file = VirtualFile(filename, self.buffer)
-        context.virtual_file_registry.add(self._virtual_file, context)
+        self._virtual_file = registry.store(
+            filename, self.buffer
+        ) or VirtualFile(filename, b"")
+        # The storage owns the contents now
+        self.buffer = b""
 
     def dispose(self, context: RuntimeContext, deletion: bool) -> bool:
-        # Remove the file if the refcount is 0, or if the cell is being
+        # Remove the file if nothing references it, or if the cell is being
         # deleted. (We can't rely on when the refcount will be decremented, so
         # we need to check for deletion explicitly to prevent leaks.)
-        if deletion or (
-            context.virtual_file_registry.refcount(self.virtual_file.filename)
-            <= 0
+        if deletion or not context.virtual_file_registry.referenced(
+            self.virtual_file.filename
         ):
             context.virtual_file_registry.remove(self.virtual_file)
             return True
-        # refcount > 0, so need to keep this disposal hook around
+        # still referenced, so need to keep this disposal hook around
         return False
 
 
+# Matches the filenames in virtual file URLs, e.g. `./@file/11-1-abc.png`
+_FILE_URL = re.compile(r"@file/\d+-([\w.-]+)")
+
+DEFAULT_VIRTUAL_FILES_MAX_BYTES = 500_000_000  # 500MB
+
+
+def virtual_files_max_bytes() -> int | None:
+    """The most bytes of virtual files a session keeps, or None if
+    unlimited."""
+    from marimo._runtime.context import get_context
+
+    try:
+        max_bytes = (
+            get_context()
+            .marimo_config["runtime"]
+            .get("virtual_files_max_bytes", DEFAULT_VIRTUAL_FILES_MAX_BYTES)
+        )
+    except ContextNotInitializedError:
+        return DEFAULT_VIRTUAL_FILES_MAX_BYTES
+    # Negative disables the quota
+    return max_bytes if max_bytes >= 0 else None
+
+
 @dataclasses.dataclass
 class VirtualFileRegistryItem:
     # number of HTML objects that are referencing this virtual file
     refcount: int
+    # size of the file's contents, in bytes
+    nbytes: int = 0
+    # cells whose current output references this virtual file
+    outputs: set[CellId_t] = dataclasses.field(default_factory=set)
+    # whether this file has appeared in a cell's output
+    shown: bool = False
+
+    @property
+    def referenced(self) -> bool:
+        return self.refcount > 0 or bool(self.outputs)
+
+
+@dataclasses.dataclass(frozen=True)
+class VirtualFileStats:
+    # number of virtual files in storage
+    files: int
+    # total size of their contents, in bytes
+    nbytes: int
+    # number of files removed to stay within the byte quota
+    evictions: int
 
 
 @dataclasses.dataclass
@@ -204,10 +278,17 @@ class VirtualFileRegistry:
 
     The registry maps virtual file filenames to their contents. Each
     registry item is reference counted: refcount > 0 means that an object
-    exists somewhere that uses the virtual file.
+    exists somewhere that uses the virtual file. The registry also tracks
+    which cells' outputs reference each file (see `track_output`).
 
     The registry itself doesn't maintain the reference counts, it only
     exposes methods for incrementing, decrementing, and getting the counts.
+    Once a file has been shown in an output, it is removed as soon as
+    neither an object nor an output references it.
+
+    The registry is ordered from least to most recently used. When the
+    files' total size exceeds `virtual_files_max_bytes()`, the least
+    recently used files are evicted, preferring unreferenced ones.
     """
 
     storage: VirtualFileStorage
@@ -215,6 +296,13 @@ class VirtualFileRegistry:
         default_factory=dict
     )
     shutting_down: bool = False
+    # total size of the registered files, in bytes
+    nbytes: int = 0
+    evictions: int = 0
+    # filenames referenced by each cell's current output
+    _output_files: dict[CellId_t, set[str]] = dataclasses.field(
+        default_factory=dict, repr=False
+    )
 
     def __post_init__(self) -> None:
         # Set singleton reference for read_virtual_file()
@@ -237,17 +325,65 @@ class VirtualFileRegistry:
         return filename in self.registry
 
     def filenames(self) -> Iterable[str]:
-        return self.registry.keys()
+        # A snapshot, since referencing a file reorders the registry
+        return list(self.registry)
 
     def reference(self, filename: str) -> None:
         """Increment the reference count"""
         if filename in self.registry:
             self.registry[filename].refcount += 1
+            self._touch(filename)
 
     def dereference(self, filename: str) -> None:
         """Decrement the reference count"""
         if filename in self.registry:
             self.registry[filename].refcount -= 1
+            self._maybe_release(filename)
+
+    def referenced(self, filename: str) -> bool:
+        """Whether an object or a cell's output references the file"""
+        item = self.registry.get(filename)
+        return item is not None and item.referenced
+
+    def track_output(self, cell_id: CellId_t, output: str) -> None:
+        """Record that `output` is now the cell's output.
+
+        Files that the cell's previous output referenced, and that nothing
+        else references, are removed.
+        """
+        filenames = {
+            filename
+            for filename in _FILE_URL.findall(output)
+            if filename in self.registry
+        }
+        previous = self._output_files.pop(cell_id, set())
+        if filenames:
+            self._output_files[cell_id] = filenames
+        for filename in filenames - previous:
+            item = self.registry[filename]
+            item.outputs.add(cell_id)
+            item.shown = True
+            self._touch(filename)
+        for filename in previous - filenames:
+            if (item := self.registry.get(filename)) is not None:
+                item.outputs.discard(cell_id)
+                self._maybe_release(filename)
+
+    def stats(self) -> VirtualFileStats:
+        return VirtualFileStats(
+            files=len(self.registry),
+            nbytes=self.nbytes,
+            evictions=self.evictions,
+        )
+
+    def _touch(self, filename: str) -> None:
+        # Move to the most recently used end
+        self.registry[filename] = self.registry.pop(filename)
+
+    def _maybe_release(self, filename: str) -> None:
+        item = self.registry.get(filename)
+        if item is not None and item.shown and not item.referenced:
+            self._remove(filename)
 
     def refcount(self, filename: str) -> int:
         """Get the reference count"""
@@ -259,26 +395,77 @@ class VirtualFileRegistry:
         if not context.virtual_files_supported:
             return
 
-        key = virtual_file.filename
-        if key in self.registry:
-            LOGGER.debug(
-                "Virtual file (key=%s) already registered", virtual_file
+        self.store(virtual_file.filename, virtual_file.buffer)
+
+    def store(
+        self, filename: str, contents: VirtualFileContents
+    ) -> VirtualFile | None:
+        """Write `contents` to storage as `filename`.
+
+        Buffers are copied straight into storage, and producers are
+        consumed chunk by chunk, so the contents are never assembled into
+        a single `bytes` object first.
+
+        Returns the registered file, whose buffer is empty since storage
+        holds the contents, or None if there were no contents to store. If
+        `filename` is already registered, its existing file is returned and
+        `contents` are ignored.
+        """
+        if (item := self.registry.get(filename)) is not None:
+            LOGGER.debug("Virtual file (key=%s) already registered", filename)
+            self._touch(filename)
+            return VirtualFile(
+                filename, b"", url=_file_url(filename, item.nbytes)
             )
-            return
 
-        buffer = virtual_file.buffer
+        size = self.storage.store(filename, contents)
         # Skip adding if buffer is empty
-        if len(buffer) == 0:
+        if size == 0:
+            return None
+
+        self.registry[filename] = VirtualFileRegistryItem(
+            refcount=0, nbytes=size
+        )
+        self.nbytes += size
+        self._evict(keep=filename)
+        return VirtualFile(filename, b"", url=_file_url(filename, size))
+
+    def _evict(self, keep: str) -> None:
+        max_bytes = virtual_files_max_bytes()
+        if max_bytes is None or self.nbytes <= max_bytes:
             return
 
-        self.storage.store(key, buffer)
-        self.registry[key] = VirtualFileRegistryItem(refcount=0)
+        # Least recently used first, but files that nothing references
+        # before any that are still shown or in use
+        candidates = sorted(
+            (name for name in self.filenames() if name != keep),
+            key=self.referenced,
+        )
+        for filename in candidates:
+            if self.nbytes <= max_bytes:
+                break
+            if self.referenced(filename):
+                LOGGER.warning(
+                    "Removing virtual file %s, which is still in use, to "
+                    "stay within the %s byte quota (runtime."
+                    "virtual_files_max_bytes)",
+                    filename,
+                    max_bytes,
+                )
+            self._remove(filename)
+            self.evictions += 1
 
     def remove(self, virtual_file: VirtualFile) -> None:
-        key = virtual_file.filename
-        if key in self.registry:
-            self.storage.remove(key)
-            del self.registry[key]
+        self._remove(virtual_file.filename)
+
+    def _remove(self, filename: str) -> None:
+        item = self.registry.pop(filename, None)
+        if item is None:
+            return
+        self.nbytes -= item.nbytes
+        for cell_id in item.outputs:
+            self._output_files.get(cell_id, set()).discard(filename)
+        self.storage.remove(filename)
 
     def shutdown(self) -> None:
         # Try to make this method re-entrant since it's called in the
@@ -291,10 +478,16 @@ class VirtualFileRegistry:
             self.shutting_down = True
             self.storage.shutdown(keys=self.registry.keys())
             self.registry.clear()
+            self._output_files.clear()
+            self.nbytes = 0
         finally:
             self.shutting_down = False
 
 
+def _nbytes(buffer: BufferLike) -> int:
+    return memoryview(buffer).nbytes
+
+
 def _without_leading_dot(ext: str) -> str:
     return ext.removeprefix(".")
 
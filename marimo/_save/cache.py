@@ -13,6 +13,7 @@ from marimo._plugins.ui._core.ui_element import UIElement
 from marimo._runtime.cell_lifecycle_item import CellLifecycleItem
 from marimo._runtime.context import ContextNotInitializedError, get_context
 from marimo._runtime.state import SetFunctor
+from marimo._save.encode import DigestMemo
 from marimo._save.stubs import (
     CUSTOM_STUBS,
     ClassStub,
@@ -78,6 +79,9 @@ class CacheState:
 
     store: Store
     hash_memo: dict[str, bytes] = field(default_factory=dict)
+    # Digests of data primitives by object identity; unlike `hash_memo`,
+    # survives reruns of the defining cell while the object is unchanged.
+    digest_memo: DigestMemo = field(default_factory=DigestMemo)
     # Cache-signing policy resolved once for the session from the effective
     # config (user/env only; project/script trust is stripped upstream). A
     # `LazyLoader` reads it as the default trust/identity source.
@@ -127,6 +131,10 @@ MetaKey = Literal["return", "version", "runtime", "variable_hashes"]
 CacheInfo = namedtuple(
     "CacheInfo", ["hits", "misses", "maxsize", "currsize", "time_saved"]
 )
+# Kept apart from CacheInfo, which callers unpack like functools'
+CacheMemoryInfo = namedtuple(
+    "CacheMemoryInfo", ["evictions", "resident_bytes"]
+)
 
 
 def _source_refs(code: str) -> set[Name]:
@@ -624,6 +632,13 @@ class CacheContext(abc.ABC):
             time_saved=self.time_saved,
         )
 
+    def cache_memory_info(self) -> CacheMemoryInfo:
+        """Entries evicted from memory, and the bytes of those resident."""
+        return CacheMemoryInfo(
+            evictions=self.evictions,
+            resident_bytes=self.resident_bytes,
+        )
+
     @property
     def loader(self) -> Loader:
         assert self._loader is not None, UNEXPECTED_FAILURE_BOILERPLATE
@@ -669,6 +684,18 @@ class CacheContext(abc.ABC):
             return 0.0
         return self.loader.time_saved
 
+    @property
+    def evictions(self) -> int:
+        if self._loader is None:
+            return 0
+        return int(getattr(self.loader, "evictions", 0))
+
+    @property
+    def resident_bytes(self) -> int:
+        if self._loader is None:
+            return 0
+        return int(getattr(self.loader, "resident_bytes", 0))
+
     @property
     @abc.abstractmethod
     def last_hash(self) -> str | None:
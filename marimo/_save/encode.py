@@ -9,12 +9,17 @@ from __future__ import annotations
 
 import hashlib
 import io
+import os
 import pickle
 import struct
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._runtime.primitives import is_data_primitive, is_primitive
+from marimo._utils.platform import is_pyodide
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -97,6 +102,173 @@ def data_to_buffer(data: Tensor) -> bytes:
     return type_sign(_contiguous_tensor_bytes(data), "data")
 
 
+# Buffers are fed to the hash in slices of this size. hashlib releases the
+# GIL while digesting each slice, so buffers hashed on worker threads are
+# digested in parallel.
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+# Below this many bytes in total, a thread pool costs more than it saves.
+PARALLEL_HASH_THRESHOLD = 8 * 1024 * 1024
+
+_HASH_POOL: ThreadPoolExecutor | None = None
+_HASH_POOL_LOCK = threading.Lock()
+
+
+def _reset_hash_pool() -> None:
+    # A forked child inherits the pool but not its worker threads, so
+    # work submitted to it would never run; start a fresh one on demand.
+    global _HASH_POOL, _HASH_POOL_LOCK
+    _HASH_POOL = None
+    _HASH_POOL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_hash_pool)
+
+
+def _flat_bytes(view: memoryview) -> memoryview:
+    """View `view` as 1-d bytes (views with a 0-length axis can't cast)."""
+    if view.nbytes == 0:
+        return memoryview(b"")
+    return view.cast("B") if view.ndim != 1 else view
+
+
+def hash_data_buffer(data: Tensor, hash_type: str) -> bytes:
+    """Digest of `data_to_buffer(data)`, without copying the buffer.
+
+    Streams the tensor's bytes into the hash in `HASH_CHUNK_SIZE` slices,
+    followed by the `type_sign` trailer, so the digest is identical to
+    hashing `data_to_buffer(data)`.
+    """
+    view = _contiguous_tensor_bytes(data)
+    flat = _flat_bytes(view)
+    hash_alg = hashlib.new(hash_type, usedforsecurity=False)
+    for start in range(0, flat.nbytes, HASH_CHUNK_SIZE):
+        hash_alg.update(flat[start : start + HASH_CHUNK_SIZE])
+    # NB. `type_sign` records `len` of the (possibly n-d) view.
+    hash_alg.update(struct.pack("!Q", len(view)))
+    hash_alg.update(b":data")
+    return hash_alg.digest()
+
+
+def hash_data_buffers(values: list[Tensor], hash_type: str) -> list[bytes]:
+    """`hash_data_buffer` for each of `values`, in parallel when large."""
+    total = sum(getattr(value, "nbytes", 0) for value in values)
+    if len(values) < 2 or total < PARALLEL_HASH_THRESHOLD or is_pyodide():
+        return [hash_data_buffer(value, hash_type) for value in values]
+
+    global _HASH_POOL
+    with _HASH_POOL_LOCK:
+        if _HASH_POOL is None:
+            _HASH_POOL = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="marimo-hash",
+            )
+    return list(
+        _HASH_POOL.map(
+            lambda value: hash_data_buffer(value, hash_type), values
+        )
+    )
+
+
+def _is_read_only(data: Any) -> bool:
+    """Whether numpy array `data` can't be written through itself or any
+    array whose memory it views."""
+    while data is not None:
+        flags = getattr(data, "flags", None)
+        if flags is None:
+            # Only an immutable bytes base is known to stay unchanged.
+            return isinstance(data, bytes)
+        if flags.writeable:
+            return False
+        data = data.base
+    return True
+
+
+def _mutation_witness(data: Tensor) -> tuple[Any, ...] | None:
+    """A fingerprint that changes when `data` is rebound or written.
+
+    torch counts in-place writes in `_version`. numpy has no such counter,
+    so only read-only arrays (whose bases are read-only too) have a
+    witness: their buffer layout. Other types have no witness and are
+    never memoized.
+    """
+    if hasattr(data, "_version") and hasattr(data, "data_ptr"):
+        return (
+            "torch",
+            data.data_ptr(),
+            tuple(data.shape),
+            tuple(data.stride()),
+            str(data.dtype),
+            data._version,
+        )
+    interface = getattr(data, "__array_interface__", None)
+    if not isinstance(interface, dict) or not _is_read_only(data):
+        return None
+    return (
+        "numpy",
+        interface.get("data"),
+        interface.get("shape"),
+        interface.get("strides"),
+        interface.get("typestr"),
+    )
+
+
+class DigestMemo:
+    """Per-object memo of `hash_data_buffer` digests.
+
+    Entries are keyed by `id` and validated with a weak reference (so a
+    recycled id never matches) and a mutation witness (so an object written
+    in place is rehashed). Entries are dropped when their object is
+    collected.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[
+            int, tuple[weakref.ref[Any], tuple[Any, ...], str, bytes]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(self, data: Tensor, hash_type: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(id(data))
+        if entry is None:
+            return None
+        ref, witness, entry_hash_type, digest = entry
+        if (
+            ref() is not data
+            or entry_hash_type != hash_type
+            or _mutation_witness(data) != witness
+        ):
+            return None
+        return digest
+
+    def put(self, data: Tensor, hash_type: str, digest: bytes) -> None:
+        witness = _mutation_witness(data)
+        if witness is None:
+            return
+        key = id(data)
+        try:
+            ref = weakref.ref(data, lambda _: self._discard(key))
+        except TypeError:
+            # Not weak-referenceable: an id can't be trusted across reruns.
+            return
+        with self._lock:
+            self._entries[key] = (ref, witness, hash_type, digest)
+
+    def _discard(self, key: int) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is None:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def primitive_to_bytes(value: Any) -> bytes:
     if value is None:
         return b":none"
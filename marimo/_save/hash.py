@@ -37,8 +37,8 @@ from marimo._save.cache import Cache, CacheType, HashMemoCleanup
 from marimo._save.encode import (
     attempt_signed_bytes,
     common_container_to_bytes,
-    data_to_buffer,
     deterministic_dumps,
+    hash_data_buffers,
     primitive_to_bytes,
     type_sign,
 )
@@ -717,6 +717,8 @@ class BlockHasher:
         # Content addressed hash is valid if every reference is accounted for
         # and can be shown to be a primitive value.
         imports = get_imports(scope)
+        # (local_ref, ref, value) for data primitives (arrays, tensors).
+        buffers: list[tuple[Name, Name, Any]] = []
         for local_ref in sorted(refs):
             ref = if_local_then_mangle(local_ref, self.cell_id)
             # An underscore import (e.g. `import marimo as _private`) is
@@ -784,7 +786,10 @@ class BlockHasher:
             if is_primitive(value):
                 serial_value = primitive_to_bytes(value)
             elif is_data_primitive(value):
-                serial_value = data_to_buffer(value)
+                # Digested after the loop, alongside the other buffers.
+                buffers.append((local_ref, ref, value))
+                refs.remove(local_ref)
+                continue
             elif is_data_primitive_container(value):
                 serial_value = common_container_to_bytes(value)
             elif is_pure_function(
@@ -864,6 +869,11 @@ class BlockHasher:
             # Fall through means that the references should be dequeued.
             refs.remove(local_ref)
 
+        if buffers:
+            defining_cells |= self._hash_buffers(
+                buffers, content_serialization, ctx
+            )
+
         # Register lifecycle cleanup — deduped, at most one per cell
         if ctx:
             for def_cell in defining_cells:
@@ -874,6 +884,45 @@ class BlockHasher:
 
         return SerialRefs(refs, content_serialization, set())
 
+    def _hash_buffers(
+        self,
+        buffers: list[tuple[Name, Name, Any]],
+        content_serialization: dict[Name, bytes],
+        ctx: RuntimeContext | None,
+    ) -> set[CellId_t]:
+        """Digest data primitives into `content_serialization`.
+
+        Buffers are hashed zero-copy, in parallel when large, and objects
+        whose digest is memoized (and unchanged since) are not rehashed.
+        Returns the cells defining newly memoized refs.
+        """
+        hash_type = self.hash_alg.name
+        defining_cells: set[CellId_t] = set()
+        pending: list[tuple[Name, Name, Any, bool]] = []
+        for local_ref, ref, value in buffers:
+            memoizable = ctx is not None and self._is_memoizable(
+                local_ref, value, ctx
+            )
+            digest = (
+                ctx.cache.digest_memo.get(value, hash_type)
+                if ctx is not None and memoizable
+                else None
+            )
+            if digest is None:
+                pending.append((local_ref, ref, value, memoizable))
+            else:
+                content_serialization[ref] = digest
+        digests = hash_data_buffers([p[2] for p in pending], hash_type)
+        for (local_ref, ref, value, memoizable), digest in zip(
+            pending, digests, strict=True
+        ):
+            content_serialization[ref] = digest
+            if ctx is not None and memoizable:
+                ctx.cache.hash_memo[local_ref] = digest
+                ctx.cache.digest_memo.put(value, hash_type, digest)
+                defining_cells |= self.graph.definitions.get(local_ref, set())
+        return defining_cells
+
     def serialize_and_dequeue_stateful_content_refs(
         self,
         refs: set[Name],
@@ -50,6 +50,7 @@ from marimo._save.stubs import (
     ModuleStub,
 )
 from marimo._save.stubs.lazy_stub import (
+    BLOB_COMPRESSION_THRESHOLD,
     BLOB_DESERIALIZERS,
     BLOB_SERIALIZERS,
     LAZY_STUB_LOOKUP,
@@ -60,6 +61,9 @@ from marimo._save.stubs.lazy_stub import (
     Meta,
     ReferenceStub,
     UnhashableStub,
+    compress_blob,
+    decompress_blob,
+    resolve_codec,
 )
 from marimo._save.stubs.stubs import mro_lookup
 
@@ -94,6 +98,41 @@ class _BlobStatus(Enum):
     UNREADABLE = auto()
 
 
+# Serialized bytes held before a batching store's pending writes are flushed.
+_MAX_BATCH_BYTES = 64 * 1024 * 1024
+
+
+class _BlobWriter:
+    """Writes the blobs of a cache entry, in bounded batches when the store
+    batches writes.
+
+    `ok` turns `False` once any write fails, so the caller can skip the
+    manifest rather than publish an entry with missing blobs.
+    """
+
+    def __init__(self, store: Store, max_bytes: int) -> None:
+        self._store = store
+        self._max_bytes = max_bytes
+        self._pending: list[tuple[str, bytes]] = []
+        self._nbytes = 0
+        self.ok = True
+
+    def put(self, key: str, data: bytes) -> None:
+        if not self._store.batched:
+            self.ok = self._store.put(key, data) and self.ok
+            return
+        self._pending.append((key, data))
+        self._nbytes += len(data)
+        if self._nbytes >= self._max_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.ok = self._store.put_batch(self._pending) and self.ok
+        self._pending = []
+        self._nbytes = 0
+
+
 # Domain-separation tag prepended to manifest signable bytes, binding a
 # signature to this purpose and format version independent of payload shape.
 _MANIFEST_SIG_CONTEXT = b"marimo-cache-manifest:v1:"
@@ -463,6 +502,7 @@ class LazyStore(Store):
 
     def __init__(self, inner: Store | None = None) -> None:
         self._inner = inner if inner is not None else FileStore()
+        self.batched = self._inner.batched
         self._written_keys: set[str] = set()
         # Keys read this session. A warm re-export hits the cache rather
         # than re-writing it, so the export manifest must cover reads too
@@ -485,6 +525,19 @@ class LazyStore(Store):
             self._touched_keys.add(key)
         return result
 
+    def get_batch(
+        self, keys: Iterable[str]
+    ) -> Iterator[tuple[str, bytes | None]]:
+        for key, data in self._inner.get_batch(keys):
+            if data is not None:
+                self._touched_keys.add(key)
+            yield key, data
+
+    def put_batch(self, items: Iterable[tuple[str, bytes]]) -> bool:
+        items = list(items)
+        self._written_keys.update(key for key, _ in items)
+        return self._inner.put_batch(items)
+
     def clear(self, key: str) -> bool:
         self._written_keys.discard(key)
         self._touched_keys.discard(key)
@@ -610,6 +663,8 @@ class LazyLoader(BasePersistenceLoader):
         signer: CacheSigner | None | _Unset = _SIGNER_UNSET,
         trusted_signers: Iterable[str] | None | _Unset = _TRUSTED_UNSET,
         verification: str | _Unset = _VERIFICATION_UNSET,
+        compression: str | None = "zlib",
+        compression_threshold: int = BLOB_COMPRESSION_THRESHOLD,
     ) -> None:
         """Create a LazyLoader.
 
@@ -655,6 +710,15 @@ class LazyLoader(BasePersistenceLoader):
                 than serving unsigned data.  Two stores are exempt: WebAssembly
                 blobs served from the notebook's own origin, and, when
                 `cryptography` is not installed at all, a local file store.
+            compression: Codec for pickle, numpy and torch blobs — `"zlib"`
+                (default; in the standard library, so every reader can
+                decompress it), `"zstd"`, `"lz4"`, `"auto"` (the first of
+                those three that is installed, in that order) or `None` to
+                store blobs uncompressed.  The codec is recorded per blob in
+                the manifest, so entries written with any setting stay
+                readable wherever the codec is installed.
+            compression_threshold: Blobs smaller than this many bytes are
+                stored uncompressed.
         """
         state = _cache_state()
         # An unset arg falls back to the session's config-derived policy (trust
@@ -705,6 +769,10 @@ class LazyLoader(BasePersistenceLoader):
         # key (avoiding a stray cache_signing_key.pem and read-only-state-dir
         # warnings for a caller who opted out). on/strict resolve it below.
         self._signer: CacheSigner | _Unset | None = signer
+        self._compression: str | None = None
+        self._codec: str | None = None
+        self.compression = compression
+        self.compression_threshold = compression_threshold
         # Fail fast on an impossible strict configuration (no crypto, or no
         # signer and no trusted_signers). This reads `self.signer` for
         # verify/strict (resolving the key), but returns early for 'off'.
@@ -852,6 +920,17 @@ class LazyLoader(BasePersistenceLoader):
         # mint/load a machine-local key when reconfiguring an 'off' loader.
         self._signer = value
 
+    @property
+    def compression(self) -> str | None:
+        return self._compression
+
+    @compression.setter
+    def compression(self, value: str | None) -> None:
+        # Resolved eagerly so an unknown or missing codec fails at
+        # construction rather than in the background writer.
+        self._codec = resolve_codec(value)
+        self._compression = value
+
     @property
     def trusted_signers(self) -> frozenset[str]:
         # Frozen copy so mutating the return value can't bypass
@@ -1097,6 +1176,8 @@ class LazyLoader(BasePersistenceLoader):
         # Collect references to load
         ref_vars: dict[str, str] = {}
         ref_type_hints: dict[str, str | None] = {}
+        # Blob key -> codec, for blobs stored compressed.
+        blob_codecs: dict[str, str] = {}
         variable_hashes: dict[str, str] = {}
         # Instances of cell-defined (__main__) classes are deferred: their
         # class must be re-exec'd into __main__ before the blob can unpickle.
@@ -1106,6 +1187,8 @@ class LazyLoader(BasePersistenceLoader):
         # type_hint so the `UnhashableStub` can name what it stood in for.
         unresolvable: dict[str, str | None] = {}
         for var_name, item in cache_data.defs.items():
+            if item.reference is not None and item.codec is not None:
+                blob_codecs[item.reference] = item.codec
             if var_name in cache_data.ui_defs:
                 ref_vars[var_name] = (base / "ui.pickle").as_posix()
             elif item.reference is not None:
@@ -1131,6 +1214,8 @@ class LazyLoader(BasePersistenceLoader):
         ):
             return_ref = cache_data.meta.return_value.reference
             return_type_hint = cache_data.meta.return_value.type_hint
+            if cache_data.meta.return_value.codec is not None:
+                blob_codecs[return_ref] = cache_data.meta.return_value.codec
 
         unique_keys = set(ref_vars.values())
         if return_ref:
@@ -1142,6 +1227,7 @@ class LazyLoader(BasePersistenceLoader):
             return_type_hint,
             blob_hash_map,
             effective_signer,
+            blob_codecs,
         )
 
         # Distribute to defs
@@ -1167,6 +1253,7 @@ class LazyLoader(BasePersistenceLoader):
                 # blob hash here too — before these bytes are ever unpickled
                 # by `ReferenceStub.load` during `Cache.restore`.
                 _verify_signed_blob(ref, raw, blob_hash_map, effective_signer)
+                raw = decompress_blob(raw, item.codec)
                 stub = ImmediateReferenceStub(
                     ReferenceStub(ref, hash_value=item.hash or "", blob=raw)
                 )
@@ -1221,10 +1308,13 @@ class LazyLoader(BasePersistenceLoader):
         return_type_hint: str | None,
         blob_hash_map: dict[str, str] | None = None,
         effective_signer: CacheSigner | None = None,
+        blob_codecs: dict[str, str] | None = None,
     ) -> Any:
         # Verify the blob hash before deserialization so a tampered blob never
         # reaches pickle.loads. Raises CacheSignatureError (propagated by the
         # callers) on mismatch or a missing hash under a verified manifest.
+        # The hash covers the stored (possibly compressed) bytes, so it is
+        # checked before decompression too.
         _verify_signed_blob(key, data, blob_hash_map, effective_signer)
         ext = Path(key).suffix
         deserialize = BLOB_DESERIALIZERS.get(
@@ -1234,7 +1324,9 @@ class LazyLoader(BasePersistenceLoader):
             return_type_hint if key == return_ref else None
         )
         try:
-            return deserialize(data, type_hint)
+            return deserialize(
+                decompress_blob(data, (blob_codecs or {}).get(key)), type_hint
+            )
         except ModuleNotFoundError as e:
             # Raise if we need something for return, otherwise defer to a stub.
             if key == return_ref:
@@ -1249,6 +1341,7 @@ class LazyLoader(BasePersistenceLoader):
         return_type_hint: str | None,
         blob_hash_map: dict[str, str] | None = None,
         effective_signer: CacheSigner | None = None,
+        blob_codecs: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Read + deserialize blobs in parallel via threads."""
         results: queue.Queue[tuple[str, Any]] = queue.Queue()
@@ -1258,9 +1351,26 @@ class LazyLoader(BasePersistenceLoader):
         # generic cache miss.
         errors: list[CacheSignatureError] = []
 
+        # Stores with batched reads fetch every blob in one round trip up
+        # front; threads then only deserialize.
+        prefetched: dict[str, bytes | None] | None = None
+        if self.store.batched:
+            try:
+                prefetched = dict(self.store.get_batch(unique_keys))
+            except Exception as e:
+                # As for a failed read of a single blob: recompute.
+                LOGGER.warning("Failed to read blobs: %s", e)
+                raise FileNotFoundError(
+                    "Incomplete cache: blobs could not be read"
+                ) from e
+
         def _load_blob(key: str) -> None:
             try:
-                data = self.store.get(key)
+                data = (
+                    prefetched.get(key)
+                    if prefetched is not None
+                    else self.store.get(key)
+                )
                 if data:
                     results.put(
                         (
@@ -1273,6 +1383,7 @@ class LazyLoader(BasePersistenceLoader):
                                 return_type_hint,
                                 blob_hash_map,
                                 effective_signer,
+                                blob_codecs,
                             ),
                         )
                     )
@@ -1466,6 +1577,11 @@ class LazyLoader(BasePersistenceLoader):
             else "pickle"
         )
         manifest_key = str(self.build_path(cache.key))
+        codec = self._codec
+        threshold = self.compression_threshold
+        # Blobs are written ahead of the manifest, in as few round trips as
+        # the store allows.
+        writer = _BlobWriter(store, _MAX_BATCH_BYTES)
 
         def _put_or_mark_unserializable(
             key: str,
@@ -1473,17 +1589,24 @@ class LazyLoader(BasePersistenceLoader):
             serialize: Callable[[Any], bytes],
             items: list[Item],
             var_name: str = "",
+            strategy: str = "pickle",
         ) -> bool:
             """Store one blob; on serialization failure write no blob and
             instead mark each manifest `Item` with `unserializable_type`.
 
             Returns `True` when the blob was stored, `False` when it was
-            marked unserializable. Records the blob digest for the signed
-            manifest when the loader is signing.
+            marked unserializable. Compresses the blob when `strategy` and
+            its size call for it (recording the codec on each `Item`), and
+            records the digest of the stored bytes for the signed manifest
+            when the loader is signing.
             """
             try:
-                data = serialize(value)
-                store.put(key, data)
+                data, blob_codec = compress_blob(
+                    serialize(value), strategy, codec, threshold
+                )
+                for item in items:
+                    item.codec = blob_codec
+                writer.put(key, data)
                 if signing:
                     blob_hashes[key] = _sha256hex(data)
             except Exception as e:
@@ -1497,6 +1620,7 @@ class LazyLoader(BasePersistenceLoader):
                 for item in items:
                     type_name = item.type_hint or fallback
                     item.reference = None
+                    item.codec = None
                     # NB. keep item.hash — the content digest stays valid even
                     # when the value blob can't be pickled.
                     item.type_hint = None
@@ -1517,6 +1641,7 @@ class LazyLoader(BasePersistenceLoader):
                         serialize,
                         [return_item],
                         "return",
+                        return_loader,
                     )
                 if ui_vars:
                     ui_key = (path / "ui.pickle").as_posix()
@@ -1526,6 +1651,7 @@ class LazyLoader(BasePersistenceLoader):
                         pickle.dumps,
                         [defs_dict[v] for v in ui_defs_list],
                         "ui",
+                        "ui",
                     )
                     if not ui_ok:
                         # UI defs restore via `ui_defs` → `ui.pickle`,
@@ -1550,7 +1676,16 @@ class LazyLoader(BasePersistenceLoader):
                             serialize,
                             [defs_dict[var]],
                             var,
+                            loader,
                         )
+                writer.flush()
+                if not writer.ok:
+                    LOGGER.warning(
+                        "Failed to write cache blobs for %s; not writing "
+                        "its manifest",
+                        path,
+                    )
+                    return
                 # Manifest last — readers check for it to detect complete
                 # writes, and it now carries any unserializable marks set above
                 # plus (when signing) the signed blob hashes and signature.
@@ -1587,6 +1722,7 @@ class WasmLazyLoader(LazyLoader):
         return_type_hint: str | None,
         blob_hash_map: dict[str, str] | None = None,
         effective_signer: CacheSigner | None = None,
+        blob_codecs: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         unpickled: dict[str, Any] = {}
         # The store handles concurrency (HTTP batch fetch in WASM). The WASM
@@ -1605,6 +1741,7 @@ class WasmLazyLoader(LazyLoader):
                 return_type_hint,
                 blob_hash_map,
                 effective_signer,
+                blob_codecs,
             )
         return unpickled
 
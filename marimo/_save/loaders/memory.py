@@ -1,10 +1,14 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import pickle
+import re
+import sys
 import threading
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from marimo import _loggers
 from marimo._save.cache import Cache
 from marimo._save.loaders.loader import Loader
 
@@ -13,25 +17,89 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from marimo._save.hash import HashKey
+    from marimo._save.stores.store import Store
 
+LOGGER = _loggers.marimo_logger()
 
 T = TypeVar("T")
 
+# Containers deeper than this are sized by their shallow size only.
+_MAX_SIZE_DEPTH = 4
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Estimate the memory held by `value`, in bytes.
+
+    Prefers the sizes libraries report for their buffers (array `nbytes`,
+    Arrow buffers, polars `estimated_size`, pandas `memory_usage`), recurses
+    into builtin containers, and falls back to `sys.getsizeof`.
+    """
+    return _estimate_nbytes(value, set(), 0)
+
+
+def _estimate_nbytes(value: Any, seen: set[int], depth: int) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    # numpy arrays, torch tensors and pyarrow tables/arrays all report the
+    # size of their buffers as `nbytes`.
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    try:
+        # polars
+        if callable(getattr(value, "estimated_size", None)):
+            return int(value.estimated_size())
+        # pandas
+        if callable(getattr(value, "memory_usage", None)):
+            usage = value.memory_usage(index=True)
+            return int(getattr(usage, "sum", lambda: usage)())
+    except Exception:
+        pass
+
+    size = sys.getsizeof(value, 0)
+    if depth >= _MAX_SIZE_DEPTH:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _estimate_nbytes(k, seen, depth + 1)
+            size += _estimate_nbytes(v, seen, depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_nbytes(item, seen, depth + 1)
+    return size
+
+
+def _cache_nbytes(cache: Cache) -> int:
+    seen: set[int] = set()
+    return sum(
+        _estimate_nbytes(value, seen, 0) for value in cache.defs.values()
+    ) + _estimate_nbytes(cache.meta.get("return"), seen, 0)
+
 
 class MemoryLoader(Loader):
-    """In memory loader for saved objects."""
+    """In memory loader for saved objects.
+
+    Bounded by `max_size` entries and, optionally, by `max_bytes` of
+    estimated payload size; least recently used entries are evicted first.
+    Evicted entries are dropped, or written to `spill_store` (e.g. a
+    `FileStore`) when one is given, and reloaded from it on a later hit.
+    """
 
     def __init__(
         self,
         *args: Any,
         max_size: int = 128,
+        max_bytes: int | None = None,
+        spill_store: Store | None = None,
         cache: OrderedDict[Path, Cache] | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
 
         self._cache: OrderedDict[Path, Cache] | dict[Path, Cache]
-        self.is_lru = max_size > 0
+        self.is_lru = max_size > 0 or max_bytes is not None
 
         # Normal python dicts are atomic, ordered dictionaries are not.
         # As such, default to normal dict if not LRU.
@@ -42,8 +110,19 @@ class MemoryLoader(Loader):
             self._cache = OrderedDict()
             self._cache_lock = threading.Lock()
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self.spill_store = spill_store
+        # Estimated payload size per entry; only tracked under a byte budget.
+        self._nbytes: dict[Path, int] = {}
+        self._resident_bytes = 0
+        self._evictions = 0
+        # Entries this loader spilled, so `clear` can remove them.
+        self._spilled: set[Path] = set()
         if cache is not None:
             self._maybe_lock(lambda: self._cache.update(cache))
+            if max_bytes is not None:
+                for path, entry in cache.items():
+                    self._track(path, entry)
 
     def _maybe_lock(self, fn: Callable[..., T]) -> T:
         if self._cache_lock is not None:
@@ -54,7 +133,11 @@ class MemoryLoader(Loader):
 
     def cache_hit(self, key: HashKey) -> bool:
         path = self.build_path(key)
-        return self._maybe_lock(lambda: path in self._cache)
+        if self._maybe_lock(lambda: path in self._cache):
+            return True
+        return self.spill_store is not None and self.spill_store.hit(
+            self._spill_key(path)
+        )
 
     def load_cache(
         self,
@@ -62,15 +145,21 @@ class MemoryLoader(Loader):
         glbls: dict[str, Any] | None = None,
     ) -> Cache | None:
         del glbls  # Memory loader doesn't need a cell namespace.
-        if not self.cache_hit(key):
-            return None
         path = self.build_path(key)
-        if self.is_lru:
-            assert isinstance(self._cache, OrderedDict)
-            assert self._cache_lock is not None
-            with self._cache_lock:
+
+        def _lookup() -> Cache | None:
+            cached = self._cache.get(path)
+            if cached is not None and self.is_lru:
+                assert isinstance(self._cache, OrderedDict)
                 self._cache.move_to_end(path)
-        return self._cache[path]
+            return cached
+
+        cached = self._maybe_lock(_lookup)
+        if cached is not None:
+            return cached
+        if self.spill_store is not None:
+            return self._unspill(path)
+        return None
 
     def save_cache(self, cache: Cache) -> bool:
         path = self.build_path(cache.key)
@@ -78,33 +167,125 @@ class MemoryLoader(Loader):
         if self.is_lru:
             assert isinstance(self._cache, OrderedDict)
             assert self._cache_lock is not None
+            # Size the entry before taking the lock; it may be slow.
+            nbytes = (
+                _cache_nbytes(cache) if self._max_bytes is not None else None
+            )
             with self._cache_lock:
                 self._cache[path] = cache
                 self._cache.move_to_end(path)
-                if len(self._cache) > self.max_size:
-                    self._cache.popitem(last=False)
+                if self._max_bytes is not None:
+                    self._track(path, cache, nbytes)
+                evicted = self._evict()
+            # Pickling and writing out evicted entries happens outside the
+            # lock, so it doesn't block other lookups.
+            self._spill_all(evicted)
+            return True
         self._cache[path] = cache
         return True
 
-    def resize(self, max_size: int) -> None:
+    def _track(
+        self, path: Path, cache: Cache, nbytes: int | None = None
+    ) -> None:
+        self._resident_bytes -= self._nbytes.get(path, 0)
+        self._nbytes[path] = _cache_nbytes(cache) if nbytes is None else nbytes
+        self._resident_bytes += self._nbytes[path]
+
+    def _over_budget(self) -> bool:
+        return (self._max_size > 0 and len(self._cache) > self._max_size) or (
+            self._max_bytes is not None
+            and self._resident_bytes > self._max_bytes
+        )
+
+    def _evict(self) -> list[tuple[Path, Cache]]:
+        """Evict LRU entries until within budget; the lock must be held.
+
+        The most recently used entry is always kept, even if it alone is
+        over the byte budget. Returns the evicted entries, which the caller
+        spills with `_spill_all` once the lock is released.
+        """
+        assert isinstance(self._cache, OrderedDict)
+        evicted: list[tuple[Path, Cache]] = []
+        while len(self._cache) > 1 and self._over_budget():
+            path, entry = self._cache.popitem(last=False)
+            self._resident_bytes -= self._nbytes.pop(path, 0)
+            self._evictions += 1
+            evicted.append((path, entry))
+        return evicted
+
+    def _spill_all(self, evicted: list[tuple[Path, Cache]]) -> None:
+        for path, entry in evicted:
+            self._spill(path, entry)
+
+    def _spill_key(self, path: Path) -> str:
+        # Memory keys aren't namespaced; spilled ones share a store, so are.
+        name = re.sub(r"[^a-zA-Z0-9 _-]", "_", self.name)
+        return f"{name}/{path.as_posix()}.pickle"
+
+    def _spill(self, path: Path, cache: Cache) -> None:
+        if self.spill_store is None:
+            return
+        try:
+            self.spill_store.put(self._spill_key(path), pickle.dumps(cache))
+            self._spilled.add(path)
+        except Exception as e:
+            LOGGER.warning("Failed to spill cache entry %s: %s", path, e)
+
+    def _unspill(self, path: Path) -> Cache | None:
+        """Reload a spilled entry and make it resident again."""
+        assert self.spill_store is not None
+        spill_key = self._spill_key(path)
+        blob = self.spill_store.get(spill_key)
+        if not blob:
+            return None
+        try:
+            cache: Cache = pickle.loads(blob)
+        except Exception as e:
+            LOGGER.warning("Failed to reload spilled entry %s: %s", path, e)
+            return None
+        self.spill_store.clear(spill_key)
+        self._spilled.discard(path)
+        self.save_cache(cache)
+        return cache
+
+    def resize(
+        self, max_size: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        """Rebound the cache; `None` keeps the current limit."""
+        max_size = self._max_size if max_size is None else max_size
+        max_bytes = self._max_bytes if max_bytes is None else max_bytes
+        if max_bytes is not None and max_bytes < 0:
+            # Negative disables the byte budget, as for `max_size`.
+            max_bytes = None
+        is_lru = max_size > 0 or max_bytes is not None
         if not self.is_lru:
-            self.is_lru = max_size > 0
+            self.is_lru = is_lru
             if self.is_lru:
                 self._cache = OrderedDict(self._cache.items())
                 self._cache_lock = threading.Lock()
-            self._max_size = max_size
-            return
-        assert isinstance(self._cache, OrderedDict)
-        assert self._cache_lock is not None
-        with self._cache_lock:
-            self.is_lru = max_size > 0
-            if not self.is_lru:
-                self._cache = dict(self._cache.items())
-                self._max_size = max_size
-                return
-            while len(self._cache) > max_size:
-                self._cache.popitem(last=False)
+        assert self._cache_lock is not None or not self.is_lru
+        evicted = self._maybe_lock(
+            lambda: self._rebound(max_size, max_bytes, is_lru)
+        )
+        self._spill_all(evicted)
+
+    def _rebound(
+        self, max_size: int, max_bytes: int | None, is_lru: bool
+    ) -> list[tuple[Path, Cache]]:
+        if max_bytes is not None and self._max_bytes is None:
+            # Start tracking sizes for entries cached before the budget.
+            for path, entry in self._cache.items():
+                self._track(path, entry)
+        elif max_bytes is None:
+            self._nbytes.clear()
+            self._resident_bytes = 0
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        if not is_lru:
+            self.is_lru = False
+            self._cache = dict(self._cache.items())
+            return []
+        return self._evict()
 
     @property
     def max_size(self) -> int:
@@ -112,12 +293,40 @@ class MemoryLoader(Loader):
 
     @max_size.setter
     def max_size(self, value: int) -> None:
-        self.resize(value)
+        self.resize(max_size=value)
+
+    @property
+    def max_bytes(self) -> int | None:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int | None) -> None:
+        self.resize(max_bytes=-1 if value is None else value)
 
     @property
     def current_size(self) -> int:
         return len(self._cache)
 
+    @property
+    def resident_bytes(self) -> int:
+        """Estimated bytes held by cached entries (tracked under a byte
+        budget; `0` otherwise)."""
+        return self._resident_bytes
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
     def clear(self) -> None:
         """Clear all cached items."""
-        self._maybe_lock(lambda: self._cache.clear())
+
+        def _clear() -> None:
+            self._cache.clear()
+            self._nbytes.clear()
+            self._resident_bytes = 0
+
+        self._maybe_lock(_clear)
+        if self.spill_store is not None:
+            for path in list(self._spilled):
+                self.spill_store.clear(self._spill_key(path))
+        self._spilled.clear()
@@ -1,8 +1,12 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import json
 import os
 import re
+import threading
+import time
+import uuid
 from pathlib import Path
 
 from marimo import _loggers
@@ -15,6 +19,10 @@ LOGGER = _loggers.marimo_logger()
 # Resolves against the working directory as a fallback.
 FALLBACK_SAVE_PATH = Path(MARIMO_DIR_NAME, "cache")
 
+# Sidecar recording `key -> [size, last access]` for size-bounded stores. A
+# dotfile, like the export manifest, so it can't collide with a cache key.
+INDEX_NAME = ".cache-index.json"
+
 
 def export_manifest_name(notebook_filename: str | None) -> str:
     """Export-manifest filename for a notebook, from its filename stem.
@@ -43,13 +51,47 @@ def _writable_dir(path: Path) -> bool:
 
 
 class FileStore(Store):
-    def __init__(self, save_path: str | None = None) -> None:
+    """Store that writes each key to a file under `save_path`.
+
+    Writes go to a temporary file that is renamed into place, so readers
+    never observe a partially written blob.
+
+    When `max_bytes` and/or `max_entries` is set, the store keeps a sidecar
+    index of entry sizes and access times and, after each write, evicts the
+    least recently used entries until it is back within budget. Reads also
+    stamp the access time onto the file (`os.utime`), so an index rebuilt
+    from disk keeps the LRU order even on `noatime` mounts. Eviction is
+    best-effort when several processes share the directory.
+
+    Args:
+        save_path: Directory to store entries in. Defaults to
+            `__marimo__/cache` next to the notebook.
+        max_bytes: Optional budget for the total size of stored entries.
+        max_entries: Optional budget for the number of stored entries.
+    """
+
+    def __init__(
+        self,
+        save_path: str | None = None,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+    ) -> None:
         # Defer default path resolution until first use so that the runtime
         # context (and __file__) is available.
         self._resolved_save_path: Path | None = (
             Path(save_path) if save_path is not None else None
         )
         self._initialized = False
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        # key -> [size in bytes, last access time]; loaded on first use.
+        self._index: dict[str, list[float]] | None = None
+        self._index_mtime: float | None = None
+        self._index_lock = threading.Lock()
+
+    @property
+    def _bounded(self) -> bool:
+        return self.max_bytes is not None or self.max_entries is not None
 
     @property
     def save_path(self) -> Path:
@@ -85,13 +127,21 @@ class FileStore(Store):
         path = self.save_path / key
         if not _valid_path(path):
             return None
+        if self._bounded:
+            self._touch(key, path)
         return path.read_bytes()
 
     def put(self, key: str, value: bytes) -> bool:
         path = self.save_path / key
         path.parent.mkdir(parents=True, exist_ok=True)
         self._initialized = True
-        path.write_bytes(value)
+        _atomic_write(path, value)
+        if self._bounded:
+            with self._index_lock:
+                index = self._load_index()
+                index[key] = [len(value), time.time()]
+                self._evict(index, keep=key)
+                self._save_index(index)
         return True
 
     def hit(self, key: str) -> bool:
@@ -104,4 +154,120 @@ class FileStore(Store):
         if not _valid_path(path):
             return False
         path.unlink()
+        if self._bounded:
+            with self._index_lock:
+                index = self._load_index()
+                if index.pop(key, None) is not None:
+                    self._save_index(index)
         return True
+
+    def _touch(self, key: str, path: Path) -> None:
+        """Record an access to `key` for LRU ordering."""
+        now = time.time()
+        try:
+            stat = path.stat()
+            os.utime(path, (now, stat.st_mtime))
+        except OSError:
+            return
+        with self._index_lock:
+            index = self._load_index()
+            index[key] = [stat.st_size, now]
+
+    def _evict(self, index: dict[str, list[float]], keep: str) -> None:
+        """Remove least recently used entries until within budget."""
+        total = sum(size for size, _ in index.values())
+        count = len(index)
+
+        def over_budget() -> bool:
+            return (self.max_bytes is not None and total > self.max_bytes) or (
+                self.max_entries is not None and count > self.max_entries
+            )
+
+        if not over_budget():
+            return
+        for key, (size, _) in sorted(index.items(), key=lambda kv: kv[1][1]):
+            if not over_budget():
+                break
+            if key == keep:
+                continue
+            try:
+                (self.save_path / key).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                LOGGER.warning("Failed to evict cache entry %s: %s", key, e)
+                continue
+            del index[key]
+            total -= size
+            count -= 1
+
+    def _index_path(self) -> Path:
+        return self.save_path / INDEX_NAME
+
+    def _load_index(self) -> dict[str, list[float]]:
+        """The in-memory index, reloaded if another process rewrote it."""
+        try:
+            mtime: float | None = self._index_path().stat().st_mtime
+        except OSError:
+            mtime = None
+        if self._index is not None and mtime == self._index_mtime:
+            return self._index
+        index: dict[str, list[float]] | None = None
+        if mtime is not None:
+            try:
+                index = json.loads(self._index_path().read_text())
+            except (OSError, ValueError) as e:
+                LOGGER.warning("Rebuilding unreadable cache index: %s", e)
+        self._index = index if index is not None else self._scan()
+        self._index_mtime = mtime
+        return self._index
+
+    def _save_index(self, index: dict[str, list[float]]) -> None:
+        try:
+            _atomic_write(self._index_path(), json.dumps(index).encode())
+            self._index_mtime = self._index_path().stat().st_mtime
+        except OSError as e:
+            LOGGER.warning("Failed to write cache index: %s", e)
+
+    def _scan(self) -> dict[str, list[float]]:
+        """Build the index from the entries on disk."""
+        index: dict[str, list[float]] = {}
+        root = self.save_path
+        if not root.is_dir():
+            return index
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                # Skip the index, export manifests and in-flight writes.
+                if name.startswith("."):
+                    continue
+                path = Path(dirpath, name)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                key = path.relative_to(root).as_posix()
+                index[key] = [stat.st_size, stat.st_atime]
+        return index
+
+
+def _atomic_write(path: Path, value: bytes) -> None:
+    """Write `value` to `path` via a temporary file renamed into place."""
+    # NB. not `tempfile.mkstemp`, whose 0600 mode would hide entries from
+    # other users of a shared cache directory.
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(
+        tmp,
+        os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+        0o666,
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
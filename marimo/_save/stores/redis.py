@@ -1,29 +1,109 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
 
 from marimo._save.stores.store import Store
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import redis
+
+# Keys per MGET / pipeline flush; bounds the size of a single reply.
+_BATCH_SIZE = 256
+
+# Clients are shared by connection config so every store (one per loader)
+# draws from the same `ConnectionPool` rather than dialing its own.
+_CLIENTS: dict[str, redis.Redis] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_client(url: str | None, kwargs: dict[str, Any]) -> redis.Redis:
+    import redis
+
+    config_key = repr((url, sorted(kwargs.items())))
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(config_key)
+        if client is None:
+            if url is not None:
+                client = redis.Redis.from_url(url, **kwargs)
+            else:
+                client = redis.Redis(**kwargs)
+            _CLIENTS[config_key] = client
+        return client
+
 
 class RedisStore(Store):
-    def __init__(self, **kwargs: Any) -> None:
-        import redis
+    """Store backed by Redis.
 
+    Batch reads use MGET and batch writes a non-transactional pipeline, so
+    restoring a `LazyLoader` entry costs one round trip for the manifest
+    and one for its blobs. Any extra arguments are forwarded to
+    `redis.Redis`; stores with identical arguments share a client (and
+    so its connection pool).
+
+    Args:
+        url: Optional `redis://` URL; when given, the remaining arguments
+            are passed to `redis.Redis.from_url`.
+        prefix: Namespace prepended to every key, e.g. `"marimo:"`.
+        ttl: Optional expiry in seconds applied to every write.
+    """
+
+    batched = True
+
+    def __init__(
+        self,
+        url: str | None = None,
+        prefix: str = "",
+        ttl: int | None = None,
+        **kwargs: Any,
+    ) -> None:
         # TODO: Construct from a full config dataclass, and pass in kwargs
         # opposed to experimental.store.redis.args
-        # See list of options here:
-        self.redis = redis.Redis(**kwargs)
+        self.redis = _shared_client(url, kwargs)
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
 
     def get(self, key: str) -> bytes | None:
-        result = self.redis.get(key)
+        result = self.redis.get(self._key(key))
         if result is None:
             return None
         return result  # type: ignore[no-any-return]
 
+    def get_batch(
+        self, keys: Iterable[str]
+    ) -> Iterator[tuple[str, bytes | None]]:
+        pending = list(keys)
+        for start in range(0, len(pending), _BATCH_SIZE):
+            chunk = pending[start : start + _BATCH_SIZE]
+            values = self.redis.mget([self._key(k) for k in chunk])
+            yield from zip(chunk, values, strict=True)
+
     def put(self, key: str, value: bytes) -> bool:
-        result = self.redis.set(key, value)
+        result = self.redis.set(self._key(key), value, ex=self.ttl)
         return result is not None
 
+    def put_batch(self, items: Iterable[tuple[str, bytes]]) -> bool:
+        ok = True
+        pipe = self.redis.pipeline(transaction=False)
+        queued = 0
+        for key, value in items:
+            pipe.set(self._key(key), value, ex=self.ttl)
+            queued += 1
+            if queued == _BATCH_SIZE:
+                ok = all(r is not None for r in pipe.execute()) and ok
+                queued = 0
+        if queued:
+            ok = all(r is not None for r in pipe.execute()) and ok
+        return ok
+
     def hit(self, key: str) -> bool:
-        return self.redis.exists(key) > 0
+        return self.redis.exists(self._key(key)) > 0
+
+    def clear(self, key: str) -> bool:
+        return bool(self.redis.delete(self._key(key)))
@@ -1,27 +1,195 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import base64
+import http.client
+import os
+import queue
+import threading
+import time
 import urllib.error
 import urllib.request
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+from urllib.parse import unquote, urljoin, urlsplit, urlunsplit
 
 from marimo import _loggers
 from marimo._save.stores.store import Store
 from marimo._version import __version__
 
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import Callable, Iterable, Iterator
+
 LOGGER = _loggers.marimo_logger()
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Transient statuses worth retrying; everything else is final.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Followed for reads, as `urllib.request.urlopen` does.
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+class _Proxy(NamedTuple):
+    host: str
+    port: int | None
+    headers: dict[str, str]
+
+
+def _proxy_for(scheme: str, host: str) -> _Proxy | None:
+    """The proxy that `urllib` would use for `host`, from the environment
+    (`HTTP(S)_PROXY` and `NO_PROXY`) or the system configuration."""
+    proxy_url = urllib.request.getproxies().get(scheme)
+    if not proxy_url or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy_url:
+        proxy_url = f"http://{proxy_url}"
+    parts = urlsplit(proxy_url)
+    headers: dict[str, str] = {}
+    if parts.username is not None:
+        credentials = (
+            f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        )
+        headers["Proxy-Authorization"] = (
+            f"Basic {base64.b64encode(credentials.encode()).decode()}"
+        )
+    return _Proxy(parts.hostname or "", parts.port, headers)
+
+
+class _ConnectionPool:
+    """Bounded pool of keep-alive connections to a single host.
+
+    Holds at most `size` connections; `acquire` blocks while all of them
+    are in use, which also bounds the number of requests in flight.
+    Connections are opened lazily and dropped (to be reopened on next use)
+    after any transport error. With a `proxy`, HTTPS connections tunnel
+    through it and HTTP connections are made to it.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: int | None,
+        size: int,
+        timeout: float,
+        context: ssl.SSLContext,
+        proxy: _Proxy | None = None,
+    ) -> None:
+        self._scheme = scheme
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._context = context
+        self._proxy = proxy
+        self._size = size
+        self._slots: queue.LifoQueue[http.client.HTTPConnection | None] = (
+            queue.LifoQueue()
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every connection, without closing them (e.g. because
+        they belong to the parent of a forked process)."""
+        self._slots = queue.LifoQueue()
+        for _ in range(self._size):
+            self._slots.put(None)
+
+    def acquire(self) -> http.client.HTTPConnection:
+        conn = self._slots.get()
+        if conn is not None:
+            return conn
+        host, port = self._host, self._port
+        if self._proxy is not None:
+            host, port = self._proxy.host, self._proxy.port
+        try:
+            if self._scheme == "https":
+                conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                    host,
+                    port,
+                    timeout=self._timeout,
+                    context=self._context,
+                )
+                if self._proxy is not None:
+                    conn.set_tunnel(
+                        self._host, self._port, headers=self._proxy.headers
+                    )
+                return conn
+            return http.client.HTTPConnection(
+                host, port, timeout=self._timeout
+            )
+        except Exception:
+            self._slots.put(None)
+            raise
+
+    def release(
+        self, conn: http.client.HTTPConnection, *, reusable: bool
+    ) -> None:
+        if not reusable:
+            conn.close()
+        self._slots.put(conn if reusable else None)
+
+
+# Live stores, to reset in forked children.
+_STORES: weakref.WeakSet[RestStore] = weakref.WeakSet()
+
+
+def _reset_stores_after_fork() -> None:
+    for store in list(_STORES):
+        store._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_stores_after_fork)
+
 
 class RestStore(Store):
+    """Store backed by a remote HTTP cache (`GET`/`PUT`/`HEAD` per key).
+
+    Requests share a pool of keep-alive connections, transient failures
+    (connection errors, 429 and 5xx responses) are retried with
+    exponential backoff, and batches are issued concurrently, bounded by
+    the pool size. As with `urllib`, proxies are taken from the environment
+    and redirects of reads are followed.
+
+    Args:
+        base_url: Root URL of the cache service.
+        api_key: Bearer token sent with every request.
+        project_id: Optional namespace appended to `base_url`.
+        max_connections: Pool size, and so the maximum requests in flight.
+        max_retries: Retries after the first attempt of a request.
+        backoff: Initial delay in seconds between retries; doubles each
+            attempt.
+        timeout: Socket timeout in seconds.
+    """
+
+    batched = True
+
     def __init__(
-        self, *, base_url: str, api_key: str, project_id: str | None = None
+        self,
+        *,
+        base_url: str,
+        api_key: str,
+        project_id: str | None = None,
+        max_connections: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.1,
+        timeout: float = 30.0,
     ) -> None:
         super().__init__()
         assert api_key, "api_key is required"
         assert base_url, "base_url is required"
+        assert max_connections > 0, "max_connections must be positive"
 
         self.base_url = base_url
         self.api_key = api_key
         self.project_id = project_id
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff = backoff
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "User-Agent": f"marimo/{__version__}",
@@ -30,69 +198,166 @@ class RestStore(Store):
 
         self.context = ssl.create_default_context()
 
+        self.timeout = timeout
+        parts = urlsplit(self._get_url(""))
+        self._proxy = _proxy_for(parts.scheme, parts.hostname or "")
+        self._pool = _ConnectionPool(
+            parts.scheme,
+            parts.hostname or "",
+            parts.port,
+            size=max_connections,
+            timeout=timeout,
+            context=self.context,
+            proxy=self._proxy,
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        _STORES.add(self)
+
+    def _reset_after_fork(self) -> None:
+        # Neither the executor's threads nor exclusive use of the
+        # parent's connections survive a fork.
+        self._pool.reset()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
     def get(self, key: str) -> bytes | None:
         url = self._get_url(key)
-        req = urllib.request.Request(url, headers=self.headers)
         try:
-            with urllib.request.urlopen(req, context=self.context) as response:
-                if response.status == 200:
-                    LOGGER.debug(f"GET {url} - Status: {response.status}")
-                    return response.read()  # type: ignore[no-any-return]
-                if response.status >= 400 and response.status < 500:
-                    # 400s are fine, they just mean the key doesn't exist
-                    return None
-                raise
-        except urllib.error.HTTPError as e:
-            if e.code >= 400 and e.code < 500:
-                # 400s are fine, they just mean the key doesn't exist
-                return None
-            LOGGER.warning(f"GET {url} - Error: {e}")
+            status, body = self._request("GET", key)
         except Exception as e:
             LOGGER.warning(f"GET {url} - Error: {e}")
+            return None
+        LOGGER.debug(f"GET {url} - Status: {status}")
+        if status == 200:
+            return body
+        if status < 400 or status >= 500:
+            LOGGER.warning(f"GET {url} - Status: {status}")
+        # 400s are fine, they just mean the key doesn't exist
         return None
 
     def put(self, key: str, value: bytes) -> bool:
         url = self._get_url(key)
-        req = urllib.request.Request(
-            url,
-            data=value,
-            headers={
-                **self.headers,
-                "Content-Type": "application/octet-stream",
-            },
-            method="PUT",
-        )
         try:
-            with urllib.request.urlopen(req, context=self.context) as response:
-                LOGGER.debug(f"PUT {url} - Status: {response.status}")
-                return True
-        except urllib.error.HTTPError as e:
-            LOGGER.warning(
-                f"PUT {url} - Status: {e.status} - Error: {e.reason}"
+            status, _ = self._request(
+                "PUT",
+                key,
+                body=value,
+                headers={"Content-Type": "application/octet-stream"},
             )
         except Exception as e:
             LOGGER.warning(f"PUT {url} - Error: {e}")
-
+            return False
+        LOGGER.debug(f"PUT {url} - Status: {status}")
+        if 200 <= status < 300:
+            return True
+        LOGGER.warning(f"PUT {url} - Status: {status}")
         return False
 
     def hit(self, key: str) -> bool:
         url = self._get_url(key)
-        req = urllib.request.Request(url, headers=self.headers, method="HEAD")
         try:
-            with urllib.request.urlopen(req) as response:
-                LOGGER.debug(f"HEAD {url} - Status: {response.status}")
-                return response.status == 200  # type: ignore[no-any-return]
-        except urllib.error.HTTPError as e:
-            LOGGER.warning(
-                f"HEAD {url} - Status: {e.status} - Error: {e.reason}"
-            )
-            return False
+            status, _ = self._request("HEAD", key)
         except Exception as e:
             LOGGER.warning(f"HEAD {url} - Error: {e}")
             return False
+        LOGGER.debug(f"HEAD {url} - Status: {status}")
+        return status == 200
+
+    def get_batch(
+        self, keys: Iterable[str]
+    ) -> Iterator[tuple[str, bytes | None]]:
+        keys = list(keys)
+        yield from zip(keys, self._map(self.get, keys), strict=True)
+
+    def put_batch(self, items: Iterable[tuple[str, bytes]]) -> bool:
+        items = list(items)
+        if not items:
+            return True
+        # Drain every result so all writes finish before returning.
+        return all(list(self._map(lambda item: self.put(*item), items)))
+
+    def _map(self, fn: Callable[[T], R], args: list[T]) -> Iterator[R]:
+        if len(args) <= 1:
+            return map(fn, args)
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_connections,
+                    thread_name_prefix="marimo-rest-store",
+                )
+        return self._executor.map(fn, args)
+
+    def _request(
+        self,
+        method: str,
+        key: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        """Issue one request on a pooled connection, retrying transient
+        failures; returns the final `(status, body)`."""
+        url = self._get_url(key)
+        parts = urlsplit(url)
+        if self._proxy is not None and parts.scheme == "http":
+            # Plain HTTP proxies are sent the absolute URL
+            target = urlunsplit(parts._replace(fragment=""))
+            proxy_headers = self._proxy.headers
+        else:
+            target = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+            proxy_headers = {}
+        all_headers = {**self.headers, **proxy_headers, **(headers or {})}
+        attempt = 0
+        while True:
+            conn = self._pool.acquire()
+            reusable = False
+            try:
+                conn.request(method, target, body=body, headers=all_headers)
+                response = conn.getresponse()
+                # The body must be drained before the connection is reused.
+                data = response.read()
+                reusable = not response.will_close
+                status = response.status
+                location = response.getheader("Location")
+            except (OSError, http.client.HTTPException):
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                if (
+                    status not in _RETRY_STATUSES
+                    or attempt >= self.max_retries
+                ):
+                    break
+            finally:
+                self._pool.release(conn, reusable=reusable)
+            time.sleep(self.backoff * 2**attempt)
+            attempt += 1
+
+        if (
+            status in _REDIRECT_STATUSES
+            and location
+            and method in ("GET", "HEAD")
+        ):
+            return self._follow_redirect(method, urljoin(url, location))
+        return status, data
+
+    def _follow_redirect(self, method: str, url: str) -> tuple[int, bytes]:
+        """Fetch a redirect's target with `urllib`, which may be on another
+        host, and follows any further redirects itself."""
+        req = urllib.request.Request(url, headers=self.headers, method=method)
+        try:
+            with urllib.request.urlopen(
+                req, context=self.context, timeout=self.timeout
+            ) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, b""
 
     def _get_url(self, key: str) -> str:
-        url = self.base_url
+        # Any query string of `base_url` (e.g. a signed-URL token) is kept
+        # after the key.
+        parts = urlsplit(self.base_url)
+        path = parts.path
         if self.project_id:
-            url = f"{url}/{self.project_id}"
-        return f"{url}/{key}"
+            path = f"{path}/{self.project_id}"
+        return urlunsplit(parts._replace(path=f"{path}/{key}"))
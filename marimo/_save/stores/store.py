@@ -9,6 +9,12 @@ if TYPE_CHECKING:
 
 
 class Store(ABC):
+    # Whether `get_batch`/`put_batch` beat per-key calls (a single round
+    # trip, or requests issued concurrently). Callers with many keys in
+    # hand (e.g. `LazyLoader` restoring per-variable blobs) prefer the
+    # batch methods when this is set.
+    batched: bool = False
+
     @abstractmethod
     def get(self, key: str) -> bytes | None:
         """Get the bytes of a cache from the store"""
@@ -37,6 +43,17 @@ class Store(ABC):
         for key in keys:
             yield key, self.get(key)
 
+    def put_batch(self, items: Iterable[tuple[str, bytes]]) -> bool:
+        """Put every `(key, value)` pair; `True` only if all succeeded.
+
+        Defaults to a sequential `put` per pair. Stores that can write in
+        one round trip or concurrently (e.g. Redis, REST) override this.
+        """
+        ok = True
+        for key, value in items:
+            ok = self.put(key, value) and ok
+        return ok
+
     def export_keys(self) -> list[str]:
         """Return the keys this session wrote or read that should be
         bundled on `--execute` export.
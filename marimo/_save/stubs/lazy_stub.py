@@ -5,8 +5,10 @@ from __future__ import annotations
 
 import io
 import pickle
+import sys
+import zlib
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import msgspec
 
@@ -73,6 +75,9 @@ class Item(msgspec.Struct, omit_defaults=True):
     # corrupts the value and breaks signature verification (the re-encoded
     # manifest drops the null field).
     special_float: str | None = None
+    # Name of the `BLOB_CODECS` entry the referenced blob was compressed
+    # with; `None` for a blob stored as serialized.
+    codec: str | None = None
 
     def __post_init__(self) -> None:
         fields_set = sum(
@@ -187,7 +192,8 @@ def _arrow_load(data: bytes, type_hint: str | None = None) -> Any:
     DependencyManager.pyarrow.require("to load cached Arrow IPC blobs.")
     import pyarrow as pa
 
-    reader = pa.ipc.open_file(io.BytesIO(data))
+    # py_buffer wraps `data` without copying it.
+    reader = pa.ipc.open_file(pa.py_buffer(data))
     table = reader.read_all()
     if type_hint and type_hint.startswith("pandas."):
         df = table.to_pandas()
@@ -311,6 +317,134 @@ BLOB_SERIALIZERS: dict[str, Callable[[Any], bytes]] = {
     "bin": _bin_dump,
 }
 
+# ---------------------------------------------------------------------------
+# Codecs — keyed by the name recorded in `Item.codec`
+# ---------------------------------------------------------------------------
+
+# Blobs smaller than this are stored as serialized: the saving in bytes
+# doesn't pay for the extra pass on restore.
+BLOB_COMPRESSION_THRESHOLD = 64 * 1024
+
+# Strategies whose blobs are compressed. Arrow IPC compresses its own
+# buffers, and "ui"/"bin" blobs are small or already-encoded media.
+COMPRESSIBLE_STRATEGIES = frozenset({"pickle", "npy", "pt"})
+
+# A compressed blob is only kept when it is at most this fraction of the
+# serialized size; otherwise (e.g. random floats) it is stored as is.
+_MIN_COMPRESSION_RATIO = 0.9
+
+# Codec chosen by `compression="auto"`: the first one installed.
+_CODEC_PREFERENCE = ("zstd", "lz4", "zlib")
+
+
+class BlobCodec(NamedTuple):
+    available: Callable[[], bool]
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _zstd() -> Any:
+    if sys.version_info >= (3, 14):
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd
+    DependencyManager.zstandard.require("to use zstd-compressed cache blobs.")
+    import zstandard  # type: ignore[import-not-found]
+
+    return zstandard
+
+
+def _lz4() -> Any:
+    DependencyManager.lz4.require("to use lz4-compressed cache blobs.")
+    import lz4.frame  # type: ignore[import-not-found]
+
+    return lz4.frame
+
+
+BLOB_CODECS: dict[str, BlobCodec] = {
+    "zstd": BlobCodec(
+        available=lambda: (
+            sys.version_info >= (3, 14) or DependencyManager.zstandard.has()
+        ),
+        compress=lambda data: _zstd().compress(data, 3),
+        decompress=lambda data: _zstd().decompress(data),
+    ),
+    "lz4": BlobCodec(
+        available=DependencyManager.lz4.has,
+        compress=lambda data: _lz4().compress(data),
+        decompress=lambda data: _lz4().decompress(data),
+    ),
+    # stdlib fallback; level 1 trades ratio for speed, as the others do.
+    "zlib": BlobCodec(
+        available=lambda: True,
+        compress=lambda data: zlib.compress(data, 1),
+        decompress=zlib.decompress,
+    ),
+}
+
+
+def resolve_codec(compression: str | None) -> str | None:
+    """Resolve a loader's `compression` setting to a codec name.
+
+    `"auto"` picks the first installed of zstd, lz4 and zlib; `None`
+    disables compression. An explicit codec must be installed.
+    """
+    if compression is None:
+        return None
+    if compression == "auto":
+        return next(
+            name for name in _CODEC_PREFERENCE if BLOB_CODECS[name].available()
+        )
+    codec = BLOB_CODECS.get(compression)
+    if codec is None:
+        raise ValueError(
+            f"Unknown cache compression {compression!r}; expected 'auto', "
+            f"None, or one of {sorted(BLOB_CODECS)}."
+        )
+    if not codec.available():
+        raise ModuleNotFoundError(
+            f"Cache compression {compression!r} is not installed."
+        )
+    return compression
+
+
+def compress_blob(
+    data: bytes,
+    strategy: str,
+    codec: str | None,
+    threshold: int = BLOB_COMPRESSION_THRESHOLD,
+) -> tuple[bytes, str | None]:
+    """Compress a serialized blob when its strategy and size warrant it.
+
+    Returns the bytes to store and the codec to record in the manifest
+    (`None` when the blob is stored as serialized).
+    """
+    if (
+        codec is None
+        or strategy not in COMPRESSIBLE_STRATEGIES
+        or len(data) < threshold
+    ):
+        return data, None
+    compressed = BLOB_CODECS[codec].compress(data)
+    if len(compressed) > len(data) * _MIN_COMPRESSION_RATIO:
+        return data, None
+    return compressed, codec
+
+
+def decompress_blob(data: bytes, codec: str | None) -> bytes:
+    """Invert `compress_blob` for a blob recorded with `codec`.
+
+    Raises `ModuleNotFoundError` when the codec isn't installed here, so a
+    non-return def degrades to a stub like any other missing dependency.
+    """
+    if codec is None:
+        return data
+    entry = BLOB_CODECS.get(codec)
+    if entry is None:
+        raise ValueError(f"Unknown cache blob codec {codec!r}")
+    return entry.decompress(data)
+
+
 # ---------------------------------------------------------------------------
 # Stubs for deferred / immediate blob loading
 # ---------------------------------------------------------------------------
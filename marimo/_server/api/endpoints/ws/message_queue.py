@@ -0,0 +1,170 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Per-consumer queue of kernel messages waiting to be sent.
+
+A cell that updates its output in a tight loop (a progress bar, a UI
+element driven by a loop, `mo.output.replace`) produces one `cell-op`
+per update. A fast client sends each one as it arrives; for a slow one
+they pile up, and all but the last are redundant by the time they would
+be sent. `CoalescingMessageQueue` drops such superseded messages while
+they wait, so the coalescing window is exactly the time a message sits
+unsent and a client that keeps up sees no added latency.
+
+The queue is also bounded in bytes: a consumer that falls further behind
+than that is closed instead of buffering without limit. Its client
+reconnects and is resynced from the session view.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from marimo import _loggers
+from marimo._messaging.notification import CellNotification
+from marimo._messaging.serde import FramedMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+# Bytes of kernel messages a consumer may have queued before it is closed.
+DEFAULT_MAX_QUEUED_BYTES = 256 * 1024 * 1024
+
+_ERROR_MIMETYPE = "application/vnd.marimo+error"
+
+
+def _supersedes(newer: CellNotification, older: CellNotification) -> bool:
+    """Whether sending `newer` alone leaves the frontend in the same state
+    as sending `older` and then `newer`.
+
+    Only plain output updates are dropped: console output is appended,
+    status transitions (and their timestamps) drive run timing, and error
+    outputs set sticky flags, so messages carrying any of those are always
+    delivered.
+    """
+    if older.console is not None or older.status is not None:
+        return False
+    if older.output is not None and (
+        newer.output is None or older.output.mimetype == _ERROR_MIMETYPE
+    ):
+        return False
+    if older.stale_inputs is not None and newer.stale_inputs is None:
+        return False
+    return (
+        older.serialization is msgspec.UNSET
+        or newer.serialization is not msgspec.UNSET
+    )
+
+
+class CoalescingMessageQueue(asyncio.Queue[Any]):
+    """An `asyncio.Queue` of kernel messages that coalesces output updates
+    and bounds the bytes it holds.
+
+    Items that aren't kernel messages (e.g. the SSE transport's control
+    signals) pass through untouched and don't count towards the bound.
+
+    Args:
+        max_bytes: Bytes of queued kernel messages above which the queue
+            overflows. On overflow, queued kernel messages are discarded,
+            later ones are dropped, and `on_overflow` is called once.
+        on_overflow: Called when the queue first overflows.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_QUEUED_BYTES,
+        on_overflow: Callable[[], None] | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.on_overflow = on_overflow
+        self.overflowed = False
+        self.coalesced = 0
+        super().__init__()
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    # Hooks called by asyncio.Queue, as in PriorityQueue and LifoQueue.
+
+    def _init(self, maxsize: int) -> None:
+        del maxsize
+        # Keyed by arrival, so a superseded message is removed in O(1).
+        self._queue: OrderedDict[int, Any] = OrderedDict()
+        self._seq = itertools.count()
+        self._nbytes = 0
+        # The key and notification of each cell's queued output update.
+        self._latest: dict[CellId_t, tuple[int, CellNotification]] = {}
+
+    def _get(self) -> Any:
+        seq, item = self._queue.popitem(last=False)
+        if isinstance(item, FramedMessage):
+            self._nbytes -= len(item)
+            self._forget(seq, item)
+        return item
+
+    def _put(self, item: Any) -> None:
+        seq = next(self._seq)
+        if not isinstance(item, bytes):
+            self._queue[seq] = item
+            return
+        if self.overflowed:
+            return
+
+        message = FramedMessage.of(item)
+        if message.op == CellNotification.name:
+            self._coalesce(seq, message)
+        self._queue[seq] = message
+        self._nbytes += len(message)
+
+        if self._nbytes > self.max_bytes:
+            self._overflow()
+
+    def _coalesce(self, seq: int, message: FramedMessage) -> None:
+        notification = message.notification
+        if not isinstance(notification, CellNotification):
+            return
+        cell_id = notification.cell_id
+        previous = self._latest.pop(cell_id, None)
+        if previous is not None and _supersedes(notification, previous[1]):
+            self._remove(previous[0])
+            self.coalesced += 1
+        self._latest[cell_id] = (seq, notification)
+
+    def _remove(self, seq: int) -> None:
+        message = self._queue.pop(seq, None)
+        if message is not None:
+            self._nbytes -= len(message)
+
+    def _forget(self, seq: int, message: FramedMessage) -> None:
+        if message.op != CellNotification.name:
+            return
+        notification = message.notification
+        if not isinstance(notification, CellNotification):
+            return
+        latest = self._latest.get(notification.cell_id)
+        if latest is not None and latest[0] == seq:
+            del self._latest[notification.cell_id]
+
+    def _overflow(self) -> None:
+        LOGGER.warning(
+            "Consumer fell %d bytes behind; dropping its queued messages",
+            self._nbytes,
+        )
+        self.overflowed = True
+        self._queue = OrderedDict(
+            (seq, item)
+            for seq, item in self._queue.items()
+            if not isinstance(item, bytes)
+        )
+        self._nbytes = 0
+        self._latest.clear()
+        if self.on_overflow is not None:
+            self.on_overflow()
@@ -17,6 +17,9 @@ from marimo._messaging.notification import (
     ReconnectedNotification,
 )
 from marimo._messaging.serde import serialize_kernel_message
+from marimo._server.api.endpoints.ws.message_queue import (
+    CoalescingMessageQueue,
+)
 from marimo._server.api.endpoints.ws.ws_kernel_ready import (
     build_kernel_ready,
     is_rtc_available,
@@ -81,7 +84,9 @@ class SessionHandler(SessionConsumer, abc.ABC):
         self.cancel_close_handle: asyncio.TimerHandle | None = None
         # Messages from the kernel are put in this queue
         # to be sent to the frontend
-        self.message_queue: asyncio.Queue[KernelMessage] = asyncio.Queue()
+        self.message_queue: asyncio.Queue[KernelMessage] = (
+            CoalescingMessageQueue(on_overflow=self._on_queue_overflow)
+        )
         self._consumer_id = ConsumerId(params.session_id)
 
     @property
@@ -139,6 +144,15 @@ class SessionHandler(SessionConsumer, abc.ABC):
     def _serialize_and_notify(self, notification: NotificationMessage) -> None:
         self.notify(serialize_kernel_message(notification))
 
+    def _on_queue_overflow(self) -> None:
+        # The client is too far behind to catch up message by message;
+        # close it so it reconnects and is resynced from the session view.
+        if self._is_transport_connected():
+            self._request_close(
+                WebSocketCodes.NORMAL_CLOSE,
+                WebSocketCloseReason.SLOW_CONSUMER,
+            )
+
     def _write_kernel_ready_from_session_view(
         self, session: Session, kiosk: bool
     ) -> None:
@@ -109,10 +109,10 @@ class SSESessionHandler(SessionHandler):
         self._close_requested = False
         self._stream_finished = False
         # One queue carries both kernel messages (via the base class's
-        # `notify`) and control signals; the cast reconciles the base
-        # class's narrower type with the interleaved signals.
-        self._queue: asyncio.Queue[_QueueItem] = asyncio.Queue()
-        self.message_queue = cast("asyncio.Queue[KernelMessage]", self._queue)
+        # `notify`) and control signals, which the coalescing queue passes
+        # through; the cast reconciles the base class's narrower type with
+        # the interleaved signals.
+        self._queue = cast("asyncio.Queue[_QueueItem]", self.message_queue)
 
     async def stream(self) -> AsyncGenerator[str, None]:
         """Connect to the session and stream kernel messages as SSE.
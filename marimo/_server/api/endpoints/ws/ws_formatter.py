@@ -9,25 +9,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from marimo._messaging.serde import serialize_kernel_message
+from marimo._messaging.serde import (
+    format_wire_message,
+    serialize_kernel_message,
+)
 
 if TYPE_CHECKING:
     from marimo._messaging.notification import NotificationMessage
 
-
-def format_wire_message(op: str, data: bytes) -> str:
-    """Format a serialized message for transport to the frontend.
-
-    Wraps serialized notification data with operation metadata.
-
-    Args:
-        op: The operation name (e.g., "cell-op", "kernel-ready")
-        data: The serialized notification data as bytes
-
-    Returns:
-        JSON string in wire format: {"op": "...", "data": ...}
-    """
-    return f'{{"op": "{op}", "data": {data.decode("utf-8")}}}'
+__all__ = [
+    "format_wire_message",
+    "serialize_notification_for_wire",
+]
 
 
 def serialize_notification_for_wire(
@@ -11,9 +11,8 @@ from marimo._messaging.notification import (
     CompletionResultNotification,
     FocusCellNotification,
 )
-from marimo._messaging.serde import deserialize_kernel_notification_name
+from marimo._messaging.serde import FramedMessage
 from marimo._messaging.types import KernelMessage
-from marimo._server.api.endpoints.ws.ws_formatter import format_wire_message
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -63,19 +62,21 @@ def prepare_wire_message(data: KernelMessage, *, is_kiosk: bool) -> str | None:
     """Filter and serialize a kernel message for the frontend.
 
     Shared by the WebSocket and SSE transports so both apply identical
-    kiosk filtering and produce identical wire payloads.
+    kiosk filtering and produce identical wire payloads. Broadcast
+    messages arrive as a `FramedMessage`, so the op name and payload are
+    computed once however many consumers send them.
 
     Returns:
         The wire-format text, or None if the message is filtered out or
         fails to serialize.
     """
-    op: str = deserialize_kernel_notification_name(data)
+    message = FramedMessage.of(data)
 
-    if _should_filter_operation(op, is_kiosk=is_kiosk):
+    if _should_filter_operation(message.op, is_kiosk=is_kiosk):
         return None
 
     try:
-        return format_wire_message(op, data)
+        return message.wire
     except Exception as e:
         LOGGER.error("Failed to deserialize message: %s", str(e))
         LOGGER.error("Message: %s", data)
@@ -29,3 +29,4 @@ class WebSocketCloseReason(str, Enum):
     KIOSK_NOT_ALLOWED = "MARIMO_KIOSK_NOT_ALLOWED"
     KERNEL_STARTUP_ERROR = "MARIMO_KERNEL_STARTUP_ERROR"
     SHUTDOWN = "MARIMO_SHUTDOWN"
+    SLOW_CONSUMER = "MARIMO_SLOW_CONSUMER"
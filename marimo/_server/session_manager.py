@@ -42,6 +42,10 @@ from marimo._session.file_change_handler import (
 from marimo._session.file_watcher_integration import (
     SessionFileWatcherExtension,
 )
+from marimo._session.managers.kernel_pool import (
+    KernelPool,
+    warm_import_in_background,
+)
 from marimo._session.model import ConnectionState, SessionMode
 from marimo._session.session import Session, SessionImpl
 from marimo._session.session_repository import SessionRepository
@@ -104,12 +108,26 @@ class SessionManager:
         # When running multiple apps, each app runs in an isolated  host
         # process, to avoid collisions in sys.modules and other Python global
         # structures. These processes are managed by an AppHostPool.
+        server_config = config_manager.get_config()["server"]
         self._app_host_pool: AppHostPool | None = None
         if isolate_apps and mode == SessionMode.RUN:
             self._app_host_pool = AppHostPool(
                 sandbox=sandbox_mode is SandboxMode.MULTI,
+                snapshots=server_config.get("run_snapshots", False),
             )
 
+        # Edit-mode kernels are processes, so some can be spawned ahead of
+        # time; run-mode kernels are threads that share our imports.
+        self._kernel_pool: KernelPool | None = None
+        warm_imports = server_config.get("warm_imports", [])
+        if mode == SessionMode.EDIT and sandbox_mode is not SandboxMode.MULTI:
+            pool_size = server_config.get("kernel_pool_size", 0)
+            if pool_size > 0:
+                self._kernel_pool = KernelPool(pool_size, warm_imports)
+                self._kernel_pool.start()
+        elif self._app_host_pool is None and warm_imports:
+            warm_import_in_background(warm_imports)
+
         self._repository = SessionRepository()
 
         def _get_code() -> str:
@@ -239,6 +257,7 @@ class SessionManager:
             )
             if self._app_host_pool
             else None,
+            kernel_pool=self._kernel_pool,
         )
 
         # Add to repository
@@ -441,6 +460,8 @@ class SessionManager:
         self.close_all_sessions()
         if self._app_host_pool is not None:
             self._app_host_pool.shutdown()
+        if self._kernel_pool is not None:
+            self._kernel_pool.shutdown()
         self.lsp_server.stop()
         self._watcher_manager.stop_all()
 
@@ -94,6 +94,8 @@ class AppHostArgs(msgspec.Struct):
     file_path: str
     log_level: int
     parent_pid: int | None
+    # Serve sessions from forks of a kernel that has executed the notebook
+    snapshots: bool = False
 
     def encode_json(self) -> bytes:
         return msgspec.json.encode(self)
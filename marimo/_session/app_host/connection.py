@@ -35,7 +35,10 @@ class AppHostConnection:
 
     @classmethod
     def create(
-        cls, file_path: str, log_level: int | None = None
+        cls,
+        file_path: str,
+        log_level: int | None = None,
+        snapshots: bool = False,
     ) -> tuple[AppHostConnection, AppHostArgs]:
         """Bind all sockets, return connection and args for subprocess."""
         import zmq
@@ -76,6 +79,7 @@ class AppHostConnection:
             file_path=file_path,
             log_level=log_level,
             parent_pid=os.getpid(),
+            snapshots=snapshots,
         )
 
         return conn, args
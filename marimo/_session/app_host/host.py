@@ -51,6 +51,8 @@ class AppHost:
         python: absolute path to the Python executable
         sandbox_dir: where to store the temporary venv if the notebook is sandboxed
         on_empty: callable invoked when the AppHost spins down to zero sessions
+        snapshots: whether to serve sessions from forks of a kernel that has
+            already executed the notebook (see `app_host.snapshot`)
     """
 
     def __init__(
@@ -59,11 +61,13 @@ class AppHost:
         python: str | None = None,
         sandbox_dir: str | None = None,
         on_empty: Callable[[], None] | None = None,
+        snapshots: bool = False,
     ) -> None:
         self._file_path = file_path
         self._python = python or sys.executable
         self._sandbox_dir = sandbox_dir
         self._on_empty = on_empty
+        self._snapshots = snapshots
 
         # The process hosting client kernels.
         self._process: subprocess.Popen[bytes] | None = None
@@ -162,7 +166,9 @@ class AppHost:
                 LOGGER.warning("Error in stream receiver", exc_info=True)
 
     def start(self) -> None:
-        conn, args = AppHostConnection.create(self._file_path)
+        conn, args = AppHostConnection.create(
+            self._file_path, snapshots=self._snapshots
+        )
         self._conn = conn
 
         cmd = [
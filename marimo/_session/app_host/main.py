@@ -8,6 +8,7 @@ client session).
 from __future__ import annotations
 
 import dataclasses
+import functools
 import os
 import pickle
 import queue
@@ -34,16 +35,26 @@ from marimo._session.app_host.commands import (
     decode_mgmt_command,
     encode_mgmt_response,
 )
+from marimo._session.app_host.snapshot import (
+    SnapshotProcess,
+    SnapshotSession,
+    snapshots_supported,
+)
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from marimo._session.queue import QueueType
 
 LOGGER = _loggers.marimo_logger()
 
 
 @dataclasses.dataclass
 class _KernelQueues:
-    control: queue.Queue[typing.Any]
-    ui_element: queue.Queue[typing.Any]
-    completion: queue.Queue[typing.Any]
-    input: queue.Queue[typing.Any]
+    control: QueueType[typing.Any]
+    ui_element: QueueType[typing.Any]
+    completion: QueueType[typing.Any]
+    input: QueueType[typing.Any]
 
 
 @dataclasses.dataclass
@@ -108,14 +119,20 @@ def _handle_command(
         LOGGER.debug("Dropping command for unknown session %s", session_id)
         return
 
+    _route_command(info.queues, channel, payload)
+
+
+def _route_command(
+    queues: _KernelQueues, channel: Channel, payload: typing.Any
+) -> None:
     if channel is Channel.CONTROL:
-        info.queues.control.put(payload)
+        queues.control.put(payload)
     elif channel is Channel.UI_ELEMENT:
-        info.queues.ui_element.put(payload)
+        queues.ui_element.put(payload)
     elif channel is Channel.COMPLETION:
-        info.queues.completion.put(payload)
+        queues.completion.put(payload)
     elif channel is Channel.INPUT:
-        info.queues.input.put(payload)
+        queues.input.put(payload)
 
 
 def _stream_collector_loop(
@@ -161,52 +178,93 @@ def _handle_stop_kernel(
         LOGGER.debug("Kernel stopped for session %s", cmd.session_id)
 
 
+def _start_kernel_thread(
+    cmd: CreateKernelCmd,
+    command_queues: _KernelQueues,
+    stream_queue: _TaggedStreamQueue,
+) -> threading.Thread:
+    def launch_kernel_with_cleanup() -> None:
+        try:
+            runtime.launch_kernel(
+                control_queue=command_queues.control,
+                set_ui_element_queue=command_queues.ui_element,
+                completion_queue=command_queues.completion,
+                input_queue=command_queues.input,
+                stream_queue=stream_queue,
+                socket_addr=None,
+                is_edit_mode=False,
+                configs=cmd.configs,
+                app_metadata=cmd.app_metadata,
+                user_config=cmd.user_config,
+                virtual_file_storage=cmd.virtual_file_storage,
+                redirect_console_to_browser=cmd.redirect_console_to_browser,
+                interrupt_queue=None,
+                log_level=cmd.log_level,
+                is_ipc=False,
+            )
+        except Exception:
+            LOGGER.exception(
+                "Kernel thread crashed for session %s", cmd.session_id
+            )
+        finally:
+            stream_queue.put(KernelExited())
+
+    thread = threading.Thread(
+        target=launch_kernel_with_cleanup,
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def _new_kernel_queues() -> _KernelQueues:
+    return _KernelQueues(
+        control=queue.Queue(),
+        ui_element=queue.Queue(),
+        completion=queue.Queue(),
+        input=queue.Queue(maxsize=1),
+    )
+
+
+def _start_snapshot_session(
+    cmd: CreateKernelCmd,
+    snapshots: SnapshotProcess,
+    stream_queue: _TaggedStreamQueue,
+) -> tuple[threading.Thread, _KernelQueues]:
+    """Serve a session from the snapshot, if it can be."""
+
+    def fallback() -> Callable[[Channel, typing.Any], None]:
+        command_queues = _new_kernel_queues()
+        _start_kernel_thread(cmd, command_queues, stream_queue)
+        return functools.partial(_route_command, command_queues)
+
+    session = SnapshotSession(cmd, snapshots, stream_queue, fallback)
+    thread = threading.Thread(target=session.run, daemon=True)
+    thread.start()
+    return thread, _KernelQueues(
+        control=session.channel(Channel.CONTROL),
+        ui_element=session.channel(Channel.UI_ELEMENT),
+        completion=session.channel(Channel.COMPLETION),
+        input=session.channel(Channel.INPUT),
+    )
+
+
 def _handle_create_kernel(
     cmd: CreateKernelCmd,
     kernels: dict[str, _KernelInfo],
     stream_outbox: queue.Queue[typing.Any],
     response_socket: typing.Any,
+    snapshots: SnapshotProcess | None = None,
 ) -> None:
     try:
-        command_queues = _KernelQueues(
-            control=queue.Queue(),
-            ui_element=queue.Queue(),
-            completion=queue.Queue(),
-            input=queue.Queue(maxsize=1),
-        )
         stream_queue = _TaggedStreamQueue(cmd.session_id, stream_outbox)
-
-        def launch_kernel_with_cleanup() -> None:
-            try:
-                runtime.launch_kernel(
-                    control_queue=command_queues.control,
-                    set_ui_element_queue=command_queues.ui_element,
-                    completion_queue=command_queues.completion,
-                    input_queue=command_queues.input,
-                    stream_queue=stream_queue,
-                    socket_addr=None,
-                    is_edit_mode=False,
-                    configs=cmd.configs,
-                    app_metadata=cmd.app_metadata,
-                    user_config=cmd.user_config,
-                    virtual_file_storage=cmd.virtual_file_storage,
-                    redirect_console_to_browser=cmd.redirect_console_to_browser,
-                    interrupt_queue=None,
-                    log_level=cmd.log_level,
-                    is_ipc=False,
-                )
-            except Exception:
-                LOGGER.exception(
-                    "Kernel thread crashed for session %s", cmd.session_id
-                )
-            finally:
-                stream_queue.put(KernelExited())
-
-        thread = threading.Thread(
-            target=launch_kernel_with_cleanup,
-            daemon=True,
-        )
-        thread.start()
+        if snapshots is not None:
+            thread, command_queues = _start_snapshot_session(
+                cmd, snapshots, stream_queue
+            )
+        else:
+            command_queues = _new_kernel_queues()
+            thread = _start_kernel_thread(cmd, command_queues, stream_queue)
 
         kernels[cmd.session_id] = _KernelInfo(
             thread=thread,
@@ -250,7 +308,6 @@ def app_host_main(args: AppHostArgs) -> None:
 
     if sys.platform != "win32":
         os.setsid()
-        start_parent_poller(args.parent_pid)
 
     _loggers.set_level(args.log_level)
     LOGGER.debug(
@@ -264,6 +321,15 @@ def app_host_main(args: AppHostArgs) -> None:
     # all kernel threads (not per-kernel).
     install_thread_local_proxies()
 
+    # The snapshot process is forked before this process starts any threads.
+    snapshots: SnapshotProcess | None = None
+    if args.snapshots and snapshots_supported():
+        snapshots = SnapshotProcess.start()
+        LOGGER.debug("Snapshot process started (pid=%d)", snapshots.pid)
+
+    if sys.platform != "win32":
+        start_parent_poller(args.parent_pid)
+
     context = zmq.Context()
 
     # Management channel
@@ -305,7 +371,7 @@ def app_host_main(args: AppHostArgs) -> None:
 
             if isinstance(cmd, CreateKernelCmd):
                 _handle_create_kernel(
-                    cmd, kernels, stream_outbox, response_socket
+                    cmd, kernels, stream_outbox, response_socket, snapshots
                 )
             elif isinstance(cmd, StopKernelCmd):
                 _handle_stop_kernel(cmd, kernels)
@@ -319,6 +385,8 @@ def app_host_main(args: AppHostArgs) -> None:
                     "App host received unknown command: %s", type(cmd)
                 )
 
+    if snapshots is not None:
+        snapshots.close()
     mgmt_socket.close(linger=0)
     response_socket.close(linger=0)
     cmd_socket.close(linger=0)
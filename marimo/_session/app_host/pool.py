@@ -19,10 +19,11 @@ LOGGER = _loggers.marimo_logger()
 
 
 class AppHostPool:
-    def __init__(self, sandbox: bool = False) -> None:
+    def __init__(self, sandbox: bool = False, snapshots: bool = False) -> None:
         self._workers: dict[str, AppHost] = {}
         self._lock = threading.Lock()
         self._sandbox = sandbox
+        self._snapshots = snapshots
 
     def _remove_and_shutdown(self, abs_path: str) -> None:
         """Remove an app host from the pool and shut it down.
@@ -102,6 +103,7 @@ class AppHostPool:
             python=python,
             sandbox_dir=sandbox_dir,
             on_empty=_on_empty,
+            snapshots=self._snapshots,
         )
         worker.start()
         self._workers[abs_path] = worker
@@ -0,0 +1,523 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Copy-on-write snapshots of executed run-mode kernels.
+
+Every `marimo run` session normally executes its notebook from scratch.
+With the `run_snapshots` server option, the app host instead executes the
+notebook once, in a *snapshot process* that it forks when it starts, and
+serves each session from a fork of that process: the new kernel starts
+with every cell already run, and shares the snapshot's memory pages
+copy-on-write. The outputs produced while executing the snapshot are
+replayed to each session, and only cells that depend on UI elements whose
+initial values differ from the snapshot's are re-run.
+
+A session is served from the snapshot only if it instantiates the notebook
+exactly as the snapshot did: same code, cell configs, app metadata
+(including query params) and user config. Other sessions, and all sessions
+if the snapshot fails, get an ordinary kernel thread. The snapshot is
+executed without an HTTP request, so `mo.app_meta().request` is `None`
+in cells that aren't re-run.
+
+Snapshots are only supported on Linux. As with any use of `fork`, only
+the forking thread exists in the forked kernels: threads started by the
+notebook's cells are lost. marimo's own worker threads and pools (e.g.
+for hashing, cache stores and dataset profiling) register
+`os.register_at_fork` hooks that reset them in the child, which starts
+new ones on demand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import queue
+import signal
+import socket
+import sys
+import threading
+from collections import deque
+from multiprocessing import Pipe, reduction
+from multiprocessing.connection import Connection
+from typing import TYPE_CHECKING, Any
+
+import msgspec.structs
+
+from marimo import _loggers
+from marimo._messaging.streams import ThreadSafeStream
+from marimo._messaging.types import KernelMessage, KernelStreams
+from marimo._runtime.commands import (
+    CreateNotebookCommand,
+    StopKernelCommand,
+    UpdateUIElementCommand,
+)
+from marimo._runtime.kernel_lifecycle import (
+    KernelArgs,
+    create_kernel,
+    listen_messages,
+    teardown_kernel,
+    threaded_queue_reader,
+)
+from marimo._session.app_host.commands import Channel, KernelExited
+from marimo._session.model import SessionMode
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from marimo._runtime.context.kernel_context import KernelRuntimeContext
+    from marimo._runtime.runtime import Kernel
+    from marimo._session.app_host.commands import CreateKernelCmd
+    from marimo._session.queue import QueueType
+
+LOGGER = _loggers.marimo_logger()
+
+
+def snapshots_supported() -> bool:
+    return sys.platform == "linux"
+
+
+def _snapshot_key(
+    cmd: CreateKernelCmd, request: CreateNotebookCommand
+) -> tuple[Any, ...] | None:
+    """What a session must share with the snapshot to be served from it,
+    or `None` if it can't be served from any snapshot."""
+    # Console output is redirected by a thread, which wouldn't survive fork.
+    if not request.auto_run or cmd.redirect_console_to_browser:
+        return None
+    return (
+        tuple((er.cell_id, er.code) for er in request.execution_requests),
+        request.cell_ids,
+        cmd.configs,
+        cmd.app_metadata,
+        cmd.user_config,
+        cmd.virtual_file_storage,
+    )
+
+
+class _RecordingPipe:
+    """The snapshot kernel's output pipe.
+
+    Records the snapshot's outputs until a forked kernel connects it to
+    its session, then replays them and forwards all further outputs.
+    """
+
+    def __init__(self) -> None:
+        self._recorded: list[KernelMessage] = []
+        self._conn: Connection | None = None
+
+    def send(self, obj: KernelMessage) -> None:
+        if self._conn is None:
+            self._recorded.append(obj)
+        else:
+            self._conn.send_bytes(obj)
+
+    def connect(self, conn: Connection) -> None:
+        for msg in self._recorded:
+            conn.send_bytes(msg)
+        self._recorded.clear()
+        self._conn = conn
+
+
+class _Snapshot:
+    """An executed kernel, in the snapshot process."""
+
+    def __init__(
+        self,
+        kernel: Kernel,
+        ctx: KernelRuntimeContext,
+        queues: dict[Channel, queue.Queue[Any]],
+        pipe: _RecordingPipe,
+    ) -> None:
+        self.kernel = kernel
+        self.ctx = ctx
+        self.queues = queues
+        self.pipe = pipe
+
+    @staticmethod
+    def execute(
+        cmd: CreateKernelCmd, request: CreateNotebookCommand
+    ) -> _Snapshot:
+        queues: dict[Channel, queue.Queue[Any]] = {
+            Channel.CONTROL: queue.Queue(),
+            Channel.UI_ELEMENT: queue.Queue(),
+            Channel.COMPLETION: queue.Queue(),
+            Channel.INPUT: queue.Queue(maxsize=1),
+        }
+        pipe = _RecordingPipe()
+        stream = ThreadSafeStream(
+            pipe=pipe,
+            input_queue=queues[Channel.INPUT],
+            redirect_console=False,
+        )
+        kernel, ctx = create_kernel(
+            KernelArgs(
+                streams=KernelStreams(
+                    stream=stream, stdout=None, stderr=None, stdin=None
+                ),
+                debugger=None,
+                configs=cmd.configs,
+                app_metadata=cmd.app_metadata,
+                user_config=cmd.user_config,
+                mode=SessionMode.RUN,
+                control_queue=queues[Channel.CONTROL],
+                set_ui_element_queue=queues[Channel.UI_ELEMENT],
+                virtual_file_storage=cmd.virtual_file_storage,
+            )
+        )
+        asyncio.run(kernel.handle_message(request))
+        return _Snapshot(kernel, ctx, queues, pipe)
+
+    def serve(self, conn: Connection, request: CreateNotebookCommand) -> None:
+        """Serve a session from this snapshot; called in a forked process."""
+        # Virtual files created by the snapshot's cells belong to the
+        # snapshot process, which outlives this kernel.
+        self.ctx.virtual_file_registry.registry.clear()
+        self.pipe.connect(conn)
+        threading.Thread(
+            target=self._read_commands, args=(conn,), daemon=True
+        ).start()
+        try:
+            asyncio.run(self._run(request))
+        finally:
+            teardown_kernel(self.kernel, self.ctx)
+            conn.close()
+
+    def close(self) -> None:
+        teardown_kernel(self.kernel, self.ctx)
+
+    def _read_commands(self, conn: Connection) -> None:
+        while True:
+            try:
+                channel, payload = conn.recv()
+            except (EOFError, OSError):
+                # The app host is gone.
+                self.queues[Channel.CONTROL].put(StopKernelCommand())
+                return
+            self.queues[channel].put(payload)
+
+    def _changed_ui_values(
+        self, request: UpdateUIElementCommand
+    ) -> UpdateUIElementCommand | None:
+        registry = self.ctx.ui_element_registry
+        object_ids = []
+        values = []
+        for object_id, value in request.ids_and_values:
+            try:
+                unchanged = (
+                    registry.get_object(object_id)._value_frontend == value
+                )
+            except KeyError:
+                # Not a (live) element of the snapshot; let the kernel
+                # resolve it, as it would any other update.
+                unchanged = False
+            if not unchanged:
+                object_ids.append(object_id)
+                values.append(value)
+        if not object_ids:
+            return None
+        return UpdateUIElementCommand(
+            object_ids=object_ids,
+            values=values,
+            token=request.token,
+            request=request.request,
+        )
+
+    async def _run(self, request: CreateNotebookCommand) -> None:
+        update = self._changed_ui_values(request.set_ui_element_value_request)
+        if update is not None:
+            await self.kernel.handle_message(update)
+        await listen_messages(
+            self.kernel,
+            self.queues[Channel.CONTROL],
+            self.queues[Channel.UI_ELEMENT],
+            threaded_queue_reader,
+        )
+
+
+def _fork_kernel(
+    snapshot: _Snapshot, conn: Connection, request: CreateNotebookCommand
+) -> int:
+    pid = os.fork()
+    if pid != 0:
+        return pid
+
+    # Child: becomes the session's kernel.
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    exit_code = 0
+    try:
+        snapshot.serve(conn, request)
+    except BaseException:
+        LOGGER.exception("Kernel forked from snapshot crashed")
+        exit_code = 1
+    finally:
+        os._exit(exit_code)
+
+
+def _snapshot_main(conn: Connection) -> None:
+    """Main loop of the snapshot process.
+
+    Handles one request at a time from the app host: `("execute", cmd,
+    request)` executes the notebook, and `("fork", request)`, followed by
+    a socket for the new kernel's session, forks a kernel from it.
+    """
+    # Kernels forked from the snapshot are reaped automatically.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    snapshot: _Snapshot | None = None
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                # The app host exited.
+                return
+
+            if message[0] == "execute":
+                try:
+                    snapshot = _Snapshot.execute(message[1], message[2])
+                except Exception as e:
+                    LOGGER.exception("Failed to execute snapshot")
+                    conn.send(("error", str(e)))
+                else:
+                    conn.send(("ok", None))
+            elif message[0] == "fork":
+                session = Connection(reduction.recv_handle(conn))
+                if snapshot is None:
+                    session.close()
+                    conn.send(("error", "snapshot was not executed"))
+                    continue
+                pid = _fork_kernel(snapshot, session, message[1])
+                session.close()
+                conn.send(("ok", pid))
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+
+
+class SnapshotProcess:
+    """The app host's handle to its snapshot process.
+
+    The snapshot is executed for the first session that asks for a kernel,
+    and every later session with the same snapshot key is forked from it.
+    """
+
+    def __init__(self, pid: int, conn: Connection) -> None:
+        self.pid = pid
+        self._conn = conn
+        self._lock = threading.Lock()
+        self._key: tuple[Any, ...] | None = None
+        self._failed = False
+
+    @staticmethod
+    def start() -> SnapshotProcess:
+        """Fork the snapshot process.
+
+        Must be called before the app host starts any threads.
+        """
+        ours, theirs = Pipe()
+        pid = os.fork()
+        if pid == 0:
+            ours.close()
+            exit_code = 0
+            try:
+                _snapshot_main(theirs)
+            except BaseException:
+                LOGGER.exception("Snapshot process crashed")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        theirs.close()
+        return SnapshotProcess(pid, ours)
+
+    def fork(
+        self, cmd: CreateKernelCmd, request: CreateNotebookCommand
+    ) -> Connection | None:
+        """Fork a kernel for `cmd`'s session from the snapshot.
+
+        Returns a connection to the kernel, which receives `(Channel,
+        payload)` commands and sends `KernelMessage` bytes, or `None` if
+        the session can't be served from the snapshot.
+        """
+        key = _snapshot_key(cmd, request)
+        if key is None:
+            return None
+        with self._lock:
+            if self._failed:
+                return None
+            if self._key is None:
+                self._key = key
+                # The snapshot is shared by all sessions, so it's executed
+                # without this session's HTTP request and UI values.
+                snapshot_request = msgspec.structs.replace(
+                    request,
+                    execution_requests=tuple(
+                        msgspec.structs.replace(er, request=None)
+                        for er in request.execution_requests
+                    ),
+                    set_ui_element_value_request=UpdateUIElementCommand(
+                        object_ids=[], values=[]
+                    ),
+                    request=None,
+                )
+                if not self._call(("execute", cmd, snapshot_request)):
+                    self._failed = True
+                    return None
+            elif key != self._key:
+                return None
+
+            ours, theirs = socket.socketpair()
+            try:
+                self._conn.send(("fork", request))
+                reduction.send_handle(self._conn, theirs.fileno(), self.pid)
+                status, result = self._conn.recv()
+            except (EOFError, OSError) as e:
+                LOGGER.warning("Snapshot process is gone: %s", e)
+                self._failed = True
+                ours.close()
+                return None
+            finally:
+                theirs.close()
+
+        if status != "ok":
+            LOGGER.warning("Failed to fork kernel from snapshot: %s", result)
+            ours.close()
+            return None
+        LOGGER.debug(
+            "Forked kernel for session %s from snapshot (pid=%s)",
+            cmd.session_id,
+            result,
+        )
+        return Connection(ours.detach())
+
+    def _call(self, message: tuple[Any, ...]) -> bool:
+        try:
+            self._conn.send(message)
+            status, result = self._conn.recv()
+        except (EOFError, OSError) as e:
+            LOGGER.warning("Snapshot process is gone: %s", e)
+            return False
+        if status != "ok":
+            LOGGER.warning("Failed to execute snapshot: %s", result)
+            return False
+        return True
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class SnapshotSession:
+    """Routes a session's commands to a kernel forked from the snapshot.
+
+    Commands are held until the session's first command arrives. If it
+    instantiates the notebook in a way the snapshot can serve, the session
+    gets a forked kernel; otherwise `fallback` starts an ordinary kernel
+    thread and returns a function that routes commands to it.
+    """
+
+    def __init__(
+        self,
+        cmd: CreateKernelCmd,
+        snapshots: SnapshotProcess,
+        stream_queue: QueueType[Any],
+        fallback: Callable[[], Callable[[Channel, Any], None]],
+    ) -> None:
+        self._cmd = cmd
+        self._snapshots = snapshots
+        self._stream_queue = stream_queue
+        self._fallback = fallback
+        self._cond = threading.Condition()
+        self._pending: deque[tuple[Channel, Any]] = deque()
+        self._route: Callable[[Channel, Any], None] | None = None
+        self._send_lock = threading.Lock()
+
+    def channel(self, channel: Channel) -> _SessionChannel:
+        """A write-only queue for the session's commands on `channel`."""
+        return _SessionChannel(self, channel)
+
+    def put(self, channel: Channel, payload: Any) -> None:
+        with self._cond:
+            if self._route is None:
+                self._pending.append((channel, payload))
+                self._cond.notify()
+                return
+            route = self._route
+        route(channel, payload)
+
+    def run(self) -> None:
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            channel, first = self._pending[0]
+
+        conn = None
+        if channel is Channel.CONTROL and isinstance(
+            first, CreateNotebookCommand
+        ):
+            conn = self._snapshots.fork(self._cmd, first)
+
+        if conn is None:
+            route = self._fallback()
+        else:
+            route = self._sender(conn)
+            threading.Thread(
+                target=self._receive_outputs, args=(conn,), daemon=True
+            ).start()
+
+        with self._cond:
+            if conn is not None:
+                # The forked kernel was instantiated with this request.
+                self._pending.popleft()
+            while self._pending:
+                route(*self._pending.popleft())
+            self._route = route
+
+    def _sender(self, conn: Connection) -> Callable[[Channel, Any], None]:
+        def send(channel: Channel, payload: Any) -> None:
+            try:
+                with self._send_lock:
+                    conn.send((channel, payload))
+            except OSError as e:
+                LOGGER.debug(
+                    "Dropping command for exited kernel (session %s): %s",
+                    self._cmd.session_id,
+                    e,
+                )
+
+        return send
+
+    def _receive_outputs(self, conn: Connection) -> None:
+        while True:
+            try:
+                data = conn.recv_bytes()
+            except (EOFError, OSError):
+                break
+            self._stream_queue.put(KernelMessage(data))
+        conn.close()
+        self._stream_queue.put(KernelExited())
+
+
+class _SessionChannel:
+    """Queue-like view of one of a `SnapshotSession`'s channels."""
+
+    def __init__(self, session: SnapshotSession, channel: Channel) -> None:
+        self._session = session
+        self._channel = channel
+
+    def put(
+        self,
+        item: Any,
+        /,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        del block, timeout
+        self._session.put(self._channel, item)
+
+    def put_nowait(self, item: Any, /) -> None:
+        self._session.put(self._channel, item)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        raise NotImplementedError("_SessionChannel is write-only")
+
+    def get_nowait(self) -> Any:
+        raise NotImplementedError("_SessionChannel is write-only")
+
+    def empty(self) -> bool:
+        return True
@@ -30,6 +30,7 @@ if TYPE_CHECKING:
     from marimo._config.manager import MarimoConfigReader
     from marimo._runtime.commands import AppMetadata
     from marimo._runtime.virtual_file import VirtualFileStorageType
+    from marimo._session.managers.kernel_pool import PooledKernel
     from marimo._types.ids import CellId_t
 
 LOGGER = _loggers.marimo_logger()
@@ -39,7 +40,9 @@ class KernelManagerImpl(KernelManager):
     """Kernel manager using multiprocessing Process or threading Thread.
 
     Uses Process for edit mode (allows SIGINT interrupts) and Thread for
-    run mode (lower memory overhead).
+    run mode (lower memory overhead). In edit mode, a `pooled_kernel`
+    claimed from a `KernelPool` is launched instead of spawning a new
+    process; `queue_manager` must then be that kernel's.
     """
 
     def __init__(
@@ -52,6 +55,7 @@ class KernelManagerImpl(KernelManager):
         config_manager: MarimoConfigReader,
         virtual_file_storage: VirtualFileStorageType | None,
         redirect_console_to_browser: bool,
+        pooled_kernel: PooledKernel | None = None,
     ) -> None:
         self.kernel_task: ProcessLike | threading.Thread | None = None
         self.queue_manager = queue_manager
@@ -64,6 +68,7 @@ class KernelManagerImpl(KernelManager):
         # Only used in edit mode
         self._read_conn: TypedConnection[KernelMessage] | None = None
         self._virtual_file_storage = virtual_file_storage
+        self._pooled_kernel = pooled_kernel
 
     def start_kernel(self) -> None:
         # We use a process in edit mode so that we can interrupt the app
@@ -74,6 +79,26 @@ class KernelManagerImpl(KernelManager):
         if is_edit_mode:
             # Need to use a socket for windows compatibility
             listener = connection.Listener(family="AF_INET")
+        if is_edit_mode and self._pooled_kernel is not None:
+            assert listener is not None
+            assert self.queue_manager is self._pooled_kernel.queue_manager, (
+                "a pooled kernel must use its own queues"
+            )
+            # Already running and waiting; tell it which notebook to run.
+            self.kernel_task = self._pooled_kernel.launch(
+                socket_addr=listener.address,
+                is_edit_mode=is_edit_mode,
+                configs=self.configs,
+                app_metadata=self.app_metadata,
+                user_config=self.config_manager.get_config(hide_secrets=False),
+                virtual_file_storage=self._virtual_file_storage,
+                redirect_console_to_browser=self.redirect_console_to_browser,
+                profile_path=self.profile_path,
+                log_level=GLOBAL_SETTINGS.LOG_LEVEL,
+                is_ipc=False,
+                parent_pid=os.getpid(),
+            )
+        elif is_edit_mode:
             self.kernel_task = get_context("spawn").Process(
                 target=runtime.launch_kernel,
                 args=(
@@ -158,7 +183,8 @@ class KernelManagerImpl(KernelManager):
                 daemon=True,
             )
 
-        self.kernel_task.start()  # type: ignore
+        if self._pooled_kernel is None or not is_edit_mode:
+            self.kernel_task.start()  # type: ignore
         if listener is not None:
             # Listener.accept() has no timeout. Run it on a helper thread so
             # the main path can watchdog kernel_task liveness; otherwise a
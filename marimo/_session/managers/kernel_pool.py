@@ -0,0 +1,244 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Pool of pre-spawned kernel processes for edit sessions.
+
+Starting an edit-mode kernel spawns a fresh interpreter, which then
+imports marimo's runtime and, once cells run, the notebook's libraries.
+A `KernelPool` pays for that ahead of time: it keeps a few processes that
+have already imported the runtime (and an optional list of warm imports)
+and are blocked waiting to be told which notebook to run. A session that
+claims one skips interpreter startup entirely; the pool spawns a
+replacement in the background.
+"""
+
+from __future__ import annotations
+
+import importlib
+import signal
+import threading
+from collections import deque
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._session.managers.queue import QueueManagerImpl
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from marimo._runtime.commands import (
+        BatchableCommand,
+        CommandMessage,
+        OutOfBandCommand,
+    )
+    from marimo._session.queue import QueueType
+
+LOGGER = _loggers.marimo_logger()
+
+
+def _pooled_kernel_main(
+    control_queue: QueueType[CommandMessage],
+    set_ui_element_queue: QueueType[BatchableCommand],
+    completion_queue: QueueType[OutOfBandCommand],
+    input_queue: QueueType[str],
+    interrupt_queue: QueueType[bool] | None,
+    conn: Connection,
+    warm_imports: Sequence[str],
+) -> None:
+    # Idle kernels are still in the server's process group, so a Ctrl-C in
+    # the terminal reaches them; the server shuts them down itself.
+    # `launch_kernel` restores the default handler.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    import marimo._runtime.kernel_lifecycle  # noqa: F401
+    from marimo._runtime import runtime
+
+    for module in warm_imports:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            LOGGER.warning("Failed to pre-import %s: %s", module, e)
+
+    try:
+        kwargs = conn.recv()
+    except (EOFError, OSError):
+        # The pool shut down before this kernel was claimed.
+        return
+    finally:
+        conn.close()
+
+    runtime.launch_kernel(
+        control_queue=control_queue,
+        set_ui_element_queue=set_ui_element_queue,
+        completion_queue=completion_queue,
+        input_queue=input_queue,
+        # stream queue unused
+        stream_queue=None,
+        interrupt_queue=interrupt_queue,
+        **kwargs,
+    )
+
+
+class PooledKernel:
+    """An idle kernel process, with the queues it was spawned with.
+
+    Multiprocessing queues can only be handed to a process when it is
+    spawned, so each pooled kernel owns its queues; the session that
+    claims it must use `queue_manager`.
+    """
+
+    def __init__(self, warm_imports: Sequence[str]) -> None:
+        self.queue_manager = QueueManagerImpl(use_multiprocessing=True)
+        context = get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self.process: BaseProcess = context.Process(
+            target=_pooled_kernel_main,
+            args=(
+                self.queue_manager.control_queue,
+                self.queue_manager.set_ui_element_queue,
+                self.queue_manager.completion_queue,
+                self.queue_manager.input_queue,
+                self.queue_manager.win32_interrupt_queue,
+                child_conn,
+                tuple(warm_imports),
+            ),
+            # Not a daemon, since the kernel may create child processes
+            daemon=False,
+        )
+        self.process.start()
+        # The child holds its own copy; closing ours lets it see EOF if
+        # this end is closed.
+        child_conn.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def launch(self, **kwargs: Any) -> BaseProcess:
+        """Start the kernel; `kwargs` are passed to `launch_kernel`, less
+        the queues."""
+        self._conn.send(kwargs)
+        self._conn.close()
+        return self.process
+
+    def close(self) -> None:
+        """Stop an unclaimed kernel.
+
+        It hasn't started its own process group yet, so only the process
+        itself is terminated.
+        """
+        self._conn.close()
+        self.queue_manager.close_queues()
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(timeout=1)
+
+
+class KernelPool:
+    """Keeps `size` idle kernel processes ready for edit sessions.
+
+    Kernels are spawned on a background thread, both initially and to
+    replace each one that is claimed. `warm_imports` are imported by every
+    pooled kernel before it is claimed, e.g. `["numpy", "pandas"]`.
+    """
+
+    def __init__(self, size: int, warm_imports: Sequence[str] = ()) -> None:
+        self.size = size
+        self.warm_imports = tuple(warm_imports)
+        self._idle: deque[PooledKernel] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def start(self) -> None:
+        if self._thread is not None or self.size <= 0:
+            return
+        self._thread = threading.Thread(
+            target=self._replenish, name="marimo-kernel-pool", daemon=True
+        )
+        self._thread.start()
+
+    def claim(self) -> PooledKernel | None:
+        """An idle kernel, or `None` if none is ready."""
+        kernel = None
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.popleft()
+                if candidate.is_alive():
+                    kernel = candidate
+                    break
+                candidate.close()
+            if kernel is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        self._wakeup.set()
+        LOGGER.debug(
+            "Kernel pool %s: %d hits, %d misses",
+            "hit" if kernel is not None else "miss",
+            self.hits,
+            self.misses,
+        )
+        return kernel
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def _replenish(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                missing = self.size - len(self._idle)
+            if missing <= 0:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            try:
+                kernel = PooledKernel(self.warm_imports)
+            except Exception as e:
+                LOGGER.warning("Failed to spawn a pooled kernel: %s", e)
+                return
+            with self._lock:
+                if not self._closed:
+                    self._idle.append(kernel)
+                    continue
+            kernel.close()
+            return
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        self._wakeup.set()
+        for kernel in idle:
+            kernel.close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def warm_import_in_background(modules: Sequence[str]) -> threading.Thread:
+    """Import `modules` on a background thread.
+
+    Run-mode kernels are threads in the server process, so importing
+    there ahead of time spares the first session.
+    """
+
+    def _import() -> None:
+        for module in modules:
+            try:
+                importlib.import_module(module)
+            except Exception as e:
+                LOGGER.warning("Failed to pre-import %s: %s", module, e)
+
+    thread = threading.Thread(
+        target=_import, name="marimo-warm-imports", daemon=True
+    )
+    thread.start()
+    return thread
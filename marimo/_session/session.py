@@ -17,7 +17,7 @@ from marimo._cli.sandbox import SandboxMode
 from marimo._config.manager import MarimoConfigManager, ScriptConfigManager
 from marimo._messaging.notebook.document import NotebookDocument
 from marimo._messaging.notification import NotificationMessage
-from marimo._messaging.serde import serialize_kernel_message
+from marimo._messaging.serde import FramedMessage, serialize_kernel_message
 from marimo._messaging.types import KernelMessage
 from marimo._runtime import commands
 from marimo._runtime.commands import (
@@ -68,6 +68,7 @@ if TYPE_CHECKING:
 
     from marimo._runtime.virtual_file import VirtualFileStorageType
     from marimo._session.app_host import AppHostContext
+    from marimo._session.managers.kernel_pool import KernelPool
     from marimo._session.requests import InstantiateNotebookRequest
 
 LOGGER = _loggers.marimo_logger()
@@ -101,6 +102,7 @@ class SessionImpl(Session):
         extensions: list[SessionExtension] | None = None,
         sandbox_mode: SandboxMode | None = None,
         app_host_context: AppHostContext | None = None,
+        kernel_pool: KernelPool | None = None,
     ) -> Session:
         """
         Create a new session.
@@ -166,8 +168,15 @@ class SessionImpl(Session):
         else:
             # Original kernel: Process for edit, Thread for run
             use_multiprocessing = mode == SessionMode.EDIT
-            queue_manager = QueueManagerImpl(
-                use_multiprocessing=use_multiprocessing
+            pooled_kernel = (
+                kernel_pool.claim()
+                if kernel_pool is not None and use_multiprocessing
+                else None
+            )
+            queue_manager = (
+                pooled_kernel.queue_manager
+                if pooled_kernel is not None
+                else QueueManagerImpl(use_multiprocessing=use_multiprocessing)
             )
             kernel_manager = KernelManagerImpl(
                 queue_manager=queue_manager,
@@ -177,6 +186,7 @@ class SessionImpl(Session):
                 config_manager=config_manager,
                 virtual_file_storage=virtual_file_storage,
                 redirect_console_to_browser=redirect_console_to_browser,
+                pooled_kernel=pooled_kernel,
             )
 
         if mode == SessionMode.EDIT:
@@ -429,10 +439,12 @@ class SessionImpl(Session):
         from_consumer_id: ConsumerId | None,
     ) -> None:
         """Broadcast a notification to session consumers."""
+        # Framed once and shared by every consumer and the session view.
         if isinstance(operation, bytes):
-            notification = operation
+            framed = FramedMessage.of(operation)
         else:
-            notification = serialize_kernel_message(operation)
+            framed = FramedMessage(serialize_kernel_message(operation))
+        notification = KernelMessage(framed)
 
         self.room.broadcast(notification, except_consumer=from_consumer_id)
         self._event_bus.emit_notification_sent(self, notification)
@@ -33,7 +33,7 @@ from marimo._messaging.notification import (
     VariableValue,
     VariableValuesNotification,
 )
-from marimo._messaging.serde import deserialize_kernel_message
+from marimo._messaging.serde import FramedMessage
 from marimo._messaging.types import KernelMessage
 from marimo._runtime.commands import (
     CommandMessage,
@@ -62,6 +62,25 @@ MIMEBUNDLE_TYPE: KnownMimeType = "application/vnd.marimo+mimebundle"
 
 BufferPath = tuple[str | int, ...]
 
+# Notifications `add_notification` records; others only mark it touched.
+_RECORDED_NOTIFICATIONS: tuple[type[NotificationMessage], ...] = (
+    CellNotification,
+    VariablesNotification,
+    VariableValuesNotification,
+    InterruptedNotification,
+    DatasetsNotification,
+    DataSourceConnectionsNotification,
+    StorageNamespacesNotification,
+    SQLTablePreviewNotification,
+    SQLSchemaListPreviewNotification,
+    SQLTableListPreviewNotification,
+    UIElementMessageNotification,
+    ModelLifecycleNotification,
+    StartupLogsNotification,
+    InstallingPackageAlertNotification,
+)
+_RECORDED_OPS = frozenset(cls.name for cls in _RECORDED_NOTIFICATIONS)
+
 
 @dataclass
 class ModelReplayState:
@@ -210,9 +229,14 @@ class SessionView:
         self.last_executed_code[req.cell_id] = req.code
 
     def add_raw_notification(self, raw_notification: KernelMessage) -> None:
-        self._touch()
+        message = FramedMessage.of(raw_notification)
+        if message.op not in _RECORDED_OPS:
+            # Skip decoding notifications that wouldn't be recorded.
+            self._touch()
+            self.auto_export_state.mark_all_stale()
+            return
         # Type ignore because NotificationMessage is a Union, not a class
-        self.add_notification(deserialize_kernel_message(raw_notification))  # type: ignore[arg-type]
+        self.add_notification(message.notification)  # type: ignore[arg-type]
 
     def add_control_request(self, request: CommandMessage) -> None:
         self._touch()
@@ -281,6 +305,8 @@ class SessionView:
         self._touch()
         self.auto_export_state.mark_all_stale()
 
+        if not isinstance(notification, _RECORDED_NOTIFICATIONS):
+            return
         if isinstance(notification, CellNotification):
             previous = self.cell_notifications.get(notification.cell_id)
             self.cell_notifications[notification.cell_id] = (
@@ -0,0 +1,141 @@
+import marimo
+
+__generated_with = "0.15.5"
+app = marimo.App(width="medium")
+
+
+@app.cell
+def _():
+    import marimo as mo
+
+    return (mo,)
+
+
+@app.cell
+def _():
+    import os
+    import time
+
+    from marimo._messaging.cell_output import CellChannel, CellOutput
+    from marimo._messaging.notification import CellNotification
+    from marimo._messaging.serde import (
+        FramedMessage,
+        deserialize_kernel_message,
+        deserialize_kernel_notification_name,
+        format_wire_message,
+        serialize_kernel_message,
+    )
+    from marimo._server.api.endpoints.ws.ws_message_loop import (
+        prepare_wire_message,
+    )
+    from marimo._session.state.session_view import SessionView
+    from marimo._types.ids import CellId_t
+
+    # Override for real benchmarks:
+    #   MARIMO_BENCH_OUTPUT_BYTES=1000000 python broadcast_fanout_benchmark.py
+    OUTPUT_BYTES = int(os.environ.get("MARIMO_BENCH_OUTPUT_BYTES", "50000"))
+    MESSAGES = int(os.environ.get("MARIMO_BENCH_MESSAGES", "20"))
+    CONSUMERS = (1, 10, 100)
+    return (
+        CONSUMERS,
+        CellChannel,
+        CellId_t,
+        CellNotification,
+        CellOutput,
+        FramedMessage,
+        MESSAGES,
+        OUTPUT_BYTES,
+        SessionView,
+        deserialize_kernel_message,
+        deserialize_kernel_notification_name,
+        format_wire_message,
+        prepare_wire_message,
+        serialize_kernel_message,
+        time,
+    )
+
+
+@app.cell
+def _(
+    CellChannel,
+    CellId_t,
+    CellNotification,
+    CellOutput,
+    OUTPUT_BYTES,
+    serialize_kernel_message,
+):
+    # A cell output of OUTPUT_BYTES of HTML, as the kernel sends it.
+    message = serialize_kernel_message(
+        CellNotification(
+            cell_id=CellId_t("Hbol"),
+            output=CellOutput(
+                channel=CellChannel.OUTPUT,
+                mimetype="text/html",
+                data="<pre>" + "x" * OUTPUT_BYTES + "</pre>",
+            ),
+            status="idle",
+        )
+    )
+    return (message,)
+
+
+@app.cell
+def _(
+    CONSUMERS,
+    FramedMessage,
+    MESSAGES,
+    SessionView,
+    deserialize_kernel_message,
+    deserialize_kernel_notification_name,
+    format_wire_message,
+    message,
+    prepare_wire_message,
+    time,
+):
+    # Per-message server CPU to fan a message out to every consumer's
+    # transport and record it in the session view.
+    def _per_consumer(consumers: int) -> None:
+        # Before: every consumer and the session view decode the message.
+        for _ in range(consumers):
+            op = deserialize_kernel_notification_name(message)
+            format_wire_message(op, message)
+        SessionView().add_notification(deserialize_kernel_message(message))  # type: ignore[arg-type]
+
+    def _framed(consumers: int) -> None:
+        framed = FramedMessage.of(message)
+        for _ in range(consumers):
+            prepare_wire_message(framed, is_kiosk=True)
+        SessionView().add_raw_notification(framed)
+
+    def _cpu_ms(fn, consumers: int) -> float:
+        start = time.process_time()
+        for _ in range(MESSAGES):
+            fn(consumers)
+        return (time.process_time() - start) * 1000 / MESSAGES
+
+    results = [
+        {
+            "consumers": consumers,
+            "per-consumer ms/msg": round(_cpu_ms(_per_consumer, consumers), 3),
+            "framed ms/msg": round(_cpu_ms(_framed, consumers), 3),
+        }
+        for consumers in CONSUMERS
+    ]
+    return (results,)
+
+
+@app.cell
+def _(OUTPUT_BYTES, mo, results):
+    for _row in results:
+        print(_row)
+    mo.vstack(
+        [
+            mo.md(f"Server CPU per {OUTPUT_BYTES}-byte output broadcast"),
+            mo.ui.table(results, selection=None),
+        ]
+    )
+    return
+
+
+if __name__ == "__main__":
+    app.run()
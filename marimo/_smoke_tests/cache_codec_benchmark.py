@@ -0,0 +1,204 @@
+import marimo
+
+__generated_with = "0.15.5"
+app = marimo.App(width="medium")
+
+
+@app.cell
+def _():
+    import marimo as mo
+
+    return (mo,)
+
+
+@app.cell
+def _():
+    import os
+    import tempfile
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import numpy as np
+
+    from marimo._save.cache import MARIMO_CACHE_VERSION, Cache
+    from marimo._save.hash import HashKey
+    from marimo._save.loaders import LazyLoader
+    from marimo._save.stores import FileStore
+    from marimo._save.stores.rest import RestStore
+    from marimo._save.stubs.lazy_stub import BLOB_CODECS
+
+    # Default small for CI smoke tests; override for real benchmarks:
+    #   MARIMO_BENCH_ARRAY_SIZE=50000000 python cache_codec_benchmark.py
+    ARRAY_SIZE = int(os.environ.get("MARIMO_BENCH_ARRAY_SIZE", "200000"))
+    # Throughput of the stand-in cache service, in MB/s; 0 is unthrottled.
+    BANDWIDTH = float(os.environ.get("MARIMO_BENCH_BANDWIDTH_MBPS", "100"))
+    REPEATS = int(os.environ.get("MARIMO_BENCH_REPEATS", "5"))
+    return (
+        ARRAY_SIZE,
+        BANDWIDTH,
+        BLOB_CODECS,
+        BaseHTTPRequestHandler,
+        Cache,
+        FileStore,
+        HashKey,
+        LazyLoader,
+        MARIMO_CACHE_VERSION,
+        REPEATS,
+        RestStore,
+        ThreadingHTTPServer,
+        np,
+        tempfile,
+        threading,
+        time,
+    )
+
+
+@app.cell
+def _(BANDWIDTH, BaseHTTPRequestHandler, ThreadingHTTPServer, threading, time):
+    # In-process stand-in for a remote cache service, throttled to
+    # BANDWIDTH so transfer size shows up in restore latency.
+    _blobs: dict[str, bytes] = {}
+
+    def _throttle(nbytes: int) -> None:
+        if BANDWIDTH > 0:
+            time.sleep(nbytes / (BANDWIDTH * 1e6))
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            del args
+
+        def _reply(self, status: int, body: bytes = b"") -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            _throttle(len(body))
+            self.wfile.write(body)
+
+        def do_GET(self):
+            body = _blobs.get(self.path)
+            self._reply(200 if body is not None else 404, body or b"")
+
+        def do_HEAD(self):
+            self.send_response(200 if self.path in _blobs else 404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_PUT(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            _throttle(len(body))
+            _blobs[self.path] = body
+            self._reply(200)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    return (base_url,)
+
+
+@app.cell
+def _(ARRAY_SIZE, np):
+    # Typical notebook payloads: integer codes, a smooth float signal and
+    # plain python records. Uniform random floats barely compress and are
+    # stored as is, so they'd only measure the ratio check.
+    payload = {
+        "codes": np.arange(ARRAY_SIZE, dtype=np.int64) % 1000,
+        "signal": np.round(np.sin(np.linspace(0, 100, ARRAY_SIZE)), 3),
+        "records": [
+            {"id": i, "label": f"row-{i % 97}", "ok": i % 3 == 0}
+            for i in range(ARRAY_SIZE // 20)
+        ],
+    }
+    return (payload,)
+
+
+@app.cell
+def _(
+    BLOB_CODECS,
+    Cache,
+    FileStore,
+    HashKey,
+    LazyLoader,
+    MARIMO_CACHE_VERSION,
+    REPEATS,
+    RestStore,
+    base_url,
+    payload,
+    tempfile,
+    time,
+):
+    def _bench(store_name, make_store, compression):
+        loader = LazyLoader(
+            f"bench_{store_name}_{compression}",
+            store=make_store(),
+            verification="off",
+            compression=compression,
+        )
+        cache = Cache(
+            defs=dict(payload),
+            hash="codec_bench",
+            cache_type="Pure",
+            stateful_refs=set(),
+            hit=False,
+            meta={"version": MARIMO_CACHE_VERSION},
+        )
+        loader.save_cache(cache)
+        loader.flush()
+        key = HashKey("codec_bench", "Pure")
+        stored = sum(
+            len(loader.store.get(str(path)) or b"")
+            for path in [
+                f"{loader.name}/codec_bench/{var}.{ext}"
+                for var, ext in [
+                    ("codes", "npy"),
+                    ("signal", "npy"),
+                    ("records", "pickle"),
+                ]
+            ]
+        )
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            assert loader.load_cache(key) is not None
+            timings.append(time.perf_counter() - start)
+        return {
+            "store": store_name,
+            "codec": compression or "none",
+            "stored MB": round(stored / 1e6, 2),
+            "restore ms": round(min(timings) * 1000, 1),
+        }
+
+    _tmp = tempfile.mkdtemp()
+    stores = {
+        "FileStore": lambda: FileStore(save_path=_tmp),
+        "RestStore": lambda: RestStore(base_url=base_url, api_key="bench"),
+    }
+    codecs = [None] + [n for n, c in BLOB_CODECS.items() if c.available()]
+    results = [
+        _bench(store_name, make_store, codec)
+        for store_name, make_store in stores.items()
+        for codec in codecs
+    ]
+    return (results,)
+
+
+@app.cell
+def _(ARRAY_SIZE, BANDWIDTH, mo, results):
+    for _row in results:
+        print(_row)
+    mo.vstack(
+        [
+            mo.md(
+                f"Restore latency, {ARRAY_SIZE} rows; RestStore stand-in "
+                f"at {BANDWIDTH:g} MB/s"
+            ),
+            mo.ui.table(results, selection=None),
+        ]
+    )
+    return
+
+
+if __name__ == "__main__":
+    app.run()
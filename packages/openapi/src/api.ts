@@ -6490,6 +6490,10 @@ export interface components {
      *             The default is `False`.
      *         - `std_stream_max_bytes`: the maximum size in bytes of console outputs;
      *           larger values may affect frontend performance
+     *         - `virtual_files_max_bytes`: the maximum total size in bytes of the
+     *             files (images, downloads, ...) a session keeps for its outputs; the
+     *             least recently used are removed past it. A negative value removes
+     *             the limit. The default is `500_000_000`.
      *         - `pythonpath`: a list of directories to add to the Python search path.
      *             Directories will be added to the head of sys.path. Similar to the
      *             `PYTHONPATH` environment variable, the directories will be included in
@@ -6531,6 +6535,7 @@ export interface components {
       serve_cached_sessions_in_apps?: boolean;
       show_tracebacks?: boolean;
       std_stream_max_bytes: number;
+      virtual_files_max_bytes?: number;
       /** @enum {unknown} */
       watcher_on_save: "autorun" | "lazy";
     };
@@ -6752,13 +6757,21 @@ export interface components {
      *             services that do not support WebSockets. Terminal, LSP, and
      *             real-time collaboration still require WebSockets; RTC is disabled
      *             when using `"sse"`.
+     *         - `kernel_pool_size`: number of edit-mode kernel processes to keep
+     *             spawned and idle, so new sessions don't wait for interpreter
+     *             startup. The default is `0` (no pool).
+     *         - `warm_imports`: modules to import ahead of time, e.g.
+     *             `["numpy", "pandas"]`: in pooled kernels in edit mode, and in the
+     *             server process in run mode.
      */
     ServerConfig: {
       browser: "default" | string;
       disable_file_downloads?: boolean;
       follow_symlink: boolean;
+      kernel_pool_size?: number;
       /** @enum {unknown} */
       transport?: "sse" | "websocket";
+      warm_imports?: string[];
     };
     /** Format: session-id */
     SessionId: TypedString<"SessionId">;
@@ -0,0 +1,225 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import ast
+import textwrap
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from marimo._ast import compile_cache, load
+from marimo._ast.compile_cache import (
+    CompiledCellCache,
+    get_compiled_cell_cache,
+)
+from marimo._ast.compiler import compile_cell
+from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._types.ids import CellId_t
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+CODE = textwrap.dedent(
+    """
+    import math
+    def _helper(v):
+        return v * 2
+    y = _helper(x) + math.pi
+    y
+    """
+).strip()
+
+
+@pytest.fixture(autouse=True)
+def write_bytecode() -> Generator[None, None, None]:
+    with patch("sys.dont_write_bytecode", False):
+        yield
+
+
+@pytest.fixture
+def enable_cache() -> Generator[None, None, None]:
+    with patch.object(GLOBAL_SETTINGS, "COMPILE_CACHE", True):
+        yield
+    compile_cache._caches.clear()
+
+
+def _compile(cache: CompiledCellCache, code: str = CODE, cell_id: str = "a"):
+    return compile_cell(code, cell_id=CellId_t(cell_id), compile_cache=cache)
+
+
+class TestCompiledCellCache:
+    def test_hit_matches_miss(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.msgpack"
+        writer = CompiledCellCache(path)
+        miss = _compile(writer)
+        writer.flush()
+        assert (writer.hits, writer.misses) == (0, 1)
+
+        reader = CompiledCellCache(path)
+        hit = _compile(reader)
+        assert (reader.hits, reader.misses) == (1, 0)
+
+        for attr in (
+            "defs",
+            "refs",
+            "temporaries",
+            "variable_data",
+            "import_workspace",
+            "language",
+            "markdown",
+        ):
+            assert getattr(hit, attr) == getattr(miss, attr), attr
+        assert ast.dump(hit.mod) == ast.dump(miss.mod)
+        assert hit.key == miss.key
+
+        glbls = {"x": 1}
+        exec(hit.body, glbls)
+        assert eval(hit.last_expr, glbls) == glbls["y"]
+
+    def test_key_includes_cell_id(self, tmp_path: Path) -> None:
+        cache = CompiledCellCache(tmp_path / "cache.msgpack")
+        _compile(cache, cell_id="a")
+        _compile(cache, cell_id="b")
+        assert cache.misses == 2
+
+    def test_test_cells_are_not_cached(self, tmp_path: Path) -> None:
+        cache = CompiledCellCache(tmp_path / "cache.msgpack")
+        _compile(cache, code="def test_x():\n    assert 1")
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_flush_prunes_unused_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.msgpack"
+        writer = CompiledCellCache(path)
+        _compile(writer, code="x = 1")
+        _compile(writer, code="x = 2")
+        writer.flush()
+
+        reader = CompiledCellCache(path)
+        _compile(reader, code="x = 2")
+        reader.flush()
+
+        final = CompiledCellCache(path)
+        _compile(final, code="x = 1")
+        _compile(final, code="x = 2")
+        assert (final.hits, final.misses) == (1, 1)
+
+    def test_keeps_latest_entry_per_cell(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.msgpack"
+        cache = CompiledCellCache(path)
+        for i in range(10):
+            _compile(cache, code=f"x = {i}")
+        _compile(cache, code="y = 1", cell_id="b")
+        assert len(cache._used) == 2
+        assert cache._entries is not None
+        assert len(cache._entries) == 2
+
+    def test_flush_drops_cells_not_in_graph(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.msgpack"
+        writer = CompiledCellCache(path)
+        _compile(writer, code="x = 1", cell_id="a")
+        _compile(writer, code="y = 1", cell_id="b")
+        writer.flush(cell_ids={"b"})
+        assert list(writer._used) == ["b"]
+
+        reader = CompiledCellCache(path)
+        _compile(reader, code="x = 1", cell_id="a")
+        _compile(reader, code="y = 1", cell_id="b")
+        assert (reader.hits, reader.misses) == (1, 1)
+
+    def test_flush_only_writes_changes(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.msgpack"
+        writer = CompiledCellCache(path)
+        _compile(writer)
+        writer.flush()
+
+        reader = CompiledCellCache(path)
+        _compile(reader)
+        path.unlink()
+        reader.flush()
+        assert not path.exists()
+
+    def test_version_mismatch_invalidates(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.msgpack"
+        writer = CompiledCellCache(path)
+        _compile(writer)
+        writer.flush()
+
+        with patch.object(compile_cache, "__version__", "0.0.0"):
+            reader = CompiledCellCache(path)
+            _compile(reader)
+        assert (reader.hits, reader.misses) == (0, 1)
+
+    def test_unreadable_file_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.msgpack"
+        path.write_bytes(b"not msgpack")
+        cache = CompiledCellCache(path)
+        _compile(cache)
+        assert cache.misses == 1
+        cache.flush()
+        key, _ = cache._used["a"]
+        assert CompiledCellCache(path).get(key, "a")
+
+    def test_no_write_when_dont_write_bytecode(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.msgpack"
+        cache = CompiledCellCache(path)
+        _compile(cache)
+        with patch("sys.dont_write_bytecode", True):
+            cache.flush()
+        assert not path.exists()
+
+
+class TestGetCompiledCellCache:
+    def test_disabled(self, tmp_path: Path) -> None:
+        with patch.object(GLOBAL_SETTINGS, "COMPILE_CACHE", False):
+            assert get_compiled_cell_cache(tmp_path / "nb.py") is None
+
+    @pytest.mark.usefixtures("enable_cache")
+    def test_location_and_sharing(self, tmp_path: Path) -> None:
+        assert get_compiled_cell_cache(None) is None
+        cache = get_compiled_cell_cache(tmp_path / "nb.py")
+        assert cache is not None
+        assert cache.path.parent == tmp_path / "__marimo__" / "compiled"
+        assert cache.path.name.startswith("nb.py.")
+        assert get_compiled_cell_cache(str(tmp_path / "nb.py")) is cache
+
+    @pytest.mark.usefixtures("enable_cache")
+    def test_load_app_populates_cache(self, tmp_path: Path) -> None:
+        notebook = tmp_path / "nb.py"
+        notebook.write_text(
+            textwrap.dedent(
+                """
+                import marimo
+                app = marimo.App()
+
+                @app.cell
+                def _():
+                    x = 1
+                    return (x,)
+
+                @app.cell
+                def _(x):
+                    y = x + 1
+                    return
+                """
+            ),
+            encoding="utf-8",
+        )
+        app = load.load_app(notebook)
+        assert app is not None
+        cache = get_compiled_cell_cache(notebook)
+        assert cache is not None
+        assert cache.path.exists()
+        assert cache.misses == 2
+
+        # A fresh process reads the cells back from disk.
+        compile_cache._caches.clear()
+        reloaded = load.load_app(notebook)
+        assert reloaded is not None
+        cache = get_compiled_cell_cache(notebook)
+        assert cache is not None
+        assert (cache.hits, cache.misses) == (2, 0)
+        assert [
+            cell.defs for cell in reloaded._cell_manager.cells() if cell
+        ] == [{"x"}, {"y"}]
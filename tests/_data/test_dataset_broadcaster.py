@@ -0,0 +1,159 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from marimo._data.dataset_broadcaster import (
+    DatasetBroadcaster,
+    change_witness,
+    detach,
+)
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._types.ids import VariableName
+from tests._messaging.mocks import MockStream
+
+HAS_DEPS = DependencyManager.pandas.has()
+
+
+def _datasets(stream: MockStream) -> list[list[str]]:
+    return [
+        [table["variable_name"] for table in op["tables"]]
+        for op in map(json.loads, stream.messages)
+        if op["op"] == "datasets"
+    ]
+
+
+@pytest.fixture
+def broadcaster():
+    broadcaster = DatasetBroadcaster(debounce_seconds=0.01)
+    yield broadcaster
+    broadcaster.shutdown()
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+class TestDatasetBroadcaster:
+    def test_broadcasts_dataframes(
+        self, broadcaster: DatasetBroadcaster
+    ) -> None:
+        import pandas as pd
+
+        stream = MockStream()
+        broadcaster.submit(
+            [
+                (VariableName("df"), pd.DataFrame({"a": [1, 2]})),
+                (VariableName("x"), 1),
+            ],
+            stream,
+        )
+        assert broadcaster.flush(timeout=10)
+        assert _datasets(stream) == [["df"]]
+
+    def test_unchanged_frames_are_not_profiled_again(
+        self, broadcaster: DatasetBroadcaster
+    ) -> None:
+        import pandas as pd
+
+        stream = MockStream()
+        df = pd.DataFrame({"a": [1, 2]})
+        for _ in range(2):
+            broadcaster.submit([(VariableName("df"), df)], stream)
+            assert broadcaster.flush(timeout=10)
+        assert (broadcaster.hits, broadcaster.misses) == (1, 1)
+
+        df["b"] = df["a"]
+        broadcaster.submit([(VariableName("df"), df)], stream)
+        assert broadcaster.flush(timeout=10)
+        assert broadcaster.misses == 2
+        assert _datasets(stream) == [["df"]] * 3
+
+    def test_debounces_to_latest_value(self) -> None:
+        import pandas as pd
+
+        broadcaster = DatasetBroadcaster(debounce_seconds=0.5)
+        try:
+            stream = MockStream()
+            for i in range(5):
+                broadcaster.submit(
+                    [(VariableName("df"), pd.DataFrame({"a": [i]}))], stream
+                )
+            assert broadcaster.flush(timeout=10)
+            assert broadcaster.misses == 1
+            assert _datasets(stream) == [["df"]]
+        finally:
+            broadcaster.shutdown()
+
+    def test_cancel_drops_pending(self) -> None:
+        import pandas as pd
+
+        broadcaster = DatasetBroadcaster(debounce_seconds=0.5)
+        try:
+            stream = MockStream()
+            broadcaster.submit(
+                [
+                    (VariableName("df"), pd.DataFrame({"a": [1]})),
+                    (VariableName("other"), pd.DataFrame({"b": [1]})),
+                ],
+                stream,
+            )
+            broadcaster.cancel([VariableName("df")])
+            assert broadcaster.flush(timeout=10)
+            assert _datasets(stream) == [["other"]]
+        finally:
+            broadcaster.shutdown()
+
+    def test_profiles_a_detached_copy(self) -> None:
+        import pandas as pd
+
+        broadcaster = DatasetBroadcaster(debounce_seconds=0.5)
+        try:
+            stream = MockStream()
+            df = pd.DataFrame({"a": [1, 2]})
+            broadcaster.submit([(VariableName("df"), df)], stream)
+            # The kernel keeps using the frame while it is pending
+            df["b"] = df["a"]
+            assert broadcaster.flush(timeout=10)
+            (op,) = (
+                op
+                for op in map(json.loads, stream.messages)
+                if op["op"] == "datasets"
+            )
+            assert [c["name"] for c in op["tables"][0]["columns"]] == ["a"]
+        finally:
+            broadcaster.shutdown()
+
+    @pytest.mark.skipif(
+        not DependencyManager.polars.has(), reason="polars not installed"
+    )
+    def test_lazy_frames_are_profiled_inline(
+        self, broadcaster: DatasetBroadcaster
+    ) -> None:
+        import polars as pl
+
+        stream = MockStream()
+        broadcaster.submit(
+            [(VariableName("lf"), pl.LazyFrame({"a": [1, 2]}))], stream
+        )
+        assert _datasets(stream) == [["lf"]]
+        assert broadcaster._thread is None
+
+    def test_detach(self) -> None:
+        import pandas as pd
+
+        df = pd.DataFrame({"a": [1, 2]})
+        detached = detach(df)
+        assert detached is not df
+        assert detached.equals(df)
+        assert detach(1) is None
+
+    def test_change_witness(self) -> None:
+        import pandas as pd
+
+        df = pd.DataFrame({"a": [1, 2]})
+        witness = change_witness(df)
+        assert witness is not None
+        assert change_witness(df) == witness
+        df["a"] = df["a"].astype(str)
+        assert change_witness(df) != witness
+        assert change_witness(1) is None
@@ -12,6 +12,7 @@ from marimo._messaging.notification import (
     InterruptedNotification,
 )
 from marimo._messaging.serde import (
+    FramedMessage,
     deserialize_kernel_message,
     deserialize_kernel_notification_name,
     serialize_kernel_message,
@@ -155,3 +156,26 @@ def test_deserialize_kernel_notification_name() -> None:
     original = CompletedRunNotification()
     serialized = serialize_kernel_message(original)
     assert deserialize_kernel_notification_name(serialized) == "completed-run"
+
+
+class TestFramedMessage:
+    def test_is_the_same_message(self) -> None:
+        serialized = serialize_kernel_message(CompletedRunNotification())
+        framed = FramedMessage.of(serialized)
+        assert framed == serialized
+        assert isinstance(framed, bytes)
+        assert FramedMessage.of(KernelMessage(framed)) is framed
+
+    def test_derived_values_are_computed_once(self) -> None:
+        original = AlertNotification(
+            title="Test", description="Unicode: 🎉", variant="danger"
+        )
+        framed = FramedMessage.of(serialize_kernel_message(original))
+
+        assert framed.op == "alert"
+        assert framed.notification == original
+        assert framed.notification is framed.notification
+        assert framed.wire is framed.wire
+        wire = json.loads(framed.wire)
+        assert wire["op"] == "alert"
+        assert wire["data"]["description"] == "Unicode: 🎉"
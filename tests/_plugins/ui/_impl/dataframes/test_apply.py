@@ -0,0 +1,104 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from marimo._plugins.ui._impl.dataframes.transforms import apply
+from marimo._plugins.ui._impl.dataframes.transforms.apply import (
+    TransformsContainer,
+)
+from marimo._plugins.ui._impl.dataframes.transforms.handlers import (
+    NarwhalsTransformHandler,
+)
+from marimo._plugins.ui._impl.dataframes.transforms.types import (
+    RenameColumnTransform,
+    SortColumnTransform,
+    Transformations,
+    TransformType,
+)
+from marimo._utils.narwhals_utils import make_lazy
+from tests._data.mocks import create_dataframes
+
+RENAME = RenameColumnTransform(
+    type=TransformType.RENAME_COLUMN, column_id="A", new_column_id="C"
+)
+SORT = SortColumnTransform(
+    type=TransformType.SORT_COLUMN,
+    column_id="B",
+    ascending=False,
+    na_position="last",
+)
+SORT_A = SortColumnTransform(
+    type=TransformType.SORT_COLUMN,
+    column_id="A",
+    ascending=True,
+    na_position="last",
+)
+
+
+def _container(df: Any, **kwargs: Any) -> TransformsContainer:
+    nw_df, _ = make_lazy(df)
+    return TransformsContainer(nw_df, NarwhalsTransformHandler(), **kwargs)
+
+
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"A": [1, 2, 3], "B": [4, 6, 5]}, include=["pandas", "polars"]
+    ),
+)
+def test_recomputes_only_uncached_suffix(df: Any) -> None:
+    container = _container(df)
+    with patch.object(apply, "_handle", wraps=apply._handle) as handle:
+        container.apply(Transformations([SORT_A, SORT, RENAME]))
+        assert handle.call_count == 3
+
+        # Undoing a step reuses its prefix
+        result, field_types = container.apply(Transformations([SORT_A, SORT]))
+        assert handle.call_count == 3
+        assert len(field_types) == 3
+        assert result.collect()["B"].to_list() == [6, 5, 4]
+
+        # Toggling a step back on, or changing the last one, only
+        # recomputes the steps after the shared prefix
+        container.apply(Transformations([SORT_A, SORT, RENAME]))
+        assert handle.call_count == 3
+        container.apply(Transformations([SORT_A, RENAME]))
+        assert handle.call_count == 4
+        result, field_types = container.apply(Transformations([RENAME]))
+        assert handle.call_count == 5
+        assert [name for name, _ in field_types[1]] == ["C", "B"]
+        assert result.collect()["C"].to_list() == [1, 2, 3]
+
+
+def test_evicts_least_recently_used_snapshots() -> None:
+    container = _container(
+        create_dataframes(
+            {"A": [1, 2, 3], "B": [4, 6, 5]}, include=["pandas"]
+        )[0],
+        max_bytes=0,
+    )
+    container.apply(Transformations([SORT, RENAME]))
+    assert container._root is not None
+    assert container._root.children == []
+    assert container._nbytes == 0
+
+    container.max_bytes = 10**9
+    container.apply(Transformations([SORT, RENAME]))
+    container.apply(Transformations([RENAME]))
+    sort, rename = container._root.children
+    assert [child.transform for child in sort.children] == [RENAME]
+
+    # Leaves go before their ancestors
+    container.max_bytes = container._nbytes - 1
+    container.apply(Transformations([RENAME]))
+    assert container._root.children == [sort, rename]
+    assert sort.children == []
+
+    container.max_bytes = rename.nbytes
+    container.apply(Transformations([RENAME]))
+    assert container._root.children == [rename]
+    assert container._nbytes == rename.nbytes
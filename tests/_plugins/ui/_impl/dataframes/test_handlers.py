@@ -2261,15 +2261,15 @@ class TestTransformHandler:
             ),
         )
         transformations = Transformations([sort_transform, filter_transform])
-        # Verify the next transformation
-        assert container._is_superset(transformations) is False
-        assert (
-            container._get_next_transformations(transformations)
-            == transformations
-        )
+        assert container._root is None
 
         # Apply the transformations
         result, field_types = container.apply(transformations)
+        # One snapshot per step, on a single path from the root
+        assert container._root is not None
+        (sort_node,) = container._root.children
+        (filter_node,) = sort_node.children
+        assert filter_node.transform == filter_transform
 
         # Verify field_types: original + 2 transforms = 3 entries
         assert len(field_types) == 3
@@ -2300,14 +2300,15 @@ class TestTransformHandler:
         transformations = Transformations(
             [sort_transform, filter_transform, filter_again_transform]
         )
-        # Verify the next transformation
-        assert container._is_superset(transformations) is True
-        assert container._get_next_transformations(
-            transformations
-        ) == Transformations([filter_again_transform])
         result, field_types = container.apply(
             transformations,
         )
+        # The shared prefix is reused; only the new step is added
+        assert container._root.children == [sort_node]
+        assert sort_node.children == [filter_node]
+        assert [node.transform for node in filter_node.children] == [
+            filter_again_transform
+        ]
         # Verify field_types: original + 3 transforms = 4 entries
         assert len(field_types) == 4
 
@@ -2315,16 +2316,12 @@ class TestTransformHandler:
         assert_frame_equal(undo(result), expected2)
 
         transformations = Transformations([sort_transform, filter_transform])
-        # Verify the next transformation
-        assert container._is_superset(transformations) is False
-        assert (
-            container._get_next_transformations(transformations)
-            == transformations
-        )
         # Reapply by removing the last transform
         result, field_types = container.apply(
             transformations,
         )
+        # Served from the existing snapshot, without recomputing
+        assert result is filter_node.df
         # Verify field_types: original + 2 transforms = 3 entries
         assert len(field_types) == 3
 
@@ -0,0 +1,41 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from marimo._data.models import BinValue, ColumnStats, ValueCount
+from marimo._plugins.ui._impl.tables.approximate import (
+    approximate_bin_values,
+    approximate_stats,
+    approximate_value_counts,
+    estimate_distinct,
+)
+
+
+def test_estimate_distinct() -> None:
+    # Exact when the sample is the whole table
+    assert estimate_distinct(7, 3, 100, 100) == 7
+    # Values seen more than once are counted once
+    assert estimate_distinct(10, 0, 100, 10_000) == 10
+    # Each singleton stands for sqrt(10_000 / 100) = 10 values
+    assert estimate_distinct(10, 5, 100, 10_000) == 55
+    # No repeats: the column looks unique
+    assert estimate_distinct(100, 100, 100, 10_000) == 10_000
+
+
+def test_approximate_stats() -> None:
+    stats = ColumnStats(
+        total=100, nulls=10, unique=20, min=1, max=9, true=30, p25=3
+    )
+    assert approximate_stats(stats, 0, 100, 1_000) == ColumnStats(
+        total=1_000, nulls=100, unique=20, min=1, max=9, true=300, p25=3
+    )
+    # Without singleton counts, distinct counts are unknown
+    assert approximate_stats(stats, None, 100, 1_000).unique is None
+
+
+def test_approximate_counts() -> None:
+    assert approximate_bin_values(
+        [BinValue(bin_start=0, bin_end=1, count=3)], 10, 100
+    ) == [BinValue(bin_start=0, bin_end=1, count=30)]
+    assert approximate_value_counts(
+        [ValueCount(value="a", count=7)], 10, 100
+    ) == [ValueCount(value="a", count=70)]
@@ -611,7 +611,9 @@ class TestHostGuards:
         ) -> tuple[str, Literal["csv"]]:
             return ",".join(manager.get_column_names()), "csv"
 
-        monkeypatch.setattr(table._manager, "get_bin_values", fail_bin_values)
+        monkeypatch.setattr(
+            table._manager, "get_bin_values_batch", fail_bin_values
+        )
         monkeypatch.setattr(
             type(table),
             "_to_chart_data_url",
@@ -425,6 +425,88 @@ class TestNarwhalsTableManagerFactory(unittest.TestCase):
         for column in complex_data.get_column_names():
             assert complex_data.get_stats(column) is not None
 
+    def test_get_stats_batch_matches_get_stats(self) -> None:
+        complex_data = self.get_complex_data()
+        columns = complex_data.get_column_names()
+        stats = complex_data.get_stats_batch([*columns, "missing"])
+        for column in columns:
+            assert stats[column] == complex_data.get_stats(column)
+        assert stats["missing"] == ColumnStats()
+
+    def test_get_bin_values_batch_matches_get_bin_values(self) -> None:
+        complex_data = self.get_complex_data()
+        columns = complex_data.get_column_names()
+        bin_values = complex_data.get_bin_values_batch(columns, 4)
+        # Durations can't be binned, so they're left out
+        assert "duration" not in bin_values
+        for column in columns:
+            if column != "duration":
+                assert bin_values[column] == complex_data.get_bin_values(
+                    column, 4
+                )
+
+    def test_calculate_top_k_rows_batch_matches_calculate_top_k_rows(
+        self,
+    ) -> None:
+        import polars as pl
+
+        manager = NarwhalsTableManager.from_dataframe(
+            pl.DataFrame(
+                {
+                    "strings": ["a", "b", "b", None, None, None],
+                    "category": pl.Series(
+                        ["x", "y", "y", "y", "x", None], dtype=pl.Categorical
+                    ),
+                    "enum": pl.Series(
+                        ["y", "y", "x", "x", None, None],
+                        dtype=pl.Enum(["y", "x"]),
+                    ),
+                    "int": [1, 1, 2, 3, 3, 3],
+                }
+            )
+        )
+        columns = manager.get_column_names()
+        top_k_rows = manager.calculate_top_k_rows_batch(columns, 2)
+        assert list(top_k_rows) == columns
+        for column in columns:
+            assert top_k_rows[column] == manager.calculate_top_k_rows(
+                column, 2
+            )
+
+    def test_sample_rows(self) -> None:
+        import polars as pl
+
+        manager = NarwhalsTableManager.from_dataframe(
+            pl.DataFrame({"A": list(range(100))})
+        )
+        sample = manager.sample_rows(5)
+        assert sample.as_frame()["A"].to_list() == [0, 25, 50, 74, 99]
+        assert manager.sample_rows(200).get_num_rows() == 100
+
+    def test_sample_rows_lazy(self) -> None:
+        import polars as pl
+
+        manager = NarwhalsTableManager.from_dataframe(
+            pl.LazyFrame({"A": list(range(100))})
+        )
+        sample = manager.sample_rows(5)
+        assert sample is not None
+        assert sample.as_frame()["A"].to_list() == [0, 20, 40, 60, 80]
+        # Only the sample is collected
+        assert "_collected_frame" not in manager.__dict__
+        assert manager.sample_rows(200) is manager
+
+    def test_get_singleton_counts(self) -> None:
+        import polars as pl
+
+        manager = NarwhalsTableManager.from_dataframe(
+            pl.DataFrame({"A": [1, 1, 2, 3], "B": ["x", "y", "y", "y"]})
+        )
+        assert manager.get_singleton_counts(["A", "B", "missing"]) == {
+            "A": 2,
+            "B": 1,
+        }
+
     def test_get_stats_unwraps_scalars_properly(self) -> None:
         """Test that get_stats properly unwraps narwhals scalars to Python primitives.
 
@@ -1413,6 +1495,46 @@ def test_search_wide_dataframe(df: Any) -> None:
     assert result.get_num_rows() == 0
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {
+            "A": [2, 1, None, 2, 1, 2, None],
+            "B": ["x", "z", "y", None, "y", "x", "x"],
+            "C": [0, 1, 2, 3, 4, 5, 6],
+        },
+        exclude=NON_EAGER_LIBS,
+    ),
+)
+def test_sort_permutation_matches_sort_values(df: Any) -> None:
+    manager = NarwhalsTableManager.from_dataframe(df)
+    by = [
+        SortArgs(by="A", descending=True),
+        SortArgs(by="B", descending=False),
+    ]
+
+    def keys(m: Any) -> list[tuple[Any, ...]]:
+        frame = m.as_frame()
+        return [
+            tuple(
+                None if v is None or (isinstance(v, float) and isnan(v)) else v
+                for v in (row["A"], row["B"])
+            )
+            for row in frame.iter_rows(named=True)
+        ]
+
+    expected = keys(manager.sort_values(by))
+    positions = manager.sort_permutation(by)
+    assert keys(manager.gather_rows(positions)) == expected
+
+    # Extending a cached single-key permutation by a secondary key.
+    prefix = manager.sort_permutation(by[:1])
+    extended = manager.sort_permutation(by, prefix, 1)
+    assert keys(manager.gather_rows(extended)) == expected
+    assert extended.dtype == nw.UInt32
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 @pytest.mark.parametrize(
     "df",
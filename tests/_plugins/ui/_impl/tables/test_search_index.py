@@ -0,0 +1,91 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._plugins.ui._impl.tables import search_index
+from marimo._plugins.ui._impl.tables.search_index import TrigramSearchIndex
+from marimo._plugins.ui._impl.tables.utils import get_table_manager
+from tests._data.mocks import EAGER_LIBS, create_dataframes
+
+DATA = {
+    "name": ["Alpha", "beta", None, "GAMMA", "alphabet", "delta"],
+    "count": [1, 12, 123, 4, 5, 6],
+    "flag": [True, False, True, False, True, False],
+}
+DATA_DF = create_dataframes(DATA, include=["polars", "pandas"])[0]
+
+
+@pytest.fixture(autouse=True)
+def index_small_tables() -> Any:
+    with patch.object(search_index, "SEARCH_INDEX_MIN_ROWS", 0):
+        yield
+
+
+def _rows(manager: Any) -> list[Any]:
+    return manager.as_frame().rows()
+
+
+@pytest.mark.parametrize(
+    "df", create_dataframes(DATA, include=EAGER_LIBS, strict=False)
+)
+@pytest.mark.parametrize(
+    "query", ["alp", "ALPHAB", "ta", "12", "true", "zzz", "a"]
+)
+def test_search_matches_scan(df: Any, query: str) -> None:
+    manager = get_table_manager(df)
+    index = TrigramSearchIndex.create(manager)
+    assert index is not None
+    result = index.search(manager, query)
+    assert result is not None
+    assert _rows(result) == _rows(manager.search(query))
+
+
+def test_narrows_cached_prefix() -> None:
+    manager = get_table_manager(DATA_DF)
+    index = TrigramSearchIndex.create(manager)
+    assert index is not None
+    assert index.search(manager, "al") is not None
+    with patch.object(
+        search_index._ColumnIndex, "candidates", side_effect=AssertionError
+    ):
+        result = index.search(manager, "alph")
+    assert result is not None
+    assert _rows(result) == _rows(manager.search("alph"))
+
+
+def test_scans_columns_over_budget() -> None:
+    manager = get_table_manager(DATA_DF)
+    with patch.object(search_index, "MAX_INDEXED_VALUES", 7):
+        index = TrigramSearchIndex.create(manager)
+    assert index is not None
+    assert index._scanned == ["count"]
+    result = index.search(manager, "12")
+    assert result is not None
+    assert _rows(result) == _rows(manager.search("12"))
+
+
+def test_unsupported() -> None:
+    manager = get_table_manager(DATA_DF)
+    index = TrigramSearchIndex.create(manager)
+    assert index is not None
+    # Regex queries are left to the backend
+    assert index.search(manager, "a.p") is None
+
+    with patch.object(search_index, "SEARCH_INDEX_MIN_ROWS", 100):
+        assert TrigramSearchIndex.create(manager) is None
+    assert TrigramSearchIndex.create(get_table_manager([1, 2, 3])) is None
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+def test_unsupported_pandas_index() -> None:
+    import pandas as pd
+
+    df = pd.DataFrame(DATA, index=["x", "y", "z", "u", "v", "w"])
+    assert TrigramSearchIndex.create(get_table_manager(df)) is None
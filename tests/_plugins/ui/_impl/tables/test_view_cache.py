@@ -0,0 +1,72 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from collections import UserList
+
+from marimo._plugins.ui._impl.table import SortArgs
+from marimo._plugins.ui._impl.tables.default_table import DefaultTableManager
+from marimo._plugins.ui._impl.tables.view_cache import TableViewCache
+
+A = SortArgs(by="a", descending=False)
+B = SortArgs(by="b", descending=True)
+
+
+class _Positions(UserList[int]):
+    dtype = "UInt32"
+
+
+def test_hits_and_misses() -> None:
+    cache = TableViewCache()
+    assert cache.get_permutation(None, "q", [A]) is None
+    cache.put_permutation(None, "q", [A], _Positions([1, 0]))
+    assert cache.get_permutation(None, "q", [A]) == [1, 0]
+    assert cache.get_permutation(None, None, [A]) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.nbytes == 8
+
+
+def test_evicts_least_recently_used_over_budget() -> None:
+    cache = TableViewCache(max_bytes=16)
+    cache.put_permutation(None, None, [A], _Positions([0, 1]))
+    cache.put_permutation(None, None, [B], _Positions([1, 0]))
+    # Touch [A] so [B] is the least recently used.
+    assert cache.get_permutation(None, None, [A]) is not None
+    cache.put_permutation(None, None, [A, B], _Positions([0, 1]))
+    assert cache.get_permutation(None, None, [B]) is None
+    assert cache.get_permutation(None, None, [A]) is not None
+    assert cache.nbytes == 16
+
+    # Entries larger than the whole budget aren't cached at all.
+    cache.put_permutation(None, "big", [A], _Positions(range(10)))
+    assert cache.get_permutation(None, "big", [A]) is None
+    assert len(cache) == 2
+
+
+def test_longest_prefix() -> None:
+    cache = TableViewCache()
+    C = SortArgs(by="c", descending=False)
+    assert cache.longest_prefix(None, None, [A, B, C]) == (None, 0)
+    cache.put_permutation(None, None, [A], _Positions([0]))
+    cache.put_permutation(None, None, [A, B], _Positions([1]))
+    assert cache.longest_prefix(None, None, [A, B, C]) == ([1], 2)
+    assert cache.longest_prefix(None, None, [A, C]) == ([0], 1)
+    # The full key is not its own prefix, and filters must match.
+    assert cache.longest_prefix(None, None, [A]) == (None, 0)
+    assert cache.longest_prefix(None, "q", [A, B]) == (None, 0)
+
+
+def test_views_and_current() -> None:
+    cache = TableViewCache()
+    view = DefaultTableManager({"a": [1, 2]})
+    cache.put_view(None, "q", view)
+    assert cache.get_view(None, "q") is view
+    assert cache.nbytes > 0
+
+    cache.set_current((None, "q", None), view)
+    assert cache.get_current((None, "q", None)) is view
+    assert cache.get_current((None, "r", None)) is None
+
+    cache.clear()
+    assert cache.get_view(None, "q") is None
+    assert cache.get_current((None, "q", None)) is None
+    assert cache.nbytes == 0
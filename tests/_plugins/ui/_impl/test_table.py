@@ -32,7 +32,11 @@ from marimo._plugins.ui._impl.table import (
 )
 from marimo._plugins.ui._impl.tables.default_table import DefaultTableManager
 from marimo._plugins.ui._impl.tables.selection import INDEX_COLUMN_NAME
-from marimo._plugins.ui._impl.tables.table_manager import TableCell
+from marimo._plugins.ui._impl.tables.table_manager import (
+    TableCell,
+    TableManager,
+)
+from marimo._plugins.ui._impl.tables.utils import get_table_manager
 from marimo._plugins.ui._impl.utils.dataframe import TableData
 from marimo._runtime.functions import EmptyArgs
 from marimo._runtime.runtime import Kernel
@@ -43,6 +47,8 @@ from tests._data.mocks import NON_EAGER_LIBS, create_dataframes
 if TYPE_CHECKING:
     import pandas as pd
 
+    from tests.conftest import ExecReqProvider
+
 
 @pytest.fixture
 def dtm() -> DefaultTableManager:
@@ -616,6 +622,167 @@ def test_search_sort_nonexistent_columns() -> None:
     assert type(table.value) is type(data)
 
 
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="Polars not installed"
+)
+def test_search_reuses_cached_sort_permutations() -> None:
+    import polars as pl
+
+    from marimo._plugins.ui._impl.tables.narwhals_table import (
+        NarwhalsTableManager,
+    )
+
+    df = pl.DataFrame({"a": [3, 1, 2, 1, 3], "b": ["x", "y", "z", "w", "v"]})
+    table = ui.table(df)
+
+    def search(*sort: SortArgs, page_number: int = 0) -> list[str]:
+        response = table._search(
+            SearchTableArgs(
+                sort=list(sort), page_size=2, page_number=page_number
+            )
+        )
+        return [row["b"] for row in json.loads(response.data)]
+
+    by_a = SortArgs(by="a", descending=False)
+    by_b = SortArgs(by="b", descending=True)
+    with patch.object(
+        NarwhalsTableManager,
+        "sort_permutation",
+        autospec=True,
+        side_effect=NarwhalsTableManager.sort_permutation,
+    ) as sort_permutation:
+        assert search(by_a) == ["y", "w"]
+        assert search(by_a, page_number=1) == ["z", "x"]
+        assert search(by_b) == ["z", "y"]
+        # Flipping back reuses the cached permutation.
+        assert search(by_a, page_number=2) == ["v"]
+        assert sort_permutation.call_count == 2
+
+        # Adding a secondary key starts from the cached prefix.
+        assert search(by_a, by_b) == ["y", "w"]
+        assert sort_permutation.call_count == 3
+        _, by, presorted, prefix = sort_permutation.call_args.args
+        assert by == [by_a, by_b]
+        assert presorted is not None
+        assert prefix == 1
+
+    cache = table._view_cache
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has() or not DependencyManager.pyarrow.has(),
+    reason="Polars or pyarrow not installed",
+)
+def test_search_arrow_page() -> None:
+    import polars as pl
+    import pyarrow as pa
+
+    df = pl.DataFrame({"a": [1.5, 2.5, None], "b": [True, False, True]})
+    table = ui.table(df)
+
+    # JSON unless the client asks for Arrow
+    response = table._search(SearchTableArgs(page_size=2, page_number=0))
+    assert response.data_format == "json"
+
+    response = table._search(
+        SearchTableArgs(page_size=2, page_number=1, data_format="arrow")
+    )
+    assert response.data_format == "arrow"
+    mime_type, data = from_data_uri(response.data)
+    assert mime_type == "application/vnd.apache.arrow.file"
+    page = pa.ipc.open_file(pa.py_buffer(data)).read_all()
+    assert page.to_pylist() == [{INDEX_COLUMN_NAME: 2, "a": None, "b": True}]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pyarrow.has(), reason="pyarrow not installed"
+)
+def test_search_arrow_page_pyarrow() -> None:
+    import pyarrow as pa
+
+    table = ui.table(pa.table({"a": [1.5, 2.5, 3.5]}))
+    response = table._search(
+        SearchTableArgs(page_size=2, page_number=0, data_format="arrow")
+    )
+    assert response.data_format == "arrow"
+    _, data = from_data_uri(response.data)
+    page = pa.ipc.open_file(pa.py_buffer(data)).read_all()
+    assert page.column("a").to_pylist() == [1.5, 2.5]
+
+    # Only pages are encoded as Arrow; charts of pyarrow tables stay CSV
+    with pytest.raises(NotImplementedError):
+        get_table_manager(pa.table({"a": [1.5]})).to_arrow_ipc()
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has() or not DependencyManager.pyarrow.has(),
+    reason="Polars or pyarrow not installed",
+)
+async def test_search_arrow_pages_stay_available(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    # Other viewers may still hold an earlier page's URL, so paging must
+    # not remove its file; the registry's quota releases it instead.
+    await k.run(
+        [
+            exec_req.get(
+                """
+                import marimo as mo
+                import polars as pl
+                from marimo._plugins.ui._impl.table import SearchTableArgs
+                from marimo._runtime.context import get_context
+
+                table = mo.ui.table(pl.DataFrame({"a": [0.5] * 10}))
+                urls = [
+                    table._search(
+                        SearchTableArgs(
+                            page_size=2,
+                            page_number=page_number,
+                            data_format="arrow",
+                        )
+                    ).data
+                    for page_number in range(3)
+                ]
+                registry = set(get_context().virtual_file_registry.registry)
+                """
+            ),
+        ]
+    )
+    assert not k.errors
+    registry = k.globals["registry"]
+    for url in k.globals["urls"]:
+        assert any(filename in url for filename in registry)
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has() or not DependencyManager.pyarrow.has(),
+    reason="Polars or pyarrow not installed",
+)
+@pytest.mark.parametrize(
+    ("data", "format_mapping"),
+    [
+        # Integers and strings need the JSON encoder's handling
+        ({"a": [1, 2]}, None),
+        ({"a": [1.5, 2.5], "b": ["x", "y"]}, None),
+        # Formatted pages are rendered server-side
+        ({"a": [1.5, 2.5]}, {"a": "{:.1f}"}),
+    ],
+)
+def test_search_arrow_page_falls_back_to_json(
+    data: dict[str, list[Any]], format_mapping: dict[str, Any] | None
+) -> None:
+    import polars as pl
+
+    table = ui.table(pl.DataFrame(data), format_mapping=format_mapping)
+    response = table._search(
+        SearchTableArgs(page_size=2, page_number=0, data_format="arrow")
+    )
+    assert response.data_format == "json"
+    assert len(json.loads(response.data)) == 2
+
+
 def test_invalid_index_in_initial_selection() -> None:
     """Test that invalid initial selection raises appropriate errors"""
     with pytest.raises(IndexError):
@@ -882,6 +1049,39 @@ def test_table_with_too_many_rows_column_summaries_disabled() -> None:
     assert summaries_enabled.is_disabled is False
 
 
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="polars not installed"
+)
+def test_table_with_too_many_rows_approximate_column_summaries() -> None:
+    import polars as pl
+
+    data = pl.DataFrame(
+        {
+            "a": list(range(200)),
+            "b": [i % 4 for i in range(200)],
+            "c": [i % 2 == 0 for i in range(200)],
+        }
+    )
+    table = ui.table(
+        data,
+        approximate_column_summaries=True,
+        _internal_summary_row_limit=100,
+    )
+    with patch.object(TableManager, "DEFAULT_SUMMARY_SAMPLE_SIZE", 20):
+        summaries = table._get_column_summaries(ColumnSummariesArgs())
+    assert summaries.is_disabled is False
+    assert summaries.is_approximate is True
+    assert summaries.stats["a"].total == 200
+    assert summaries.stats["a"].min == 0
+    assert summaries.stats["a"].max == 199
+    assert summaries.stats["c"].true == 100
+    # Bin counts are scaled up to the whole table
+    assert sum(b.count for b in summaries.bin_values["a"]) == 200
+
+    exact = ui.table(data)._get_column_summaries(ColumnSummariesArgs())
+    assert exact.is_approximate is False
+
+
 def test_with_too_many_rows_column_charts_disabled() -> None:
     data = {"a": list(range(20))}
     table = ui.table(data, _internal_column_charts_row_limit=10)
@@ -961,6 +1161,79 @@ def test_get_column_summaries_after_search_df(df: Any) -> None:
     assert summaries.stats["a"].nulls == 0
 
 
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="polars not installed"
+)
+def test_get_column_summaries_cached_per_query() -> None:
+    import polars as pl
+
+    table = ui.table(
+        pl.DataFrame({"a": list(range(20))}), show_column_summaries="stats"
+    )
+    manager_type = type(table._searched_manager)
+    with patch.object(
+        manager_type,
+        "get_stats_batch",
+        autospec=True,
+        side_effect=manager_type.get_stats_batch,
+    ) as mock_get_stats_batch:
+        first = table._get_column_summaries(ColumnSummariesArgs())
+        assert table._get_column_summaries(ColumnSummariesArgs()) is first
+        assert mock_get_stats_batch.call_count == 1
+
+        table._search(SearchTableArgs(query="2", page_size=10, page_number=0))
+        searched = table._get_column_summaries(ColumnSummariesArgs())
+        assert searched.stats["a"].max == 12
+        assert mock_get_stats_batch.call_count == 2
+
+        table._search(SearchTableArgs(page_size=10, page_number=0))
+        assert table._get_column_summaries(ColumnSummariesArgs()) is first
+        assert mock_get_stats_batch.call_count == 2
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="polars not installed"
+)
+def test_get_column_summaries_batches_charts() -> None:
+    import polars as pl
+
+    table = ui.table(
+        pl.DataFrame(
+            {
+                "a": [1, 2, 3, 4],
+                "b": [0.5, 1.5, 2.5, 3.5],
+                "c": pl.Series(["x", "y", "y", "z"], dtype=pl.Categorical),
+                "d": pl.Series(["u", "u", "v", "v"], dtype=pl.Categorical),
+            }
+        ),
+        show_column_summaries=True,
+    )
+    manager_type = type(table._searched_manager)
+    with (
+        patch.object(
+            manager_type, "get_bin_values", side_effect=AssertionError
+        ),
+        patch.object(
+            manager_type, "calculate_top_k_rows", side_effect=AssertionError
+        ),
+        patch.object(
+            manager_type,
+            "_collect_stats",
+            autospec=True,
+            side_effect=manager_type._collect_stats,
+        ) as mock_collect_stats,
+    ):
+        summaries = table._get_column_summaries(ColumnSummariesArgs())
+
+    assert set(summaries.bin_values) == {"a", "b"}
+    assert sum(bv.count for bv in summaries.bin_values["a"]) == 4
+    assert sum(bv.count for bv in summaries.bin_values["b"]) == 4
+    assert summaries.value_counts["c"][0] == ValueCount(value="y", count=2)
+    assert set(summaries.value_counts) == {"c", "d"}
+    # One select for the stats, and two for the bins of both columns
+    assert mock_collect_stats.call_count == 3
+
+
 def test_show_column_summaries_modes():
     data = {"a": list(range(20))}
 
@@ -1330,6 +1603,71 @@ def test_table_with_filtered_columns(df: Any) -> None:
     assert result.total_rows == 1
 
 
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="polars not installed"
+)
+def test_table_search_with_search_index() -> None:
+    import polars as pl
+
+    from marimo._plugins.ui._impl.tables import search_index
+
+    table = ui.table(
+        pl.DataFrame({"a": [1, 2, 3, 12], "b": ["abc", "def", None, "fab"]}),
+        selection=None,
+        search_index=True,
+    )
+    with patch.object(search_index, "SEARCH_INDEX_MIN_ROWS", 0):
+        result = table._search(
+            SearchTableArgs(
+                query="ab",
+                filters=FilterGroup(
+                    type="group",
+                    operator="and",
+                    children=[
+                        FilterCondition(
+                            type="condition",
+                            column_id="a",
+                            operator=">",
+                            value=1,
+                        )
+                    ],
+                ),
+                page_size=10,
+                page_number=0,
+            )
+        )
+    assert table._search_index is not None
+    assert result.total_rows == 1
+    assert json.loads(result.data) == [{"a": 12, "b": "fab"}]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="polars not installed"
+)
+def test_table_search_index_is_opt_in() -> None:
+    import polars as pl
+
+    from marimo._plugins.ui._impl.tables import search_index
+
+    table = ui.table(
+        pl.DataFrame({"a": [1, 2, 3, 12], "b": ["abc", "def", None, "fab"]}),
+        selection=None,
+    )
+    with (
+        patch.object(search_index, "SEARCH_INDEX_MIN_ROWS", 0),
+        patch.object(
+            search_index.TrigramSearchIndex,
+            "create",
+            side_effect=AssertionError,
+        ),
+    ):
+        result = table._search(
+            SearchTableArgs(query="ab", page_size=10, page_number=0)
+        )
+    assert table._search_index is None
+    assert result.total_rows == 2
+
+
 def test_show_column_summaries_default():
     # Test default behavior (True for < 40 columns, False otherwise)
     small_data = {"col" + str(i): range(5) for i in range(39)}
@@ -1421,7 +1759,7 @@ def test_column_summaries_fallback(monkeypatch):
         raise RuntimeError("Intentional bin failure")
 
     monkeypatch.setattr(
-        table._manager, "get_bin_values", always_fail_get_bin_values
+        table._manager, "get_bin_values_batch", always_fail_get_bin_values
     )
 
     summaries = table._get_column_summaries(ColumnSummariesArgs())
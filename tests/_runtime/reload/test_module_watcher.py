@@ -16,6 +16,8 @@ from marimo._dependencies.dependencies import DependencyManager
 from marimo._runtime.commands import UpdateUserConfigCommand
 from marimo._runtime.reload.autoreload import ModuleReloader
 from marimo._runtime.reload.module_watcher import (
+    ModuleIndex,
+    PollingModuleFileWatcher,
     _check_modules,
     _depends_on,
     _get_excluded_modules,
@@ -969,6 +971,61 @@ class TestCheckModules:
         stale = _check_modules(modules, reloader, sys.modules)
         assert len(stale) == 0
 
+    def test_check_modules_only_checks_changed(self, tmp_path: pathlib.Path):
+        import importlib
+
+        sys.path.append(str(tmp_path))
+        py_file = tmp_path / "test_check_changed_mod.py"
+        py_file.write_text("x = 1")
+
+        mod = importlib.import_module("test_check_changed_mod")
+        reloader = ModuleReloader()
+        update_file(py_file, "x = 2")
+
+        modules = {"test_check_changed_mod": mod}
+        assert not _check_modules(modules, reloader, sys.modules, changed={})
+        assert "test_check_changed_mod" in _check_modules(
+            modules, reloader, sys.modules, changed=modules
+        )
+
+
+class TestModuleIndex:
+    def test_add_and_remove(self, exec_req: ExecReqProvider):
+        from marimo._ast.compiler import compile_cell
+
+        index = ModuleIndex()
+        er = exec_req.get("import os; from a.b import c")
+        index.add(er.cell_id, compile_cell(er.code, cell_id=er.cell_id))
+        assert set(index.modules()) == {"os", "a.b", "a.b.c"}
+        assert index.cells_importing("a.b.c") == {er.cell_id}
+
+        # Re-registering a cell replaces its imports
+        index.add(er.cell_id, compile_cell("import os", cell_id=er.cell_id))
+        assert index.modules() == ["os"]
+
+        index.remove(er.cell_id)
+        assert index.modules() == []
+        assert index.cells_importing("os") == set()
+
+
+class TestPollingModuleFileWatcher:
+    def test_reports_changed_files(self, tmp_path: pathlib.Path):
+        changed: list[str] = []
+        watcher = PollingModuleFileWatcher(changed.append)
+        watched = tmp_path / "watched.py"
+        watched.write_text("x = 1")
+        (unwatched := tmp_path / "unwatched.py").write_text("x = 1")
+        watcher.watch(str(watched))
+
+        watcher.poll()
+        assert changed == []
+
+        update_file(watched, "x = 2")
+        update_file(unwatched, "x = 2")
+        watcher.poll()
+        watcher.poll()
+        assert changed == [str(watched)]
+
 
 class TestModuleWatcherStop:
     """Tests for ModuleWatcher.stop method"""
@@ -996,6 +1053,34 @@ class TestModuleWatcherStop:
         # should_exit should be set
         assert watcher.should_exit.is_set()
 
+    async def test_module_watcher_watches_user_modules(
+        self,
+        tmp_path: pathlib.Path,
+        py_modname: str,
+        execution_kernel: Kernel,
+        exec_req: ExecReqProvider,
+    ):
+        k = execution_kernel
+        sys.path.append(str(tmp_path))
+        (tmp_path / f"{py_modname}.py").write_text("x = 1")
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config["runtime"]["auto_reload"] = "lazy"
+        k.set_user_config(UpdateUserConfigCommand(config=config))
+        watcher = k.autoreload_manager.watcher
+        assert watcher is not None
+
+        await k.run([exec_req.get(f"import {py_modname}; import json")])
+        watched = {
+            modname
+            for modnames in watcher._modules_by_file.values()
+            for modname in modnames
+        }
+        # Imported by the cell
+        assert py_modname in watched
+        # Not user modules
+        assert "json" not in watched
+        assert "os" not in watched
+
     async def test_module_watcher_processes_flag(
         self, execution_kernel: Kernel, exec_req: ExecReqProvider
     ):
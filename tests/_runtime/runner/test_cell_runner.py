@@ -538,3 +538,62 @@ async def test_run_all_swallows_sigint_raise_and_fires_on_finish(
         "on_finish_hooks must see the cells that were still queued "
         "when SIGINT fired"
     )
+
+
+async def test_concurrent_async_cells_overlap(
+    mocked_kernel: Any, exec_req: ExecReqProvider
+) -> None:
+    import time
+
+    k = mocked_kernel.k
+    experimental = {**k.user_config.get("experimental", {})}
+    experimental["concurrent_async_cells"] = True
+    k.user_config = {**k.user_config, "experimental": experimental}
+
+    await k.run(
+        [exec_req.get_with_id("setup", "import asyncio; import marimo as mo")]
+    )
+    start = time.monotonic()
+    await k.run(
+        [
+            exec_req.get_with_id(
+                "a",
+                """
+                await asyncio.sleep(0.3)
+                mo.output.replace("from a")
+                print("printed by a")
+                a = 1
+                """,
+            ),
+            exec_req.get_with_id(
+                "b",
+                """
+                await asyncio.sleep(0.3)
+                mo.output.replace("from b")
+                print("printed by b")
+                b = 2
+                """,
+            ),
+            exec_req.get_with_id("c", "c = a + b"),
+        ]
+    )
+    elapsed = time.monotonic() - start
+
+    assert not k.errors
+    assert k.globals["c"] == 3
+    # a and b sleep concurrently.
+    assert elapsed < 0.55
+
+    # Outputs written mid-run are attributed to the cell that wrote them.
+    outputs = [
+        (op.cell_id, op.output.data)
+        for op in mocked_kernel.stream.cell_notifications
+        if op.output is not None and op.cell_id in ("a", "b")
+    ]
+    assert any(cid == "a" and "from a" in str(data) for cid, data in outputs)
+    assert any(cid == "b" and "from b" in str(data) for cid, data in outputs)
+    assert not any(
+        cid == "a" and "from b" in str(data) for cid, data in outputs
+    )
+    assert "printed by a" in repr(mocked_kernel.stdout)
+    assert "printed by b" in repr(mocked_kernel.stdout)
@@ -1712,3 +1712,81 @@ def test_is_any_ancestor_errored_marimo_error() -> None:
     # Fix cell 0
     graph.cells["0"].set_run_result_status("success")
     assert not graph.is_any_ancestor_errored("1")
+
+
+def test_flagged_mask_matches_single_checks() -> None:
+    graph = dataflow.DirectedGraph()
+    # Diamond 0 -> {1, 2} -> 3, a cycle 4 <-> 5 and an isolated 6
+    for cid, code in enumerate(
+        ["x = 0", "y = x", "z = x", "w = y + z", "a = b", "b = a", "c = 0"]
+    ):
+        graph.register_cell(str(cid), parse_cell(code, cell_id=str(cid)))
+
+    graph.cells["1"].set_run_result_status("exception")
+    graph.cells["4"].set_run_result_status("marimo-error")
+    graph.cells["2"].config.disabled = True
+    graph.cells["5"].set_stale(stale=True, broadcast=False)
+
+    for flag, check in (
+        ("stale", graph.is_any_ancestor_stale),
+        ("disabled", graph.is_any_ancestor_disabled),
+        ("errored", graph.is_any_ancestor_errored),
+    ):
+        flagged = graph.flagged_mask(flag)
+        for cid in graph.cells:
+            assert check(cid, flagged) == check(cid), (flag, cid)
+
+    disabled = graph.flagged_mask("disabled")
+    assert [
+        cid for cid in graph.cells if graph.is_disabled(cid, disabled)
+    ] == [
+        "2",
+        "3",
+    ]
+    assert graph.is_any_ancestor_errored("3")
+    assert graph.is_any_ancestor_errored("5")
+    assert not graph.is_any_ancestor_errored("4")
+    assert graph.is_any_ancestor_stale("4")
+    assert not graph.is_any_ancestor_stale("5")
+
+
+def test_directed_graph_fork() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = 0"))
+    graph.register_cell("1", parse_cell("y = x", cell_id="1"))
+    graph.register_cell("2", parse_cell("x = 1", cell_id="2"))
+    graph.cells["0"].set_stale(True, broadcast=False)
+
+    forked = graph.fork()
+    assert forked.parents == graph.parents
+    assert forked.children == graph.children
+    assert forked.definitions == graph.definitions
+    for cid, cell in graph.cells.items():
+        # Compiled code is shared, runtime state is not.
+        assert forked.cells[cid] is not cell
+        assert forked.cells[cid].body is cell.body
+        assert forked.cells[cid].defs is cell.defs
+    assert not forked.cells["0"].stale
+
+    # The fork is independent of the original.
+    forked.delete_cell("2")
+    forked.register_cell("3", parse_cell("z = y", cell_id="3"))
+    assert graph.children["1"] == set()
+    assert forked.children["1"] == {"3"}
+    assert graph.definitions["x"] == {"0", "2"}
+    assert forked.definitions["x"] == {"0"}
+    assert forked.descendants("0") == {"1", "3"}
+    assert graph.descendants("0") == {"1"}
+
+
+def test_directed_graph_fork_into() -> None:
+    graph = dataflow.DirectedGraph()
+    graph.register_cell("0", parse_cell("x = 0"))
+    graph.register_cell("1", parse_cell("y = x", cell_id="1"))
+
+    target = dataflow.DirectedGraph()
+    assert graph.fork(into=target) is target
+    assert target.children == {"0": {"1"}, "1": set()}
+
+    with pytest.raises(AssertionError):
+        graph.fork(into=target)
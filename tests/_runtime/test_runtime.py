@@ -31,7 +31,10 @@ from marimo._messaging.notification import (
 )
 from marimo._messaging.serde import deserialize_kernel_message
 from marimo._plugins.ui._core.ids import IDProvider
-from marimo._plugins.ui._core.ui_element import UIElement
+from marimo._plugins.ui._core.ui_element import (
+    MarimoConvertValueException,
+    UIElement,
+)
 from marimo._runtime.commands import (
     CreateNotebookCommand,
     DeleteCellCommand,
@@ -40,6 +43,7 @@ from marimo._runtime.commands import (
     UpdateUIElementCommand,
 )
 from marimo._runtime.dataflow import EdgeWithVar
+from marimo._runtime.dataflow.templates import GRAPH_TEMPLATES
 from marimo._runtime.runtime import (
     Kernel,
     launch_kernel,
@@ -47,6 +51,7 @@ from marimo._runtime.runtime import (
     notebook_location,
 )
 from marimo._runtime.scratch import SCRATCH_CELL_ID
+from marimo._session.model import SessionMode
 from marimo._types.ids import CellId_t
 from marimo._utils.parse_dataclass import parse_raw
 from tests._messaging.mocks import MockStderr, MockStream
@@ -219,6 +224,112 @@ class TestExecution:
         assert k.globals["x"] == 6
         assert not k.graph.cells["2"].stale
 
+    async def test_set_ui_element_value_latest_value_wins(
+        self, k: Kernel
+    ) -> None:
+        await k.run(
+            [
+                ExecuteCellCommand(cell_id="0", code="import marimo as mo"),
+                ExecuteCellCommand(
+                    cell_id="1",
+                    code="s = mo.ui.slider(0, 10, value=1).latest_value_wins()",
+                ),
+                ExecuteCellCommand(cell_id="2", code="x = s.value + 1"),
+                ExecuteCellCommand(cell_id="3", code="y = x + 1"),
+            ]
+        )
+        assert k.globals["y"] == 3
+
+        # A newer value for the slider arrives while cell "2" runs
+        k.ui_request_manager = Mock()
+        k.ui_request_manager.superseded.return_value = True
+        element_id = k.globals["s"]._id
+        await k.set_ui_element_value(
+            UpdateUIElementCommand.from_ids_and_values([(element_id, 5)]),
+            notify_frontend=False,
+        )
+
+        k.ui_request_manager.superseded.assert_called_with(
+            frozenset([element_id])
+        )
+        assert k.preempted_runs == 1
+        assert k.globals["x"] == 6
+        # Left for the newer value's run
+        assert "y" not in k.globals
+        assert k.graph.cells["3"].stale
+        assert k.graph.cells["3"].runtime_state == "idle"
+
+        k.ui_request_manager.superseded.return_value = False
+        await k.set_ui_element_value(
+            UpdateUIElementCommand.from_ids_and_values([(element_id, 7)]),
+            notify_frontend=False,
+        )
+        assert k.preempted_runs == 1
+        assert k.globals["y"] == 9
+        assert not k.graph.get_stale()
+
+    async def test_preempted_cells_run_when_newer_value_fails(
+        self, k: Kernel
+    ) -> None:
+        await k.run(
+            [
+                ExecuteCellCommand(cell_id="0", code="import marimo as mo"),
+                ExecuteCellCommand(
+                    cell_id="1",
+                    code="s = mo.ui.slider(0, 10, value=1).latest_value_wins()",
+                ),
+                ExecuteCellCommand(cell_id="2", code="x = s.value + 1"),
+                ExecuteCellCommand(cell_id="3", code="y = x + 1"),
+            ]
+        )
+        k.ui_request_manager = Mock()
+        k.ui_request_manager.superseded.return_value = True
+        element = k.globals["s"]
+        await k.set_ui_element_value(
+            UpdateUIElementCommand.from_ids_and_values([(element._id, 5)]),
+            notify_frontend=False,
+        )
+        assert k.graph.cells["3"].stale
+
+        # The newer value doesn't convert, so its update is skipped
+        k.ui_request_manager.superseded.return_value = False
+        with patch.object(
+            element,
+            "_convert_value",
+            side_effect=MarimoConvertValueException,
+        ):
+            await k.set_ui_element_value(
+                UpdateUIElementCommand.from_ids_and_values([(element._id, 7)]),
+                notify_frontend=False,
+            )
+        assert k.globals["y"] == 7
+        assert not k.graph.get_stale()
+
+    async def test_set_ui_element_value_not_preempted_by_default(
+        self, k: Kernel
+    ) -> None:
+        await k.run(
+            [
+                ExecuteCellCommand(cell_id="0", code="import marimo as mo"),
+                ExecuteCellCommand(
+                    cell_id="1", code="s = mo.ui.slider(0, 10, value=1)"
+                ),
+                ExecuteCellCommand(cell_id="2", code="x = s.value + 1"),
+                ExecuteCellCommand(cell_id="3", code="y = x + 1"),
+            ]
+        )
+        k.ui_request_manager = Mock()
+        k.ui_request_manager.superseded.return_value = True
+        await k.set_ui_element_value(
+            UpdateUIElementCommand.from_ids_and_values(
+                [(k.globals["s"]._id, 5)]
+            ),
+            notify_frontend=False,
+        )
+        k.ui_request_manager.superseded.assert_not_called()
+        assert k.preempted_runs == 0
+        assert k.globals["y"] == 7
+
     async def test_set_ui_element_value_lensed(
         self, any_kernel: Kernel, exec_req: ExecReqProvider
     ) -> None:
@@ -4621,6 +4732,51 @@ def _filter_to_error_ops(
     ]
 
 
+class TestGraphTemplates:
+    async def test_run_mode_kernels_fork_shared_graph(
+        self, tmp_path: pathlib.Path, exec_req: ExecReqProvider
+    ) -> None:
+        GRAPH_TEMPLATES.clear()
+        codes = ["x = 1", "y = x + 1", "z = y * 2"]
+        notebook = tmp_path / "nb.py"
+        notebook.write_text(
+            "import marimo\napp = marimo.App()\n\n"
+            + "".join(f"@app.cell\ndef _():\n    {c}\n\n" for c in codes),
+            encoding="utf-8",
+        )
+        requests = [exec_req.get(c) for c in codes]
+        graphs = []
+        for _ in range(2):
+            with mocked_kernel_session(
+                mode=SessionMode.RUN,
+                app_metadata=default_app_metadata(filename=str(notebook)),
+            ) as tk:
+                await tk.kernel.run(requests)
+                assert tk.kernel.globals["z"] == 4
+                assert not tk.kernel.errors
+                graphs.append(tk.kernel.graph)
+        assert (GRAPH_TEMPLATES.hits, GRAPH_TEMPLATES.misses) == (1, 1)
+
+        first, second = graphs
+        assert first.children == second.children
+        for cid, cell in first.cells.items():
+            assert second.cells[cid] is not cell
+            assert second.cells[cid].body is cell.body
+        GRAPH_TEMPLATES.clear()
+
+    async def test_edit_mode_does_not_use_templates(
+        self, tmp_path: pathlib.Path, exec_req: ExecReqProvider
+    ) -> None:
+        GRAPH_TEMPLATES.clear()
+        notebook = tmp_path / "nb.py"
+        notebook.write_text("", encoding="utf-8")
+        with mocked_kernel_session(
+            app_metadata=default_app_metadata(filename=str(notebook))
+        ) as tk:
+            await tk.kernel.run([exec_req.get("x = 1")])
+        assert (GRAPH_TEMPLATES.hits, GRAPH_TEMPLATES.misses) == (0, 0)
+
+
 class TestLaunchKernelEventLoop:
     """Event-loop policy / factory selection in launch_kernel.
 
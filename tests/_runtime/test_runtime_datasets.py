@@ -6,6 +6,8 @@ import pytest
 
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.notification import (
+    CellNotification,
+    DatasetsNotification,
     DataSourceConnectionsNotification,
     SQLDatabaseMetadata,
     SQLMetadata,
@@ -744,3 +746,34 @@ class TestSQLValidate:
             validate_result=None,
             error="Engine is required for validating catalog",
         )
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+async def test_datasets_broadcast_after_cell_is_idle(
+    mocked_kernel: MockedKernel,
+) -> None:
+    k = mocked_kernel.k
+    stream = mocked_kernel.stream
+
+    await k.run(
+        [
+            ExecuteCellCommand(
+                cell_id=CellId_t("0"),
+                code="import pandas as pd\ndf = pd.DataFrame({'a': [1, 2]})",
+            )
+        ]
+    )
+    assert k.datasets_callbacks.broadcaster.flush(timeout=10)
+
+    ops = stream.operations
+    datasets = [op for op in ops if isinstance(op, DatasetsNotification)]
+    assert [t.variable_name for t in datasets[0].tables] == ["df"]
+    # Profiled off the run: the cell went idle first.
+    idle = next(
+        i
+        for i, op in enumerate(ops)
+        if isinstance(op, CellNotification) and op.status == "idle"
+    )
+    assert ops.index(datasets[0]) > idle
@@ -1,12 +1,15 @@
 # Copyright 2026 Marimo. All rights reserved.
-"""Queue + cancellation invariants for SequentialScheduler."""
+"""Queue + cancellation invariants for Sequential/AsyncWaveScheduler."""
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
-from marimo._runtime.runner.scheduler import SequentialScheduler
+from marimo._runtime.runner.scheduler import (
+    AsyncWaveScheduler,
+    SequentialScheduler,
+)
 from marimo._types.ids import CellId_t
 
 if TYPE_CHECKING:
@@ -154,3 +157,65 @@ def test_batch_respects_interrupt() -> None:
     # Generator stops once interrupted is set.
     remaining = list(iterator)
     assert remaining == []
+
+
+def _chain_graph(parents: dict[str, set[str]]) -> MagicMock:
+    """A graph whose `ancestors` follows the given parent mapping."""
+    g = MagicMock()
+    g.cells = {}
+
+    def ancestors(cid: CellId_t) -> set[CellId_t]:
+        seen: set[CellId_t] = set()
+        stack = list(parents.get(cid, set()))
+        while stack:
+            p = CellId_t(stack.pop())
+            if p not in seen:
+                seen.add(p)
+                stack.extend(parents.get(p, set()))
+        return seen
+
+    g.ancestors = ancestors
+    return g
+
+
+def test_async_wave_batch_yields_waves() -> None:
+    # a -> c, b -> c, c -> d; e independent
+    g = _chain_graph({"c": {"a", "b"}, "d": {"c"}})
+    sched = AsyncWaveScheduler([], graph=g)
+    cells = [CellId_t(c) for c in ("a", "b", "e", "c", "d")]
+    batches = [list(b) for b in sched.batch(cells)]
+    assert batches == [["a", "b", "e"], ["c"], ["d"]]
+
+
+def test_async_wave_batch_blocks_on_unqueued_intermediate() -> None:
+    # a -> b -> c, with b not queued: c still waits for a.
+    g = _chain_graph({"b": {"a"}, "c": {"b"}})
+    sched = AsyncWaveScheduler([], graph=g)
+    batches = [list(b) for b in sched.batch([CellId_t("a"), CellId_t("c")])]
+    assert batches == [["a"], ["c"]]
+
+
+def test_async_wave_batch_picks_up_requeued_cells(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    g = _chain_graph({"b": {"a"}})
+    monkeypatch.setattr(
+        "marimo._runtime.dataflow.topological_sort",
+        lambda graph, cells: sorted(cells),  # noqa: ARG005
+    )
+    sched = AsyncWaveScheduler([], graph=g)
+    iterator = sched.batch([CellId_t("a"), CellId_t("b")])
+    assert list(next(iterator)) == ["a"]
+    # A lifecycle asks for `a` to run again before `b`.
+    sched.requeue_for_rerun({CellId_t("a")})
+    assert [list(b) for b in iterator] == [["a"], ["b"]]
+
+
+def test_async_wave_batch_respects_interrupt() -> None:
+    sched = AsyncWaveScheduler([], graph=_chain_graph({"b": {"a"}}))
+    iterator = sched.batch([CellId_t("a"), CellId_t("b")])
+    assert list(next(iterator)) == ["a"]
+    sched.interrupted = True
+    assert list(iterator) == []
+    # The unrun cell stays queued so on-finish hooks can report it.
+    assert list(sched.cells_to_run) == ["b"]
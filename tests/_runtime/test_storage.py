@@ -1,14 +1,29 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
+from marimo._runtime.virtual_file import storage as storage_module
 from marimo._runtime.virtual_file.storage import (
     InMemoryStorage,
     SharedMemoryStorage,
     VirtualFileStorageManager,
+    _spill_path,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def _reused_buffer_chunks(*chunks: bytes) -> Iterator[bytearray]:
+    """Yields each chunk from the same, reused, buffer."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer[:] = chunk
+        yield buffer
+
 
 class TestInMemoryStorageReadChunked:
     def test_read_chunked_basic(self) -> None:
@@ -101,6 +116,25 @@ class TestInMemoryStorage:
         storage.store("test_key", b"hello")
         assert storage.has("test_key")
 
+    def test_store_buffers_and_producers(self) -> None:
+        storage = InMemoryStorage()
+        mutable = bytearray(b"hello")
+        assert storage.store("buffer", mutable) == 5
+        mutable[:] = b"HELLO"
+        assert storage.read("buffer", 5) == b"hello"
+
+        assert storage.store("view", memoryview(b"hello world")[6:]) == 5
+        assert storage.read("view", 5) == b"world"
+
+        chunks = _reused_buffer_chunks(b"ab", b"cd")
+        assert storage.store("stream", chunks) == 4
+        assert storage.read("stream", 4) == b"abcd"
+
+    def test_store_empty_is_skipped(self) -> None:
+        storage = InMemoryStorage()
+        assert storage.store("empty", iter([])) == 0
+        assert not storage.has("empty")
+
     def test_shutdown_clears_storage(self) -> None:
         storage = InMemoryStorage()
         storage.store("key1", b"data1")
@@ -301,6 +335,99 @@ class TestSharedMemoryStorage:
         finally:
             storage.shutdown()
 
+    def test_store_buffers_and_producers(self) -> None:
+        storage = SharedMemoryStorage()
+        try:
+            assert storage.store("marimo_buf_1", bytearray(b"hello")) == 5
+            assert storage.read("marimo_buf_1", 5) == b"hello"
+
+            view = memoryview(b"hello world")[6:]
+            assert storage.store("marimo_buf_2", view) == 5
+            assert storage.read("marimo_buf_2", 5) == b"world"
+
+            chunks = _reused_buffer_chunks(b"ab", b"", b"cd")
+            assert storage.store("marimo_buf_3", chunks) == 4
+            assert storage.read("marimo_buf_3", 4) == b"abcd"
+
+            assert storage.store("marimo_buf_4", iter([])) == 0
+            assert not storage.has("marimo_buf_4")
+        finally:
+            storage.shutdown()
+
+    def test_store_rejects_non_buffer_chunks(self) -> None:
+        storage = SharedMemoryStorage()
+        with pytest.raises(TypeError, match="Expected a bytes-like object"):
+            storage.store("marimo_buf_bad", ["text"])  # type: ignore[list-item]
+        assert not storage.has("marimo_buf_bad")
+
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_large_contents_spill_to_file(
+        self, streamed: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(storage_module, "SPILL_THRESHOLD", 8)
+        key = f"marimo_spill_{int(streamed)}"
+        data = bytes(range(100))
+        storage = SharedMemoryStorage()
+        try:
+            contents = (
+                _reused_buffer_chunks(data[:5], data[5:50], data[50:])
+                if streamed
+                else data
+            )
+            assert storage.store(key, contents) == len(data)
+            assert storage.has(key)
+            path = _spill_path(key)
+            assert path is not None
+            assert path.read_bytes() == data
+
+            # Readable by name, like shared memory
+            reader = SharedMemoryStorage()
+            assert reader.read(key, len(data)) == data
+            chunks = list(
+                reader.read_chunked(key, 40, chunk_size=16, start=50)
+            )
+            assert b"".join(chunks) == data[50:90]
+            assert [len(chunk) for chunk in chunks] == [16, 16, 8]
+
+            storage.remove(key)
+            assert not path.exists()
+            with pytest.raises(KeyError):
+                reader.read(key, len(data))
+        finally:
+            storage.shutdown()
+
+    def test_small_streams_stay_in_shared_memory(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(storage_module, "SPILL_THRESHOLD", 8)
+        storage = SharedMemoryStorage()
+        try:
+            storage.store("marimo_nospill", iter([b"abc", b"def"]))
+            path = _spill_path("marimo_nospill")
+            assert path is not None
+            assert not path.exists()
+            assert storage.read("marimo_nospill", 6) == b"abcdef"
+        finally:
+            storage.shutdown()
+
+    def test_shutdown_removes_spilled_files(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(storage_module, "SPILL_THRESHOLD", 8)
+        storage = SharedMemoryStorage()
+        storage.store("marimo_spill_shutdown", b"x" * 100)
+        path = _spill_path("marimo_spill_shutdown")
+        assert path is not None
+        assert path.exists()
+        storage.shutdown()
+        assert not path.exists()
+
+    def test_spill_path_rejects_unsafe_keys(self) -> None:
+        assert _spill_path("../escape") is None
+        assert _spill_path(".hidden") is None
+        assert _spill_path("a/b") is None
+        assert _spill_path("123-abc.png") is not None
+
 
 class TestVirtualFileStorageManager:
     def test_singleton(self) -> None:
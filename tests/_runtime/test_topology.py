@@ -460,3 +460,71 @@ class TestMutableGraphTopology:
         graph.remove_node("cell_3")
         assert graph.descendants("cell_1") == {"cell_2"}
         assert "cell_3" not in graph.cells
+
+    def test_closure_index_tracks_edge_and_node_removal(self) -> None:
+        """The reachability index stays correct across removals."""
+        graph = MutableGraphTopology()
+        for i in range(1, 5):
+            graph.add_node(f"cell_{i}", parse_cell(f"x{i} = {i}"))
+        graph.add_edge("cell_1", "cell_2")
+        graph.add_edge("cell_2", "cell_3")
+        graph.add_edge("cell_3", "cell_4")
+        assert graph.descendants("cell_1") == {"cell_2", "cell_3", "cell_4"}
+
+        graph.remove_edge("cell_2", "cell_3")
+        assert graph.descendants("cell_1") == {"cell_2"}
+        assert graph.ancestors("cell_4") == {"cell_3"}
+
+        graph.remove_node("cell_3")
+        graph.add_node("cell_5", parse_cell("x5 = 5"))
+        graph.add_edge("cell_2", "cell_5")
+        assert graph.descendants("cell_1") == {"cell_2", "cell_5"}
+        assert graph.ancestors("cell_4") == set()
+
+    def test_closure_excludes_roots_on_cycles(self) -> None:
+        """A cell on a cycle is not its own ancestor, as in a traversal."""
+        graph = MutableGraphTopology()
+        for i in range(1, 4):
+            graph.add_node(f"cell_{i}", parse_cell(f"x{i} = {i}"))
+        graph.add_edge("cell_1", "cell_2")
+        graph.add_edge("cell_2", "cell_1")
+        graph.add_edge("cell_2", "cell_3")
+
+        assert graph.ancestors("cell_1") == {"cell_2"}
+        assert graph.descendants("cell_1") == {"cell_2", "cell_3"}
+        assert graph.closure({"cell_1"}, children=True, inclusive=True) == {
+            "cell_1",
+            "cell_2",
+            "cell_3",
+        }
+        assert graph.is_reachable("cell_3", ["cell_1"], children=False)
+        assert not graph.is_reachable("cell_1", ["cell_1"], children=False)
+
+    def test_closure_matches_traversal_on_random_graphs(self) -> None:
+        """The index agrees with a BFS over random edit sequences."""
+        import random
+
+        from marimo._runtime.dataflow import transitive_closure
+
+        def bfs(graph: MutableGraphTopology, cid: str) -> set[str]:
+            return transitive_closure(
+                graph,
+                {cid},
+                inclusive=False,
+                # A no-op predicate forces the traversal path.
+                predicate=lambda _: True,
+            )
+
+        rng = random.Random(0)
+        graph = MutableGraphTopology()
+        ids = [f"cell_{i}" for i in range(12)]
+        for cid in ids:
+            graph.add_node(cid, parse_cell("x = 1"))
+        for _ in range(200):
+            parent, child = rng.sample(ids, 2)
+            if rng.random() < 0.7:
+                graph.add_edge(parent, child)
+            else:
+                graph.remove_edge(parent, child)
+            probe = rng.choice(ids)
+            assert graph.descendants(probe) == bfs(graph, probe)
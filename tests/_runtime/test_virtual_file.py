@@ -1,8 +1,11 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import logging
 import uuid
+from typing import TYPE_CHECKING
 
+from marimo import _loggers
 from marimo._runtime.commands import DeleteCellCommand
 from marimo._runtime.context import get_context
 from marimo._runtime.runtime import Kernel
@@ -15,10 +18,17 @@ from marimo._runtime.virtual_file.virtual_file import (
     VirtualFile,
     VirtualFileLifecycleItem,
     VirtualFileRegistry,
+    VirtualFileStats,
     read_virtual_file,
 )
+from marimo._types.ids import CellId_t
 from tests.conftest import ExecReqProvider, MockedKernel
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pytest
+
 
 async def test_virtual_file_creation(
     execution_kernel: Kernel, exec_req: ExecReqProvider
@@ -392,6 +402,34 @@ def test_create_and_register_with_context(
     assert read_virtual_file(vfile.filename, 11) == b"hello world"
 
 
+def test_create_and_register_streams_producers(
+    run_mode_kernel: MockedKernel,  # noqa: ARG001
+) -> None:
+    ctx = get_context()
+
+    def produce() -> Iterator[bytes]:
+        yield b"hello "
+        yield b"world"
+
+    vfile = VirtualFile.create_and_register(produce(), "txt")
+
+    assert vfile.url == f"./@file/11-{vfile.filename}"
+    # The registry's storage holds the contents, not the file
+    assert vfile.buffer == b""
+    assert ctx.virtual_file_registry.has(vfile.filename)
+    assert read_virtual_file(vfile.filename, 11) == b"hello world"
+
+
+def test_create_and_register_buffer_size_in_bytes(
+    run_mode_kernel: MockedKernel,  # noqa: ARG001
+) -> None:
+    vfile = VirtualFile.create_and_register(
+        memoryview(bytearray(8)).cast("B").cast("I"), "bin"
+    )
+    assert vfile.url == f"./@file/8-{vfile.filename}"
+    assert read_virtual_file(vfile.filename, 8) == bytes(8)
+
+
 def test_create_and_register_without_context() -> None:
     # No kernel context initialized — should fall back to data URL
     vfile = VirtualFile.create_and_register(b"test data", "bin")
@@ -417,6 +455,12 @@ def test_create_and_register_empty_buffer_uses_data_url(
     assert len(ctx.virtual_file_registry.registry) == registry_size_before
 
 
+def test_create_and_register_producer_without_context() -> None:
+    vfile = VirtualFile.create_and_register(iter([b"a", b"b"]), "txt")
+    assert vfile.url.startswith("data:")
+    assert vfile.buffer == b"ab"
+
+
 def test_create_and_register_empty_buffer_without_context() -> None:
     # No kernel context — empty buffer should still produce a data URL
     vfile = VirtualFile.create_and_register(b"", "bin")
@@ -447,3 +491,188 @@ def test_create_and_register_preserves_extension(
     for ext in ("pdf", "png", "csv"):
         vfile = VirtualFile.create_and_register(b"content", ext)
         assert vfile.filename.endswith(f".{ext}")
+
+
+async def test_replaced_output_releases_virtual_file(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    registry = get_context().virtual_file_registry
+    await k.run(
+        [
+            exec_req.get("import io; import marimo as mo"),
+            show := exec_req.get(
+                """
+                for i in range(3):
+                    mo.output.replace(mo.pdf(io.BytesIO(f"pdf {i}".encode())))
+                """
+            ),
+        ]
+    )
+    # Only the file in the cell's final output is left
+    assert len(registry.registry) == 1
+    (filename,) = registry.registry
+    assert read_virtual_file(filename, 5) == b"pdf 2"
+
+    await k.delete_cell(DeleteCellCommand(cell_id=show.cell_id))
+    assert not registry.registry
+    assert registry.stats().nbytes == 0
+
+
+async def test_file_shown_by_another_cell_outlives_its_cell(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    registry = get_context().virtual_file_registry
+    await k.run(
+        [
+            exec_req.get("import io; import marimo as mo"),
+            create := exec_req.get("html = mo.pdf(io.BytesIO(b'hi')).text"),
+            show := exec_req.get("mo.Html(html)"),
+        ]
+    )
+    (filename,) = registry.registry
+    assert registry.referenced(filename)
+    assert registry.registry[filename].outputs == {show.cell_id}
+
+    # The creating cell's file is kept while another cell shows it, and
+    # released once that cell's output changes
+    await k.run([exec_req.get_with_id(create.cell_id, "html = 'gone'")])
+    assert filename not in registry.registry
+
+
+def _registry_with_files(*sizes: int) -> tuple[VirtualFileRegistry, list[str]]:
+    registry = VirtualFileRegistry(storage=InMemoryStorage())
+    filenames = []
+    for i, size in enumerate(sizes):
+        vfile = registry.store(f"file-{uuid.uuid4()}-{i}.bin", b"x" * size)
+        assert vfile is not None
+        filenames.append(vfile.filename)
+    return registry, filenames
+
+
+def test_track_output_releases_unreferenced_files() -> None:
+    registry, (a, b) = _registry_with_files(3, 4)
+    try:
+        cell_id = CellId_t("cell")
+        registry.track_output(cell_id, f"<img src='./@file/3-{a}' />")
+        registry.reference(a)
+        registry.track_output(cell_id, f"<img src='./@file/4-{b}' />")
+
+        # Still referenced by an object
+        assert registry.has(a)
+        registry.dereference(a)
+        assert not registry.has(a)
+        assert not registry.storage.has(a)
+
+        registry.track_output(cell_id, "")
+        assert not registry.has(b)
+        assert registry.stats() == VirtualFileStats(
+            files=0, nbytes=0, evictions=0
+        )
+    finally:
+        registry.shutdown()
+
+
+def test_never_shown_files_are_not_released() -> None:
+    registry, (a,) = _registry_with_files(3)
+    try:
+        registry.reference(a)
+        registry.dereference(a)
+        assert registry.has(a)
+        registry.track_output(CellId_t("cell"), "no files here")
+        assert registry.has(a)
+    finally:
+        registry.shutdown()
+
+
+def test_quota_evicts_least_recently_used_unreferenced_first(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from marimo._runtime.virtual_file import virtual_file
+
+    monkeypatch.setattr(virtual_file, "virtual_files_max_bytes", lambda: 10)
+    registry, (a, b, c) = _registry_with_files(4, 4, 2)
+    try:
+        registry.reference(a)
+        assert registry.stats() == VirtualFileStats(
+            files=3, nbytes=10, evictions=0
+        )
+
+        # b is the least recently used file that isn't referenced
+        d = registry.store("d.bin", b"xx")
+        assert d is not None
+        assert [registry.has(f) for f in (a, b, c, "d.bin")] == [
+            True,
+            False,
+            True,
+            True,
+        ]
+        assert not registry.storage.has(b)
+
+        # Referenced files go last, but do go
+        registry.store("e.bin", b"x" * 8)
+        assert list(registry.registry) == ["e.bin"]
+        assert registry.stats() == VirtualFileStats(
+            files=1, nbytes=8, evictions=4
+        )
+    finally:
+        registry.shutdown()
+
+
+def test_quota_from_config(
+    run_mode_kernel: MockedKernel, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from marimo._runtime.virtual_file.virtual_file import (
+        DEFAULT_VIRTUAL_FILES_MAX_BYTES,
+        virtual_files_max_bytes,
+    )
+
+    assert virtual_files_max_bytes() == DEFAULT_VIRTUAL_FILES_MAX_BYTES
+    runtime_config = run_mode_kernel.k.user_config["runtime"]
+    monkeypatch.setitem(runtime_config, "virtual_files_max_bytes", 100)
+    assert virtual_files_max_bytes() == 100
+    monkeypatch.setitem(runtime_config, "virtual_files_max_bytes", -1)
+    assert virtual_files_max_bytes() is None
+
+
+def test_store_returns_existing_file_for_duplicate_key() -> None:
+    registry, (a,) = _registry_with_files(3)
+    try:
+        vfile = registry.store(a, b"other contents")
+        assert vfile is not None
+        assert vfile.filename == a
+        assert vfile.url == f"./@file/3-{a}"
+        assert registry.storage.read(a, 3) == b"xxx"
+        assert registry.stats() == VirtualFileStats(
+            files=1, nbytes=3, evictions=0
+        )
+    finally:
+        registry.shutdown()
+
+
+async def test_run_logs_virtual_file_stats(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    logger = _loggers.marimo_logger()
+    level = logger.level
+    logger.setLevel(logging.DEBUG)
+    try:
+        with _loggers.capture_output() as (_, _, records):
+            await k.run(
+                [
+                    exec_req.get(
+                        """
+                        import io
+                        import marimo as mo
+                        pdf_plugin = mo.pdf(io.BytesIO(b"hello world"))
+                        """
+                    ),
+                ]
+            )
+    finally:
+        logger.setLevel(level)
+    messages = [record.getMessage() for record in records]
+    assert "Virtual files: 1 live, 11 bytes, 0 evicted" in messages
+    assert "Runs preempted by newer UI values: 0" in messages
@@ -192,6 +192,30 @@ async def test_process_request_with_asyncio_queue() -> None:
     assert set(cmd.object_ids) == {"obj1", "obj2"}
 
 
+def test_superseded_buffers_drained_commands() -> None:
+    q: queue.Queue[BatchableCommand] = queue.Queue()
+    manager = SetUIElementRequestManager(q)
+    assert not manager.superseded(["obj1"])
+
+    newer = UpdateUIElementCommand(
+        object_ids=["obj1"], values=[2], token="token2"
+    )
+    q.put(UpdateUIElementCommand(object_ids=["obj2"], values=[1]))
+    assert not manager.superseded(["obj1"])
+    q.put(newer)
+    assert manager.superseded(["obj1"])
+    assert q.empty()
+
+    # The control queue's copy of `newer` is deduped against the buffered
+    # one, and the buffered commands are processed with it.
+    result = manager.process_request(newer)
+    assert len(result) == 1
+    cmd = result[0]
+    assert isinstance(cmd, UpdateUIElementCommand)
+    assert dict(cmd.ids_and_values) == {"obj2": 1, "obj1": 2}
+    assert not manager.superseded(["obj1"])
+
+
 def test_process_request_returns_empty_for_empty_batch() -> None:
     """Test that an empty list is returned when all requests are duplicates."""
     q: queue.Queue[BatchableCommand] = queue.Queue()
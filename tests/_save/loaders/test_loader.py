@@ -161,6 +161,107 @@ class TestMemoryLoader(ABCTestLoader):
         )
 
 
+def _sized_cache(hash_val: str, nbytes: int) -> Cache:
+    return Cache(
+        defs={"blob": b"x" * nbytes},
+        hash=hash_val,
+        cache_type="Pure",
+        stateful_refs=set(),
+        hit=False,
+        meta={},
+    )
+
+
+class TestMemoryLoaderByteBudget:
+    def test_evicts_lru_entries_over_budget(self) -> None:
+        loader = MemoryLoader("test", max_size=-1, max_bytes=2500)
+        loader.save_cache(_sized_cache("a", 1000))
+        loader.save_cache(_sized_cache("b", 1000))
+        # Touch `a`, so `b` is the least recently used entry.
+        assert loader.load_cache(key("a", "Pure")) is not None
+        loader.save_cache(_sized_cache("c", 1000))
+
+        assert loader.cache_hit(key("a", "Pure"))
+        assert not loader.cache_hit(key("b", "Pure"))
+        assert loader.cache_hit(key("c", "Pure"))
+        assert loader.evictions == 1
+        assert 2000 <= loader.resident_bytes <= 2500
+
+    def test_keeps_single_oversized_entry(self) -> None:
+        loader = MemoryLoader("test", max_bytes=10)
+        loader.save_cache(_sized_cache("a", 1000))
+        assert loader.cache_hit(key("a", "Pure"))
+        assert loader.evictions == 0
+
+    def test_spills_to_store(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = FileStore(save_path=tmp)
+            loader = MemoryLoader(
+                "test", max_size=1, max_bytes=10_000, spill_store=store
+            )
+            loader.save_cache(_sized_cache("a", 100))
+            loader.save_cache(_sized_cache("b", 100))
+            assert loader.current_size == 1
+
+            # `a` was spilled rather than dropped, and comes back resident.
+            assert loader.cache_hit(key("a", "Pure"))
+            restored = loader.load_cache(key("a", "Pure"))
+            assert restored is not None
+            assert restored.defs["blob"] == b"x" * 100
+            assert loader.evictions == 2
+
+            loader.clear()
+            assert not loader.cache_hit(key("a", "Pure"))
+            assert not loader.cache_hit(key("b", "Pure"))
+
+    def test_spills_outside_the_lock(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            locked: list[bool] = []
+
+            class _Store(FileStore):
+                def put(self, key: str, value: bytes) -> bool:
+                    locked.append(loader._cache_lock.locked())
+                    return super().put(key, value)
+
+            loader = MemoryLoader(
+                "test", max_size=1, spill_store=_Store(save_path=tmp)
+            )
+            loader.save_cache(_sized_cache("a", 100))
+            loader.save_cache(_sized_cache("b", 100))
+            loader.save_cache(_sized_cache("c", 100))
+            assert locked == [False, False]
+
+    def test_resize_to_byte_budget(self) -> None:
+        loader = MemoryLoader("test")
+        for h in "abc":
+            loader.save_cache(_sized_cache(h, 1000))
+        assert loader.resident_bytes == 0
+
+        loader.max_bytes = 1500
+        assert loader.current_size == 1
+        assert loader.cache_hit(key("c", "Pure"))
+
+        loader.max_bytes = None
+        assert loader.resident_bytes == 0
+
+    def test_estimate_nbytes(self) -> None:
+        from marimo._save.loaders.memory import estimate_nbytes
+
+        assert estimate_nbytes(b"x" * 1000) >= 1000
+        assert estimate_nbytes([b"x" * 1000] * 3) < 2000
+        assert estimate_nbytes({"a": [b"x" * 1000, b"y" * 1000]}) >= 2000
+
+    @pytest.mark.skipif(
+        not DependencyManager.numpy.has(), reason="numpy not installed"
+    )
+    def test_estimate_nbytes_numpy(self) -> None:
+        import numpy as np
+
+        from marimo._save.loaders.memory import estimate_nbytes
+
+        assert estimate_nbytes(np.zeros(1000, dtype=np.float64)) == 8000
+
+
 class TestJsonLoader(ABCTestLoader):
     suffix = "json"
 
@@ -648,3 +749,79 @@ class TestLazyLoader(ABCTestLoader):
         assert loaded is not None
         assert isinstance(loaded.defs["s"], pd.Series)
         pd.testing.assert_series_equal(loaded.defs["s"], s)
+
+    def test_large_blobs_compressed_and_recorded(self) -> None:
+        """Compressible blobs above the threshold are stored compressed, the
+        codec is recorded in the manifest, and restore inverts it; small
+        blobs stay as serialized."""
+        loader = self.instance()
+        big = ["marimo"] * 50_000
+        cache = Cache(
+            defs={"big": big, "small": [1, 2, 3]},
+            hash="compressed_hash",
+            cache_type="Pure",
+            stateful_refs=set(),
+            hit=False,
+            meta={"version": MARIMO_CACHE_VERSION, "return": big},
+        )
+        assert loader.save_cache(cache)
+        loader.flush()
+
+        cache_path = loader.build_path(key("compressed_hash", "Pure"))
+        decoded = msgspec.json.decode(
+            self.store.get(str(cache_path)), type=CacheSchema
+        )
+        assert decoded.defs["big"].codec == loader._codec
+        assert decoded.meta.return_value is not None
+        assert decoded.meta.return_value.codec == loader._codec
+        assert decoded.defs["small"].codec is None
+        big_ref = decoded.defs["big"].reference
+        assert big_ref is not None
+        assert len(self.store.get(big_ref)) < len(pickle.dumps(big)) // 10
+
+        loaded = loader.load_cache(key("compressed_hash", "Pure"))
+        assert loaded is not None
+        assert loaded.defs["big"] == big
+        assert loaded.defs["small"] == [1, 2, 3]
+        assert loaded.meta["return"] == big
+
+    def test_default_compression_is_zlib(self) -> None:
+        # Optional codecs would leave entries unreadable where they aren't
+        # installed, so they are opt-in.
+        loader = LazyLoader("test", store=self.store, verification="off")
+        assert loader.compression == "zlib"
+        assert loader._codec == "zlib"
+
+    def test_compression_disabled(self) -> None:
+        loader = LazyLoader(
+            "test", store=self.store, verification="off", compression=None
+        )
+        big = ["marimo"] * 50_000
+        cache = Cache(
+            defs={"big": big},
+            hash="uncompressed_hash",
+            cache_type="Pure",
+            stateful_refs=set(),
+            hit=False,
+            meta={"version": MARIMO_CACHE_VERSION},
+        )
+        assert loader.save_cache(cache)
+        loader.flush()
+
+        cache_path = loader.build_path(key("uncompressed_hash", "Pure"))
+        decoded = msgspec.json.decode(
+            self.store.get(str(cache_path)), type=CacheSchema
+        )
+        assert decoded.defs["big"].codec is None
+        loaded = loader.load_cache(key("uncompressed_hash", "Pure"))
+        assert loaded is not None
+        assert loaded.defs["big"] == big
+
+    def test_unknown_compression_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown cache compression"):
+            LazyLoader(
+                "test",
+                store=self.store,
+                verification="off",
+                compression="brotli",
+            )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 from pathlib import Path
 
@@ -63,6 +64,69 @@ class TestFileStore:
         assert store._resolved_save_path is not None
 
 
+class TestBoundedFileStore:
+    def test_put_is_atomic(self, tmp_path, monkeypatch) -> None:
+        """A failed write leaves the previous entry and no temp files."""
+        store = FileStore(tmp_path)
+        store.put("key", b"old")
+
+        def fail_replace(*_args: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(file_mod.os, "replace", fail_replace)
+        try:
+            store.put("key", b"new")
+        except OSError:
+            pass
+        assert store.get("key") == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["key"]
+
+    def test_evicts_least_recently_used_by_entries(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        clock = itertools.count(1_000_000)
+        monkeypatch.setattr(file_mod.time, "time", lambda: next(clock))
+        store = FileStore(tmp_path, max_entries=2)
+        store.put("a", b"1")
+        store.put("b", b"2")
+        # Reading `a` makes `b` the least recently used entry.
+        assert store.get("a") == b"1"
+        store.put("c", b"3")
+        assert store.hit("a")
+        assert not store.hit("b")
+        assert store.hit("c")
+
+    def test_evicts_by_bytes(self, tmp_path) -> None:
+        store = FileStore(tmp_path, max_bytes=10)
+        store.put("dir/a", b"x" * 4)
+        store.put("dir/b", b"x" * 4)
+        store.put("dir/c", b"x" * 4)
+        assert not store.hit("dir/a")
+        assert store.hit("dir/b")
+        assert store.hit("dir/c")
+
+    def test_never_evicts_the_entry_just_written(self, tmp_path) -> None:
+        store = FileStore(tmp_path, max_bytes=1)
+        store.put("big", b"x" * 8)
+        assert store.get("big") == b"x" * 8
+
+    def test_index_is_shared_through_sidecar(self, tmp_path) -> None:
+        FileStore(tmp_path, max_entries=2).put("a", b"1")
+        assert (tmp_path / file_mod.INDEX_NAME).exists()
+        other = FileStore(tmp_path, max_entries=2)
+        other.put("b", b"2")
+        other.put("c", b"3")
+        assert not other.hit("a")
+
+    def test_index_rebuilt_from_disk(self, tmp_path) -> None:
+        FileStore(tmp_path).put("a", b"1")
+        FileStore(tmp_path).put("b", b"2")
+        store = FileStore(tmp_path, max_entries=2)
+        store.put("c", b"3")
+        assert sum(store.hit(k) for k in "abc") == 2
+        assert store.hit("c")
+
+
 class TestDefaultSavePath:
     def test_writable_notebook_dir(self, tmp_path, monkeypatch) -> None:
         """The cache anchors next to the notebook when its directory is writable."""
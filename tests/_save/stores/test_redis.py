@@ -0,0 +1,199 @@
+# Copyright 2026 Marimo. All rights reserved.
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from marimo._save.cache import MARIMO_CACHE_VERSION, Cache
+from marimo._save.hash import HashKey
+from marimo._save.loaders import LazyLoader
+from marimo._save.stores.redis import RedisStore
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis) -> None:
+        self._client = client
+        self._ops: list[tuple[str, Any, int | None]] = []
+
+    def set(self, key: str, value: Any, ex: int | None = None) -> None:
+        self._ops.append((key, value, ex))
+
+    def execute(self) -> list[bool]:
+        self._client.round_trips += 1
+        results = [self._client._set(*op) for op in self._ops]
+        self._ops.clear()
+        return results
+
+
+class FakeRedis:
+    """In-memory stand-in recording one round trip per command."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.round_trips = 0
+
+    def _set(self, key: str, value: bytes, ex: int | None) -> bool:
+        self.data[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def get(self, key: str) -> bytes | None:
+        self.round_trips += 1
+        return self.data.get(key)
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.round_trips += 1
+        return [self.data.get(k) for k in keys]
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> bool:
+        self.round_trips += 1
+        return self._set(key, value, ex)
+
+    def exists(self, key: str) -> int:
+        self.round_trips += 1
+        return int(key in self.data)
+
+    def delete(self, key: str) -> int:
+        self.round_trips += 1
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        del transaction
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def client() -> FakeRedis:
+    return FakeRedis()
+
+
+def _store(client: FakeRedis, **kwargs: Any) -> RedisStore:
+    with patch(
+        "marimo._save.stores.redis._shared_client", return_value=client
+    ):
+        return RedisStore(**kwargs)
+
+
+class TestRedisStore:
+    def test_prefix_and_ttl(self, client: FakeRedis) -> None:
+        store = _store(client, prefix="nb:", ttl=60)
+        assert store.put("a", b"1")
+        assert client.data == {"nb:a": b"1"}
+        assert client.ttls == {"nb:a": 60}
+        assert store.get("a") == b"1"
+        assert store.clear("a")
+        assert store.get("a") is None
+
+    def test_get_batch_is_one_round_trip(self, client: FakeRedis) -> None:
+        store = _store(client)
+        client.data.update({f"k{i}": str(i).encode() for i in range(10)})
+        result = dict(store.get_batch(["k0", "k5", "missing"]))
+        assert result == {"k0": b"0", "k5": b"5", "missing": None}
+        assert client.round_trips == 1
+
+    def test_put_batch_is_one_round_trip(self, client: FakeRedis) -> None:
+        store = _store(client, prefix="p/", ttl=5)
+        assert store.put_batch([("a", b"1"), ("b", b"2")])
+        assert client.round_trips == 1
+        assert client.data == {"p/a": b"1", "p/b": b"2"}
+        assert set(client.ttls.values()) == {5}
+
+    def test_hit_checks_existence(self, client: FakeRedis) -> None:
+        store = _store(client, prefix="p/")
+        client.data["p/m"] = b"manifest"
+        with patch.object(client, "get", side_effect=AssertionError):
+            assert store.hit("m")
+            assert not store.hit("absent")
+
+    def test_lazy_loader_restores_blobs_in_one_round_trip(
+        self, client: FakeRedis
+    ) -> None:
+        store = _store(client)
+        loader = LazyLoader("ns", store=store, verification="off")
+        cache = Cache(
+            defs={"x": 1, "y": [1, 2], "z": "three"},
+            hash="redis_hash",
+            cache_type="Pure",
+            stateful_refs=set(),
+            hit=False,
+            meta={"version": MARIMO_CACHE_VERSION},
+        )
+        assert loader.save_cache(cache)
+        loader.flush()
+        # One pipeline for the blobs, one SET for the manifest.
+        assert client.round_trips == 2
+
+        client.round_trips = 0
+        reader = LazyLoader("ns", store=store, verification="off")
+        loaded = reader.load_cache(HashKey("redis_hash", "Pure"))
+        assert loaded is not None
+        assert loaded.defs == {"x": 1, "y": [1, 2], "z": "three"}
+        # Manifest GET + one MGET for every blob.
+        assert client.round_trips == 2
+
+    def test_lazy_loader_misses_on_batch_error(
+        self, client: FakeRedis
+    ) -> None:
+        store = _store(client)
+        loader = LazyLoader("ns", store=store, verification="off")
+        cache = Cache(
+            defs={"y": [1, 2]},
+            hash="redis_hash",
+            cache_type="Pure",
+            stateful_refs=set(),
+            hit=False,
+            meta={"version": MARIMO_CACHE_VERSION},
+        )
+        assert loader.save_cache(cache)
+        loader.flush()
+
+        reader = LazyLoader("ns", store=store, verification="off")
+        with patch.object(client, "mget", side_effect=ConnectionError):
+            assert reader.load_cache(HashKey("redis_hash", "Pure")) is None
+
+    def test_lazy_loader_skips_manifest_on_failed_batch(
+        self, client: FakeRedis
+    ) -> None:
+        store = _store(client)
+        loader = LazyLoader("ns", store=store, verification="off")
+        cache = Cache(
+            defs={"y": [1, 2]},
+            hash="redis_hash",
+            cache_type="Pure",
+            stateful_refs=set(),
+            hit=False,
+            meta={"version": MARIMO_CACHE_VERSION},
+        )
+        with patch.object(RedisStore, "put_batch", return_value=False):
+            assert loader.save_cache(cache)
+            loader.flush()
+        assert client.data == {}
+
+    def test_lazy_loader_flushes_blobs_in_chunks(
+        self, client: FakeRedis
+    ) -> None:
+        store = _store(client)
+        loader = LazyLoader(
+            "ns", store=store, verification="off", compression=None
+        )
+        cache = Cache(
+            defs={"x": [1] * 100, "y": [2] * 100, "z": [3] * 100},
+            hash="redis_hash",
+            cache_type="Pure",
+            stateful_refs=set(),
+            hit=False,
+            meta={"version": MARIMO_CACHE_VERSION},
+        )
+        with patch("marimo._save.loaders.lazy._MAX_BATCH_BYTES", 1):
+            assert loader.save_cache(cache)
+            loader.flush()
+        # One pipeline per blob, then the manifest.
+        assert client.round_trips == 4
+        reader = LazyLoader("ns", store=store, verification="off")
+        loaded = reader.load_cache(HashKey("redis_hash", "Pure"))
+        assert loaded is not None
+        assert loaded.defs["z"] == [3] * 100
@@ -0,0 +1,189 @@
+# Copyright 2026 Marimo. All rights reserved.
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._save.stores.rest import RestStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _CacheServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.data: dict[str, bytes] = {}
+        self.connections = 0
+        self.failures_left = 0
+        self.redirects: dict[str, str] = {}
+        self.proxy_authorization: str | None = None
+        self.lock = threading.Lock()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so connections are kept alive between requests.
+    protocol_version = "HTTP/1.1"
+    server: _CacheServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args: object) -> None:
+        del args
+
+    def _reply(self, status: int, body: bytes = b"") -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _should_fail(self) -> bool:
+        with self.server.lock:
+            if self.server.failures_left > 0:
+                self.server.failures_left -= 1
+                return True
+        return False
+
+    def do_GET(self) -> None:
+        if self._should_fail():
+            self._reply(503)
+            return
+        location = self.server.redirects.get(self.path)
+        if location is not None:
+            self.send_response(302)
+            self.send_header("Location", location)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = self.server.data.get(self.path)
+        if data is None:
+            self._reply(404)
+        else:
+            self._reply(200, data)
+
+    def do_HEAD(self) -> None:
+        self._reply(200 if self.path in self.server.data else 404)
+
+    def do_PUT(self) -> None:
+        assert self.headers["Authorization"] == "Bearer secret"
+        self.server.proxy_authorization = self.headers["Proxy-Authorization"]
+        length = int(self.headers["Content-Length"])
+        self.server.data[self.path] = self.rfile.read(length)
+        self._reply(201)
+
+
+@pytest.fixture
+def server() -> Iterator[_CacheServer]:
+    srv = _CacheServer()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _store(server: _CacheServer, **kwargs: object) -> RestStore:
+    host, port = server.server_address[:2]
+    return RestStore(
+        base_url=f"http://{host}:{port}/cache",
+        api_key="secret",
+        project_id="proj",
+        backoff=0.001,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestRestStore:
+    def test_round_trip_reuses_connection(self, server: _CacheServer) -> None:
+        store = _store(server)
+        assert store.put("a/b.pickle", b"payload")
+        assert server.data == {"/cache/proj/a/b.pickle": b"payload"}
+        assert store.hit("a/b.pickle")
+        assert not store.hit("missing")
+        assert store.get("a/b.pickle") == b"payload"
+        assert store.get("missing") is None
+        assert server.connections == 1
+
+    def test_batches(self, server: _CacheServer) -> None:
+        store = _store(server, max_connections=4)
+        items = [(f"k{i}", str(i).encode()) for i in range(20)]
+        assert store.put_batch(items)
+        keys = [k for k, _ in items] + ["missing"]
+        result = list(store.get_batch(keys))
+        assert result == [*items, ("missing", None)]
+        # Concurrency is bounded by the pool.
+        assert server.connections <= 4
+
+    def test_retries_transient_errors(self, server: _CacheServer) -> None:
+        store = _store(server, max_retries=2)
+        server.data["/cache/proj/k"] = b"v"
+        server.failures_left = 2
+        assert store.get("k") == b"v"
+
+        server.failures_left = 3
+        assert store.get("k") is None
+        assert server.failures_left == 0
+
+    def test_connection_errors_degrade_to_miss(self) -> None:
+        store = RestStore(
+            base_url="http://127.0.0.1:9",
+            api_key="secret",
+            max_retries=1,
+            backoff=0.001,
+            timeout=1,
+        )
+        assert store.get("k") is None
+        assert not store.put("k", b"v")
+        assert not store.hit("k")
+
+    def test_keeps_query_string(self, server: _CacheServer) -> None:
+        host, port = server.server_address[:2]
+        store = RestStore(
+            base_url=f"http://{host}:{port}/cache?token=abc",
+            api_key="secret",
+            project_id="proj",
+        )
+        assert store.put("k", b"v")
+        assert server.data == {"/cache/proj/k?token=abc": b"v"}
+        assert store.get("k") == b"v"
+
+    def test_follows_redirects(self, server: _CacheServer) -> None:
+        store = _store(server)
+        server.data["/elsewhere"] = b"v"
+        server.redirects["/cache/proj/k"] = "/elsewhere"
+        assert store.get("k") == b"v"
+
+    def test_uses_proxy_from_environment(
+        self, server: _CacheServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        host, port = server.server_address[:2]
+        monkeypatch.setenv("http_proxy", f"http://user:pw@{host}:{port}")
+        monkeypatch.delenv("no_proxy", raising=False)
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        store = RestStore(
+            base_url="http://cache.invalid/cache", api_key="secret"
+        )
+        # The proxy (here, the test server) is sent the absolute URL.
+        assert store.put("k", b"v")
+        assert server.data == {"http://cache.invalid/cache/k": b"v"}
+        assert server.proxy_authorization == "Basic dXNlcjpwdw=="
+        assert store.get("k") == b"v"
+
+    def test_no_proxy_bypasses_proxy(
+        self, server: _CacheServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+        monkeypatch.setenv("no_proxy", "127.0.0.1")
+        store = _store(server, max_retries=0)
+        assert store.put("k", b"v")
+        assert store.get("k") == b"v"
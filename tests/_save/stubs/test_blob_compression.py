@@ -0,0 +1,66 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import os
+import pickle
+
+import pytest
+
+from marimo._save.stubs.lazy_stub import (
+    BLOB_CODECS,
+    BLOB_COMPRESSION_THRESHOLD,
+    compress_blob,
+    decompress_blob,
+    resolve_codec,
+)
+
+AVAILABLE_CODECS = [
+    name for name, codec in BLOB_CODECS.items() if codec.available()
+]
+
+COMPRESSIBLE = pickle.dumps(list(range(100)) * 1_000)
+
+
+@pytest.mark.parametrize("codec", AVAILABLE_CODECS)
+def test_round_trip(codec: str) -> None:
+    data, used = compress_blob(COMPRESSIBLE, "pickle", codec)
+    assert used == codec
+    assert len(data) < len(COMPRESSIBLE)
+    assert decompress_blob(data, used) == COMPRESSIBLE
+
+
+def test_auto_prefers_fastest_installed() -> None:
+    assert resolve_codec("auto") == AVAILABLE_CODECS[0]
+    assert resolve_codec(None) is None
+    # zlib is the stdlib fallback, so "auto" always resolves.
+    assert "zlib" in AVAILABLE_CODECS
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(ValueError):
+        resolve_codec("brotli")
+    with pytest.raises(ValueError):
+        decompress_blob(b"", "brotli")
+
+
+def test_skips_small_blobs() -> None:
+    small = COMPRESSIBLE[: BLOB_COMPRESSION_THRESHOLD - 1]
+    assert compress_blob(small, "pickle", "zlib") == (small, None)
+    assert compress_blob(small, "pickle", "zlib", threshold=0)[1] == "zlib"
+
+
+@pytest.mark.parametrize("strategy", ["arrow", "ui", "bin"])
+def test_skips_strategies_with_own_encoding(strategy: str) -> None:
+    assert compress_blob(COMPRESSIBLE, strategy, "zlib") == (
+        COMPRESSIBLE,
+        None,
+    )
+
+
+def test_keeps_incompressible_blobs_raw() -> None:
+    noise = os.urandom(BLOB_COMPRESSION_THRESHOLD * 2)
+    assert compress_blob(noise, "npy", "zlib") == (noise, None)
+
+
+def test_decompress_without_codec_is_identity() -> None:
+    assert decompress_blob(COMPRESSIBLE, None) is COMPRESSIBLE
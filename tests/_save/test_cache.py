@@ -2782,6 +2782,11 @@ class TestCacheStatistics:
 
                     # Test lru_cache maxsize
                     lru_info = lru_func.cache_info()
+                    lru_func(1)
+                    lru_func(2)
+                    lru_func(3)  # evicts lru_func(1)
+                    lru_evicted_info = lru_func.cache_info()
+                    lru_memory_info = lru_func.cache_memory_info()
 
                     # Test cache_clear
                     func.cache_clear()
@@ -2810,6 +2815,10 @@ class TestCacheStatistics:
         # LRU maxsize
         lru_info = k.globals["lru_info"]
         assert lru_info.maxsize == 2
+        assert len(lru_info) == 5
+        lru_evicted_info = k.globals["lru_evicted_info"]
+        assert lru_evicted_info.currsize == 2
+        assert k.globals["lru_memory_info"].evictions == 1
 
         # After clear
         info2 = k.globals["info2"]
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import array
+import os
 import pickle
+import signal
+import sys
 from typing import Any
 
 import pytest
@@ -137,3 +140,120 @@ def test_bytearray_does_not_collide_with_equal_bytes() -> None:
     assert common_container_to_bytes(bytearray(b"abc")) != (
         common_container_to_bytes(b"abc")
     )
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda np: np.arange(12.0).reshape(3, 4),
+        lambda np: np.asfortranarray(np.arange(12.0).reshape(3, 4)),
+        lambda np: np.arange(20)[::2],
+        lambda np: np.array(3.0),
+        lambda np: np.zeros((0, 3)),
+        lambda np: np.arange(3 * 10**6, dtype=np.uint8),
+    ],
+)
+def test_hash_data_buffer_matches_data_to_buffer(make: Any) -> None:
+    """Streaming must not change content hashes (and so cache keys)."""
+    import hashlib
+
+    import numpy as np
+
+    from marimo._save.encode import data_to_buffer, hash_data_buffer
+
+    value = make(np)
+    expected = hashlib.sha256(data_to_buffer(value)).digest()
+    assert hash_data_buffer(value, "sha256") == expected
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_hash_data_buffers_parallel_matches_serial(monkeypatch) -> None:
+    import numpy as np
+
+    from marimo._save import encode
+
+    values = [np.full(1000, i, dtype=np.int64) for i in range(6)]
+    serial = [encode.hash_data_buffer(v, "sha256") for v in values]
+    monkeypatch.setattr(encode, "PARALLEL_HASH_THRESHOLD", 0)
+    assert encode.hash_data_buffers(values, "sha256") == serial
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+@pytest.mark.skipif(sys.platform != "linux", reason="requires fork")
+def test_hash_data_buffers_after_fork(monkeypatch) -> None:
+    import numpy as np
+
+    from marimo._save import encode
+
+    values = [np.full(1000, i, dtype=np.int64) for i in range(6)]
+    serial = [encode.hash_data_buffer(v, "sha256") for v in values]
+    monkeypatch.setattr(encode, "PARALLEL_HASH_THRESHOLD", 0)
+    # Start the pool in the parent
+    assert encode.hash_data_buffers(values, "sha256") == serial
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        # Die instead of hanging if the child uses the parent's pool
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+        signal.alarm(10)
+        code = 1
+        try:
+            if encode.hash_data_buffers(values, "sha256") == serial:
+                code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_digest_memo_invalidates_on_write_and_collection() -> None:
+    import gc
+
+    import numpy as np
+
+    from marimo._save.encode import DigestMemo
+
+    memo = DigestMemo()
+    arr = np.zeros(1000)
+    arr.flags.writeable = False
+    memo.put(arr, "sha256", b"digest")
+    assert memo.get(arr, "sha256") == b"digest"
+    assert memo.get(arr, "md5") is None
+    # An equal but distinct object never matches.
+    assert memo.get(arr.copy(), "sha256") is None
+
+    arr.flags.writeable = True
+    assert memo.get(arr, "sha256") is None
+
+    del arr
+    gc.collect()
+    assert len(memo) == 0
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_digest_memo_skips_writeable_arrays() -> None:
+    import numpy as np
+
+    from marimo._save.encode import DigestMemo, hash_data_buffer
+
+    memo = DigestMemo()
+    arr = np.zeros(100_000)
+    memo.put(arr, "sha256", hash_data_buffer(arr, "sha256"))
+    # A write between sampled offsets would go unnoticed
+    arr[1] += 1
+    assert memo.get(arr, "sha256") is None
+    assert len(memo) == 0
+
+    # Read-only views of writeable arrays can change too
+    view = arr[:10]
+    view.flags.writeable = False
+    memo.put(view, "sha256", b"digest")
+    assert memo.get(view, "sha256") is None
+
+    base = np.zeros(10)
+    base.flags.writeable = False
+    frozen = base[:5]
+    memo.put(frozen, "sha256", b"digest")
+    assert memo.get(frozen, "sha256") == b"digest"
@@ -744,6 +744,58 @@ class TestHashMemo:
             cleanup.dispose(ctx, deletion=False)
             assert len(ctx.cache.hash_memo) == 0
 
+    @staticmethod
+    @pytest.mark.skipif(
+        not DependencyManager.numpy.has(),
+        reason="optional dependencies not installed",
+    )
+    def test_digest_memo_survives_cleanup(app) -> None:
+        """Per-object digests outlive HashMemoCleanup while the object is
+        unchanged, and are not served once it is written in place."""
+
+        @app.cell
+        def load() -> tuple[Any]:
+            import numpy as np
+
+            from marimo._runtime.context.types import get_context
+            from marimo._save.cache import HashMemoCleanup
+            from marimo._save.save import persistent_cache
+            from tests._save.loaders.mocks import MockLoader
+
+            arr = np.ones((64, 64))
+            # Only read-only arrays are memoized
+            arr.flags.writeable = False
+            return (
+                MockLoader,
+                persistent_cache,
+                arr,
+                np,
+                get_context,
+                HashMemoCleanup,
+            )
+
+        @app.cell
+        def one(
+            MockLoader, persistent_cache, arr, np, get_context, HashMemoCleanup
+        ) -> tuple[Any]:
+            with persistent_cache(name="one", _loader=MockLoader()) as c1:
+                _v = np.sum(arr)
+            ctx = get_context()
+            HashMemoCleanup().dispose(ctx, deletion=False)
+            assert len(ctx.cache.hash_memo) == 0
+            assert ctx.cache.digest_memo.get(arr, "sha256") is not None
+
+            with persistent_cache(name="one", _loader=MockLoader()) as c2:
+                _v = np.sum(arr)
+            assert c1._cache.hash == c2._cache.hash
+
+            HashMemoCleanup().dispose(ctx, deletion=False)
+            arr.flags.writeable = True
+            arr[0, 0] = 2.0
+            with persistent_cache(name="one", _loader=MockLoader()) as c3:
+                _v = np.sum(arr)
+            assert c1._cache.hash != c3._cache.hash
+
     @staticmethod
     @pytest.mark.skipif(
         not DependencyManager.numpy.has(),
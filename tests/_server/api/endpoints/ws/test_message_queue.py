@@ -0,0 +1,130 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import Any
+
+from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.notification import (
+    AlertNotification,
+    CellNotification,
+)
+from marimo._messaging.serde import (
+    deserialize_kernel_message,
+    serialize_kernel_message,
+)
+from marimo._server.api.endpoints.ws.message_queue import (
+    CoalescingMessageQueue,
+)
+from marimo._types.ids import CellId_t
+
+
+def _output(data: str, mimetype: str = "text/plain") -> CellOutput:
+    return CellOutput(channel=CellChannel.OUTPUT, mimetype=mimetype, data=data)
+
+
+def _cell_op(cell_id: str = "a", **kwargs: Any) -> bytes:
+    return serialize_kernel_message(
+        CellNotification(cell_id=CellId_t(cell_id), **kwargs)
+    )
+
+
+def _drain(queue: CoalescingMessageQueue) -> list[Any]:
+    items = []
+    while not queue.empty():
+        item = queue.get_nowait()
+        items.append(
+            deserialize_kernel_message(item)
+            if isinstance(item, bytes)
+            else item
+        )
+    return items
+
+
+class TestCoalescing:
+    async def test_output_updates_collapse_to_latest(self) -> None:
+        queue = CoalescingMessageQueue()
+        for i in range(100):
+            queue.put_nowait(_cell_op(output=_output(str(i))))
+        assert queue.qsize() == 1
+        items = _drain(queue)
+        assert len(items) == 1
+        assert items[0].output.data == "99"
+        assert queue.coalesced == 99
+        assert queue.nbytes == 0
+
+    async def test_keeps_order_relative_to_other_messages(self) -> None:
+        queue = CoalescingMessageQueue()
+        queue.put_nowait(_cell_op(output=_output("old")))
+        queue.put_nowait(
+            serialize_kernel_message(
+                AlertNotification(title="t", description="d")
+            )
+        )
+        queue.put_nowait(_cell_op(output=_output("new")))
+        items = _drain(queue)
+        assert isinstance(items[0], AlertNotification)
+        assert items[1].output.data == "new"
+
+    async def test_cells_coalesce_independently(self) -> None:
+        queue = CoalescingMessageQueue()
+        queue.put_nowait(_cell_op("a", output=_output("a1")))
+        queue.put_nowait(_cell_op("b", output=_output("b1")))
+        queue.put_nowait(_cell_op("a", output=_output("a2")))
+        items = _drain(queue)
+        assert [(n.cell_id, n.output.data) for n in items] == [
+            ("b", "b1"),
+            ("a", "a2"),
+        ]
+
+    async def test_sent_messages_are_not_superseded(self) -> None:
+        queue = CoalescingMessageQueue()
+        queue.put_nowait(_cell_op(output=_output("1")))
+        assert queue.get_nowait() is not None
+        queue.put_nowait(_cell_op(output=_output("2")))
+        assert [n.output.data for n in _drain(queue)] == ["2"]
+        assert queue.coalesced == 0
+
+    async def test_state_changing_messages_are_kept(self) -> None:
+        kept = [
+            _cell_op(status="running"),
+            _cell_op(console=_output("log")),
+            _cell_op(
+                output=_output("[]", mimetype="application/vnd.marimo+error")
+            ),
+            _cell_op(stale_inputs=True),
+            _cell_op(serialization="Valid"),
+        ]
+        for message in kept:
+            queue = CoalescingMessageQueue()
+            queue.put_nowait(message)
+            queue.put_nowait(_cell_op(output=_output("next")))
+            assert len(_drain(queue)) == 2
+
+    async def test_output_is_not_dropped_for_status_only_update(self) -> None:
+        queue = CoalescingMessageQueue()
+        queue.put_nowait(_cell_op(output=_output("out")))
+        queue.put_nowait(_cell_op(status="idle"))
+        assert len(_drain(queue)) == 2
+
+
+class TestOverflow:
+    async def test_overflow_drops_messages_and_notifies_once(self) -> None:
+        overflows: list[None] = []
+        queue = CoalescingMessageQueue(
+            max_bytes=1000, on_overflow=lambda: overflows.append(None)
+        )
+        queue.put_nowait(_cell_op("a", console=_output("x" * 600)))
+        assert not queue.overflowed
+        queue.put_nowait(_cell_op("b", console=_output("x" * 600)))
+        assert queue.overflowed
+        queue.put_nowait(_cell_op("c", console=_output("x")))
+        assert overflows == [None]
+        assert queue.empty()
+        assert queue.nbytes == 0
+
+    async def test_signals_pass_through(self) -> None:
+        queue = CoalescingMessageQueue(max_bytes=10)
+        queue.put_nowait("signal")
+        queue.put_nowait(_cell_op(output=_output("x" * 100)))
+        queue.put_nowait("close")
+        assert _drain(queue) == ["signal", "close"]
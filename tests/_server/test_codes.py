@@ -24,3 +24,4 @@ def test_websocket_close_reason_wire_values() -> None:
         == "MARIMO_KERNEL_STARTUP_ERROR"
     )
     assert WebSocketCloseReason.SHUTDOWN == "MARIMO_SHUTDOWN"
+    assert WebSocketCloseReason.SLOW_CONSUMER == "MARIMO_SLOW_CONSUMER"
@@ -0,0 +1,249 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
+
+import msgspec.structs
+import pytest
+
+from marimo._config.config import DEFAULT_CONFIG
+from marimo._runtime.commands import (
+    AppMetadata,
+    CreateNotebookCommand,
+    ExecuteCellCommand,
+    StopKernelCommand,
+    UpdateUIElementCommand,
+)
+from marimo._session.app_host.commands import (
+    Channel,
+    CreateKernelCmd,
+    KernelExited,
+)
+from marimo._session.app_host.snapshot import (
+    SnapshotProcess,
+    SnapshotSession,
+    _snapshot_key,
+)
+from marimo._types.ids import CellId_t
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from multiprocessing.connection import Connection
+
+CODES = {
+    CellId_t("a"): "import marimo as mo; import os",
+    CellId_t("b"): "slider = mo.ui.slider(0, 10, value=3); slider",
+    CellId_t("c"): "os.getpid()",
+    CellId_t("d"): "slider.value * 2",
+}
+
+
+def _create_kernel_cmd(**kwargs: Any) -> CreateKernelCmd:
+    return CreateKernelCmd(
+        session_id=kwargs.pop("session_id", "s1"),
+        configs={},
+        app_metadata=AppMetadata(
+            query_params=kwargs.pop("query_params", {}),
+            cli_args={},
+            app_config={},  # type: ignore[arg-type]
+        ),
+        user_config=DEFAULT_CONFIG,
+        virtual_file_storage=None,
+        redirect_console_to_browser=kwargs.pop(
+            "redirect_console_to_browser", False
+        ),
+        log_level=10,
+    )
+
+
+def _create_notebook(
+    object_ids: list[str] | None = None,
+    values: list[Any] | None = None,
+    auto_run: bool = True,
+) -> CreateNotebookCommand:
+    return CreateNotebookCommand(
+        execution_requests=tuple(
+            ExecuteCellCommand(cell_id=cell_id, code=code)
+            for cell_id, code in CODES.items()
+        ),
+        cell_ids=tuple(CODES),
+        set_ui_element_value_request=UpdateUIElementCommand(
+            object_ids=object_ids or [],  # type: ignore[arg-type]
+            values=values or [],
+        ),
+        auto_run=auto_run,
+    )
+
+
+class TestSnapshotKey:
+    def test_same_session_same_key(self) -> None:
+        assert _snapshot_key(
+            _create_kernel_cmd(), _create_notebook()
+        ) == _snapshot_key(
+            _create_kernel_cmd(session_id="s2"),
+            _create_notebook(object_ids=["x"], values=[1]),
+        )
+
+    def test_differs_with_query_params(self) -> None:
+        assert _snapshot_key(
+            _create_kernel_cmd(), _create_notebook()
+        ) != _snapshot_key(
+            _create_kernel_cmd(query_params={"q": "1"}), _create_notebook()
+        )
+
+    def test_differs_with_code(self) -> None:
+        request = _create_notebook()
+        edited = msgspec.structs.replace(
+            request,
+            execution_requests=(
+                ExecuteCellCommand(cell_id=CellId_t("a"), code="x = 1"),
+            ),
+        )
+        cmd = _create_kernel_cmd()
+        assert _snapshot_key(cmd, request) != _snapshot_key(cmd, edited)
+
+    def test_unsupported_sessions(self) -> None:
+        assert (
+            _snapshot_key(
+                _create_kernel_cmd(), _create_notebook(auto_run=False)
+            )
+            is None
+        )
+        assert (
+            _snapshot_key(
+                _create_kernel_cmd(redirect_console_to_browser=True),
+                _create_notebook(),
+            )
+            is None
+        )
+
+
+class TestSnapshotSession:
+    def _session(
+        self, fork_result: Connection | None = None
+    ) -> tuple[SnapshotSession, list[tuple[Channel, Any]], Mock]:
+        routed: list[tuple[Channel, Any]] = []
+        snapshots = Mock()
+        snapshots.fork.return_value = fork_result
+        session = SnapshotSession(
+            _create_kernel_cmd(),
+            snapshots,
+            Mock(),
+            lambda: lambda channel, payload: routed.append((channel, payload)),
+        )
+        return session, routed, snapshots
+
+    def test_falls_back_and_replays_pending_commands(self) -> None:
+        session, routed, snapshots = self._session(fork_result=None)
+        request = _create_notebook()
+        session.channel(Channel.CONTROL).put(request)
+        session.channel(Channel.UI_ELEMENT).put("ui")
+        session.run()
+        session.channel(Channel.INPUT).put_nowait("input")
+
+        snapshots.fork.assert_called_once()
+        assert routed == [
+            (Channel.CONTROL, request),
+            (Channel.UI_ELEMENT, "ui"),
+            (Channel.INPUT, "input"),
+        ]
+
+    def test_only_create_notebook_is_forked(self) -> None:
+        session, routed, snapshots = self._session()
+        session.channel(Channel.CONTROL).put(StopKernelCommand())
+        session.run()
+        snapshots.fork.assert_not_called()
+        assert len(routed) == 1
+
+
+def _recv_until_idle(conn: Connection, timeout: float = 30) -> list[bytes]:
+    messages = []
+    while conn.poll(timeout if not messages else 1):
+        try:
+            messages.append(conn.recv_bytes())
+        except EOFError:
+            break
+    return messages
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="snapshots require Linux")
+# pytest's own threads don't touch the kernels forked by these tests.
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+class TestSnapshotProcess:
+    @pytest.fixture
+    def snapshots(self) -> Generator[SnapshotProcess, None, None]:
+        snapshots = SnapshotProcess.start()
+        yield snapshots
+        snapshots.close()
+
+    def test_forks_executed_kernel(self, snapshots: SnapshotProcess) -> None:
+        first = snapshots.fork(_create_kernel_cmd(), _create_notebook())
+        assert first is not None
+        outputs = b"".join(_recv_until_idle(first))
+        assert b"<pre class='text-xs'>6</pre>" in outputs
+
+        # The snapshot's outputs are replayed to every session; cells ran
+        # once, in the snapshot process.
+        second = snapshots.fork(
+            _create_kernel_cmd(session_id="s2"), _create_notebook()
+        )
+        assert second is not None
+        assert b"".join(_recv_until_idle(second)) == outputs
+        assert str(snapshots.pid).encode() in outputs
+
+        first.send((Channel.CONTROL, StopKernelCommand()))
+        assert _recv_until_idle(first) == []
+        second.close()
+
+    def test_reruns_cells_with_changed_ui_values(
+        self, snapshots: SnapshotProcess
+    ) -> None:
+        first = snapshots.fork(_create_kernel_cmd(), _create_notebook())
+        assert first is not None
+        _recv_until_idle(first)
+        first.close()
+
+        conn = snapshots.fork(
+            _create_kernel_cmd(session_id="s2"),
+            _create_notebook(object_ids=["b-0"], values=[7]),
+        )
+        assert conn is not None
+        outputs = b"".join(_recv_until_idle(conn))
+        assert b"<pre class='text-xs'>14</pre>" in outputs
+        # Only the cell that depends on the slider re-ran; the other
+        # "running" notification is from the snapshot's replayed outputs.
+        running = b',"output":null,"console":[],"status":"running"'
+        assert outputs.count(b'"cell_id":"c"' + running) == 1
+        assert outputs.count(b'"cell_id":"d"' + running) == 2
+        conn.close()
+
+    def test_mismatched_sessions_are_not_forked(
+        self, snapshots: SnapshotProcess
+    ) -> None:
+        conn = snapshots.fork(_create_kernel_cmd(), _create_notebook())
+        assert conn is not None
+        conn.close()
+        assert (
+            snapshots.fork(
+                _create_kernel_cmd(query_params={"q": "1"}),
+                _create_notebook(),
+            )
+            is None
+        )
+
+
+def test_receive_outputs_signals_exit() -> None:
+    from multiprocessing import Pipe
+
+    stream_queue = Mock()
+    session = SnapshotSession(
+        _create_kernel_cmd(), Mock(), stream_queue, Mock()
+    )
+    ours, theirs = Pipe()
+    theirs.send_bytes(b"message")
+    theirs.close()
+    session._receive_outputs(ours)
+    assert stream_queue.put.call_args_list[0].args == (b"message",)
+    assert isinstance(stream_queue.put.call_args_list[1].args[0], KernelExited)
@@ -0,0 +1,75 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import time
+
+from marimo._ast.app_config import _AppConfig
+from marimo._config.manager import get_default_config_manager
+from marimo._runtime.commands import AppMetadata
+from marimo._session.managers import KernelManagerImpl
+from marimo._session.managers.kernel_pool import KernelPool
+from marimo._session.model import SessionMode
+
+
+def _wait_for_idle(pool: KernelPool, count: int, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while pool.idle_count < count:
+        assert time.monotonic() < deadline, "pool did not fill up"
+        time.sleep(0.05)
+
+
+def test_claim_from_empty_pool() -> None:
+    pool = KernelPool(size=1)
+    assert pool.claim() is None
+    assert pool.misses == 1
+    pool.shutdown()
+
+
+def test_pool_replaces_claimed_kernels() -> None:
+    pool = KernelPool(size=1, warm_imports=["json", "not_a_real_module"])
+    pool.start()
+    try:
+        _wait_for_idle(pool, 1)
+        claimed = pool.claim()
+        assert claimed is not None
+        assert claimed.is_alive()
+        assert pool.hits == 1
+        # A replacement is spawned in the background.
+        _wait_for_idle(pool, 1)
+        claimed.close()
+        assert not claimed.is_alive()
+    finally:
+        pool.shutdown()
+    assert pool.idle_count == 0
+
+
+def test_pooled_kernel_runs_session() -> None:
+    pool = KernelPool(size=1)
+    pool.start()
+    try:
+        _wait_for_idle(pool, 1)
+        pooled = pool.claim()
+        assert pooled is not None
+        manager = KernelManagerImpl(
+            queue_manager=pooled.queue_manager,
+            mode=SessionMode.EDIT,
+            configs={},
+            app_metadata=AppMetadata(
+                query_params={},
+                filename="test.py",
+                cli_args={},
+                argv=None,
+                app_config=_AppConfig(),
+            ),
+            config_manager=get_default_config_manager(current_path=None),
+            virtual_file_storage="shared_memory",
+            redirect_console_to_browser=False,
+            pooled_kernel=pooled,
+        )
+        # Returns once the kernel has connected back.
+        manager.start_kernel()
+        assert manager.pid == pooled.process.pid
+        assert manager.is_alive()
+        manager.close_kernel()
+    finally:
+        pool.shutdown()
@@ -1,8 +1,11 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import ast
+import inspect
+import textwrap
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import msgspec
 
@@ -22,6 +25,7 @@ from marimo._messaging.notification import (
     DatasetsNotification,
     DataSourceConnectionsNotification,
     EsmSpec,
+    FocusCellNotification,
     InstallingPackageAlertNotification,
     ModelClose,
     ModelCustom,
@@ -39,7 +43,7 @@ from marimo._messaging.notification import (
     VariableValue,
     VariableValuesNotification,
 )
-from marimo._messaging.serde import serialize_kernel_message
+from marimo._messaging.serde import FramedMessage, serialize_kernel_message
 from marimo._messaging.variables import create_variable_value
 from marimo._runtime.commands import (
     CreateNotebookCommand,
@@ -50,6 +54,7 @@ from marimo._runtime.commands import (
     ModelUpdateMessage,
     UpdateUIElementCommand,
 )
+from marimo._session.state import session_view as session_view_module
 from marimo._session.state.session_view import ModelReplayState, SessionView
 from marimo._sql.engines.duckdb import INTERNAL_DUCKDB_ENGINE
 from marimo._types.ids import CellId_t, RequestId, VariableName, WidgetModelId
@@ -754,6 +759,45 @@ def test_add_variables(session_view: SessionView) -> None:
     assert session_view.variable_values["var2"].datatype == "str"
 
 
+def test_add_raw_notification_skips_unrecorded(
+    session_view: SessionView,
+) -> None:
+    session_view.mark_auto_export_html()
+    with patch.object(
+        FramedMessage, "notification", new_callable=PropertyMock
+    ) as notification:
+        session_view.add_raw_notification(
+            serialize_kernel_message(
+                FocusCellNotification(cell_id=CellId_t("Hbol"))
+            )
+        )
+        notification.assert_not_called()
+    assert session_view.auto_export_state.is_stale("html")
+
+
+def test_recorded_notifications_match_add_notification() -> None:
+    # `add_raw_notification` skips decoding ops outside
+    # `_RECORDED_NOTIFICATIONS`, so every type `add_notification` handles
+    # must be listed there.
+    tree = ast.parse(
+        textwrap.dedent(inspect.getsource(SessionView.add_notification))
+    )
+    handled = {
+        node.args[1].id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "isinstance"
+        and isinstance(node.args[0], ast.Name)
+        and node.args[0].id == "notification"
+        and isinstance(node.args[1], ast.Name)
+    }
+    handled.discard("_RECORDED_NOTIFICATIONS")
+    assert handled == {
+        cls.__name__ for cls in session_view_module._RECORDED_NOTIFICATIONS
+    }
+
+
 def test_add_datasets(session_view: SessionView) -> None:
     session_view.add_raw_notification(
         serialize_kernel_message(
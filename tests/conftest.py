@@ -17,6 +17,7 @@ from _pytest import runner
 
 from marimo._ast.app import App
 from marimo._ast.cell_manager import CellManager
+from marimo._config.settings import GLOBAL_SETTINGS
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._output.formatters.formatters import register_formatters
 from marimo._runtime.commands import ExecuteCellCommand
@@ -50,6 +51,9 @@ register_formatters()
 # Initialize mimetypes for consistent behavior across platforms (especially Windows)
 initialize_mimetypes()
 
+# Don't write compiled-cell caches next to the notebooks under test.
+GLOBAL_SETTINGS.COMPILE_CACHE = False
+
 
 def pytest_collection_modifyitems(
     config: pytest.Config, items: list[pytest.Item]